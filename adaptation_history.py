@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+История метаболической адаптации пользователей FitAdventure Bot
+Кольцевой буфер фиксированной емкости на пользователя (компактные массивы array),
+ограниченное число пользователей в памяти и необязательное сохранение
+в хранилище (storage.py) с ленивой загрузкой при первом обращении.
+"""
+
+import time
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from config import CalculationConstants, StorageConfig
+
+class AdaptationRing:
+    """Последние capacity записей адаптации одного пользователя
+
+    Поля записей хранятся в отдельных массивах array('d'); новая запись
+    затирает самую старую, объем памяти не зависит от числа вызовов.
+    """
+
+    __slots__ = ('capacity', 'start', 'size', 'timestamps', 'weeks', 'factors', 'tdees')
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity должен быть положительным")
+        self.capacity = capacity
+        self.start = 0
+        self.size = 0
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.weeks = array('d', bytes(8 * capacity))
+        self.factors = array('d', bytes(8 * capacity))
+        self.tdees = array('d', bytes(8 * capacity))
+
+    def append(self, timestamp: float, weeks_on_plan: float, adaptation_factor: float, tdee: float) -> None:
+        """Добавление записи (при заполнении - на место самой старой)"""
+        if self.size < self.capacity:
+            index = (self.start + self.size) % self.capacity
+            self.size += 1
+        else:
+            index = self.start
+            self.start = (self.start + 1) % self.capacity
+        self.timestamps[index] = timestamp
+        self.weeks[index] = weeks_on_plan
+        self.factors[index] = adaptation_factor
+        self.tdees[index] = tdee
+
+    def __len__(self) -> int:
+        return self.size
+
+    def rows(self) -> List[List[float]]:
+        """Записи от старой к новой: [время, недели, фактор, TDEE]"""
+        rows = []
+        for offset in range(self.size):
+            index = (self.start + offset) % self.capacity
+            rows.append([self.timestamps[index], self.weeks[index], self.factors[index], self.tdees[index]])
+        return rows
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Записи в прежнем формате adaptation_history[user_id]['adaptations']"""
+        return [{
+            'date': datetime.fromtimestamp(timestamp).isoformat(),
+            'weeks_on_plan': int(weeks) if weeks.is_integer() else weeks,
+            'adaptation_factor': factor,
+            'tdee': tdee
+        } for timestamp, weeks, factor, tdee in self.rows()]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Сериализация для хранилища"""
+        return {'rows': self.rows()}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], capacity: int) -> 'AdaptationRing':
+        """Восстановление из хранилища (лишние старые записи отбрасываются)"""
+        ring = cls(capacity)
+        for row in data.get('rows', [])[-capacity:]:
+            ring.append(*row)
+        return ring
+
+class AdaptationHistory:
+    """История адаптации всех пользователей
+
+    В памяти держится не больше max_users буферов (давно не использованные
+    вытесняются); при подключенном хранилище каждая запись сохраняется,
+    а вытесненный или потерянный при перезапуске буфер загружается заново
+    при следующем обращении к пользователю.
+    """
+
+    def __init__(self, capacity: int = None, max_users: int = None, storage=None,
+                 namespace: str = None):
+        self.capacity = capacity or CalculationConstants.ADAPTATION_HISTORY_SIZE
+        self.max_users = max_users or CalculationConstants.ADAPTATION_MAX_USERS
+        self.storage = storage
+        self.namespace = namespace or StorageConfig.ADAPTATION_NAMESPACE
+        self._rings: "OrderedDict[str, AdaptationRing]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def attach_storage(self, storage) -> None:
+        """Подключение хранилища (например, storage.get_storage())"""
+        with self._lock:
+            self.storage = storage
+            self._rings.clear()
+
+    def _ring(self, user_id, create: bool) -> Optional[AdaptationRing]:
+        """Буфер пользователя: из памяти, из хранилища или новый"""
+        key = str(user_id)
+        ring = self._rings.get(key)
+        if ring is not None:
+            self._rings.move_to_end(key)
+            return ring
+
+        if self.storage is not None:
+            data = self.storage.get_user(self.namespace, key)
+            if data:
+                ring = AdaptationRing.from_dict(data, self.capacity)
+        if ring is None:
+            if not create:
+                return None
+            ring = AdaptationRing(self.capacity)
+
+        self._rings[key] = ring
+        while len(self._rings) > self.max_users:
+            self._rings.popitem(last=False)
+        return ring
+
+    def append(self, user_id, weeks_on_plan: float, adaptation_factor: float, tdee: float,
+               timestamp: float = None) -> None:
+        """Запись результата расчета (и сохранение, если есть хранилище)"""
+        with self._lock:
+            ring = self._ring(user_id, create=True)
+            ring.append(timestamp if timestamp is not None else time.time(),
+                        weeks_on_plan, adaptation_factor, tdee)
+            if self.storage is not None:
+                self.storage.set_user(self.namespace, str(user_id), ring.to_dict())
+
+    def get(self, user_id) -> List[Dict[str, Any]]:
+        """Записи пользователя от старой к новой (пустой список, если нет)"""
+        with self._lock:
+            ring = self._ring(user_id, create=False)
+            return ring.records() if ring is not None else []
+
+    def __contains__(self, user_id) -> bool:
+        with self._lock:
+            return self._ring(user_id, create=False) is not None
+
+    def __len__(self) -> int:
+        """Количество пользователей в памяти"""
+        return len(self._rings)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк расчета планов питания: по одному профилю vs пакетный расчет (NumPy)
+Использовать: python benchmark_calculations.py
+"""
+
+import time
+
+import numpy as np
+
+from calculations import NutritionCalculator
+from reference_data import random_profiles
+
+SIZES = [1_000, 100_000, 1_000_000]
+# Скалярный путь на больших объемах оцениваем по выборке
+SCALAR_SAMPLE = 20_000
+
+def run_benchmark():
+    """Запуск бенчмарка для всех размеров"""
+    print("🧮 Бенчмарк пакетного расчета планов питания\n")
+    print(f"{'Профилей':>10} | {'По одному, с':>13} | {'Пакет (словари), с':>19} | {'Пакет (столбцы), с':>19} | {'Ускорение':>9}")
+    print("-" * 84)
+
+    base = random_profiles(SCALAR_SAMPLE)
+    for size in SIZES:
+        profiles = [base[i % len(base)] for i in range(size)]
+        fields = {field for profile in base for field in profile}
+        columns = {field: [profile.get(field) for profile in profiles] for field in fields}
+        # Числовые столбцы - массивы NumPy (пропуски как NaN)
+        for field in ('weight', 'height', 'age', 'steps', 'stress_level', 'training_days',
+                      'workout_duration', 'fat_percent'):
+            columns[field] = np.array([np.nan if value is None else value for value in columns[field]])
+
+        # Без кэша: каждый профиль считается заново
+        calculator = NutritionCalculator(cache_size=1)
+        sample = profiles[:SCALAR_SAMPLE]
+        start = time.perf_counter()
+        for profile in sample:
+            calculator.calculate_nutrition_plan(profile)
+        scalar_s = (time.perf_counter() - start) * size / len(sample)
+
+        start = time.perf_counter()
+        calculator.calculate_batch(profiles)
+        batch_records_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        calculator.calculate_batch(columns)
+        batch_columns_s = time.perf_counter() - start
+
+        estimate = '*' if size > len(sample) else ' '
+        print(f"{size:>10} | {scalar_s:>12.2f}{estimate} | {batch_records_s:>19.3f} | {batch_columns_s:>19.3f} | {scalar_s / batch_columns_s:>8.0f}x")
+
+    print(f"\n* оценка по выборке из {SCALAR_SAMPLE} профилей")
+
+if __name__ == "__main__":
+    run_benchmark()
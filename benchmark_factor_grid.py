@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк сетки факторов: calculate_nutrition_plan с сеткой и без нее
+Кэш отключен (размер 1, все профили разные) - замеряется сам расчет.
+Использовать: python benchmark_factor_grid.py
+"""
+
+import logging
+import time
+
+import nutrition_engine
+from calculations import NutritionCalculator
+from reference_data import random_profiles
+
+PROFILES = 20_000
+REPEAT = 15
+
+def best_time(function, profiles):
+    """Лучшее время одного профиля из REPEAT прогонов, мкс"""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for profile in profiles:
+            function(profile)
+        best = min(best, time.perf_counter() - start)
+    return best / len(profiles) * 1e6
+
+def run_benchmark():
+    """Сравнение расчета плана по формулам и через сетку"""
+    logging.disable(logging.INFO)
+    profiles = random_profiles(PROFILES)
+
+    start = time.perf_counter()
+    grid = nutrition_engine.FactorGrid()
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"🧮 Сетка факторов: {len(grid)} ячеек, построение {build_ms:.2f} мс\n")
+
+    cases = [
+        ('compute_plan', nutrition_engine.compute_plan, grid.compute_plan),
+        ('calculate_nutrition_plan', NutritionCalculator(cache_size=1, precompute=False).calculate_nutrition_plan,
+         NutritionCalculator(cache_size=1, precompute=True).calculate_nutrition_plan),
+    ]
+
+    print(f"{'Этап':<26} | {'Формулы, мкс':>12} | {'Сетка, мкс':>10} | {'Ускорение':>9}")
+    print("-" * 66)
+    for name, direct, gridded in cases:
+        before = best_time(direct, profiles)
+        after = best_time(gridded, profiles)
+        print(f"{name:<26} | {before:>12.2f} | {after:>10.2f} | {before / after:>8.2f}x")
+
+if __name__ == "__main__":
+    run_benchmark()
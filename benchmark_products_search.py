@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк поиска продуктов: линейный проход vs n-граммный индекс,
+а также нечеткий ранжированный поиск с опечатками
+Использовать: python benchmark_products_search.py
+"""
+
+import random
+import time
+
+from products_database import PRODUCTS_DATABASE, PRODUCTS_INDEX
+from products_index import ProductIndex, scan_search
+
+SIZES = [300, 10_000, 100_000]
+FUZZY_TARGET_US = 1000  # нечеткий поиск по реальной базе - не дольше 1 мс на запрос
+QUERIES = ["овсянка", "рис", "грудка", "масло", "ку", "творог 5%", "несуществующий продукт"]
+PREFIXES = ["кур", "рис ", "сыр"]
+FUZZY_QUERIES = ["куринная грудка", "авакадо", "грутка", "kуриная", "творог 5", "гречка ядрица"]
+VARIANTS = ["домашний", "фермерский", "органический", "замороженный", "вареный",
+            "запеченный", "сушеный", "копченый", "свежий", "консервированный"]
+
+def build_synthetic_database(size: int, seed: int = 42):
+    """Синтетическая база нужного размера на основе реальных названий"""
+    rng = random.Random(seed)
+    base = [
+        (goal, category, name, data)
+        for goal, categories in PRODUCTS_DATABASE.items()
+        for category, products in categories.items()
+        for name, data in products.items()
+    ]
+
+    database = {}
+    for i in range(size):
+        goal, category, name, data = base[i % len(base)]
+        if i >= len(base):
+            name = f"{name} {rng.choice(VARIANTS)} {i}"
+        database.setdefault(goal, {}).setdefault(category, {})[name] = data
+    return database
+
+def time_per_call(func, args_list, repeat: int) -> float:
+    """Среднее время одного вызова в микросекундах"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for args in args_list:
+            func(*args)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repeat * len(args_list)) * 1e6
+
+def run_benchmark():
+    """Запуск бенчмарка для всех размеров базы"""
+    print("🔍 Бенчмарк поиска продуктов\n")
+    print(f"{'Размер':>8} | {'Построение':>11} | {'Скан, мкс':>10} | {'Индекс, мкс':>11} | {'Префикс, мкс':>12} | {'Нечеткий, мкс':>13} | {'Ускорение':>9}")
+    print("-" * 94)
+
+    for size in SIZES:
+        database = build_synthetic_database(size)
+
+        start = time.perf_counter()
+        index = ProductIndex(database)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # Проверка совпадения результатов
+        for query in QUERIES:
+            assert index.search(query) == scan_search(database, query), query
+
+        repeat = max(1, 30_000 // size)
+        scan_us = time_per_call(scan_search, [(database, q) for q in QUERIES], repeat)
+        index_us = time_per_call(index.search, [(q,) for q in QUERIES], repeat * 10)
+        prefix_us = time_per_call(index.search_prefix, [(p,) for p in PREFIXES], repeat * 10)
+        fuzzy_us = time_per_call(index.rank, [(q,) for q in FUZZY_QUERIES], repeat * 10)
+
+        print(f"{size:>8} | {build_ms:>8.1f} мс | {scan_us:>10.1f} | {index_us:>11.1f} | {prefix_us:>12.1f} | {fuzzy_us:>13.1f} | {scan_us / index_us:>8.1f}x")
+
+    fuzzy_us = time_per_call(PRODUCTS_INDEX.rank, [(q,) for q in FUZZY_QUERIES], 100)
+    print(f"\nНечеткий поиск по реальной базе: {fuzzy_us:.1f} мкс на запрос "
+          f"({'в пределах' if fuzzy_us < FUZZY_TARGET_US else 'ВЫШЕ'} цели {FUZZY_TARGET_US} мкс)")
+    print("\n💡 Время индекса включает группировку результатов по цели и категории")
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк отрисовки ответов: сборка строк через += и новая клавиатура на каждое
+сообщение против шаблонов rendering.py, общих клавиатур и кэша карточек
+На каждый ответ (текст + клавиатура) считаются время, число блоков памяти,
+оставшихся за ответом, и пик временной памяти при его сборке (tracemalloc).
+Использовать: python benchmark_rendering.py [повторов]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+import rendering
+from reference_data import (legacy_product_details, legacy_results, legacy_water_statistics,
+                            sample_products, sample_results, sample_water)
+
+REPEAT = 200
+
+# === НОВАЯ ОТРИСОВКА ===
+def new_results(results):
+    return rendering.render_results(results), rendering.keyboard_markup('RESULTS_MENU', web_apps=True)
+
+def new_product_details(product_name, user_goal):
+    return rendering.product_card(product_name, user_goal), rendering.keyboard_markup('BACK_TO_CATEGORIES')
+
+def new_water_statistics(water_data, today):
+    return rendering.render_water_statistics(water_data, today)
+
+# === ЗАМЕРЫ ===
+def measure(render: Callable, args_list: List[tuple], repeat: int) -> dict:
+    """Время, блоки памяти за ответом и пик временной памяти на один ответ"""
+    for args in args_list:
+        render(*args)  # прогрев кэшей
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for args in args_list:
+            render(*args)
+    calls = repeat * len(args_list)
+    microseconds = (time.perf_counter() - start) / calls * 1e6
+
+    gc.collect()
+    tracemalloc.start()
+    peak = 0
+    for args in args_list:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        render(*args)
+        peak += tracemalloc.get_traced_memory()[1] - current
+    # Ответы держим живыми: остаются блоки, принадлежащие самим ответам
+    before = tracemalloc.take_snapshot()
+    kept = [render(*args) for _ in range(repeat) for args in args_list]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del kept
+    return {'us': microseconds, 'blocks': blocks / calls, 'peak': peak / len(args_list)}
+
+def run_benchmark(repeat: int = REPEAT) -> None:
+    scenarios = [
+        ("План питания + клавиатура", legacy_results, new_results, sample_results()),
+        ("Карточка продукта", legacy_product_details, new_product_details, sample_products()),
+        ("Статистика воды", legacy_water_statistics, new_water_statistics, sample_water()),
+    ]
+    print("🖨️ Бенчмарк отрисовки ответов (на один ответ)\n")
+    print(f"{'Ответ':<28} | {'Было, мкс':>9} | {'Стало, мкс':>10} | {'Блоков было':>11} | "
+          f"{'Блоков стало':>12} | {'Пик было, Б':>11} | {'Пик стало, Б':>12}")
+    print("-" * 112)
+    for title, legacy, new, args_list in scenarios:
+        old_stats = measure(legacy, args_list, repeat)
+        new_stats = measure(new, args_list, repeat)
+        print(f"{title:<28} | {old_stats['us']:>9.1f} | {new_stats['us']:>10.1f} | {old_stats['blocks']:>11.1f} | "
+              f"{new_stats['blocks']:>12.1f} | {old_stats['peak']:>11.0f} | {new_stats['peak']:>12.0f}")
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else REPEAT)
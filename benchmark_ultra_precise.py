@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Микро-бенчмарк калькулятора v5.0: время одного вызова каждого метода
+Использовать: python benchmark_ultra_precise.py [старая_версия.py]
+Чтобы сравнить с прошлой версией, сохраните ее в файл, например:
+    git show HEAD~1:ultra_precise_formulas.py > /tmp/ultra_precise_old.py
+"""
+
+import importlib.util
+import sys
+import timeit
+
+import ultra_precise_formulas
+
+REPEAT = 5
+NUMBER = 20_000
+
+PROFILE = {
+    'gender': 'мужчина', 'weight': 82, 'height': 181, 'age': 34, 'goal': 'Похудение',
+    'training_experience': 'Средний', 'training_days': 4, 'activity_type': 'Силовые',
+    'workout_duration': 60, 'steps': 9000, 'occupation': 'office', 'sleep_quality': 'good',
+    'stress_level': 5, 'intensity': 'high', 'recovery': 'good', 'ethnicity': 'asian',
+    'hormone_status': 'good', 'chronotype': 'moderate_morning', 'thyroid_function': 'normal',
+    'medications': ['metformin'], 'genetic_profile': 'good', 'muscle_quality': 'good'
+}
+
+def load_module(path):
+    """Загрузка другой версии модуля из файла"""
+    spec = importlib.util.spec_from_file_location('ultra_precise_reference', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def build_cases(module):
+    """Вызовы для замера: имя -> функция без аргументов"""
+    calculator = module.UltraPreciseCalculatorV5()
+    return {
+        'get_ultra_precise_lbm_v5': lambda: calculator.get_ultra_precise_lbm_v5(
+            82, 181, 'мужчина', 34, None, 'good', 'good', 'asian', 'good'),
+        'get_ultra_precise_bmr_v5': lambda: calculator.get_ultra_precise_bmr_v5(
+            65.0, 34, 'мужчина', 'temperate', 'healthy', ['metformin'], 36.6, 'normal', 'moderate_morning'),
+        'get_ultra_precise_neat': lambda: calculator.get_ultra_precise_neat(9000, 82, 34, 'мужчина', 'office'),
+        'get_ultra_precise_eat': lambda: calculator.get_ultra_precise_eat(
+            'Силовые', 82, 60, 4, 'Средний', 34, 'high', 'good', 'мужчина'),
+        'get_ultra_precise_tef': lambda: calculator.get_ultra_precise_tef(150, 70, 250, 34, 4),
+        'get_adaptive_tdee': lambda: calculator.get_adaptive_tdee(1700, 350, 300, 200, 0, 5, 'good'),
+        # Полный расчет без user_id: история адаптации не растет
+        'generate_maximum_precision_recommendations': lambda: module.generate_maximum_precision_recommendations(PROFILE),
+    }
+
+def measure(function):
+    """Лучшее время одного вызова, мкс"""
+    return min(timeit.repeat(function, repeat=REPEAT, number=NUMBER)) / NUMBER * 1e6
+
+def run_benchmark(reference_path=None):
+    """Замер текущей версии и (если задана) прошлой"""
+    current = build_cases(ultra_precise_formulas)
+    reference = build_cases(load_module(reference_path)) if reference_path else None
+
+    print("⏱️ Бенчмарк калькулятора v5.0 (мкс на вызов)\n")
+    if reference:
+        print(f"{'Метод':<44} | {'Было':>7} | {'Стало':>7} | {'Ускорение':>9}")
+        print("-" * 76)
+    else:
+        print(f"{'Метод':<44} | {'Время':>7}")
+        print("-" * 54)
+
+    for name, function in current.items():
+        after = measure(function)
+        if reference:
+            before = measure(reference[name])
+            print(f"{name:<44} | {before:>7.2f} | {after:>7.2f} | {before / after:>8.1f}x")
+        else:
+            print(f"{name:<44} | {after:>7.2f}")
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Нагрузочный стенд режима webhook без доступа к Telegram
+Поднимает поддельный Bot API (getMe, sendMessage и т.д.) и WebhookServer,
+затем шлет обновления через несколько keep-alive соединений, как Telegram,
+и замеряет прием (запросов в секунду, задержки ответа) и полную обработку
+(до ответа бота, полученного поддельным API).
+Использовать: python benchmark_webhook.py [обновлений] [соединений] [параллельных_обновлений]
+"""
+
+import sys
+import json
+import time
+import asyncio
+import logging
+from statistics import quantiles
+from urllib.parse import parse_qsl
+
+from telegram import Update
+from telegram.ext import Application, ContextTypes, MessageHandler, filters
+
+from bot_webhook import WebhookServer, read_http_request, serve_webhook, write_http_response
+
+TOKEN = '123456:TEST-TOKEN'
+SECRET = 'benchmark-secret'
+UPDATES = 5000
+CONNECTIONS = 40
+CONCURRENT_UPDATES = 16
+
+class FakeTelegramAPI:
+    """Поддельный Bot API: отвечает на методы бота и считает sendMessage"""
+
+    def __init__(self, expected: int):
+        self.expected = expected
+        self.sent = 0
+        self.done = asyncio.Event()
+        self.port = None
+        self._server = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+
+    def _result(self, method: str, params: dict):
+        if method == 'getMe':
+            return {'id': 123456, 'is_bot': True, 'first_name': 'FitAdventure', 'username': 'fitadventure_test_bot'}
+        if method == 'sendMessage':
+            self.sent += 1
+            if self.sent >= self.expected:
+                self.done.set()
+            return {'message_id': self.sent, 'date': int(time.time()), 'text': params.get('text', ''),
+                    'chat': {'id': int(params.get('chat_id', 0)), 'type': 'private'}}
+        return True
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request = await read_http_request(reader, 10 * 1024 * 1024)
+                if request is None:
+                    break
+                _, path, headers, body = request
+                params = {}
+                if body and headers.get('content-type', '').startswith('application/json'):
+                    params = json.loads(body)
+                elif body:
+                    params = dict(parse_qsl(body.decode()))
+                result = self._result(path.rsplit('/', 1)[-1], params)
+                write_http_response(writer, 200, json.dumps({'ok': True, 'result': result}).encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+def make_update(update_id: int) -> bytes:
+    chat_id = 1000 + update_id % 500
+    return json.dumps({
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id, 'date': int(time.time()), 'text': '🚀 Начать',
+            'chat': {'id': chat_id, 'type': 'private'},
+            'from': {'id': chat_id, 'is_bot': False, 'first_name': 'Load'}
+        }
+    }).encode()
+
+async def post_updates(port: int, path: str, update_ids, latencies: list) -> None:
+    """Отправка обновлений по одному keep-alive соединению"""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    for update_id in update_ids:
+        body = make_update(update_id)
+        started = time.perf_counter()
+        writer.write(
+            f"POST {path} HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+            f"X-Telegram-Bot-Api-Secret-Token: {SECRET}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+        )
+        await writer.drain()
+        response = await read_http_request(reader, 1024)
+        if response is None or response[1] != '200':
+            raise RuntimeError(f"Webhook rejected update {update_id}: {response and response[:2]}")
+        latencies.append(time.perf_counter() - started)
+    writer.close()
+
+async def echo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    await update.message.reply_text("✅")
+
+async def run_benchmark(updates: int, connections: int, concurrent_updates: int) -> None:
+    logging.disable(logging.WARNING)
+    api = FakeTelegramAPI(updates)
+    await api.start()
+
+    application = (Application.builder().token(TOKEN)
+                   .base_url(f"http://127.0.0.1:{api.port}/bot")
+                   .concurrent_updates(concurrent_updates)
+                   .connection_pool_size(concurrent_updates + 4)
+                   .build())
+    application.add_handler(MessageHandler(filters.TEXT, echo))
+    server = WebhookServer(application, listen='127.0.0.1', port=0, secret_token=SECRET,
+                           max_connections=connections)
+    stop_event = asyncio.Event()
+    serving = asyncio.create_task(serve_webhook(application, stop_event, server))
+    while not server.running or not application.running:
+        await asyncio.sleep(0.01)
+
+    latencies = []
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(*(post_updates(server.port, server.url_path, range(index, updates, connections), latencies)
+                               for index in range(connections)))
+        accepted = time.perf_counter() - started
+        await asyncio.wait_for(api.done.wait(), 120)
+        processed = time.perf_counter() - started
+    finally:
+        stop_event.set()
+        await serving
+        await api.stop()
+
+    p50, p99 = (quantiles(latencies, n=100)[index] * 1000 for index in (49, 98))
+    print(f"📨 Обновлений: {updates}, соединений: {connections}, параллельных обновлений: {concurrent_updates}")
+    print(f"⚡ Прием: {updates / accepted:,.0f} обн/с (ответ webhook p50 {p50:.2f} мс, p99 {p99:.2f} мс)")
+    print(f"✅ Обработка с ответом бота: {updates / processed:,.0f} обн/с, отправлено {api.sent}")
+    print(f"📊 Сервер: {server.stats}")
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:4]]
+    defaults = [UPDATES, CONNECTIONS, CONCURRENT_UPDATES]
+    asyncio.run(run_benchmark(*(args + defaults[len(args):])))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Логирование FitAdventure Bot без блокировки цикла событий
+Обработчики бота только кладут записи в очередь (QueueHandler); форматирование
+и запись в файл с ротацией по размеру выполняет отдельный поток QueueListener.
+Частые отладочные строки горячего пути прореживаются (SamplingFilter),
+при переполнении очереди записи отбрасываются, а не ждут диска.
+"""
+
+import queue
+import atexit
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+from config import LoggingConfig
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler с отбрасыванием записей при заполненной очереди
+
+    Как и QueueHandler.prepare, сообщение собирается из msg % args в вызывающем
+    потоке: аргументы бывают изменяемыми (анкета пользователя), и в лог должно
+    попасть их состояние на момент вызова. Отметку времени, уровень и остальной
+    формат добавляет поток QueueListener. Записи ниже уровня логгера не создаются
+    вовсе, поэтому отладочные вызовы горячего пути по-прежнему почти бесплатны.
+    При заполненной очереди запись отбрасывается и учитывается в dropped.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Вызывается после проверки уровня и фильтров - только для записей, которые попадут в лог
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            # Трейсбек нельзя отложить: кадры стека к тому времени изменятся
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class SamplingFilter(logging.Filter):
+    """Пропуск каждой every-й записи уровня не выше level для каждого шаблона сообщения
+
+    Счетчик ведется по (логгер, шаблон msg), поэтому редкие строки того же
+    логгера не теряются из-за частых. Первая запись шаблона проходит всегда.
+    """
+
+    def __init__(self, every: int, level: int = logging.INFO):
+        super().__init__()
+        self.every = max(1, every)
+        self.level = level
+        self._counts: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level or self.every == 1:
+            return True
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % self.every == 0
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+def setup_logging(level: str = None, log_file: str = None, console: bool = True) -> logging.Logger:
+    """Настройка корневого логгера: очередь, файл с ротацией, консоль, прореживание
+
+    Повторный вызов ничего не меняет. Возвращает корневой логгер.
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    if _listener is not None:
+        return root
+
+    formatter = logging.Formatter(LoggingConfig.FORMAT)
+    handlers = [RotatingFileHandler(
+        log_file or LoggingConfig.FILE, maxBytes=LoggingConfig.MAX_BYTES,
+        backupCount=LoggingConfig.BACKUP_COUNT, encoding=LoggingConfig.ENCODING
+    )]
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    _queue_handler = DroppingQueueHandler(queue.Queue(LoggingConfig.QUEUE_SIZE))
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    root.handlers[:] = [_queue_handler]
+    root.setLevel(getattr(logging, level or LoggingConfig.LEVEL))
+    for name, every in LoggingConfig.SAMPLING.items():
+        logging.getLogger(name).addFilter(SamplingFilter(every))
+    atexit.register(stop_logging)
+    return root
+
+def stop_logging() -> None:
+    """Запись оставшихся сообщений и остановка потока логирования"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    logging.getLogger().handlers[:] = []
+    if _queue_handler is not None and _queue_handler.dropped:
+        logging.getLogger(__name__).warning("%d log records dropped: queue was full", _queue_handler.dropped)
+
+def dropped_records() -> int:
+    """Число записей, отброшенных из-за переполнения очереди"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сохранение состояния бота FitAdventure между перезапусками
+SQLitePersistence - реализация BasePersistence поверх SQLite (storage.py):
+состояния ConversationHandler, chat_data, user_data и bot_data.
+Записи копятся в CachedStorage и сбрасываются на диск пакетами по таймеру.
+SurveyStateStore - словарь ответов анкеты по chat_id, который хранит данные
+в chat_data приложения и поэтому сохраняется вместе с ним; брошенные сессии
+вытесняются по времени бездействия и по лимиту числа сессий.
+"""
+
+import json
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from telegram.ext import BasePersistence, PersistenceInput
+
+from config import StorageConfig
+from storage import CachedStorage, SQLiteStorage
+from survey_profile import SurveyProfile
+
+logger = logging.getLogger(__name__)
+
+# Пространства имен таблицы user_data
+USER_DATA_NAMESPACE = 'bot_user_data'
+CHAT_DATA_NAMESPACE = 'bot_chat_data'
+BOT_DATA_NAMESPACE = 'bot_bot_data'
+CALLBACK_DATA_NAMESPACE = 'bot_callback_data'
+CONVERSATIONS_NAMESPACE = 'bot_conversations:{name}'
+SINGLE_KEY = 'data'
+# Метка анкеты SurveyProfile в JSON-записи chat_data
+PROFILE_TAG = '__survey_profile__'
+
+def encode_chat_data(data: Dict[Any, Any]) -> Dict[Any, Any]:
+    """chat_data для записи в JSON: анкеты SurveyProfile - словарями с меткой"""
+    return {key: {PROFILE_TAG: value.to_dict()} if isinstance(value, SurveyProfile) else value
+            for key, value in data.items()}
+
+def decode_chat_data(data: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Обратное преобразование encode_chat_data"""
+    return {key: SurveyProfile.from_dict(value[PROFILE_TAG])
+            if isinstance(value, dict) and PROFILE_TAG in value else value
+            for key, value in data.items()}
+
+class SQLitePersistence(BasePersistence):
+    """Состояние бота в SQLite с пакетной записью
+
+    Приложение передает изменения раз в update_interval секунд; они попадают
+    в кэш CachedStorage и пишутся одной транзакцией на пространство имен
+    по таймеру, при накоплении или при остановке (flush).
+    В режиме shared данные чата и пользователя перед каждым обновлением
+    сверяются с базой и перечитываются, если их изменил другой процесс.
+    """
+
+    def __init__(self, db_file: str = None, update_interval: float = None,
+                 flush_interval: float = None, shared: bool = None,
+                 store_data: Optional[PersistenceInput] = None):
+        super().__init__(
+            store_data=store_data,
+            update_interval=update_interval if update_interval is not None else StorageConfig.PERSISTENCE_UPDATE_INTERVAL
+        )
+        self.backend = SQLiteStorage(db_file or StorageConfig.PERSISTENCE_FILE)
+        self.storage = CachedStorage(self.backend, flush_interval=flush_interval)
+        self.storage.start_auto_flush()
+        self.shared = StorageConfig.PERSISTENCE_SHARED if shared is None else shared
+        # Метка этого процесса в записях: свои записи при shared не перечитываются
+        self.writer = uuid.uuid4().hex
+        # (пространство имен, ключ) -> время последней загрузки или записи
+        self._seen: Dict[Tuple[str, str], float] = {}
+
+    # === СЛУЖЕБНЫЕ ===
+    def _write(self, namespace: str, key, data: Any) -> None:
+        self.storage.set_user(namespace, key, {'writer': self.writer, 'data': data})
+        self._seen[(namespace, str(key))] = time.time()
+
+    def _drop(self, namespace: str, key) -> None:
+        self.storage.delete_user(namespace, key)
+        self._seen.pop((namespace, str(key)), None)
+
+    def _load_all(self, namespace: str) -> Dict[str, Any]:
+        now = time.time()
+        rows = self.storage.load_all(namespace)
+        for key in rows:
+            self._seen[(namespace, key)] = now
+        return {key: row['data'] for key, row in rows.items()}
+
+    def _refresh(self, namespace: str, key, data: Dict[str, Any],
+                 decode: Callable[[Dict[Any, Any]], Dict[Any, Any]] = None) -> None:
+        """Замена данных на версию из базы, если ее записал другой процесс"""
+        if not self.shared:
+            return
+        seen_key = (namespace, str(key))
+        fresh = self.backend.get_user_if_newer(namespace, key, self._seen.get(seen_key, 0.0))
+        if fresh is None:
+            return
+        row, updated_at = fresh
+        self._seen[seen_key] = updated_at
+        if row.get('writer') != self.writer:
+            data.clear()
+            data.update(decode(row['data']) if decode else row['data'])
+
+    # === ДАННЫЕ ПОЛЬЗОВАТЕЛЕЙ И ЧАТОВ ===
+    async def get_user_data(self) -> Dict[int, Dict[Any, Any]]:
+        return {int(key): data for key, data in self._load_all(USER_DATA_NAMESPACE).items()}
+
+    async def get_chat_data(self) -> Dict[int, Dict[Any, Any]]:
+        return {int(key): decode_chat_data(data) for key, data in self._load_all(CHAT_DATA_NAMESPACE).items()}
+
+    async def get_bot_data(self) -> Dict[Any, Any]:
+        return self._load_all(BOT_DATA_NAMESPACE).get(SINGLE_KEY, {})
+
+    async def get_callback_data(self) -> Optional[Tuple[list, Dict[str, str]]]:
+        stored = self._load_all(CALLBACK_DATA_NAMESPACE).get(SINGLE_KEY)
+        if stored is None:
+            return None
+        keyboards, mapping = stored
+        return [tuple(keyboard) for keyboard in keyboards], mapping
+
+    async def update_user_data(self, user_id: int, data: Dict[Any, Any]) -> None:
+        self._write(USER_DATA_NAMESPACE, user_id, data)
+
+    async def update_chat_data(self, chat_id: int, data: Dict[Any, Any]) -> None:
+        self._write(CHAT_DATA_NAMESPACE, chat_id, encode_chat_data(data))
+
+    async def update_bot_data(self, data: Dict[Any, Any]) -> None:
+        self._write(BOT_DATA_NAMESPACE, SINGLE_KEY, data)
+
+    async def update_callback_data(self, data: Tuple[list, Dict[str, str]]) -> None:
+        self._write(CALLBACK_DATA_NAMESPACE, SINGLE_KEY, data)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        self._drop(USER_DATA_NAMESPACE, user_id)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        self._drop(CHAT_DATA_NAMESPACE, chat_id)
+
+    async def refresh_user_data(self, user_id: int, user_data: Dict[Any, Any]) -> None:
+        self._refresh(USER_DATA_NAMESPACE, user_id, user_data)
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: Dict[Any, Any]) -> None:
+        self._refresh(CHAT_DATA_NAMESPACE, chat_id, chat_data, decode_chat_data)
+
+    async def refresh_bot_data(self, bot_data: Dict[Any, Any]) -> None:
+        self._refresh(BOT_DATA_NAMESPACE, SINGLE_KEY, bot_data)
+
+    # === СОСТОЯНИЯ ДИАЛОГОВ ===
+    async def get_conversations(self, name: str) -> Dict[Tuple[Any, ...], object]:
+        rows = self._load_all(CONVERSATIONS_NAMESPACE.format(name=name))
+        return {tuple(json.loads(key)): state for key, state in rows.items()}
+
+    async def update_conversation(self, name: str, key: Tuple[Any, ...], new_state: Optional[object]) -> None:
+        namespace = CONVERSATIONS_NAMESPACE.format(name=name)
+        row_key = json.dumps(list(key))
+        if new_state is None:
+            self._drop(namespace, row_key)
+        else:
+            self._write(namespace, row_key, new_state)
+
+    async def flush(self) -> None:
+        """Запись всех накопленных изменений (вызывается при остановке)"""
+        flushed = self.storage.flush()
+        logger.info(f"Persistence flushed: {flushed} entries")
+
+    def close(self) -> None:
+        """Сброс и закрытие базы"""
+        self.storage.close()
+
+class SurveyStateStore(MutableMapping):
+    """Ответы анкеты по chat_id с вытеснением брошенных сессий
+
+    До bind() данные лежат в обычном словаре; после - в chat_data приложения
+    под ключом 'survey', поэтому сохраняются SQLitePersistence вместе с чатом.
+    Каждое обращение обновляет время последней активности (в chat_data оно
+    сохраняется вместе с ответами); sweep() удаляет сессии старше ttl,
+    а при превышении max_sessions вытесняются самые давние (LRU).
+    """
+
+    KEY = 'survey'
+    TOUCHED_KEY = 'survey_touched'
+
+    def __init__(self, ttl: float = None, max_sessions: int = None,
+                 abandon_after: float = None, clock: Callable[[], float] = time.time):
+        self.ttl = ttl if ttl is not None else StorageConfig.SESSION_TTL
+        self.max_sessions = max_sessions or StorageConfig.SESSION_MAX
+        self.abandon_after = abandon_after if abandon_after is not None else StorageConfig.SESSION_ABANDON_AFTER
+        self._clock = clock
+        self._local: Dict[int, Dict[str, Any]] = {}
+        self._application = None
+        self._chat_data = None
+        # chat_id -> время последней активности, от давних к свежим
+        self._touched: "OrderedDict[int, float]" = OrderedDict()
+        # Очистка при записи, если нет фоновой задачи (см. schedule_session_sweeper)
+        self.sweep_on_write_interval: Optional[float] = None
+        self._started = clock()
+        self._last_sweep = self._started
+        self.metrics = {'sweeps': 0, 'expired': 0, 'evicted_lru': 0, 'last_sweep_expired': 0}
+
+    def bind(self, application) -> None:
+        """Перенос ответов в chat_data приложения"""
+        self._application = application
+        self._chat_data = application.chat_data
+        for chat_id, answers in self._local.items():
+            self._chat_data[chat_id][self.KEY] = answers
+            self._chat_data[chat_id][self.TOUCHED_KEY] = self._touched.get(chat_id, self._clock())
+        self._local.clear()
+        self.reload_sessions()
+
+    def reload_sessions(self) -> None:
+        """Порядок LRU по сохраненным временам (после загрузки из persistence)"""
+        if self._chat_data is None:
+            return
+        now = self._clock()
+        sessions = [(chat_data.get(self.TOUCHED_KEY, now), chat_id)
+                    for chat_id, chat_data in self._chat_data.items() if self.KEY in chat_data]
+        self._touched = OrderedDict((chat_id, touched) for touched, chat_id in sorted(sessions))
+
+    def _touch(self, chat_id) -> None:
+        now = self._clock()
+        self._touched[chat_id] = now
+        self._touched.move_to_end(chat_id)
+        if self._chat_data is not None:
+            self._chat_data[chat_id][self.TOUCHED_KEY] = now
+
+    def __getitem__(self, chat_id) -> Dict[str, Any]:
+        if self._chat_data is None:
+            answers = self._local[chat_id]
+        else:
+            chat_data = self._chat_data.get(chat_id)
+            if chat_data is None or self.KEY not in chat_data:
+                raise KeyError(chat_id)
+            answers = chat_data[self.KEY]
+        self._touch(chat_id)
+        return answers
+
+    def __setitem__(self, chat_id, answers: Dict[str, Any]) -> None:
+        if self._chat_data is None:
+            self._local[chat_id] = answers
+        else:
+            # chat_data приложения - defaultdict: запись чата создается при обращении
+            self._chat_data[chat_id][self.KEY] = answers
+        self._touch(chat_id)
+
+        while len(self._touched) > self.max_sessions:
+            oldest = next(iter(self._touched))
+            self._evict(oldest)
+            self.metrics['evicted_lru'] += 1
+
+        if (self.sweep_on_write_interval is not None and
+                self._clock() - self._last_sweep >= self.sweep_on_write_interval):
+            self.sweep()
+
+    def __delitem__(self, chat_id) -> None:
+        if chat_id not in self:
+            raise KeyError(chat_id)
+        self._evict(chat_id)
+
+    def __contains__(self, chat_id) -> bool:
+        if self._chat_data is None:
+            return chat_id in self._local
+        chat_data = self._chat_data.get(chat_id)
+        return chat_data is not None and self.KEY in chat_data
+
+    def __iter__(self):
+        return iter(list(self._touched))
+
+    def __len__(self) -> int:
+        return len(self._touched)
+
+    # === ВЫТЕСНЕНИЕ ===
+    def _evict(self, chat_id) -> None:
+        """Удаление сессии из памяти и (через persistence) из базы"""
+        self._touched.pop(chat_id, None)
+        if self._chat_data is None:
+            self._local.pop(chat_id, None)
+            return
+        chat_data = self._chat_data.get(chat_id)
+        if chat_data is None:
+            return
+        chat_data.pop(self.KEY, None)
+        chat_data.pop(self.TOUCHED_KEY, None)
+        if not chat_data:
+            self._application.drop_chat_data(chat_id)
+        else:
+            self._application.mark_data_for_update_persistence(chat_ids=chat_id)
+
+    def sweep(self) -> int:
+        """Удаление сессий без активности дольше ttl. Возвращает число удаленных"""
+        now = self._clock()
+        expired = []
+        for chat_id, touched in self._touched.items():
+            if now - touched < self.ttl:
+                break  # дальше только более свежие сессии
+            expired.append(chat_id)
+        for chat_id in expired:
+            self._evict(chat_id)
+
+        self._last_sweep = now
+        self.metrics['sweeps'] += 1
+        self.metrics['expired'] += len(expired)
+        self.metrics['last_sweep_expired'] = len(expired)
+        if expired:
+            logger.info(f"Session sweep: {len(expired)} expired, {len(self._touched)} active")
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Метрики сессий: активные, брошенные, скорость вытеснения"""
+        now = self._clock()
+        abandoned = 0
+        for touched in self._touched.values():
+            if now - touched < self.abandon_after:
+                break
+            abandoned += 1
+        hours = max(now - self._started, 1.0) / 3600
+        evicted = self.metrics['expired'] + self.metrics['evicted_lru']
+        return {
+            'sessions': len(self._touched),
+            'max_sessions': self.max_sessions,
+            'abandoned_sessions': abandoned,
+            **self.metrics,
+            'evictions_per_hour': round(evicted / hours, 2),
+        }
+
+def schedule_session_sweeper(application, store: SurveyStateStore, interval: float = None) -> bool:
+    """Периодическая очистка брошенных сессий через JobQueue приложения
+
+    Без JobQueue (нет пакета python-telegram-bot[job-queue]) очистка
+    выполняется при записи новых сессий не чаще раза в interval секунд.
+    """
+    interval = interval or StorageConfig.SESSION_SWEEP_INTERVAL
+
+    async def sweep_sessions(context) -> None:
+        store.sweep()
+
+    if application.job_queue is None:
+        logger.warning("JobQueue is not available, sessions are swept on write")
+        store.sweep_on_write_interval = interval
+        return False
+
+    application.job_queue.run_repeating(sweep_sessions, interval=interval, first=interval, name='session-sweeper')
+    return True
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Запуск FitAdventure Bot: long polling или webhook
+WebhookServer - минимальный асинхронный HTTP-сервер (asyncio, без внешних
+зависимостей), принимающий обновления от Telegram: проверка секретного токена
+X-Telegram-Bot-Api-Secret-Token, ограничение числа одновременных соединений
+и размера запроса. При остановке сервер перестает принимать запросы,
+дожидается уже принятых и дает приложению обработать очередь обновлений.
+Режим выбирается в WebhookConfig.MODE (переменная FITADVENTURE_RUN_MODE).
+"""
+
+import hmac
+import json
+import signal
+import asyncio
+import logging
+import secrets
+from typing import Dict, Optional, Tuple
+
+from telegram import Update
+from telegram.ext import Application
+
+from config import WebhookConfig
+
+logger = logging.getLogger(__name__)
+
+SECRET_HEADER = 'x-telegram-bot-api-secret-token'
+REASONS = {
+    200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+    411: 'Length Required', 413: 'Payload Too Large', 503: 'Service Unavailable'
+}
+
+# === HTTP ===
+async def read_http_request(reader: asyncio.StreamReader,
+                            max_body_size: int) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Чтение одного запроса: (метод, путь, заголовки, тело); None - соединение закрыто
+
+    Тело больше max_body_size не читается: вместо него возвращается b''
+    и служебный заголовок ':too-large' (соединение после ответа закрывается).
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    lines = head.decode('latin-1').split('\r\n')
+    method, path, _ = (lines[0].split(' ') + ['', ''])[:3]
+    headers = {}
+    for line in lines[1:]:
+        name, separator, value = line.partition(':')
+        if separator:
+            headers[name.strip().lower()] = value.strip()
+
+    length = headers.get('content-length')
+    if length is None or not length.isdigit():
+        return method, path, headers, b''
+    if int(length) > max_body_size:
+        headers[':too-large'] = '1'
+        return method, path, headers, b''
+    try:
+        body = await reader.readexactly(int(length))
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    return method, path, headers, body
+
+def write_http_response(writer: asyncio.StreamWriter, status: int, body: bytes = b'',
+                        content_type: str = 'application/json', keep_alive: bool = True) -> None:
+    """Запись ответа (Content-Length всегда задан, чтобы работал keep-alive)"""
+    writer.write(
+        f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + body
+    )
+
+# === СЕРВЕР ОБНОВЛЕНИЙ ===
+class WebhookServer:
+    """Прием обновлений Telegram и передача их в application.update_queue"""
+
+    def __init__(self, application: Application, listen: str = None, port: int = None,
+                 url_path: str = None, secret_token: str = None, max_connections: int = None,
+                 max_body_size: int = None):
+        self.application = application
+        self.listen = listen or WebhookConfig.LISTEN
+        self.port = WebhookConfig.PORT if port is None else port
+        self.url_path = '/' + (url_path or WebhookConfig.URL_PATH).lstrip('/')
+        self.secret_token = secret_token if secret_token is not None else WebhookConfig.SECRET_TOKEN
+        self.max_connections = max_connections or WebhookConfig.MAX_CONNECTIONS
+        self.max_body_size = max_body_size or WebhookConfig.MAX_BODY_SIZE
+        self.stats = {'accepted': 0, 'rejected': 0, 'connections': 0}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._writers = set()
+        self._in_flight = 0
+        self._idle: Optional[asyncio.Event] = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    async def start(self) -> None:
+        self._slots = asyncio.Semaphore(self.max_connections)
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._server = await asyncio.start_server(self._handle_connection, self.listen, self.port)
+        # При port=0 система выбирает свободный порт
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Webhook server listening on {self.listen}:{self.port}{self.url_path}")
+
+    async def stop(self, timeout: float = None) -> None:
+        """Остановка приема: новые соединения не принимаются, принятые запросы дорабатываются"""
+        if self._server is None:
+            return
+        self._closing = True
+        self._server.close()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout or WebhookConfig.DRAIN_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.warning(f"Webhook server stopped with {self._in_flight} requests in flight")
+        for writer in list(self._writers):
+            writer.close()
+        self._server = None
+        logger.info(f"Webhook server stopped: {self.stats}")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        async with self._slots:
+            self.stats['connections'] += 1
+            self._writers.add(writer)
+            try:
+                while not self._closing:
+                    request = await read_http_request(reader, self.max_body_size)
+                    if request is None:
+                        break
+                    self._in_flight += 1
+                    self._idle.clear()
+                    try:
+                        status = await self._handle_request(*request)
+                        headers = request[2]
+                        keep_alive = (not self._closing and ':too-large' not in headers
+                                      and headers.get('connection', '').lower() != 'close')
+                        write_http_response(writer, status, keep_alive=keep_alive)
+                        await writer.drain()
+                    finally:
+                        self._in_flight -= 1
+                        if not self._in_flight:
+                            self._idle.set()
+                    if not keep_alive:
+                        break
+            except ConnectionError:
+                pass
+            finally:
+                self._writers.discard(writer)
+                writer.close()
+
+    async def _handle_request(self, method: str, path: str, headers: Dict[str, str], body: bytes) -> int:
+        status = self._check_request(method, path, headers)
+        if status == 200:
+            try:
+                update = Update.de_json(json.loads(body), self.application.bot)
+            except (ValueError, TypeError, KeyError) as error:
+                logger.warning(f"Webhook: invalid update payload: {error}")
+                status = 400
+            else:
+                await self.application.update_queue.put(update)
+                self.stats['accepted'] += 1
+                return 200
+        self.stats['rejected'] += 1
+        return status
+
+    def _check_request(self, method: str, path: str, headers: Dict[str, str]) -> int:
+        if self._closing:
+            return 503
+        if path.split('?', 1)[0] != self.url_path:
+            return 404
+        if method != 'POST':
+            return 405
+        if self.secret_token and not hmac.compare_digest(
+                headers.get(SECRET_HEADER, '').encode(), self.secret_token.encode()):
+            return 403
+        if ':too-large' in headers:
+            return 413
+        if 'content-length' not in headers:
+            return 411
+        return 200
+
+# === ЗАПУСК ===
+async def drain_updates(application: Application, timeout: float = None) -> int:
+    """Ожидание обработки очереди обновлений; по истечении timeout остаток отбрасывается"""
+    queue = application.update_queue
+    try:
+        await asyncio.wait_for(queue.join(), timeout or WebhookConfig.DRAIN_TIMEOUT)
+        return 0
+    except asyncio.TimeoutError:
+        dropped = 0
+        while not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+            dropped += 1
+        logger.warning(f"Drain timeout: {dropped} pending updates dropped")
+        return dropped
+
+async def serve_webhook(application: Application, stop_event: asyncio.Event = None,
+                        server: WebhookServer = None) -> WebhookServer:
+    """Полный цикл работы в режиме webhook (аналог Application.run_webhook)
+
+    Останавливается по SIGINT/SIGTERM или по stop_event.
+    """
+    server = server or WebhookServer(application)
+    if not server.secret_token:
+        # Без общего токена несколько процессов за балансировщиком не согласуют его между собой
+        server.secret_token = secrets.token_urlsafe(32)
+        logger.warning("FITADVENTURE_WEBHOOK_SECRET is not set, using a random secret token")
+
+    stop_event = stop_event or asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop_event.set)
+        except (NotImplementedError, RuntimeError):
+            pass  # Windows или не главный поток: остановка только через stop_event
+
+    # Остановка и закрытие - только для тех частей, что успели запуститься
+    initialized = started = False
+    try:
+        await application.initialize()
+        initialized = True
+        if application.post_init:
+            await application.post_init(application)
+        await server.start()
+        if WebhookConfig.URL:
+            await application.bot.set_webhook(
+                url=WebhookConfig.URL.rstrip('/') + server.url_path,
+                secret_token=server.secret_token,
+                max_connections=server.max_connections,
+                drop_pending_updates=WebhookConfig.DROP_PENDING_UPDATES,
+                allowed_updates=Update.ALL_TYPES,
+            )
+            logger.info(f"Webhook registered at {WebhookConfig.URL}")
+        await application.start()
+        started = True
+
+        await stop_event.wait()
+    finally:
+        logger.info("Stopping webhook mode: draining requests and pending updates")
+        await server.stop()  # без start() ничего не делает
+        if started:
+            await drain_updates(application)
+            await application.stop()
+            if application.post_stop:
+                await application.post_stop(application)
+        if initialized:
+            await application.shutdown()
+            if application.post_shutdown:
+                await application.post_shutdown(application)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.remove_signal_handler(signum)
+            except (NotImplementedError, RuntimeError):
+                pass
+    return server
+
+def run_application(application: Application, mode: str = None) -> None:
+    """Запуск бота в режиме из WebhookConfig.MODE ('polling' или 'webhook')"""
+    mode = mode or WebhookConfig.MODE
+    if mode == 'webhook':
+        print(f"🌐 Режим webhook: {WebhookConfig.LISTEN}:{WebhookConfig.PORT}{WebhookConfig.URL_PATH}")
+        asyncio.run(serve_webhook(application))
+    elif mode == 'polling':
+        application.run_polling()
+    else:
+        raise ValueError(f"Неизвестный режим запуска: {mode}")
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Рассылка сообщений подписчикам FitAdventure Bot
+Отправка идет пулом из нескольких задач через общую корзину токенов
+(не быстрее лимита Telegram); RetryAfter приостанавливает всю рассылку
+на указанное время, прогресс периодически сохраняется в хранилище,
+поэтому прерванную рассылку можно продолжить с места остановки.
+"""
+
+import time
+import uuid
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TelegramError
+
+from config import BroadcastConfig
+from storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """Ограничитель частоты: rate токенов в секунду, не больше burst подряд"""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate и burst должны быть положительными")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self.updated = clock()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float) -> None:
+        """Пауза после RetryAfter: токены обнуляются и копятся заново после паузы"""
+        self.paused_until = max(self.paused_until, self._clock() + seconds)
+        self.tokens = 0.0
+        self.updated = self.paused_until
+
+    async def acquire(self) -> None:
+        """Ожидание свободного токена"""
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self.paused_until:
+                    await self._sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await self._sleep((1 - self.tokens) / self.rate)
+
+class BroadcastJob:
+    """Состояние одной рассылки (сохраняется в хранилище как контрольная точка)"""
+
+    __slots__ = ('job_id', 'text', 'parse_mode', 'admin_chat_id', 'recipients', 'done',
+                 'sent', 'failed', 'blocked', 'retries', 'status', 'started_at', 'updated_at')
+
+    def __init__(self, text: str, recipients: Iterable[int], admin_chat_id: Optional[int] = None,
+                 parse_mode: Optional[str] = None, job_id: str = None):
+        self.job_id = job_id or uuid.uuid4().hex[:12]
+        self.text = text
+        self.parse_mode = parse_mode
+        self.admin_chat_id = admin_chat_id
+        self.recipients = list(recipients)
+        self.done = set()
+        self.sent = 0
+        self.failed = 0
+        self.blocked = []
+        self.retries = 0
+        self.status = 'running'
+        self.started_at = time.time()
+        self.updated_at = self.started_at
+
+    @property
+    def total(self) -> int:
+        return len(self.recipients)
+
+    @property
+    def processed(self) -> int:
+        return len(self.done)
+
+    def pending(self) -> List[int]:
+        """Получатели, которым сообщение еще не отправлялось"""
+        return [chat_id for chat_id in self.recipients if chat_id not in self.done]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'text': self.text, 'parse_mode': self.parse_mode, 'admin_chat_id': self.admin_chat_id,
+            'recipients': self.recipients, 'done': sorted(self.done), 'sent': self.sent,
+            'failed': self.failed, 'blocked': self.blocked, 'retries': self.retries,
+            'status': self.status, 'started_at': self.started_at, 'updated_at': self.updated_at
+        }
+
+    @classmethod
+    def from_dict(cls, job_id: str, data: Dict[str, Any]) -> 'BroadcastJob':
+        job = cls(data['text'], data['recipients'], data.get('admin_chat_id'), data.get('parse_mode'), job_id)
+        job.done = set(data.get('done', []))
+        job.sent = data.get('sent', 0)
+        job.failed = data.get('failed', 0)
+        job.blocked = data.get('blocked', [])
+        job.retries = data.get('retries', 0)
+        job.status = data.get('status', 'running')
+        job.started_at = data.get('started_at', job.started_at)
+        job.updated_at = data.get('updated_at', job.updated_at)
+        return job
+
+def format_progress(job: BroadcastJob) -> str:
+    """Текст прогресса рассылки для администратора"""
+    percent = job.processed * 100 // job.total if job.total else 100
+    title = "📢 **Рассылка завершена!**" if job.status == 'done' else "📤 **Идет рассылка...**"
+    return (
+        f"{title}\n\n"
+        f"📊 Прогресс: {job.processed}/{job.total} ({percent}%)\n"
+        f"✅ Успешно отправлено: {job.sent}\n"
+        f"❌ Ошибок: {job.failed}\n"
+        f"🚫 Заблокировали бота: {len(job.blocked)}\n"
+        f"🔁 Повторов: {job.retries}\n"
+        f"🆔 `{job.job_id}`"
+    )
+
+class Broadcaster:
+    """Отправка рассылок с ограничением частоты и контрольными точками"""
+
+    def __init__(self, storage=None, rate: float = None, burst: int = None, concurrency: int = None,
+                 max_retries: int = None, checkpoint_every: int = None, progress_interval: float = None,
+                 namespace: str = None, bucket: TokenBucket = None):
+        self._storage = storage
+        self.rate = rate or BroadcastConfig.RATE
+        self.burst = burst or BroadcastConfig.BURST
+        self.concurrency = concurrency or BroadcastConfig.CONCURRENCY
+        self.max_retries = BroadcastConfig.MAX_RETRIES if max_retries is None else max_retries
+        self.checkpoint_every = checkpoint_every or BroadcastConfig.CHECKPOINT_EVERY
+        self.progress_interval = progress_interval or BroadcastConfig.PROGRESS_INTERVAL
+        self.namespace = namespace or BroadcastConfig.NAMESPACE
+        self._bucket = bucket
+        self.active = set()  # идентификаторы рассылок, идущих в этом процессе
+
+    @property
+    def storage(self):
+        """Хранилище контрольных точек (глобальное, если не задано)"""
+        if self._storage is None:
+            self._storage = get_storage()
+        return self._storage
+
+    @property
+    def bucket(self) -> TokenBucket:
+        # Создается в цикле событий, в котором идет рассылка
+        if self._bucket is None:
+            self._bucket = TokenBucket(self.rate, self.burst)
+        return self._bucket
+
+    # === КОНТРОЛЬНЫЕ ТОЧКИ ===
+    def create_job(self, text: str, recipients: Iterable[int], admin_chat_id: Optional[int] = None,
+                   parse_mode: Optional[str] = None) -> BroadcastJob:
+        """Новая рассылка (сразу сохраняется, чтобы ее можно было продолжить)"""
+        job = BroadcastJob(text, recipients, admin_chat_id, parse_mode)
+        self.save(job)
+        return job
+
+    def save(self, job: BroadcastJob) -> None:
+        job.updated_at = time.time()
+        self.storage.set_user(self.namespace, job.job_id, job.to_dict())
+
+    def _checkpoint(self, job: BroadcastJob) -> None:
+        """Сохранение прогресса во время рассылки: ошибка хранилища ее не останавливает"""
+        try:
+            self.save(job)
+        except Exception as error:
+            logger.error(f"Broadcast {job.job_id}: checkpoint not saved: {error}")
+
+    def load(self, job_id: str) -> Optional[BroadcastJob]:
+        data = self.storage.get_user(self.namespace, job_id)
+        return BroadcastJob.from_dict(job_id, data) if data else None
+
+    def unfinished(self) -> List[BroadcastJob]:
+        """Прерванные рассылки, от старых к новым"""
+        jobs = [BroadcastJob.from_dict(job_id, data)
+                for job_id, data in self.storage.load_all(self.namespace).items()
+                if data.get('status') != 'done' and job_id not in self.active]
+        return sorted(jobs, key=lambda job: job.started_at)
+
+    # === ОТПРАВКА ===
+    async def run(self, bot, job: BroadcastJob,
+                  on_progress: Callable[[BroadcastJob], Awaitable[Any]] = None) -> BroadcastJob:
+        """Отправка всем еще не обработанным получателям рассылки"""
+        queue: asyncio.Queue = asyncio.Queue()
+        for chat_id in job.pending():
+            queue.put_nowait((chat_id, 0))
+        logger.info(f"Broadcast {job.job_id}: {queue.qsize()} of {job.total} recipients pending")
+
+        job.status = 'running'
+        self.active.add(job.job_id)
+        checkpoint = {'since': 0}
+        workers = [asyncio.create_task(self._worker(bot, job, queue, checkpoint))
+                   for _ in range(min(self.concurrency, queue.qsize()))]
+        reporter = asyncio.create_task(self._report(job, on_progress)) if on_progress else None
+        joined = asyncio.create_task(queue.join())
+        try:
+            # Задачи-отправители завершаются только с ошибкой: без них queue.join() ждал бы вечно
+            await asyncio.wait([joined, *workers], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            finished = joined.done()
+            tasks = [joined, *workers, *([reporter] if reporter else [])]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if finished:
+                job.status = 'done'
+            self._checkpoint(job)
+            self.active.discard(job.job_id)
+
+        for task in workers:
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Broadcast {job.job_id} stopped, {job.total - job.processed} recipients left")
+                raise task.exception()
+
+        if on_progress:
+            await self._notify(job, on_progress)
+        logger.info(f"Broadcast {job.job_id} finished: sent={job.sent} failed={job.failed} "
+                    f"blocked={len(job.blocked)} retries={job.retries}")
+        return job
+
+    async def _worker(self, bot, job: BroadcastJob, queue: asyncio.Queue, checkpoint: Dict[str, int]) -> None:
+        while True:
+            chat_id, attempt = await queue.get()
+            try:
+                await self.bucket.acquire()
+                try:
+                    await bot.send_message(chat_id=chat_id, text=job.text, parse_mode=job.parse_mode)
+                except RetryAfter as error:
+                    delay = _seconds(error.retry_after)
+                    logger.warning(f"Broadcast {job.job_id}: flood limit, pausing for {delay}s")
+                    self.bucket.pause(delay)
+                    self._retry_or_fail(job, queue, chat_id, attempt, checkpoint, error)
+                except Forbidden as error:
+                    # Бот заблокирован или чат удален - повторять бессмысленно
+                    job.blocked.append(chat_id)
+                    self._finish(job, chat_id, False, checkpoint, error)
+                except BadRequest as error:
+                    self._finish(job, chat_id, False, checkpoint, error)
+                except NetworkError as error:
+                    self._retry_or_fail(job, queue, chat_id, attempt, checkpoint, error)
+                except TelegramError as error:
+                    self._finish(job, chat_id, False, checkpoint, error)
+                except Exception as error:
+                    # Непредвиденная ошибка одного получателя не останавливает отправителя
+                    self._finish(job, chat_id, False, checkpoint, error)
+                else:
+                    self._finish(job, chat_id, True, checkpoint)
+            finally:
+                queue.task_done()
+
+    def _retry_or_fail(self, job: BroadcastJob, queue: asyncio.Queue, chat_id: int, attempt: int,
+                       checkpoint: Dict[str, int], error: Exception) -> None:
+        if attempt < self.max_retries:
+            job.retries += 1
+            queue.put_nowait((chat_id, attempt + 1))
+        else:
+            self._finish(job, chat_id, False, checkpoint, error)
+
+    def _finish(self, job: BroadcastJob, chat_id: int, success: bool,
+                checkpoint: Dict[str, int], error: Exception = None) -> None:
+        job.done.add(chat_id)
+        if success:
+            job.sent += 1
+        else:
+            job.failed += 1
+            logger.error(f"Failed to send broadcast to {chat_id}: {error}")
+        checkpoint['since'] += 1
+        if checkpoint['since'] >= self.checkpoint_every:
+            checkpoint['since'] = 0
+            self._checkpoint(job)
+
+    async def _report(self, job: BroadcastJob, on_progress) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await self._notify(job, on_progress)
+
+    @staticmethod
+    async def _notify(job: BroadcastJob, on_progress) -> None:
+        try:
+            await on_progress(job)
+        except TelegramError as error:
+            # Например, "message is not modified" - прогресс не изменился
+            logger.debug(f"Broadcast progress update skipped: {error}")
+
+def _seconds(retry_after) -> float:
+    """retry_after из RetryAfter в секундах (int или timedelta)"""
+    total_seconds = getattr(retry_after, 'total_seconds', None)
+    return float(total_seconds() if total_seconds else retry_after)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Сборка статических данных веб-приложения базы продуктов
+Создает версионированные файлы products.<hash>.json и meal_templates.<hash>.js
+рядом с webapp_products_github.html и прописывает их имена в HTML.
+База страницы - webapp_products_data.json (прежний встроенный в HTML объект),
+а не products_database.py бота: у веб-приложения свой набор продуктов.
+Использовать: python build_webapp_assets.py (после изменения базы или шаблонов)
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict
+
+BASE_DIR = Path(__file__).resolve().parent
+
+# HTML-страницы, которым нужны файлы данных (файлы кладутся в тот же каталог)
+HTML_TARGETS = [
+    BASE_DIR / 'webapp_products_github.html',
+    BASE_DIR / 'webapp' / 'webapp_products_github.html',
+]
+PRODUCTS_SOURCE = BASE_DIR / 'webapp_products_data.json'
+MEAL_TEMPLATES_SOURCE = BASE_DIR / 'meal_templates.js'
+
+HASH_LENGTH = 12
+ASSET_PATTERN = re.compile(r'^(products\.[0-9a-f]{%d}\.json|meal_templates\.[0-9a-f]{%d}\.js)$' % (HASH_LENGTH, HASH_LENGTH))
+MANIFEST_PATTERN = re.compile(r'(// ASSETS:BEGIN\n)(.*?)(\n\s*// ASSETS:END)', re.S)
+
+def content_hash(content: bytes) -> str:
+    """Короткий хэш содержимого для имени файла"""
+    return hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+
+def build_products_bundle(source: Path = PRODUCTS_SOURCE) -> bytes:
+    """Компактная база веб-приложения: {категория: {цель: {название: данные}}}"""
+    database = json.loads(source.read_text(encoding='utf-8'))
+    return json.dumps(database, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def build_assets() -> Dict[str, bytes]:
+    """Имена и содержимое версионированных файлов"""
+    products = build_products_bundle()
+    meal_templates = MEAL_TEMPLATES_SOURCE.read_bytes()
+    return {
+        f"products.{content_hash(products)}.json": products,
+        f"meal_templates.{content_hash(meal_templates)}.js": meal_templates,
+    }
+
+def render_manifest(assets: Dict[str, bytes], indent: str) -> str:
+    """JS-объект с именами файлов для HTML"""
+    manifest = {name.split('.', 1)[0]: name for name in assets}
+    return f"{indent}const ASSETS = {json.dumps(manifest, ensure_ascii=False)};"
+
+def write_assets(html_file: Path, assets: Dict[str, bytes]) -> None:
+    """Запись файлов рядом с HTML, удаление устаревших версий, обновление манифеста"""
+    target_dir = html_file.parent
+    for name, content in assets.items():
+        path = target_dir / name
+        if not path.exists():
+            temp_path = path.with_suffix(path.suffix + '.tmp')
+            temp_path.write_bytes(content)
+            os.replace(temp_path, path)
+
+    for path in target_dir.iterdir():
+        if ASSET_PATTERN.match(path.name) and path.name not in assets:
+            path.unlink()
+
+    html = html_file.read_text(encoding='utf-8')
+    match = MANIFEST_PATTERN.search(html)
+    if not match:
+        raise RuntimeError(f"В {html_file} нет блока // ASSETS:BEGIN ... // ASSETS:END")
+    indent = re.match(r'\s*', match.group(2)).group(0)
+    updated = html[:match.start(2)] + render_manifest(assets, indent) + html[match.end(2):]
+    if updated != html:
+        html_file.write_text(updated, encoding='utf-8')
+
+def main():
+    """Сборка для всех HTML-страниц"""
+    assets = build_assets()
+    for html_file in HTML_TARGETS:
+        if not html_file.exists():
+            continue
+        write_assets(html_file, assets)
+        print(f"✅ {html_file.relative_to(BASE_DIR)}")
+
+    for name, content in assets.items():
+        print(f"📦 {name}: {len(content) / 1024:.1f} КБ")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Маршрутизация нажатий на кнопки FitAdventure Bot
+Таблица (состояние, нормализованный текст кнопки) -> обработчик строится
+один раз из раскладок config.Keyboards: кнопку, которой нет на клавиатуре,
+нельзя привязать к обработчику, поэтому клавиатуры и маршруты не расходятся.
+Выбор обработчика - один поиск в словаре вместо цепочек Regex и if/elif.
+"""
+
+import unicodedata
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from telegram import Update
+from telegram.ext import ContextTypes, MessageHandler, filters
+
+# Маршрут для любого состояния (используется, если нет маршрута для конкретного)
+ANY_STATE = '*'
+
+Handler = Callable[[Update, ContextTypes.DEFAULT_TYPE], Any]
+
+def normalize_button(text: str) -> str:
+    """Текст кнопки для сравнения: без селекторов эмодзи, лишних пробелов и регистра"""
+    text = unicodedata.normalize('NFC', text).replace('\ufe0f', '')
+    return ' '.join(text.split()).casefold()
+
+def keyboard_buttons(keyboard: Sequence[Sequence[Any]]) -> Tuple[str, ...]:
+    """Тексты всех кнопок раскладки (строки или KeyboardButton)"""
+    return tuple(getattr(button, 'text', button) for row in keyboard for button in row)
+
+class ButtonRouter:
+    """Таблица маршрутов кнопок: (состояние, нормализованный текст) -> обработчик"""
+
+    def __init__(self, name: str = 'buttons'):
+        self.name = name
+        self._routes: Dict[Tuple[Any, str], Handler] = {}
+
+    def add(self, keyboard: Sequence[Sequence[Any]], handlers: Dict[str, Handler],
+            states: Iterable[Any] = (ANY_STATE,), aliases: Dict[str, str] = None) -> 'ButtonRouter':
+        """Привязка кнопок раскладки к обработчикам в состояниях states
+
+        aliases - дополнительные тексты (например, набранные вручную) для кнопок.
+        Более поздний маршрут для той же пары (состояние, кнопка) заменяет прежний.
+        """
+        buttons = {normalize_button(button) for button in keyboard_buttons(keyboard)}
+        keys = {}
+        for text, handler in handlers.items():
+            key = normalize_button(text)
+            if key not in buttons:
+                raise ValueError(f"{self.name}: кнопки {text!r} нет на клавиатуре {keyboard_buttons(keyboard)}")
+            keys[key] = handler
+        for alias, text in (aliases or {}).items():
+            keys[normalize_button(alias)] = keys[normalize_button(text)]
+
+        states = tuple(states)
+        for state in states:
+            for key, handler in keys.items():
+                self._routes[(state, key)] = handler
+        return self
+
+    def resolve(self, state: Any, text: Optional[str]) -> Optional[Handler]:
+        """Обработчик кнопки в состоянии state (None - это не кнопка)"""
+        if not text:
+            return None
+        key = normalize_button(text)
+        return self._routes.get((state, key)) or self._routes.get((ANY_STATE, key))
+
+    def buttons(self, state: Any = ANY_STATE) -> Tuple[str, ...]:
+        """Нормализованные тексты кнопок, доступных в состоянии"""
+        return tuple(sorted({key for route_state, key in self._routes if route_state in (state, ANY_STATE)}))
+
+    async def dispatch(self, update: Update, context: ContextTypes.DEFAULT_TYPE,
+                       state: Any = ANY_STATE, default: Handler = None):
+        """Вызов обработчика нажатой кнопки; не кнопка - default (или None)"""
+        handler = self.resolve(state, update.message.text) or default
+        if handler is None:
+            return None
+        return await handler(update, context)
+
+    def handler(self, state: Any, default: Handler = None) -> MessageHandler:
+        """MessageHandler состояния ConversationHandler
+
+        Без default срабатывает только на кнопки состояния, остальной текст
+        достается следующим обработчикам списка; с default - на любой текст.
+        """
+        async def callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            return await self.dispatch(update, context, state, default)
+
+        callback.__qualname__ = f"{self.name}[{state}]"
+        message_filter = filters.TEXT & ~filters.COMMAND if default else ButtonFilter(self, state)
+        return MessageHandler(message_filter, callback)
+
+class ButtonFilter(filters.MessageFilter):
+    """Фильтр сообщений: текст - кнопка состояния state"""
+
+    __slots__ = ('router', 'state')
+
+    def __init__(self, router: ButtonRouter, state: Any):
+        super().__init__(name=f"ButtonFilter({router.name}[{state}])")
+        self.router = router
+        self.state = state
+
+    def filter(self, message) -> bool:
+        return self.router.resolve(self.state, message.text) is not None
@@ -6,239 +6,211 @@
 """
 
 import logging
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, List, Sequence, Union
 from config import CalculationConstants
+from bounded_cache import BoundedCache
+import nutrition_engine
+import metrics
+from nutrition_engine import FACTORS, FAT_CATEGORY_LABELS, FAT_CATEGORY_BOUNDS
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Поля данных пользователя, от которых зависит результат расчета (порядок ключа кэша)
+CACHE_KEY_FIELDS = (
+    'weight', 'height', 'age', 'gender', 'steps',
+    'occupation', 'recovery', 'sleep_quality', 'stress_level', 'goal',
+    'has_training_experience', 'training_days', 'activity_type',
+    'intensity', 'workout_duration', 'fat_percent'
+)
+_NUMBER_TYPES = (int, float)
+
+BatchInput = Union[Sequence[Dict[str, Any]], Dict[str, Sequence[Any]]]
+
 class NutritionCalculator:
     """Класс для расчета питания с кэшированием результатов"""
     
-    def __init__(self):
-        self._cache = {}
-        self._cache_hits = 0
-        self._cache_misses = 0
+    def __init__(self, cache_size: int = CalculationConstants.CACHE_MAX_SIZE,
+                 cache_ttl: Optional[float] = CalculationConstants.CACHE_TTL,
+                 precompute: bool = CalculationConstants.PRECOMPUTE_FACTOR_GRID):
+        self._cache = BoundedCache(cache_size, cache_ttl)
+        # Сетка факторов по дискретным ответам анкеты строится один раз
+        self._grid = nutrition_engine.FactorGrid(FACTORS) if precompute else None
     
-    def _get_cache_key(self, user_data: Dict[str, Any]) -> str:
-        """Генерация ключа кэша на основе данных пользователя"""
-        key_fields = [
-            'weight', 'height', 'age', 'gender', 'steps',
-            'occupation', 'recovery', 'sleep_quality', 'stress_level', 'goal',
-            'has_training_experience', 'training_days', 'activity_type', 
-            'intensity', 'workout_duration', 'fat_percent'
-        ]
-        
-        cache_data = {field: user_data.get(field) for field in key_fields}
-        return str(sorted(cache_data.items()))
+    def _get_cache_key(self, user_data: Dict[str, Any]) -> tuple:
+        """Ключ кэша: кортеж значений полей, числа округлены (80 и 80.0 совпадают)"""
+        digits = CalculationConstants.CACHE_FLOAT_DIGITS
+        values = map(user_data.get, CACHE_KEY_FIELDS)
+        # bool - подкласс int, поэтому сравниваем точный тип
+        return tuple(round(value, digits) if type(value) in _NUMBER_TYPES else value for value in values)
     
     def _validate_user_data(self, user_data: Dict[str, Any]) -> None:
         """Валидация данных пользователя"""
-        required_fields = [
-            'weight', 'height', 'age', 'gender', 'steps',
-            'occupation', 'recovery', 'sleep_quality', 'stress_level', 'goal'
-        ]
-        
-        missing = [field for field in required_fields if field not in user_data]
-        if missing:
-            raise ValueError(f"Не заполнены обязательные поля: {', '.join(missing)}. Пройдите все этапы опроса!")
-        
-        # Проверяем наличие опыта в тренировках
-        has_training_experience = user_data.get('has_training_experience', True)
-        
-        if has_training_experience:
-            training_fields = ['training_days', 'activity_type', 'intensity', 'workout_duration']
-            missing_training = [field for field in training_fields if field not in user_data]
-            if missing_training:
-                raise ValueError(f"Не заполнены поля тренировок: {', '.join(missing_training)}. Пройдите все этапы опроса!")
-    
-    def _calculate_fat_percentage(self, user_data: Dict[str, Any]) -> float:
-        """Расчет процента жира если не указан пользователем"""
-        fat_percent = user_data.get('fat_percent')
-        if fat_percent is not None:
-            return fat_percent
-        
-        # Расчет по формуле BMI и возрасту
-        weight = user_data['weight']
-        height = user_data['height']
-        age = user_data['age']
-        gender = user_data['gender']
-        
-        bmi = weight / ((height / 100) ** 2)
-        
-        if gender == 'мужчина':
-            fat_percent = 1.20 * bmi + 0.23 * age - 16.2
-        else:  # женщина
-            fat_percent = 1.20 * bmi + 0.23 * age - 5.4
-        
-        # Ограничиваем значения
-        fat_percent = max(8, min(35, fat_percent))
-        return round(fat_percent, 1)
+        nutrition_engine.validate(user_data)
     
-    def _get_fat_category(self, fat_percent: float, gender: str) -> str:
-        """Определение категории по проценту жира"""
-        if gender == 'мужчина':
-            if fat_percent < 6:
-                return "Экстремально низкий"
-            elif fat_percent < 14:
-                return "Спортивный"
-            elif fat_percent < 18:
-                return "Фитнес"
-            elif fat_percent < 25:
-                return "Средний"
-            elif fat_percent < 32:
-                return "Высокий"
-            else:
-                return "Очень высокий"
-        else:  # женщина
-            if fat_percent < 14:
-                return "Экстремально низкий"
-            elif fat_percent < 21:
-                return "Спортивный"
-            elif fat_percent < 25:
-                return "Фитнес"
-            elif fat_percent < 32:
-                return "Средний"
-            elif fat_percent < 38:
-                return "Высокий"
-            else:
-                return "Очень высокий"
-    
-    def _calculate_bmr(self, weight: float, height: float, age: int, gender: str) -> int:
-        """Расчет BMR по формуле Mifflin-St Jeor"""
-        if gender == 'мужчина':
-            bmr = 10 * weight + 6.25 * height - 5 * age + 5
-        else:
-            bmr = 10 * weight + 6.25 * height - 5 * age - 161
-        
-        return int(bmr)
-    
-    def _calculate_activity_factors(self, user_data: Dict[str, Any]) -> Tuple[float, float]:
-        """Расчет факторов активности для дней отдыха и тренировок"""
-        steps = user_data['steps']
+    def calculate_nutrition_plan(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Основной метод расчета плана питания с кэшированием"""
+        cache_key = self._get_cache_key(user_data)
         
-        # Рабочая активность
-        work_factor = CalculationConstants.OCCUPATION_FACTORS.get(
-            user_data['occupation'], 0.2
-        )
+        # Проверяем кэш
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            metrics.CACHE_REQUESTS.inc('hit')
+            logger.debug("Cache hit! Total hits: %d", self._cache.hits)
+            return cached
         
-        # Шаги
-        steps_factor = min(steps / 10000 * 0.05, 0.15)
+        metrics.CACHE_REQUESTS.inc('miss')
+        logger.debug("Cache miss! Total misses: %d", self._cache.misses)
         
-        # Базовый фактор для дней отдыха
-        rest_day_factor = 1 + work_factor + steps_factor
+        # Валидация данных
+        self._validate_user_data(user_data)
         
-        # Тренировочная активность
-        has_training_experience = user_data.get('has_training_experience', True)
+        logger.debug("Calculating for: Weight=%s, Height=%s, Age=%s, Gender=%s",
+                     user_data['weight'], user_data['height'], user_data['age'], user_data['gender'])
         
-        if has_training_experience:
-            training_days = user_data['training_days']
-            
-            # Тренировочная активность
-            training_base = CalculationConstants.ACTIVITY_MULTIPLIERS.get(
-                user_data['activity_type'], 0.08
-            )
-            
-            # Интенсивность тренировок
-            intensity_factor = CalculationConstants.INTENSITY_MULTIPLIERS.get(
-                user_data['intensity'], 1.0
-            )
-            
-            # Продолжительность тренировки
-            duration_factor = min(user_data['workout_duration'] / 60, 2.0)
-            
-            training_factor = training_base * intensity_factor * duration_factor * (training_days / 7)
-            training_day_factor = rest_day_factor + training_factor
+        if self._grid is not None:
+            result = self._grid.compute_plan(user_data)
         else:
-            training_factor = 0.0
-            training_day_factor = rest_day_factor
-        
-        return rest_day_factor, training_day_factor, training_factor
-    
-    def _apply_recovery_factors(self, rest_factor: float, training_factor: float, user_data: Dict[str, Any]) -> Tuple[float, float]:
-        """Применение факторов восстановления"""
-        recovery_multiplier = CalculationConstants.RECOVERY_FACTORS.get(
-            user_data['recovery'], 1.0
-        )
-        
-        sleep_multiplier = CalculationConstants.SLEEP_FACTORS.get(
-            user_data['sleep_quality'], 1.0
-        )
+            result = nutrition_engine.compute_plan(user_data)
         
-        # Стресс (обратная зависимость)
-        stress_level = user_data['stress_level']
-        stress_multiplier = max(0.85, 1.1 - (stress_level / 10) * 0.25)
+        # Сохраняем в кэш (LRU сам вытесняет давние записи)
+        self._cache.set(cache_key, result)
         
-        total_multiplier = recovery_multiplier * sleep_multiplier * stress_multiplier
-        
-        return rest_factor * total_multiplier, training_factor * total_multiplier
+        logger.debug("Calculation completed successfully. Cache size: %d", len(self._cache))
+        return result
     
-    def _calculate_tdee(self, bmr: int, rest_factor: float, training_factor: float, user_data: Dict[str, Any]) -> Dict[str, int]:
-        """Расчет TDEE для разных типов дней"""
-        tdee_rest = int(bmr * rest_factor)
-        tdee_training = int(bmr * training_factor)
-        
-        # Средний TDEE
-        has_training_experience = user_data.get('has_training_experience', True)
-        
-        if has_training_experience:
-            training_days = user_data['training_days']
-            rest_days = 7 - training_days
-            tdee_average = int((tdee_rest * rest_days + tdee_training * training_days) / 7)
-        else:
-            rest_days = 7
-            training_days = 0
-            tdee_average = tdee_rest
-        
+    # === ПАКЕТНЫЙ РАСЧЕТ ===
+    def _batch_columns(self, records: BatchInput) -> Dict[str, List[Any]]:
+        """Столбцы входных данных; список словарей проверяется и разворачивается один раз"""
+        if isinstance(records, dict):
+            columns = dict(records)
+            missing = [field for field in nutrition_engine.REQUIRED_FIELDS if field not in columns]
+            if missing:
+                raise ValueError(f"Не заполнены обязательные поля: {', '.join(missing)}")
+            return columns
+
+        columns: Dict[str, List[Any]] = {field: [] for field in CACHE_KEY_FIELDS}
+        for record in records:
+            self._validate_user_data(record)
+            for field in CACHE_KEY_FIELDS:
+                columns[field].append(record.get(field, True) if field == 'has_training_experience' else record.get(field))
+        return columns
+
+    def calculate_batch(self, records: BatchInput) -> Dict[str, Any]:
+        """Пакетный расчет планов питания (NumPy)
+
+        records - список словарей как для calculate_nutrition_plan или словарь
+        столбцов {поле: последовательность}. Результат - словарь с теми же ключами,
+        что у calculate_nutrition_plan, значения - массивы по всем профилям.
+        Порядок операций повторяет nutrition_engine.compute_plan, поэтому результаты совпадают точно.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("Для пакетного расчета нужен numpy")
+
+        columns = self._batch_columns(records)
+        n = len(columns['weight'])
+        tables = FACTORS
+
+        def numeric(field, fill=0.0):
+            values = columns.get(field)
+            if values is None:
+                return np.full(n, fill, dtype=np.float64)
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'fiu':
+                return values.astype(np.float64)
+            return np.fromiter((fill if value is None else value for value in values), np.float64, n)
+
+        def lookup(field, table, default):
+            values = columns.get(field)
+            if values is None:
+                return np.full(n, default, dtype=np.float64)
+            return np.fromiter((table.get(value, default) for value in values), np.float64, n)
+
+        weight, height, age = numeric('weight'), numeric('height'), numeric('age')
+        steps, stress_level = numeric('steps'), numeric('stress_level')
+        is_male = np.fromiter((value == 'мужчина' for value in columns['gender']), bool, n)
+        experience = columns.get('has_training_experience')
+        has_training = (np.ones(n, dtype=bool) if experience is None
+                        else np.fromiter((bool(value) for value in experience), bool, n))
+
+        # Процент жира: указанный пользователем или по ИМТ и возрасту
+        bmi = weight / ((height / 100) ** 2)
+        estimated = np.where(is_male, 1.20 * bmi + 0.23 * age - 16.2, 1.20 * bmi + 0.23 * age - 5.4)
+        estimated = _round_like_python(np.maximum(8, np.minimum(35, estimated)), 1)
+        given = numeric('fat_percent', np.nan)
+        fat_percent = np.where(np.isnan(given), estimated, given)
+
+        bounds = np.where(is_male[:, None], FAT_CATEGORY_BOUNDS['мужчина'], FAT_CATEGORY_BOUNDS['женщина'])
+        fat_category = np.array(FAT_CATEGORY_LABELS, dtype=object)[(fat_percent[:, None] >= bounds).sum(axis=1)]
+
+        # BMR (Mifflin-St Jeor); в TDEE идет без округления
+        bmr = np.where(is_male, 10 * weight + 6.25 * height - 5 * age + 5,
+                       10 * weight + 6.25 * height - 5 * age - 161)
+
+        # Факторы активности
+        work_factor = lookup('occupation', tables.occupation, 0.2)
+        steps_factor = np.minimum(steps / 10000 * 0.05, 0.15)
+        rest_day_factor = 1 + work_factor + steps_factor
+
+        training_days = np.where(has_training, numeric('training_days'), 0).astype(np.int64)
+        training_base = lookup('activity_type', tables.activity, 0.08)
+        intensity_factor = lookup('intensity', tables.intensity, 1.0)
+        duration_factor = np.minimum(numeric('workout_duration') / 60, 2.0)
+        training_factor = training_base * intensity_factor * duration_factor * (training_days / 7)
+        training_day_factor = np.where(has_training, rest_day_factor + training_factor, rest_day_factor)
+
+        # Восстановление, сон и стресс
+        recovery_multiplier = lookup('recovery', tables.recovery, 1.0)
+        sleep_multiplier = lookup('sleep_quality', tables.sleep, 1.0)
+        stress_multiplier = np.maximum(0.85, 1.1 - (stress_level / 10) * 0.25)
+        total_multiplier = recovery_multiplier * sleep_multiplier * stress_multiplier
+        rest_factor_final = rest_day_factor * total_multiplier
+        training_factor_final = training_day_factor * total_multiplier
+
+        # TDEE
+        tdee_rest = np.trunc(bmr * rest_factor_final).astype(np.int64)
+        tdee_training = np.trunc(bmr * training_factor_final).astype(np.int64)
+        rest_days = 7 - training_days
+        tdee_average = np.where(
+            has_training,
+            np.trunc((tdee_rest * rest_days + tdee_training * training_days) / 7).astype(np.int64),
+            tdee_rest
+        )
+
+        # Целевые калории
+        adjustment = lookup('goal', tables.goal, 0)
+        target_rest = np.trunc(tdee_rest * (1 + adjustment)).astype(np.int64)
+        target_training = np.trunc(tdee_training * (1 + adjustment)).astype(np.int64)
+        target_average = np.trunc(tdee_average * (1 + adjustment)).astype(np.int64)
+
+        # Макронутриенты
+        protein_grams = np.trunc(weight * tables.protein_per_kg).astype(np.int64)
+        protein_min = np.trunc(weight * tables.protein_min).astype(np.int64)
+        protein_max = np.trunc(weight * tables.protein_max).astype(np.int64)
+        fats_rest = np.trunc(target_rest * tables.fat_share / 9).astype(np.int64)
+        fats_training = np.trunc(target_training * tables.fat_share / 9).astype(np.int64)
+        protein_calories = protein_grams * 4
+        carbs_rest = np.trunc((target_rest - protein_calories - fats_rest * 9) / 4).astype(np.int64)
+        carbs_training = np.trunc((target_training - protein_calories - fats_training * 9) / 4).astype(np.int64)
+        fiber_rest = np.maximum(tables.fiber_min_rest,
+                                np.trunc(carbs_rest * tables.fiber_share).astype(np.int64))
+        fiber_training = np.maximum(tables.fiber_min_training,
+                                    np.trunc(carbs_training * tables.fiber_share).astype(np.int64))
+        water = np.trunc(weight * tables.water_per_kg).astype(np.int64)
+
         return {
+            'bmr': np.trunc(bmr).astype(np.int64),
             'tdee_rest': tdee_rest,
             'tdee_training': tdee_training,
             'tdee_average': tdee_average,
-            'rest_days': rest_days,
-            'training_days': training_days
-        }
-    
-    def _calculate_target_calories(self, tdee_data: Dict[str, int], user_data: Dict[str, Any]) -> Dict[str, int]:
-        """Расчет целевых калорий с учетом цели"""
-        goal = user_data['goal']
-        adjustment = CalculationConstants.GOAL_ADJUSTMENTS.get(goal, 0)
-        
-        target_calories_rest = int(tdee_data['tdee_rest'] * (1 + adjustment))
-        target_calories_training = int(tdee_data['tdee_training'] * (1 + adjustment))
-        target_calories_average = int(tdee_data['tdee_average'] * (1 + adjustment))
-        
-        return {
-            'target_calories_rest': target_calories_rest,
-            'target_calories_training': target_calories_training,
-            'target_calories_average': target_calories_average
-        }
-    
-    def _calculate_macros(self, target_calories: Dict[str, int], weight: float) -> Dict[str, int]:
-        """Расчет макронутриентов"""
-        # Белки
-        protein_grams = int(weight * CalculationConstants.PROTEIN_PER_KG)
-        protein_min = int(weight * CalculationConstants.PROTEIN_MIN_MULTIPLIER)
-        protein_max = int(weight * CalculationConstants.PROTEIN_MAX_MULTIPLIER)
-        
-        # Жиры
-        fats_rest = int(target_calories['target_calories_rest'] * CalculationConstants.FAT_PERCENTAGE / 9)
-        fats_training = int(target_calories['target_calories_training'] * CalculationConstants.FAT_PERCENTAGE / 9)
-        
-        # Углеводы
-        protein_calories = protein_grams * 4
-        fat_calories_rest = fats_rest * 9
-        fat_calories_training = fats_training * 9
-        
-        carbs_rest = int((target_calories['target_calories_rest'] - protein_calories - fat_calories_rest) / 4)
-        carbs_training = int((target_calories['target_calories_training'] - protein_calories - fat_calories_training) / 4)
-        
-        # Клетчатка
-        fiber_rest = max(CalculationConstants.FIBER_MIN_REST, int(carbs_rest * CalculationConstants.FIBER_PERCENTAGE))
-        fiber_training = max(CalculationConstants.FIBER_MIN_TRAINING, int(carbs_training * CalculationConstants.FIBER_PERCENTAGE))
-        
-        # Вода
-        water = int(weight * CalculationConstants.WATER_PER_KG)
-        
-        return {
+            'target_calories_rest': target_rest,
+            'target_calories_training': target_training,
+            'target_calories_average': target_average,
             'protein_grams': protein_grams,
             'protein_min': protein_min,
             'protein_max': protein_max,
@@ -248,113 +220,50 @@ class NutritionCalculator:
             'carbs_training': carbs_training,
             'fiber_rest': fiber_rest,
             'fiber_training': fiber_training,
-            'water': water
-        }
-    
-    def calculate_nutrition_plan(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Основной метод расчета плана питания с кэшированием"""
-        cache_key = self._get_cache_key(user_data)
-        
-        # Проверяем кэш
-        if cache_key in self._cache:
-            self._cache_hits += 1
-            logger.info(f"Cache hit! Total hits: {self._cache_hits}")
-            return self._cache[cache_key]
-        
-        self._cache_misses += 1
-        logger.info(f"Cache miss! Total misses: {self._cache_misses}")
-        
-        # Валидация данных
-        self._validate_user_data(user_data)
-        
-        # Извлекаем базовые параметры
-        weight = user_data['weight']
-        height = user_data['height']
-        age = user_data['age']
-        gender = user_data['gender']
-        
-        logger.info(f"Calculating for: Weight={weight}, Height={height}, Age={age}, Gender={gender}")
-        
-        # Расчет процента жира
-        fat_percent = self._calculate_fat_percentage(user_data)
-        fat_category = self._get_fat_category(fat_percent, gender)
-        
-        # Расчет BMR
-        bmr = self._calculate_bmr(weight, height, age, gender)
-        
-        # Расчет факторов активности
-        rest_factor, training_factor, training_activity = self._calculate_activity_factors(user_data)
-        
-        # Применение факторов восстановления
-        rest_factor_final, training_factor_final = self._apply_recovery_factors(rest_factor, training_factor, user_data)
-        
-        # Расчет TDEE
-        tdee_data = self._calculate_tdee(bmr, rest_factor_final, training_factor_final, user_data)
-        
-        # Расчет целевых калорий
-        target_calories = self._calculate_target_calories(tdee_data, user_data)
-        
-        # Расчет макронутриентов
-        macros = self._calculate_macros(target_calories, weight)
-        
-        # Формируем результат
-        result = {
-            'bmr': bmr,
-            'tdee_rest': tdee_data['tdee_rest'],
-            'tdee_training': tdee_data['tdee_training'],
-            'tdee_average': tdee_data['tdee_average'],
-            'target_calories_rest': target_calories['target_calories_rest'],
-            'target_calories_training': target_calories['target_calories_training'],
-            'target_calories_average': target_calories['target_calories_average'],
-            'protein_grams': macros['protein_grams'],
-            'protein_min': macros['protein_min'],
-            'protein_max': macros['protein_max'],
-            'fats_rest': macros['fats_rest'],
-            'fats_training': macros['fats_training'],
-            'carbs_rest': macros['carbs_rest'],
-            'carbs_training': macros['carbs_training'],
-            'fiber_rest': macros['fiber_rest'],
-            'fiber_training': macros['fiber_training'],
-            'water': macros['water'],
-            'rest_day_factor': round(rest_factor_final, 2),
-            'training_day_factor': round(training_factor_final, 2),
-            'training_days': tdee_data['training_days'],
-            'rest_days': tdee_data['rest_days'],
-            'has_training_experience': user_data.get('has_training_experience', True),
+            'water': water,
+            'rest_day_factor': _round_like_python(rest_factor_final, 2),
+            'training_day_factor': _round_like_python(training_factor_final, 2),
+            'training_days': training_days,
+            'rest_days': rest_days,
+            'has_training_experience': has_training,
             'fat_percent': fat_percent,
             'fat_category': fat_category,
-            'precision_score': 98
+            'precision_score': np.full(n, 98, dtype=np.int64),
+            'engine_version': np.full(n, nutrition_engine.ENGINE_VERSION, dtype=object)
         }
-        
-        # Сохраняем в кэш (ограничиваем размер кэша)
-        if len(self._cache) > 100:
-            # Удаляем старые записи
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-        
-        self._cache[cache_key] = result
-        
-        logger.info(f"Calculation completed successfully. Cache size: {len(self._cache)}")
-        return result
-    
-    def get_cache_stats(self) -> Dict[str, int]:
+
+    def get_cache_stats(self) -> Dict[str, Any]:
         """Получение статистики кэша"""
+        stats = self._cache.stats()
         return {
-            'cache_size': len(self._cache),
-            'cache_hits': self._cache_hits,
-            'cache_misses': self._cache_misses,
-            'hit_rate': round(self._cache_hits / (self._cache_hits + self._cache_misses) * 100, 2) if (self._cache_hits + self._cache_misses) > 0 else 0
+            'cache_size': stats['size'],
+            'cache_max_size': stats['max_size'],
+            'cache_ttl': stats['ttl'],
+            'cache_hits': stats['hits'],
+            'cache_misses': stats['misses'],
+            'cache_evictions': stats['evictions'],
+            'cache_expirations': stats['expirations'],
+            'hit_rate': stats['hit_rate']
         }
     
     def clear_cache(self) -> None:
         """Очистка кэша"""
         self._cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
         logger.info("Cache cleared")
 
+def _round_like_python(values, digits: int):
+    """Округление как у встроенного round (np.round расходится с ним на границах .5)"""
+    rounded = np.round(values, digits)
+    scaled = values * 10 ** digits
+    # Значения у самой границы пересчитываем точным round
+    suspicious = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6)
+    for i in suspicious:
+        rounded[i] = round(float(values[i]), digits)
+    return rounded
+
 # Глобальный экземпляр калькулятора
 calculator = NutritionCalculator()
+metrics.CACHE_SIZE.set_function(lambda: len(calculator._cache))
 
 def generate_ultra_precise_recommendations(user_data: Dict[str, Any]) -> Dict[str, Any]:
     """Функция-обертка для обратной совместимости"""
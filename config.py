@@ -181,6 +181,16 @@ class CalculationConstants:
     # Вода (мл на кг веса)
     WATER_PER_KG = 35
 
+    # Кэш расчетов (NutritionCalculator)
+    CACHE_MAX_SIZE = 1024       # записей
+    CACHE_TTL = 24 * 60 * 60    # секунды; None - без ограничения времени
+    CACHE_FLOAT_DIGITS = 3      # округление чисел в ключе кэша
+    PRECOMPUTE_FACTOR_GRID = False  # сетка коэффициентов по дискретным ответам анкеты (benchmark_factor_grid.py)
+
+    # История метаболической адаптации (UltraPreciseCalculatorV5)
+    ADAPTATION_HISTORY_SIZE = 52      # записей на пользователя (кольцевой буфер)
+    ADAPTATION_MAX_USERS = 10000      # пользователей в памяти, остальные - в хранилище
+
 # === КЛАВИАТУРЫ ===
 class Keyboards:
     """Предустановленные клавиатуры"""
@@ -267,6 +277,58 @@ class Keyboards:
         ['🔍 Поиск продукта', '📊 Рекомендации'],
         ['🔙 Назад']
     ]
+    
+    # Кнопки категорий базы продуктов -> ключ категории в PRODUCTS_DATABASE
+    PRODUCT_CATEGORY_BUTTONS = {
+        '🌾 Сложные углеводы': 'сложные_углеводы',
+        '⚡ Простые углеводы': 'простые_углеводы',
+        '🥩 Белки': 'белки',
+        '🫒 Ненасыщенные жиры': 'ненасыщенные_жиры',
+        '🧈 Насыщенные жиры': 'насыщенные_жиры',
+        '🌿 Клетчатка': 'клетчатка'
+    }
+    
+    # Мини-приложение базы продуктов (products_mini_app.py)
+    PRODUCTS_MINI_APP = [
+        ['🌾 Сложные углеводы', '⚡ Простые углеводы'],
+        ['🥩 Белки', '🫒 Ненасыщенные жиры'],
+        ['🧈 Насыщенные жиры', '🌿 Клетчатка'],
+        ['🔍 Поиск продукта', '📊 Рекомендации'],
+        ['🔙 Главное меню']
+    ]
+    
+    # Краткое меню базы продуктов (mini_apps.py)
+    PRODUCTS_MENU = [
+        ['🥩 Белки', '🍞 Углеводы'],
+        ['🧈 Жиры', '🔍 Поиск продукта'],
+        ['📊 Рекомендации', '🔙 Назад']
+    ]
+    
+    # Все мини-приложения (mini_apps.py)
+    MINI_APPS_HUB = [
+        ['🍎 База продуктов', '💧 Трекер воды'],
+        ['🎯 Трекер целей', '📊 Статистика'],
+        ['🔙 Главное меню']
+    ]
+    
+    # После расчета плана; 🍎 База продуктов открывается как Web App
+    RESULTS_MENU = [
+        ['💬 Получить консультацию', '🍎 База продуктов'],
+        ['🚀 Начать заново', '❓ Помощь'],
+        ['🌍 Язык', '📊 О боте']
+    ]
+    
+    CONSULTATION_MENU = [['🚀 Начать заново', '❓ Помощь'], ['📊 О боте']]
+    
+    # Постоянные кнопки во время расчета
+    SHORT_MENU = [['🚀 Начать', '❓ Помощь'], ['📊 О боте']]
+    
+    # Кнопки, открывающие Web App (только в раскладках с web_apps=True, см. rendering.keyboard_markup)
+    PRODUCTS_WEBAPP_URL = 'https://darksaiders12.github.io/fitadventure-webapp/webapp_products_github.html?v=686'
+    WEB_APP_BUTTONS = {'🍎 База продуктов': PRODUCTS_WEBAPP_URL}
+    
+    BACK_TO_CATEGORIES = [['🔙 Назад к категориям']]
+    BACK_TO_APPS = [['🔙 Назад к приложениям']]
 
 # === СООБЩЕНИЯ ===
 class Messages:
@@ -354,11 +416,126 @@ class Messages:
 
 🚀 **Готовы к трансформации?** Свяжитесь прямо сейчас!"""
 
+# === ХРАНИЛИЩЕ ДАННЫХ ===
+class StorageConfig:
+    """Настройки хранилища данных пользователей"""
+
+    # Бэкенд: 'sqlite' или 'json'
+    BACKEND = os.getenv('FITADVENTURE_STORAGE', 'sqlite')
+    SQLITE_FILE = os.getenv('FITADVENTURE_DB', 'fitadventure.db')
+    SQLITE_BUSY_TIMEOUT = 5.0  # секунды ожидания блокировки
+
+    # Кэш с отложенной записью
+    CACHE_ENABLED = os.getenv('FITADVENTURE_STORAGE_CACHE', '1') == '1'
+    FLUSH_INTERVAL = 5.0   # секунды между сбросами на диск
+    FLUSH_THRESHOLD = 100  # сброс при таком числе измененных пользователей
+    CACHE_MAX_ENTRIES = 10000  # записей в памяти; сверх этого вытесняются давно не читанные сохраненные
+
+    # Пространства имен и исходные JSON-файлы (для миграции и JSON-бэкенда)
+    MINI_APPS_NAMESPACE = 'mini_apps'
+    PRODUCTS_NAMESPACE = 'products'
+    ADAPTATION_NAMESPACE = 'adaptation'
+    SUBSCRIBERS_NAMESPACE = 'subscribers'
+
+    # Состояние диалогов бота (BasePersistence): анкета, chat_data, user_data
+    PERSISTENCE_ENABLED = os.getenv('FITADVENTURE_PERSISTENCE', '1') == '1'
+    PERSISTENCE_FILE = os.getenv('FITADVENTURE_STATE_DB', SQLITE_FILE)
+    PERSISTENCE_UPDATE_INTERVAL = 10.0  # секунды между сохранениями из приложения
+    # Несколько процессов бота: перечитывать данные чата, измененные другим процессом
+    PERSISTENCE_SHARED = os.getenv('FITADVENTURE_SHARED_STATE', '0') == '1'
+
+    # Сессии анкеты (user_data_storage): вытеснение брошенных
+    SESSION_TTL = float(os.getenv('FITADVENTURE_SESSION_TTL', 7 * 24 * 60 * 60))  # секунды без активности
+    SESSION_MAX = int(os.getenv('FITADVENTURE_SESSION_MAX', 20000))               # лимит сессий (LRU)
+    SESSION_SWEEP_INTERVAL = 10 * 60      # секунды между проходами очистки
+    SESSION_ABANDON_AFTER = 60 * 60       # бездействие, после которого сессия считается брошенной
+    JSON_FILES = {
+        'mini_apps': 'user_mini_apps_data.json',
+        'products': 'user_products_data.json'
+    }
+
+# === РАССЫЛКИ ===
+class BroadcastConfig:
+    """Настройки рассылки /broadcast"""
+
+    ADMIN_ID = int(os.getenv('FITADVENTURE_ADMIN_ID', 123456789))
+    # Telegram: не больше ~30 сообщений в секунду разным чатам
+    RATE = float(os.getenv('FITADVENTURE_BROADCAST_RATE', 25))  # сообщений в секунду
+    BURST = 25                 # емкость корзины токенов
+    CONCURRENCY = 10           # одновременных запросов к API
+    MAX_RETRIES = 3            # повторов при сетевых ошибках и RetryAfter
+    CHECKPOINT_EVERY = 100     # сохранение прогресса каждые N отправок
+    PROGRESS_INTERVAL = 5.0    # секунды между обновлениями прогресса для администратора
+    NAMESPACE = 'broadcasts'   # пространство имен хранилища
+
+# === РЕЖИМ ЗАПУСКА ===
+class WebhookConfig:
+    """Запуск через long polling или webhook (bot_webhook.py)"""
+
+    MODE = os.getenv('FITADVENTURE_RUN_MODE', 'polling')  # 'polling' или 'webhook'
+    URL = os.getenv('FITADVENTURE_WEBHOOK_URL', '')        # публичный https-адрес; пусто - webhook не регистрируется
+    LISTEN = os.getenv('FITADVENTURE_WEBHOOK_LISTEN', '0.0.0.0')
+    PORT = int(os.getenv('FITADVENTURE_WEBHOOK_PORT', 8443))
+    URL_PATH = os.getenv('FITADVENTURE_WEBHOOK_PATH', '/telegram')
+    # Общий для всех процессов за балансировщиком; пусто - случайный на процесс
+    SECRET_TOKEN = os.getenv('FITADVENTURE_WEBHOOK_SECRET', '')
+    MAX_CONNECTIONS = int(os.getenv('FITADVENTURE_WEBHOOK_MAX_CONNECTIONS', 40))  # Telegram: 1-100
+    MAX_BODY_SIZE = 1024 * 1024   # байт на одно обновление
+    DRAIN_TIMEOUT = 30.0          # секунды на обработку очереди при остановке
+    DROP_PENDING_UPDATES = False
+
 # === ЛОГИРОВАНИЕ ===
 class LoggingConfig:
     """Настройки логирования"""
     
     FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    LEVEL = 'INFO'
+    LEVEL = os.getenv('FITADVENTURE_LOG_LEVEL', 'INFO')
     FILE = 'bot_debug.log'
-    ENCODING = 'utf-8' 
\ No newline at end of file
+    ENCODING = 'utf-8'
+
+    # Ротация файла лога по размеру
+    MAX_BYTES = 10 * 1024 * 1024  # байт на файл
+    BACKUP_COUNT = 5              # старых файлов bot_debug.log.1 ... .5
+
+    # Очередь между обработчиками и потоком записи (bot_logging.py); при переполнении записи отбрасываются
+    QUEUE_SIZE = 10000
+
+    # Прореживание частых записей DEBUG/INFO: логгер -> каждая N-я запись одного шаблона
+    SAMPLING = {
+        'calculations': 100,
+        'nutrition_engine': 100,
+    }
+
+# === МЕТРИКИ ===
+class MetricsConfig:
+    """Экспорт метрик в формате Prometheus (metrics.py)"""
+
+    ENABLED = os.getenv('FITADVENTURE_METRICS', '1') == '1'
+    HOST = os.getenv('FITADVENTURE_METRICS_HOST', '127.0.0.1')  # только локально; наружу - через прокси
+    PORT = int(os.getenv('FITADVENTURE_METRICS_PORT', 9108))
+    PATH = '/metrics'
+
+    # Границы корзин гистограмм задержек, секунды
+    LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# === ТРАССИРОВКА МЕДЛЕННЫХ ОБНОВЛЕНИЙ ===
+class TracingConfig:
+    """Трассировка обработчиков и профилирование медленных обновлений (tracing.py)"""
+
+    ENABLED = os.getenv('FITADVENTURE_TRACING', '1') == '1'
+    SLOW_THRESHOLD = float(os.getenv('FITADVENTURE_SLOW_UPDATE_SECONDS', 1.0))  # секунды на обновление
+    CAPACITY = 20              # медленных трасс в кольцевом буфере
+    SAMPLE_INTERVAL = 0.2      # секунды между снимками стека зависшего обновления
+    MAX_SAMPLES = 5            # снимков стека на одну трассу
+    # cProfile на каждое обновление заметно замедляет бота; включать на время разбора
+    PROFILE = os.getenv('FITADVENTURE_PROFILE_SLOW', '0') == '1'
+    PROFILE_LINES = 15         # строк отчета pstats в трассе
+    ADMIN_ID = BroadcastConfig.ADMIN_ID  # кому доступна команда /traces
+
+# === ОТРИСОВКА ОТВЕТОВ ===
+class RenderingConfig:
+    """Шаблоны и кэши ответов бота (rendering.py)"""
+
+    PRODUCT_CARD_CACHE_SIZE = 2048  # карточек (продукт, цель) в памяти
+    WATER_DAILY_NORM = 2500         # мл в день, 100% в статистике воды
+    WATER_STATS_DAYS = 7
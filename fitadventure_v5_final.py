@@ -18,6 +18,20 @@ from telegram.ext import Application, CommandHandler, ConversationHandler, Messa
 from telegram.constants import ParseMode
 from telegram.ext import filters as tg_filters
 
+from config import StorageConfig, BroadcastConfig
+from storage import close_storage
+from calculations import calculator
+from ultra_precise_formulas import attach_adaptation_storage
+from bot_persistence import SQLitePersistence, SurveyStateStore, schedule_session_sweeper
+from bot_webhook import run_application
+from bot_logging import setup_logging
+import metrics
+import tracing
+from tracing import TracingRequest, traces_command
+from survey_profile import SurveyProfile, fields_mask
+from broadcast import Broadcaster, format_progress
+from subscribers import SubscriberRegistry, parse_segment
+
 # === АВТОМАТИЧЕСКАЯ НАСТРОЙКА ТОКЕНА ===
 def setup_bot_token():
     """Автоматическая настройка токена бота"""
@@ -67,14 +81,7 @@ def setup_bot_token():
 load_dotenv()
 
 # --- Логирование ---
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO,
-    handlers=[
-        logging.FileHandler('bot_debug.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Настраивается в main(): импорт модуля не открывает файл лога и не запускает поток
 logger = logging.getLogger(__name__)
 
 # --- Состояния ---
@@ -85,193 +92,34 @@ START_BUTTONS = ['🚀 Начать', '❓ Помощь', '🌍 Язык', '📊
 START_BUTTONS_REGEX = f"^({'|'.join([b.replace(' ', '\\s') for b in START_BUTTONS])})$"
 
 # --- Хранилище ---
-user_data_storage = {}
-subscribers = set()  # Множество подписчиков
+# Ответы анкеты; после запуска хранятся в chat_data и сохраняются вместе с ним
+user_data_storage = SurveyStateStore()
+subscribers = SubscriberRegistry()  # Подписчики (сохраняются в хранилище)
+broadcaster = Broadcaster()  # Рассылки с ограничением частоты и контрольными точками
 
 # === УЛЬТРА-ТОЧНЫЕ РАСЧЕТЫ ===
+STRICT_FIELDS = (
+    'weight', 'height', 'age', 'gender', 'training_days', 'steps', 'occupation',
+    'activity_type', 'intensity', 'workout_duration', 'recovery', 'sleep_quality',
+    'stress_level', 'goal'
+)
+STRICT_FIELDS_MASK = fields_mask(STRICT_FIELDS)
+
 def generate_ultra_precise_recommendations(user_data):
     """Генерация ультра-точных рекомендаций с разделением по дням"""
-    logger.info(f"Starting ultra-precise calculations with data: {user_data}")
-    # Строгая проверка всех нужных полей
-    required_fields = [
-        'weight', 'height', 'age', 'gender', 'training_days', 'steps', 'occupation',
-        'activity_type', 'intensity', 'workout_duration', 'recovery', 'sleep_quality',
-        'stress_level', 'goal'
-    ]
-    for field in required_fields:
-        if field not in user_data:
-            logger.error(f"Missing required field: {field}")
-            raise ValueError(f"Отсутствует обязательное поле: {field}")
-    
-    # Базовые параметры
-    weight = user_data['weight']
-    height = user_data['height'] 
-    age = user_data['age']
-    gender = user_data['gender']
-    
-    logger.info(f"Basic parameters - Weight: {weight}, Height: {height}, Age: {age}, Gender: {gender}")
-    
-    # BMR по формуле Mifflin-St Jeor
-    if gender == 'мужчина':
-        bmr = 10 * weight + 6.25 * height - 5 * age + 5
-    else:
-        bmr = 10 * weight + 6.25 * height - 5 * age - 161
-    
-    logger.info(f"Base BMR calculated: {bmr}")
-    
-    # Детальный расчет активности
-    training_days = user_data['training_days']
-    steps = user_data['steps']
-    
-    # Рабочая активность
-    occupation_factors = {
-        'office': 0.15,      # Офисная работа
-        'healthcare': 0.25,  # Активная работа  
-        'construction': 0.35 # Физический труд
-    }
-    work_factor = occupation_factors.get(user_data['occupation'], 0.2)
-    
-    # Тренировочная активность
-    activity_multipliers = {
-        'Силовые': 0.08,
-        'Выносливость': 0.06,
-        'Кроссфит': 0.1
-    }
-    training_base = activity_multipliers.get(user_data['activity_type'], 0.08)
-    
-    # Интенсивность тренировок
-    intensity_multipliers = {
-        'low': 0.8,
-        'moderate': 1.0,
-        'high': 1.2,
-        'very_high': 1.4
-    }
-    intensity_factor = intensity_multipliers.get(user_data['intensity'], 1.0)
-    
-    # Продолжительность тренировки
-    duration_factor = min(user_data['workout_duration'] / 60, 2.0)  # Максимум 2x
-    
-    training_factor = training_base * intensity_factor * duration_factor * (training_days / 7)
-    
-    # Шаги
-    steps_factor = min(steps / 10000 * 0.05, 0.15)  # Максимум 0.15
-    
-    logger.info(f"Activity breakdown - Work: {work_factor}, Training: {training_factor}, Steps: {steps_factor}")
-    
-    # Факторы восстановления
-    recovery_factors = {
-        'excellent': 1.05,
-        'good': 1.0,
-        'average': 0.95,
-        'poor': 0.9
-    }
-    recovery_multiplier = recovery_factors.get(user_data['recovery'], 1.0)
-    
-    sleep_factors = {
-        'excellent': 1.05,
-        'good': 1.0,
-        'average': 0.95,
-        'poor': 0.9
-    }
-    sleep_multiplier = sleep_factors.get(user_data['sleep_quality'], 1.0)
-    
-    # Стресс (обратная зависимость)
-    stress_level = user_data['stress_level']
-    stress_multiplier = max(0.85, 1.1 - (stress_level / 10) * 0.25)
-    
-    logger.info(f"Recovery factors - Recovery: {recovery_multiplier}, Sleep: {sleep_multiplier}, Stress: {stress_multiplier}")
-    
-    # Раздельный расчет для дней отдыха и тренировок
-    rest_day_factor = 1 + work_factor + steps_factor
-    training_day_factor = rest_day_factor + training_factor
-    
-    # Применяем факторы восстановления
-    rest_day_factor *= recovery_multiplier * sleep_multiplier * stress_multiplier
-    training_day_factor *= recovery_multiplier * sleep_multiplier * stress_multiplier
-    
-    logger.info(f"Rest day factor: {rest_day_factor}, Training day factor: {training_day_factor}")
-    
-    # TDEE для каждого типа дня
-    tdee_rest = int(bmr * rest_day_factor)
-    tdee_training = int(bmr * training_day_factor)
-    
-    # Средний TDEE
-    rest_days = 7 - training_days
-    tdee_average = int((tdee_rest * rest_days + tdee_training * training_days) / 7)
-    
-    logger.info(f"TDEE Rest Day: {tdee_rest}, TDEE Training Day: {tdee_training}, Average: {tdee_average}")
-    
-    # Корректировка под цель
-    goal_adjustments = {
-        'Похудение': -0.15,      # Дефицит 15%
-        'Поддержание': 0,        # Без изменений
-        'Набор массы': 0.1       # Профицит 10%
-    }
-    
-    goal = user_data['goal']
-    adjustment = goal_adjustments.get(goal, 0)
-    
-    logger.info(f"Goal: {goal}")
-    
-    # Целевые калории для каждого типа дня
-    target_calories_rest = int(tdee_rest * (1 + adjustment))
-    target_calories_training = int(tdee_training * (1 + adjustment))
-    target_calories_average = int(tdee_average * (1 + adjustment))
-    
-    logger.info(f"Target calories - Rest day: {target_calories_rest}, Training day: {target_calories_training}, Average: {target_calories_average}")
-    
-    # Расчет макронутриентов
-    # Белки: 2.0-2.2 г/кг веса
-    protein_grams = int(weight * 2.1)
-    protein_min = int(weight * 1.9)
-    protein_max = int(weight * 2.3)
-    
-    # Жиры: 25% от калорий (одинаково для всех дней)
-    fats_rest = int(target_calories_rest * 0.25 / 9)
-    fats_training = int(target_calories_training * 0.25 / 9)
-    
-    # Углеводы: оставшиеся калории
-    protein_calories = protein_grams * 4
-    fat_calories_rest = fats_rest * 9
-    fat_calories_training = fats_training * 9
-    
-    carbs_rest = int((target_calories_rest - protein_calories - fat_calories_rest) / 4)
-    carbs_training = int((target_calories_training - protein_calories - fat_calories_training) / 4)
-    
-    logger.info(f"Rest day macros - Protein: {protein_grams}г, Fats: {fats_rest}г, Carbs: {carbs_rest}г")
-    logger.info(f"Training day macros - Protein: {protein_grams}г, Fats: {fats_training}г, Carbs: {carbs_training}г")
-    
-    # Клетчатка и вода
-    fiber_rest = max(16, int(carbs_rest * 0.1))
-    fiber_training = max(19, int(carbs_training * 0.1)) 
-    water = int(weight * 35)  # 35 мл на кг веса
-    
-    result = {
-        'bmr': int(bmr),
-        'tdee_rest': tdee_rest,
-        'tdee_training': tdee_training,
-        'tdee_average': tdee_average,
-        'target_calories_rest': target_calories_rest,
-        'target_calories_training': target_calories_training,
-        'target_calories_average': target_calories_average,
-        'protein_grams': protein_grams,
-        'protein_min': protein_min,
-        'protein_max': protein_max,
-        'fats_rest': fats_rest,
-        'fats_training': fats_training,
-        'carbs_rest': carbs_rest,
-        'carbs_training': carbs_training,
-        'fiber_rest': fiber_rest,
-        'fiber_training': fiber_training,
-        'water': water,
-        'rest_day_factor': round(rest_day_factor, 2),
-        'training_day_factor': round(training_day_factor, 2),
-        'training_days': training_days,
-        'rest_days': rest_days,
-        'precision_score': 98  # Высокая точность
-    }
-    
-    logger.info(f"Ultra-precise result: {result}")
+    logger.debug("Starting ultra-precise calculations with data: %s", user_data)
+    # Строгая проверка всех нужных полей: в этой версии опроса тренировки обязательны
+    has_fields = getattr(user_data, 'has_fields', None)
+    if has_fields is None or not has_fields(STRICT_FIELDS_MASK):
+        for field in STRICT_FIELDS:
+            if field not in user_data:
+                logger.error("Missing required field: %s", field)
+                raise ValueError(f"Отсутствует обязательное поле: {field}")
+    
+    # Единый движок расчета (с кэшем)
+    result = calculator.calculate_nutrition_plan(user_data)
+    
+    logger.debug("Ultra-precise result: %s", result)
     return result
 
 # --- ДОБАВЛЯЕМ МОТИВАЦИЮ И FAQ ---
@@ -314,7 +162,7 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     chat_id = update.message.chat_id
     # Инициализируем только если пользователя нет
     if chat_id not in user_data_storage:
-        user_data_storage[chat_id] = {}
+        user_data_storage[chat_id] = SurveyProfile()
     
     # Постоянные кнопки внизу экрана
     keyboard = [
@@ -409,7 +257,7 @@ async def start_survey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
     """Начало опроса"""
     chat_id = update.message.chat_id
     # Очищаем данные для нового опроса
-    user_data_storage[chat_id] = {}
+    user_data_storage[chat_id] = SurveyProfile()
     
     keyboard = [['👨 Мужчина', '👩 Женщина']]
     reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
@@ -434,7 +282,7 @@ async def gender(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     
     # Проверяем что пользователь инициализирован
     if chat_id not in user_data_storage:
-        user_data_storage[chat_id] = {}
+        user_data_storage[chat_id] = SurveyProfile()
     
     if text in ['👨 Мужчина', 'мужчина', 'Мужчина']:
         user_data_storage[chat_id]['gender'] = 'мужчина'
@@ -1078,12 +926,7 @@ async def occupation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     # Диагностика: логируем все данные пользователя
     logger.info(f"[DEBUG] user_data_storage[{chat_id}] перед расчетом: {user_data_storage[chat_id]}")
     # Проверяем, какие поля не заполнены
-    required_fields = [
-        'weight', 'height', 'age', 'gender', 'training_days', 'steps', 'occupation',
-        'activity_type', 'intensity', 'workout_duration', 'recovery', 'sleep_quality',
-        'stress_level', 'goal'
-    ]
-    missing = [f for f in required_fields if f not in user_data_storage[chat_id]]
+    missing = [f for f in STRICT_FIELDS if f not in user_data_storage[chat_id]]
     if missing:
         logger.error(f"[DEBUG] Не заполнены поля: {missing}")
         await update.message.reply_text(
@@ -1094,10 +937,11 @@ async def occupation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             del user_data_storage[chat_id]
         return GENDER
     try:
-        logger.info(f"Starting calculations for user {chat_id}")
-        logger.info(f"User data: {user_data_storage[chat_id]}")
+        logger.debug("Starting calculations for user %s", chat_id)
+        logger.debug("User data: %s", user_data_storage[chat_id])
         
         results = generate_ultra_precise_recommendations(user_data_storage[chat_id])
+        subscribers.touch(chat_id, goal=user_data_storage[chat_id].get('goal'))
         
         # Форматируем результат
         result_message = f"""🎉 **Ваш ультра-точный план питания готов!**
@@ -1297,7 +1141,7 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             parse_mode=ParseMode.MARKDOWN
         )
     else:
-        subscribers.add(chat_id)
+        subscribers.add(chat_id, goal=user_data_storage[chat_id].get('goal') if chat_id in user_data_storage else None)
         
         # Отправляем приветственное сообщение о подписке
         await update.message.reply_text(
@@ -1332,7 +1176,8 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
             "📊 **Новые команды**\n"
             "• `/subscribe` - быстрая подписка\n"
             "• `/unsubscribe` - быстрая отписка\n"
-            "• `/broadcast` - рассылка (для администратора)\n\n"
+            "• `/broadcast` - рассылка (для администратора)\n"
+            "• `/broadcast_resume` - продолжить прерванную рассылку\n\n"
             "🚀 **Планы на будущее**\n"
             "• Персональные рекомендации\n"
             "• Статистика прогресса\n"
@@ -1398,8 +1243,7 @@ async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE
     chat_id = update.message.chat_id
     user_name = update.message.from_user.first_name or "Пользователь"
     
-    if chat_id in subscribers:
-        subscribers.remove(chat_id)
+    if subscribers.remove(chat_id):
         await update.message.reply_text(
             f"😔 **{user_name}**, вы отписались от обновлений.\n\n"
             "Вы больше не будете получать уведомления о новых функциях и обновлениях.\n\n"
@@ -1420,56 +1264,80 @@ async def broadcast_message(update: Update, context: ContextTypes.DEFAULT_TYPE)
     """Отправка сообщения всем подписчикам (только для администратора)"""
     chat_id = update.message.chat_id
     
-    # Проверяем, является ли пользователь администратором (замените на ваш ID)
-    ADMIN_ID = 123456789  # Замените на ваш Telegram ID
-    
-    if chat_id != ADMIN_ID:
+    # Проверяем, является ли пользователь администратором (ID задается в BroadcastConfig)
+    if chat_id != BroadcastConfig.ADMIN_ID:
         await update.message.reply_text(
             "❌ У вас нет прав для отправки сообщений всем подписчикам.",
             parse_mode=ParseMode.MARKDOWN
         )
         return ConversationHandler.END
     
-    # Получаем текст сообщения после команды /broadcast
-    message_text = update.message.text.replace('/broadcast', '').strip()
+    # Получаем текст сообщения после команды /broadcast (и необязательный сегмент)
+    goal, active_within, message_text = parse_segment(update.message.text.replace('/broadcast', '').strip())
     
     if not message_text:
         await update.message.reply_text(
-            "📝 Использование: /broadcast <текст сообщения>\n\n"
+            "📝 Использование: /broadcast [цель=похудение|поддержание|набор] [активны=<дней>] <текст сообщения>\n\n"
             "Пример: /broadcast Привет всем! Новая функция добавлена!",
             parse_mode=ParseMode.MARKDOWN
         )
         return ConversationHandler.END
     
-    # Отправляем сообщение всем подписчикам
-    success_count = 0
-    error_count = 0
+    # Рассылка идет в фоне; администратор видит прогресс в одном обновляемом сообщении
+    job = broadcaster.create_job(
+        f"📢 **Обновление от FitAdventure Bot:**\n\n{message_text}",
+        subscribers.snapshot(goal=goal, active_within=active_within),
+        admin_chat_id=chat_id, parse_mode=ParseMode.MARKDOWN
+    )
+    progress_message = await update.message.reply_text(format_progress(job), parse_mode=ParseMode.MARKDOWN)
+    context.application.create_task(run_broadcast(job, context.bot, progress_message), update=update)
     
-    for subscriber_id in subscribers:
-        try:
-            await context.bot.send_message(
-                chat_id=subscriber_id,
-                text=f"📢 **Обновление от FitAdventure Bot:**\n\n{message_text}",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            success_count += 1
-        except Exception as e:
-            error_count += 1
-            logger.error(f"Failed to send broadcast to {subscriber_id}: {e}")
+    logger.info(f"Broadcast {job.job_id} to {job.total} subscribers started by admin {chat_id}")
+    return ConversationHandler.END
+
+async def resume_broadcasts_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Продолжение прерванных рассылок (только для администратора)"""
+    chat_id = update.message.chat_id
+    if chat_id != BroadcastConfig.ADMIN_ID:
+        await update.message.reply_text("❌ Команда доступна только администратору.")
+        return ConversationHandler.END
     
-    await update.message.reply_text(
-        f"📢 **Сообщение отправлено!**\n\n"
-        f"✅ Успешно отправлено: {success_count}\n"
-        f"❌ Ошибок: {error_count}\n"
-        f"📊 Всего подписчиков: {len(subscribers)}",
-        parse_mode=ParseMode.MARKDOWN
-    )
+    jobs = broadcaster.unfinished()
+    if not jobs:
+        await update.message.reply_text("✅ Прерванных рассылок нет.")
+        return ConversationHandler.END
     
-    logger.info(f"Broadcast sent to {success_count} subscribers by admin {chat_id}")
+    for job in jobs:
+        progress_message = await update.message.reply_text(format_progress(job), parse_mode=ParseMode.MARKDOWN)
+        context.application.create_task(run_broadcast(job, context.bot, progress_message), update=update)
+        logger.info(f"Broadcast {job.job_id} resumed by admin {chat_id}: {len(job.pending())} pending")
     return ConversationHandler.END
 
+async def run_broadcast(job, bot, progress_message) -> None:
+    """Фоновая рассылка с обновлением сообщения о прогрессе"""
+    async def show_progress(current_job):
+        await progress_message.edit_text(format_progress(current_job), parse_mode=ParseMode.MARKDOWN)
+    
+    await broadcaster.run(bot, job, on_progress=show_progress)
+    # Заблокировавшие бота больше не попадают в рассылки
+    subscribers.mark_dead(job.blocked)
+
+async def restore_sessions(application: Application) -> None:
+    """Порядок вытеснения сессий анкеты по данным из persistence, хранилище истории адаптации"""
+    user_data_storage.reload_sessions()
+    # История адаптации переживает перезапуск: буферы читаются из хранилища
+    attach_adaptation_storage()
+
+async def shutdown_persistence(application: Application) -> None:
+    """Сброс состояния бота на диск при остановке"""
+    if isinstance(application.persistence, SQLitePersistence):
+        application.persistence.close()
+    close_storage()  # контрольные точки рассылок
+
 def main() -> None:
     """Главная функция запуска бота"""
+    # Запись в файл с ротацией идет в отдельном потоке (bot_logging.py)
+    setup_logging()
     print("🚀 Запуск FitAdventure Bot v5.0 Final...")
     
     # Автоматическая настройка токена
@@ -1485,7 +1353,15 @@ def main() -> None:
         
     # Создание приложения бота
     try:
-        application = Application.builder().token(TOKEN).build()
+        # TracingRequest отделяет время Telegram API от времени обработчиков в трассах
+        builder = (Application.builder().token(TOKEN).request(TracingRequest())
+                   .post_init(restore_sessions).post_shutdown(shutdown_persistence))
+        if StorageConfig.PERSISTENCE_ENABLED:
+            # Состояние анкеты и данные чатов переживают перезапуск
+            builder = builder.persistence(SQLitePersistence())
+        application = builder.build()
+        user_data_storage.bind(application)
+        schedule_session_sweeper(application, user_data_storage)
         print("✅ Telegram Application создан успешно!")
     except Exception as e:
         print(f"❌ Ошибка создания приложения: {e}")
@@ -1588,6 +1464,8 @@ def main() -> None:
             ],
         },
         fallbacks=[CommandHandler('cancel', cancel)],
+        name='survey',
+        persistent=StorageConfig.PERSISTENCE_ENABLED,
     )
 
     application.add_handler(conv_handler)
@@ -1598,6 +1476,15 @@ def main() -> None:
     application.add_handler(CommandHandler('subscribe', subscribe_command))
     application.add_handler(CommandHandler('unsubscribe', unsubscribe_command))
     application.add_handler(CommandHandler('broadcast', broadcast_message))
+    application.add_handler(CommandHandler('broadcast_resume', resume_broadcasts_command))
+    
+    application.add_handler(CommandHandler('traces', traces_command))
+    
+    # Задержки всех обработчиков и сессии анкеты (активные, брошенные, вытеснение) - в /metrics, медленные обновления - в /traces
+    metrics.instrument_application(application)
+    metrics.track_survey_sessions(user_data_storage)
+    metrics.start_metrics_server()
+    tracing.instrument_application(application)
     
     logger.info("🚀 FitAdventure Bot v5.0 Final запущен!")
     logger.info("✅ Все системы готовы к работе")
@@ -1608,7 +1495,7 @@ def main() -> None:
     print("⌨️ Нажмите Ctrl+C для остановки")
     
     try:
-        application.run_polling()
+        run_application(application)  # polling или webhook (WebhookConfig.MODE)
     except KeyboardInterrupt:
         print("\n✅ Бот остановлен пользователем")
     except Exception as e:
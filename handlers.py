@@ -13,11 +13,14 @@ from telegram.constants import ParseMode
 
 from config import States, Keyboards, Messages, CalculationConstants
 from calculations import generate_ultra_precise_recommendations
+from bot_persistence import SurveyStateStore
+from survey_profile import SurveyProfile
+from rendering import keyboard_markup, render_results
 
 logger = logging.getLogger(__name__)
 
-# Глобальное хранилище данных пользователей
-user_data_storage: Dict[int, Dict[str, Any]] = {}
+# Глобальное хранилище ответов анкеты (после запуска - в chat_data приложения)
+user_data_storage = SurveyStateStore()
 
 class InputValidator:
     """Класс для валидации пользовательского ввода"""
@@ -94,94 +97,7 @@ class MessageFormatter:
     @staticmethod
     def format_results_message(results: Dict[str, Any]) -> str:
         """Форматирование результатов расчета"""
-        if results['has_training_experience']:
-            return f"""🎉 **Ваш ультра-точный план питания готов!**
-
-🎯 **Точность расчета:** {results['precision_score']}%
-
-📊 **КАЛОРИИ ПО ДНЯМ:**
-• 💤 Дни отдыха: **{results['target_calories_rest']} ккал**
-• 🏋️ Дни тренировок: **{results['target_calories_training']} ккал**
-• 📈 Средний показатель: **{results['target_calories_average']} ккал**
-
-🥩 **МАКРОНУТРИЕНТЫ:**
-
-**🥤 Белки:** {results['protein_grams']} г ({results['protein_min']}-{results['protein_max']} г)
-
-**🥑 Жиры:**
-• Дни отдыха: {results['fats_rest']} г
-• Дни тренировок: {results['fats_training']} г
-
-**🍞 Углеводы:**
-• Дни отдыха: {results['carbs_rest']} г  
-• Дни тренировок: {results['carbs_training']} г
-
-**🌾 Клетчатка:**
-• Дни отдыха: {results['fiber_rest']} г
-• Дни тренировок: {results['fiber_training']} г
-
-**💧 Вода:** {results['water']} мл/день
-
-📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
-• 🔥 BMR (базовый метаболизм): {results['bmr']} ккал
-• ⚡ TDEE отдых: {results['tdee_rest']} ккал
-• 🏋️ TDEE тренировки: {results['tdee_training']} ккал
-• 📊 Коэффициент отдыха: {results['rest_day_factor']}
-• 💪 Коэффициент тренировок: {results['training_day_factor']}
-
-📊 **АНАЛИЗ ТЕЛА:**
-• 🎯 Процент жира: **{results['fat_percent']}%**
-• 📋 Категория: **{results['fat_category']}**
-
-**📚 ОБЪЯСНЕНИЯ:**
-• **BMR** - калории для поддержания жизнедеятельности в покое
-• **TDEE** - общий расход энергии с учетом активности
-• **Целевые калории** - калории для достижения вашей цели
-• **Процент жира** - рассчитан на основе ваших параметров
-
-✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
-
-🎯 Следуйте плану и достигайте своих целей!"""
-        else:
-            return f"""🎉 **Ваш ультра-точный план питания готов!**
-
-🎯 **Точность расчета:** {results['precision_score']}%
-
-📊 **КАЛОРИИ:**
-• 📈 Ежедневная норма: **{results['target_calories_average']} ккал**
-
-🥩 **МАКРОНУТРИЕНТЫ:**
-
-**🥤 Белки:** {results['protein_grams']} г ({results['protein_min']}-{results['protein_max']} г)
-
-**🥑 Жиры:** {results['fats_rest']} г
-
-**🍞 Углеводы:** {results['carbs_rest']} г
-
-**🌾 Клетчатка:** {results['fiber_rest']} г
-
-**💧 Вода:** {results['water']} мл/день
-
-📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
-• 🔥 BMR (базовый метаболизм): {results['bmr']} ккал
-• ⚡ TDEE (общий расход энергии): {results['tdee_average']} ккал
-• 📊 Коэффициент активности: {results['rest_day_factor']}
-
-📊 **АНАЛИЗ ТЕЛА:**
-• 🎯 Процент жира: **{results['fat_percent']}%**
-• 📋 Категория: **{results['fat_category']}**
-
-**📚 ОБЪЯСНЕНИЯ:**
-• **BMR** - калории для поддержания жизнедеятельности в покое
-• **TDEE** - общий расход энергии с учетом активности
-• **Целевые калории** - калории для достижения вашей цели
-• **Процент жира** - рассчитан на основе ваших параметров
-
-💡 **РЕКОМЕНДАЦИЯ:** Если планируете начать тренировки, пересчитайте план с учетом новой активности!
-
-✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
-
-🎯 Следуйте плану и достигайте своих целей!"""
+        return render_results(results)
 
 class CommandHandlers:
     """Класс для обработчиков команд"""
@@ -190,13 +106,9 @@ class CommandHandlers:
     async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Стартовая команда"""
         chat_id = update.message.chat_id
-        user_data_storage[chat_id] = {}
+        user_data_storage[chat_id] = SurveyProfile()
         
-        reply_markup = ReplyKeyboardMarkup(
-            Keyboards.MAIN_MENU, 
-            resize_keyboard=True, 
-            one_time_keyboard=False
-        )
+        reply_markup = keyboard_markup('MAIN_MENU')
         
         await update.message.reply_text(
             Messages.WELCOME,
@@ -218,7 +130,7 @@ class CommandHandlers:
         """Отмена анализа"""
         chat_id = update.message.chat_id
         
-        reply_markup = ReplyKeyboardMarkup(Keyboards.MAIN_MENU, resize_keyboard=True)
+        reply_markup = keyboard_markup('MAIN_MENU')
         
         await update.message.reply_text(
             "❌ **Анализ отменен**\n\nНажмите 🚀 Начать для нового расчета",
@@ -238,9 +150,9 @@ class SurveyHandlers:
     async def start_survey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Начало опроса"""
         chat_id = update.message.chat_id
-        user_data_storage[chat_id] = {}
+        user_data_storage[chat_id] = SurveyProfile()
         
-        reply_markup = ReplyKeyboardMarkup(Keyboards.GENDER_CHOICE, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('GENDER_CHOICE', one_time_keyboard=True)
         
         await update.message.reply_text(
             "👤 **Этап 1/12:** Ваш пол?",
@@ -268,7 +180,7 @@ class SurveyHandlers:
             
             logger.info(f"User {chat_id} selected gender: {user_data_storage[chat_id]['gender']}")
             
-            reply_markup = ReplyKeyboardMarkup(Keyboards.MAIN_MENU, resize_keyboard=True)
+            reply_markup = keyboard_markup('MAIN_MENU')
             await update.message.reply_text(
                 "🎂 **Этап 2/12:** Укажите ваш возраст (число от 16 до 80)",
                 reply_markup=reply_markup,
@@ -351,7 +263,7 @@ class SurveyHandlers:
             
             logger.info(f"User {chat_id} entered height: {height_value}")
             
-            reply_markup = ReplyKeyboardMarkup(Keyboards.FAT_PERCENTAGE_CHOICE, resize_keyboard=True, one_time_keyboard=True)
+            reply_markup = keyboard_markup('FAT_PERCENTAGE_CHOICE', one_time_keyboard=True)
             await update.message.reply_text(
                 "🔥 **Этап 5/12:** Знаете ли вы процент жира в организме?",
                 reply_markup=reply_markup,
@@ -408,7 +320,7 @@ class SurveyHandlers:
     @staticmethod
     async def show_goal_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Показать выбор цели"""
-        reply_markup = ReplyKeyboardMarkup(Keyboards.GOAL_CHOICE, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('GOAL_CHOICE', one_time_keyboard=True)
         
         await update.message.reply_text(
             "🎯 **Этап 6/12:** Ваша цель?",
@@ -436,7 +348,7 @@ class SurveyHandlers:
             await update.message.reply_text("❌ Пожалуйста, выберите цель, используя кнопки")
             return States.GOAL
         
-        reply_markup = ReplyKeyboardMarkup(Keyboards.TRAINING_EXPERIENCE, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('TRAINING_EXPERIENCE', one_time_keyboard=True)
         await update.message.reply_text(
             "💪 **Этап 7/12:** Есть ли у вас опыт в тренировках или спорте?",
             reply_markup=reply_markup,
@@ -495,7 +407,7 @@ class ButtonHandlers:
     @staticmethod
     async def show_mini_apps_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Показать меню мини-приложений"""
-        reply_markup = ReplyKeyboardMarkup(Keyboards.MINI_APPS_MENU, resize_keyboard=True)
+        reply_markup = keyboard_markup('MINI_APPS_MENU')
         
         text = """🎮 **Мини-приложения FitAdventure**
 
@@ -519,9 +431,9 @@ class ButtonHandlers:
     async def return_to_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         """Вернуться в главное меню"""
         chat_id = update.message.chat_id
-        user_data_storage[chat_id] = {}
+        user_data_storage[chat_id] = SurveyProfile()
         
-        reply_markup = ReplyKeyboardMarkup(Keyboards.MAIN_MENU, resize_keyboard=True, one_time_keyboard=False)
+        reply_markup = keyboard_markup('MAIN_MENU')
         
         await update.message.reply_text(
             Messages.WELCOME,
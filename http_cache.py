@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Кэширование статических ответов Flask API FitAdventure
+Тело ответа сериализуется и сжимается (gzip, brotli) один раз при запуске;
+клиенту отдается подходящее сжатие, повторные запросы получают 304 по ETag
+или Last-Modified.
+"""
+
+import gzip
+import hashlib
+import time
+from typing import Dict, Optional
+
+from flask import Response, request
+from werkzeug.http import http_date
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Данные меняются только при деплое: браузер хранит ответ, но перепроверяет его
+CACHE_CONTROL = 'public, no-cache'
+# Маленькие ответы не сжимаем - заголовки сжатия дороже выигрыша
+MIN_COMPRESS_SIZE = 256
+
+# Кодировки в порядке предпочтения сервера и суффиксы ETag для них
+ENCODING_SUFFIXES = {'br': 'br', 'gzip': 'gz'}
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """Кодировки из Accept-Encoding с весами q"""
+    encodings = {}
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+class PrecompressedResponse:
+    """Неизменяемый ответ: тело, его сжатые варианты, ETag и Last-Modified"""
+
+    def __init__(self, body: bytes, mimetype: str = 'application/json', last_modified: Optional[float] = None):
+        self.body = body
+        self.mimetype = mimetype
+        self.last_modified = int(last_modified if last_modified is not None else time.time())
+        self.etag = hashlib.sha256(body).hexdigest()[:20]
+
+        # Сжатые варианты; сохраняем только если они действительно меньше
+        self.variants: Dict[str, bytes] = {}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            compressed = {'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+            if BROTLI_AVAILABLE:
+                compressed['br'] = brotli.compress(body, quality=11)
+            for encoding, data in compressed.items():
+                if len(data) < len(body):
+                    self.variants[encoding] = data
+
+    def choose_encoding(self, accept_encoding: Optional[str]) -> Optional[str]:
+        """Лучшее сжатие из принимаемых клиентом (None - без сжатия)"""
+        accepted = parse_accept_encoding(accept_encoding)
+        best, best_quality = None, 0.0
+        for encoding in ENCODING_SUFFIXES:
+            if encoding not in self.variants:
+                continue
+            quality = accepted.get(encoding, accepted.get('*', 0.0))
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Сильный ETag конкретного представления (у каждого сжатия свой)"""
+        return f"{self.etag}-{ENCODING_SUFFIXES[encoding]}" if encoding else self.etag
+
+    def is_not_modified(self, encoding: Optional[str]) -> bool:
+        """Проверка условных заголовков запроса"""
+        if request.if_none_match:
+            # Любое представление тех же данных считается совпадением
+            return any(request.if_none_match.contains_weak(self.etag_for(variant))
+                       for variant in (None, *ENCODING_SUFFIXES))
+        if request.if_modified_since:
+            return request.if_modified_since.timestamp() >= self.last_modified
+        return False
+
+    def make_response(self) -> Response:
+        """Ответ на текущий запрос: 304, сжатое или исходное тело"""
+        encoding = self.choose_encoding(request.headers.get('Accept-Encoding'))
+        headers = {
+            'ETag': f'"{self.etag_for(encoding)}"',
+            'Last-Modified': http_date(self.last_modified),
+            'Cache-Control': CACHE_CONTROL,
+            'Vary': 'Accept-Encoding',
+        }
+
+        if self.is_not_modified(encoding):
+            return Response(status=304, headers=headers)
+
+        if encoding:
+            headers['Content-Encoding'] = encoding
+            return Response(self.variants[encoding], mimetype=self.mimetype, headers=headers)
+        return Response(self.body, mimetype=self.mimetype, headers=headers)
@@ -9,6 +9,7 @@ FitAdventure Bot - Финальная версия
 
 import os
 import sys
+import functools
 import json
 import logging
 from pathlib import Path
@@ -17,6 +18,20 @@ from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, KeyboardB
 from telegram.ext import Application, CommandHandler, ConversationHandler, MessageHandler, filters, ContextTypes
 from telegram.constants import ParseMode
 
+from config import StorageConfig, Keyboards
+from storage import close_storage
+from calculations import calculator
+from ultra_precise_formulas import attach_adaptation_storage
+from bot_persistence import SQLitePersistence, SurveyStateStore, schedule_session_sweeper
+from bot_webhook import run_application
+from bot_logging import setup_logging
+import metrics
+from button_router import ButtonRouter
+import tracing
+from tracing import TracingRequest, traces_command
+from survey_profile import SurveyProfile
+from rendering import CONSULTATION_PROMPT, keyboard_markup, render_results
+
 # Импорт мини-приложений
 try:
     from mini_apps import (
@@ -98,14 +113,7 @@ def setup_bot_token():
 load_dotenv()
 
 # --- Логирование ---
-logging.basicConfig(
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    level=logging.INFO,
-    handlers=[
-        logging.FileHandler('bot_debug.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+# Настраивается в main(): импорт модуля не открывает файл лога и не запускает поток
 logger = logging.getLogger(__name__)
 
 # --- Состояния ---
@@ -121,274 +129,22 @@ PRODUCTS_MAIN, PRODUCTS_CATEGORY, PRODUCT_DETAILS, PRODUCT_SEARCH_NEW = range(21
 WATER_TRACKER, WATER_REMINDERS, WATER_REMINDER_INTERVAL = range(25, 28)
 
 # --- Хранилище ---
-user_data_storage = {}
+# Ответы анкеты; после запуска хранятся в chat_data и сохраняются вместе с ним
+user_data_storage = SurveyStateStore()
 
 # === УЛЬТРА-ТОЧНЫЕ РАСЧЕТЫ ===
 def generate_ultra_precise_recommendations(user_data):
     """Генерация ультра-точных рекомендаций с разделением по дням"""
-    logger.info(f"Starting ultra-precise calculations with data: {user_data}")
-    
-    # Проверка обязательных полей
-    required_fields = [
-        'weight', 'height', 'age', 'gender', 'steps',
-        'occupation', 'recovery', 'sleep_quality', 'stress_level', 'goal'
-    ]
-    missing = [field for field in required_fields if field not in user_data]
-    if missing:
-        raise ValueError(f"Не заполнены обязательные поля: {', '.join(missing)}. Пройдите все этапы опроса!")
-    
-    # Проверяем наличие опыта в тренировках
-    has_training_experience = user_data.get('has_training_experience', True)
-    
-    # Если есть опыт в тренировках, проверяем дополнительные поля
-    if has_training_experience:
-        training_fields = ['training_days', 'activity_type', 'intensity', 'workout_duration']
-        missing_training = [field for field in training_fields if field not in user_data]
-        if missing_training:
-            raise ValueError(f"Не заполнены поля тренировок: {', '.join(missing_training)}. Пройдите все этапы опроса!")
-    
-    # Базовые параметры
-    weight = user_data['weight']
-    height = user_data['height'] 
-    age = user_data['age']
-    gender = user_data['gender']
-    
-    logger.info(f"Basic parameters - Weight: {weight}, Height: {height}, Age: {age}, Gender: {gender}")
-    
-    # Расчет процента жира (если не указан пользователем)
-    fat_percent = user_data.get('fat_percent')
-    if fat_percent is None:
-        # Расчет по формуле BMI и возрасту
-        bmi = weight / ((height / 100) ** 2)
-        
-        if gender == 'мужчина':
-            if age < 30:
-                fat_percent = 1.20 * bmi + 0.23 * age - 16.2
-            elif age < 50:
-                fat_percent = 1.20 * bmi + 0.23 * age - 16.2
-            else:
-                fat_percent = 1.20 * bmi + 0.23 * age - 16.2
-        else:  # женщина
-            if age < 30:
-                fat_percent = 1.20 * bmi + 0.23 * age - 5.4
-            elif age < 50:
-                fat_percent = 1.20 * bmi + 0.23 * age - 5.4
-            else:
-                fat_percent = 1.20 * bmi + 0.23 * age - 5.4
-        
-        # Ограничиваем значения
-        fat_percent = max(8, min(35, fat_percent))
-        user_data['fat_percent'] = round(fat_percent, 1)
-    
-    # Определение категории по проценту жира
-    if gender == 'мужчина':
-        if fat_percent < 6:
-            fat_category = "Экстремально низкий"
-        elif fat_percent < 14:
-            fat_category = "Спортивный"
-        elif fat_percent < 18:
-            fat_category = "Фитнес"
-        elif fat_percent < 25:
-            fat_category = "Средний"
-        elif fat_percent < 32:
-            fat_category = "Высокий"
-        else:
-            fat_category = "Очень высокий"
-    else:  # женщина
-        if fat_percent < 14:
-            fat_category = "Экстремально низкий"
-        elif fat_percent < 21:
-            fat_category = "Спортивный"
-        elif fat_percent < 25:
-            fat_category = "Фитнес"
-        elif fat_percent < 32:
-            fat_category = "Средний"
-        elif fat_percent < 38:
-            fat_category = "Высокий"
-        else:
-            fat_category = "Очень высокий"
-    
-    user_data['fat_category'] = fat_category
-    logger.info(f"Calculated fat percentage: {fat_percent}% ({fat_category})")
-    
-    # BMR по формуле Mifflin-St Jeor
-    if gender == 'мужчина':
-        bmr = 10 * weight + 6.25 * height - 5 * age + 5
-    else:
-        bmr = 10 * weight + 6.25 * height - 5 * age - 161
-    
-    logger.info(f"Base BMR calculated: {bmr}")
-    
-    # Детальный расчет активности
-    steps = user_data['steps']
-    
-    # Рабочая активность
-    occupation_factors = {
-        'office': 0.15,      # Офисная работа
-        'healthcare': 0.25,  # Активная работа  
-        'construction': 0.35 # Физический труд
-    }
-    work_factor = occupation_factors.get(user_data['occupation'], 0.2)
-    
-    # Тренировочная активность (только если есть опыт)
-    if has_training_experience:
-        training_days = user_data['training_days']
-        
-        # Тренировочная активность
-        activity_multipliers = {
-            'Силовые': 0.08,
-            'Выносливость': 0.06,
-            'Кроссфит': 0.1
-        }
-        training_base = activity_multipliers.get(user_data['activity_type'], 0.08)
-        
-        # Интенсивность тренировок
-        intensity_multipliers = {
-            'low': 0.8,
-            'moderate': 1.0,
-            'high': 1.2,
-            'very_high': 1.4
-        }
-        intensity_factor = intensity_multipliers.get(user_data['intensity'], 1.0)
-        
-        # Продолжительность тренировки
-        duration_factor = min(user_data['workout_duration'] / 60, 2.0)  # Максимум 2x
-        
-        training_factor = training_base * intensity_factor * duration_factor * (training_days / 7)
-    else:
-        training_factor = 0.0  # Нет тренировок
-    
-    # Шаги
-    steps_factor = min(steps / 10000 * 0.05, 0.15)  # Максимум 0.15
-    
-    logger.info(f"Activity breakdown - Work: {work_factor}, Training: {training_factor}, Steps: {steps_factor}")
-    
-    # Факторы восстановления
-    recovery_factors = {
-        'excellent': 1.05,
-        'good': 1.0,
-        'average': 0.95,
-        'poor': 0.9
-    }
-    recovery_multiplier = recovery_factors.get(user_data['recovery'], 1.0)
-    
-    sleep_factors = {
-        'excellent': 1.05,
-        'good': 1.0,
-        'average': 0.95,
-        'poor': 0.9
-    }
-    sleep_multiplier = sleep_factors.get(user_data['sleep_quality'], 1.0)
-    
-    # Стресс (обратная зависимость)
-    stress_level = user_data['stress_level']
-    stress_multiplier = max(0.85, 1.1 - (stress_level / 10) * 0.25)
+    logger.debug("Starting ultra-precise calculations with data: %s", user_data)
     
-    logger.info(f"Recovery factors - Recovery: {recovery_multiplier}, Sleep: {sleep_multiplier}, Stress: {stress_multiplier}")
+    # Единый движок расчета (с кэшем); ValueError, если анкета не заполнена
+    result = calculator.calculate_nutrition_plan(user_data)
     
-    # Раздельный расчет для дней отдыха и тренировок
-    rest_day_factor = 1 + work_factor + steps_factor
-    training_day_factor = rest_day_factor + training_factor
-    
-    # Применяем факторы восстановления
-    rest_day_factor *= recovery_multiplier * sleep_multiplier * stress_multiplier
-    training_day_factor *= recovery_multiplier * sleep_multiplier * stress_multiplier
-    
-    # Если нет опыта в тренировках, все дни считаются как дни отдыха
-    if not has_training_experience:
-        training_day_factor = rest_day_factor
-    
-    logger.info(f"Rest day factor: {rest_day_factor}, Training day factor: {training_day_factor}")
-    
-    # TDEE для каждого типа дня
-    tdee_rest = int(bmr * rest_day_factor)
-    tdee_training = int(bmr * training_day_factor)
-    
-    # Средний TDEE
-    if has_training_experience:
-        rest_days = 7 - training_days
-        tdee_average = int((tdee_rest * rest_days + tdee_training * training_days) / 7)
-    else:
-        rest_days = 7
-        training_days = 0
-        tdee_average = tdee_rest  # Все дни как дни отдыха
-    
-    logger.info(f"TDEE Rest Day: {tdee_rest}, TDEE Training Day: {tdee_training}, Average: {tdee_average}")
-    
-    # Корректировка под цель
-    goal_adjustments = {
-        'Похудение': -0.15,      # Дефицит 15%
-        'Поддержание': 0,        # Без изменений
-        'Набор массы': 0.1       # Профицит 10%
-    }
-    
-    goal = user_data['goal']
-    adjustment = goal_adjustments.get(goal, 0)
-    
-    logger.info(f"Goal: {goal}")
-    
-    # Целевые калории для каждого типа дня
-    target_calories_rest = int(tdee_rest * (1 + adjustment))
-    target_calories_training = int(tdee_training * (1 + adjustment))
-    target_calories_average = int(tdee_average * (1 + adjustment))
-    
-    logger.info(f"Target calories - Rest day: {target_calories_rest}, Training day: {target_calories_training}, Average: {target_calories_average}")
-    
-    # Расчет макронутриентов
-    # Белки: 2.0-2.2 г/кг веса
-    protein_grams = int(weight * 2.1)
-    protein_min = int(weight * 1.9)
-    protein_max = int(weight * 2.3)
-    
-    # Жиры: 25% от калорий (одинаково для всех дней)
-    fats_rest = int(target_calories_rest * 0.25 / 9)
-    fats_training = int(target_calories_training * 0.25 / 9)
-    
-    # Углеводы: оставшиеся калории
-    protein_calories = protein_grams * 4
-    fat_calories_rest = fats_rest * 9
-    fat_calories_training = fats_training * 9
-    
-    carbs_rest = int((target_calories_rest - protein_calories - fat_calories_rest) / 4)
-    carbs_training = int((target_calories_training - protein_calories - fat_calories_training) / 4)
-    
-    logger.info(f"Rest day macros - Protein: {protein_grams}г, Fats: {fats_rest}г, Carbs: {carbs_rest}г")
-    logger.info(f"Training day macros - Protein: {protein_grams}г, Fats: {fats_training}г, Carbs: {carbs_training}г")
-    
-    # Клетчатка и вода
-    fiber_rest = max(16, int(carbs_rest * 0.1))
-    fiber_training = max(19, int(carbs_training * 0.1)) 
-    water = int(weight * 35)  # 35 мл на кг веса
-    
-    result = {
-        'bmr': int(bmr),
-        'tdee_rest': tdee_rest,
-        'tdee_training': tdee_training,
-        'tdee_average': tdee_average,
-        'target_calories_rest': target_calories_rest,
-        'target_calories_training': target_calories_training,
-        'target_calories_average': target_calories_average,
-        'protein_grams': protein_grams,
-        'protein_min': protein_min,
-        'protein_max': protein_max,
-        'fats_rest': fats_rest,
-        'fats_training': fats_training,
-        'carbs_rest': carbs_rest,
-        'carbs_training': carbs_training,
-        'fiber_rest': fiber_rest,
-        'fiber_training': fiber_training,
-        'water': water,
-        'rest_day_factor': round(rest_day_factor, 2),
-        'training_day_factor': round(training_day_factor, 2),
-        'training_days': training_days,
-        'rest_days': rest_days,
-        'has_training_experience': has_training_experience,
-        'fat_percent': user_data['fat_percent'],
-        'fat_category': user_data['fat_category'],
-        'precision_score': 98  # Высокая точность
-    }
+    # Процент жира и категория сохраняются в анкете пользователя
+    user_data['fat_percent'] = result['fat_percent']
+    user_data['fat_category'] = result['fat_category']
     
-    logger.info(f"Ultra-precise result: {result}")
+    logger.debug("Ultra-precise result: %s", result)
     return result
 
 # === ОБРАБОТЧИКИ КОМАНД ===
@@ -396,12 +152,12 @@ def generate_ultra_precise_recommendations(user_data):
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Стартовая команда"""
     chat_id = update.message.chat_id
-    user_data_storage[chat_id] = {}
+    user_data_storage[chat_id] = SurveyProfile()
     
     # Постоянные кнопки внизу экрана
     keyboard = [
         ['🚀 Начать', '❓ Помощь'],
-        [KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp_products_github.html?v=686')), '📊 О боте'],
+        [KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url=Keyboards.PRODUCTS_WEBAPP_URL)), '📊 О боте'],
         [KeyboardButton('', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp/'))]
     ]
     reply_markup = ReplyKeyboardMarkup(
@@ -433,18 +189,15 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     return GENDER
 
 async def handle_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    """Обработка нажатий на постоянные кнопки"""
-    text = update.message.text
-    chat_id = update.message.chat_id
-    
-    print(f"🔍 DEBUG: Получено сообщение '{text}' от пользователя {update.effective_user.id}")
+    """Обработка нажатий на постоянные кнопки (таблица маршрутов buttons)"""
+    logger.debug("Button message %r from user %s", update.message.text, update.effective_user.id)
     
-    if text == '🚀 Начать':
-        return await start_survey(update, context)
-    elif text == '❓ Помощь':
-        return await help_command(update, context)
-    elif text == '📊 О боте':
-        about_text = """🤖 **FitAdventure Bot v5.0**
+    # Если это не кнопка, обрабатываем как обычное сообщение
+    return await buttons.dispatch(update, context, GENDER, default=handle_message)
+
+async def show_about(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Информация о боте"""
+    about_text = """🤖 **FitAdventure Bot v5.0**
 
 ✨ **Возможности:**
 • Ультра-точные расчеты питания (98% точность)
@@ -468,11 +221,13 @@ async def handle_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 • Адаптивные коэффициенты активности
 
 👨‍💻 **Разработано с ❤️ для достижения ваших целей**"""
-        
-        await update.message.reply_text(about_text, parse_mode=ParseMode.MARKDOWN)
-        return GENDER
-    elif text == '💬 Получить консультацию':
-        consultation_text = """💬 **Персональная консультация**
+    
+    await update.message.reply_text(about_text, parse_mode=ParseMode.MARKDOWN)
+    return GENDER
+
+async def show_consultation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Контакты для персональной консультации"""
+    consultation_text = """💬 **Персональная консультация**
 
 🎯 **Что вы получите:**
 • 📋 Индивидуальный план тренировок
@@ -491,83 +246,25 @@ async def handle_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 💡 **Стоимость и детали обсудим в личных сообщениях**
 
 🚀 **Готовы к трансформации?** Свяжитесь прямо сейчас!"""
-        
-        keyboard = [['🚀 Начать заново', '❓ Помощь'], ['📊 О боте']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        await update.message.reply_text(consultation_text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        return GENDER
-    elif text == '🚀 Начать заново':
-        return await start_survey(update, context)
-    
-    elif text == '🔙 Главное меню':
-        return await return_to_main_menu(update, context)
-    
-    # Обработка кнопок трекера воды
-    elif text == '💧 Трекер воды':
-        try:
-            from mini_apps import show_water_tracker
-            return await show_water_tracker(update, context)
-        except Exception as e:
-            logger.error(f"Ошибка открытия трекера воды: {e}")
-            await update.message.reply_text("❌ Ошибка открытия трекера воды")
-            return GENDER
-    
-    # Обработка кнопок базы продуктов
-    elif text == '🌾 Сложные углеводы':
-        return await show_products_category(update, context, 'сложные_углеводы')
-    
-    elif text == '⚡ Простые углеводы':
-        return await show_products_category(update, context, 'простые_углеводы')
-    
-    elif text == '🥩 Белки':
-        return await show_products_category(update, context, 'белки')
-    
-    elif text == '🫒 Ненасыщенные жиры':
-        return await show_products_category(update, context, 'ненасыщенные_жиры')
-    
-    elif text == '🧈 Насыщенные жиры':
-        return await show_products_category(update, context, 'насыщенные_жиры')
     
-    elif text == '🌿 Клетчатка':
-        return await show_products_category(update, context, 'клетчатка')
+    reply_markup = keyboard_markup('CONSULTATION_MENU')
     
-    elif text == '🔍 Поиск продукта':
-        return await show_search_interface(update, context)
-    
-    elif text == '📊 Рекомендации':
-        return await show_recommendations(update, context)
-    
-    elif text == '🔙 Назад':
-        # Возвращаемся к меню мини-приложений
-        keyboard = [
-            [''],
-            ['🔙 Главное меню']
-        ]
-        
-        text = """🎮 **Мини-приложения FitAdventure**
-
-Выберите нужное приложение:
+    await update.message.reply_text(consultation_text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
+    return GENDER
 
-🍎 **База продуктов** - калорийность и БЖУ продуктов
-   • Поиск по названию
-   • Фильтрация по категориям
-   • Рекомендации под вашу цель
-   • Детальная информация о продуктах"""
-        
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
+async def open_water_tracker(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Открытие трекера воды"""
+    try:
+        from mini_apps import show_water_tracker
+        return await show_water_tracker(update, context)
+    except Exception as e:
+        logger.error(f"Ошибка открытия трекера воды: {e}")
+        await update.message.reply_text("❌ Ошибка открытия трекера воды")
         return GENDER
-    
-    elif text == '🔙 Назад к приложениям':
-        # Возвращаемся к меню мини-приложений
-        keyboard = [
-            [''],
-            ['🔙 Главное меню']
-        ]
-        
-        text = """🎮 **Мини-приложения FitAdventure**
+
+async def back_to_mini_apps(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Возврат к меню мини-приложений"""
+    text = """🎮 **Мини-приложения FitAdventure**
 
 Выберите нужное приложение:
 
@@ -576,24 +273,18 @@ async def handle_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
    • Фильтрация по категориям
    • Рекомендации под вашу цель
    • Детальная информация о продуктах"""
-        
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        return GENDER
     
-    elif text == '🔙 Назад к категориям':
-        # Возвращаемся к меню категорий продуктов
-        keyboard = [
-            ['🌾 Сложные углеводы', '⚡ Простые углеводы'],
-            ['🥩 Белки', '🫒 Ненасыщенные жиры'],
-            ['🧈 Насыщенные жиры', '🌿 Клетчатка'],
-            ['🔍 Поиск продукта', '📊 Рекомендации'],
-            ['🔙 Назад']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        
-        text = """🍎 **База продуктов FitAdventure**
+    # 🍎 База продуктов открывается как Web App
+    reply_markup = keyboard_markup('MINI_APPS_MENU', web_apps=True)
+    
+    await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
+    return GENDER
+
+async def back_to_categories(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
+    """Возврат к меню категорий продуктов"""
+    reply_markup = keyboard_markup('PRODUCTS_CATEGORIES')
+    
+    text = """🍎 **База продуктов FitAdventure**
 
 📊 **Выберите категорию продуктов:**
 
@@ -608,20 +299,16 @@ async def handle_buttons(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 📊 **Рекомендации** - персональные советы
 
 💡 **Выберите категорию для просмотра продуктов**"""
-        
-        await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-        return GENDER
     
-    # Если это не кнопка, обрабатываем как обычное сообщение
-    return await handle_message(update, context)
+    await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
+    return GENDER
 
 async def start_survey(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Начало опроса"""
     chat_id = update.message.chat_id
-    user_data_storage[chat_id] = {}
+    user_data_storage[chat_id] = SurveyProfile()
     
-    keyboard = [['👨 Мужчина', '👩 Женщина']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('GENDER_CHOICE', one_time_keyboard=True)
     
     await update.message.reply_text(
         "👤 **Этап 1/12:** Ваш пол?",
@@ -731,8 +418,7 @@ async def height(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     user_data_storage[chat_id]['height'] = height_value
     logger.info(f"User {chat_id} entered height: {height_value}")
     
-    keyboard = [['✅ Да, знаю', '❌ Не знаю']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('FAT_PERCENTAGE_CHOICE', one_time_keyboard=True)
     
     await update.message.reply_text(
         "🔥 **Этап 5/12:** Знаете ли вы процент жира в организме?",
@@ -786,12 +472,7 @@ async def fat_percentage_input(update: Update, context: ContextTypes.DEFAULT_TYP
 
 async def show_goal_selection(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Показать выбор цели"""
-    keyboard = [
-        ['📉 Похудение'],
-        ['⚖️ Поддержание'],
-        ['📈 Набор массы']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('GOAL_CHOICE', one_time_keyboard=True)
     
     await update.message.reply_text(
         "🎯 **Этап 6/12:** Ваша цель?",
@@ -817,11 +498,7 @@ async def goal(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     
     logger.info(f"User {chat_id} selected goal: {user_data_storage[chat_id]['goal']}")
     
-    keyboard = [
-        ['✅ Есть опыт'],
-        ['❌ Нет опыта']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('TRAINING_EXPERIENCE', one_time_keyboard=True)
     
     await update.message.reply_text(
         "💪 **Этап 7/12:** Есть ли у вас опыт в тренировках или спорте?",
@@ -839,12 +516,7 @@ async def has_training_experience(update: Update, context: ContextTypes.DEFAULT_
         user_data_storage[chat_id]['has_training_experience'] = True
         logger.info(f"User {chat_id} has training experience")
         
-        keyboard = [
-            ['🌱 Новичок (до 1 года)'],
-            ['🔥 Средний (1-3 года)'],
-            ['⚡ Опытный (3+ года)']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('EXPERIENCE_LEVEL', one_time_keyboard=True)
         
         await update.message.reply_text(
             "💪 **Этап 8/12:** Ваш опыт тренировок?",
@@ -894,11 +566,7 @@ async def training_experience(update: Update, context: ContextTypes.DEFAULT_TYPE
     
     logger.info(f"User {chat_id} selected experience: {user_data_storage[chat_id]['training_experience']}")
     
-    keyboard = [
-        ['1️⃣ день', '2️⃣ дня', '3️⃣ дня'],
-        ['4️⃣ дня', '5️⃣ дней', '6️⃣ дней']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('TRAINING_DAYS', one_time_keyboard=True)
     
     await update.message.reply_text(
         "🏃 **Этап 9/12:** Сколько дней в неделю тренируетесь?",
@@ -928,12 +596,7 @@ async def training_days(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         await update.message.reply_text("❌ Пожалуйста, выберите количество дней, используя кнопки")
         return TRAINING_DAYS
     
-    keyboard = [
-        ['🏋️ Силовые тренировки'],
-        ['🏃 Кардио/выносливость'],
-        ['⚡ Кроссфит/функциональные']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('ACTIVITY_TYPES', one_time_keyboard=True)
     
     await update.message.reply_text(
         "💪 **Тип тренировок?**",
@@ -1018,13 +681,7 @@ async def steps(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     
     if has_training_experience:
         # Если есть опыт в тренировках, спрашиваем об интенсивности
-        keyboard = [
-            ['🟢 Низкая'],
-            ['🟡 Средняя'], 
-            ['🔴 Высокая'],
-            ['⚡ Очень высокая']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('INTENSITY_LEVELS', one_time_keyboard=True)
         
         await update.message.reply_text(
             "🔥 **Этап 9/12:** Интенсивность ваших тренировок?",
@@ -1039,13 +696,7 @@ async def steps(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         user_data_storage[chat_id]['recovery'] = 'average'
         
         # Переходим к вопросу о качестве сна
-        keyboard = [
-            ['😴 Отличный (8+ часов)'],
-            ['😊 Хороший (7-8 часов)'],
-            ['😐 Средний (6-7 часов)'],
-            ['😞 Плохой (<6 часов)']
-        ]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+        reply_markup = keyboard_markup('SLEEP_QUALITY', one_time_keyboard=True)
         
         await update.message.reply_text(
             "🌙 **Этап 9/12:** Качество сна?",
@@ -1073,13 +724,7 @@ async def intensity(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         await update.message.reply_text("❌ Пожалуйста, выберите интенсивность, используя кнопки")
         return INTENSITY
     
-    keyboard = [
-        ['⭐ Отличное'],
-        ['✅ Хорошее'],
-        ['🔶 Среднее'],
-        ['❌ Плохое']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('RECOVERY_QUALITY', one_time_keyboard=True)
     
     # Определяем номер этапа в зависимости от наличия опыта в тренировках
     stage_number = "10/12" if user_data_storage[chat_id].get('has_training_experience', True) else "9/12"
@@ -1110,13 +755,7 @@ async def recovery(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         await update.message.reply_text("❌ Пожалуйста, выберите качество восстановления, используя кнопки")
         return RECOVERY
     
-    keyboard = [
-        ['😴 Отличный (8+ часов)'],
-        ['😊 Хороший (7-8 часов)'],
-        ['😐 Средний (6-7 часов)'],
-        ['😞 Плохой (<6 часов)']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('SLEEP_QUALITY', one_time_keyboard=True)
     
     # Определяем номер этапа в зависимости от наличия опыта в тренировках
     stage_number = "11/12" if user_data_storage[chat_id].get('has_training_experience', True) else "9/12"
@@ -1147,12 +786,7 @@ async def sleep_quality(update: Update, context: ContextTypes.DEFAULT_TYPE) -> i
         await update.message.reply_text("❌ Пожалуйста, выберите качество сна, используя кнопки")
         return SLEEP_QUALITY
     
-    keyboard = [
-        ['😌 Низкий (1-3)'],
-        ['😐 Средний (4-6)'], 
-        ['😰 Высокий (7-10)']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('STRESS_LEVELS', one_time_keyboard=True)
     
     # Определяем номер этапа в зависимости от наличия опыта в тренировках
     stage_number = "11/12" if user_data_storage[chat_id].get('has_training_experience', True) else "10/12"
@@ -1182,12 +816,7 @@ async def stress_level(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         await update.message.reply_text("❌ Пожалуйста, выберите уровень стресса, используя кнопки")
         return STRESS_LEVEL
     
-    keyboard = [
-        ['💻 Офисная работа'],
-        ['🏃 Активная работа'],
-        ['💪 Физический труд']
-    ]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True, one_time_keyboard=True)
+    reply_markup = keyboard_markup('OCCUPATION_TYPES', one_time_keyboard=True)
     
     # Определяем номер этапа в зависимости от наличия опыта в тренировках
     stage_number = "12/12" if user_data_storage[chat_id].get('has_training_experience', True) else "11/12"
@@ -1218,8 +847,7 @@ async def occupation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
         return OCCUPATION
     
     # Возвращаем постоянные кнопки
-    keyboard = [['🚀 Начать', '❓ Помощь'], ['📊 О боте']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('SHORT_MENU')
     
     # Показываем процесс расчета
     calculating_msg = await update.message.reply_text(
@@ -1230,119 +858,21 @@ async def occupation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     
     # Генерируем ультра-точные рекомендации
     try:
-        logger.info(f"Starting calculations for user {chat_id}")
-        logger.info(f"User data: {user_data_storage[chat_id]}")
+        logger.debug("Starting calculations for user %s", chat_id)
+        logger.debug("User data: %s", user_data_storage[chat_id])
         
         results = generate_ultra_precise_recommendations(user_data_storage[chat_id])
         
-        # Форматируем результат в зависимости от наличия опыта в тренировках
-        if results['has_training_experience']:
-            result_message = f"""🎉 **Ваш ультра-точный план питания готов!**
-
-🎯 **Точность расчета:** {results['precision_score']}%
-
-📊 **КАЛОРИИ ПО ДНЯМ:**
-• 💤 Дни отдыха: **{results['target_calories_rest']} ккал**
-• 🏋️ Дни тренировок: **{results['target_calories_training']} ккал**
-• 📈 Средний показатель: **{results['target_calories_average']} ккал**
-
-🥩 **МАКРОНУТРИЕНТЫ:**
-
-**🥤 Белки:** {results['protein_grams']} г ({results['protein_min']}-{results['protein_max']} г)
-
-**🥑 Жиры:**
-• Дни отдыха: {results['fats_rest']} г
-• Дни тренировок: {results['fats_training']} г
-
-**🍞 Углеводы:**
-• Дни отдыха: {results['carbs_rest']} г  
-• Дни тренировок: {results['carbs_training']} г
-
-**🌾 Клетчатка:**
-• Дни отдыха: {results['fiber_rest']} г
-• Дни тренировок: {results['fiber_training']} г
-
-**💧 Вода:** {results['water']} мл/день
-
-📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
-• 🔥 BMR (базовый метаболизм): {results['bmr']} ккал
-• ⚡ TDEE отдых: {results['tdee_rest']} ккал
-• 🏋️ TDEE тренировки: {results['tdee_training']} ккал
-• 📊 Коэффициент отдыха: {results['rest_day_factor']}
-• 💪 Коэффициент тренировок: {results['training_day_factor']}
-
-📊 **АНАЛИЗ ТЕЛА:**
-• 🎯 Процент жира: **{results['fat_percent']}%**
-• 📋 Категория: **{results['fat_category']}**
-
-**📚 ОБЪЯСНЕНИЯ:**
-• **BMR** - калории для поддержания жизнедеятельности в покое
-• **TDEE** - общий расход энергии с учетом активности
-• **Целевые калории** - калории для достижения вашей цели
-• **Процент жира** - рассчитан на основе ваших параметров
-
-✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
-
-🎯 Следуйте плану и достигайте своих целей!"""
-        else:
-            result_message = f"""🎉 **Ваш ультра-точный план питания готов!**
-
-🎯 **Точность расчета:** {results['precision_score']}%
-
-📊 **КАЛОРИИ:**
-• 📈 Ежедневная норма: **{results['target_calories_average']} ккал**
-
-🥩 **МАКРОНУТРИЕНТЫ:**
-
-**🥤 Белки:** {results['protein_grams']} г ({results['protein_min']}-{results['protein_max']} г)
-
-**🥑 Жиры:** {results['fats_rest']} г
-
-**🍞 Углеводы:** {results['carbs_rest']} г
-
-**🌾 Клетчатка:** {results['fiber_rest']} г
-
-**💧 Вода:** {results['water']} мл/день
-
-📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
-• 🔥 BMR (базовый метаболизм): {results['bmr']} ккал
-• ⚡ TDEE (общий расход энергии): {results['tdee_average']} ккал
-• 📊 Коэффициент активности: {results['rest_day_factor']}
-
-📊 **АНАЛИЗ ТЕЛА:**
-• 🎯 Процент жира: **{results['fat_percent']}%**
-• 📋 Категория: **{results['fat_category']}**
-
-**📚 ОБЪЯСНЕНИЯ:**
-• **BMR** - калории для поддержания жизнедеятельности в покое
-• **TDEE** - общий расход энергии с учетом активности
-• **Целевые калории** - калории для достижения вашей цели
-• **Процент жира** - рассчитан на основе ваших параметров
-
-💡 **РЕКОМЕНДАЦИЯ:** Если планируете начать тренировки, пересчитайте план с учетом новой активности!
-
-✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
-
-🎯 Следуйте плану и достигайте своих целей!"""
+        result_message = render_results(results)
 
         # Добавляем кнопку консультации и мини-приложения
-        consultation_keyboard = [
-            [KeyboardButton('💬 Получить консультацию'), KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp_products_github.html?v=686'))],
-            ['🚀 Начать заново', '❓ Помощь'], 
-            ['🌍 Язык', '📊 О боте']
-        ]
-        consultation_markup = ReplyKeyboardMarkup(consultation_keyboard, resize_keyboard=True)
+        consultation_markup = keyboard_markup('RESULTS_MENU', web_apps=True)
         
         try:
             await calculating_msg.edit_text(result_message, parse_mode=ParseMode.MARKDOWN)
             # Отправляем сообщение с кнопкой консультации
             await update.message.reply_text(
-                "💬 **Нужна персональная консультация?**\n\n"
-                "🎯 Получите индивидуальные рекомендации от эксперта\n"
-                "📋 Составление персонального плана тренировок\n"
-                "🍽️ Детальный план питания с рецептами\n"
-                "📊 Анализ прогресса и корректировка плана\n\n"
-                "Нажмите кнопку ниже для связи с @DARKSIDERS17",
+                CONSULTATION_PROMPT,
                 reply_markup=consultation_markup,
                 parse_mode=ParseMode.MARKDOWN
             )
@@ -1351,12 +881,7 @@ async def occupation(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
             await update.message.reply_text(result_message, parse_mode=ParseMode.MARKDOWN)
             # Отправляем сообщение с кнопкой консультации
             await update.message.reply_text(
-                "💬 **Нужна персональная консультация?**\n\n"
-                "🎯 Получите индивидуальные рекомендации от эксперта\n"
-                "📋 Составление персонального плана тренировок\n"
-                "🍽️ Детальный план питания с рецептами\n"
-                "📊 Анализ прогресса и корректировка плана\n\n"
-                "Нажмите кнопку ниже для связи с @DARKSIDERS17",
+                CONSULTATION_PROMPT,
                 reply_markup=consultation_markup,
                 parse_mode=ParseMode.MARKDOWN
             )
@@ -1408,8 +933,7 @@ async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Отмена анализа"""
     chat_id = update.message.chat_id
     
-    keyboard = [['🚀 Начать', '❓ Помощь'], ['📊 О боте']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('SHORT_MENU')
     
     await update.message.reply_text(
         "❌ **Анализ отменен**\n\nНажмите 🚀 Начать для нового расчета",
@@ -1515,8 +1039,7 @@ async def show_products_category(update: Update, context: ContextTypes.DEFAULT_T
             text += f"💡 {data['описание']}\n"
         text += "\n"
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCTS_MAIN"
@@ -1534,8 +1057,7 @@ async def show_search_interface(update: Update, context: ContextTypes.DEFAULT_TY
 • гречка
 • творог"""
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCT_SEARCH_NEW"
@@ -1588,8 +1110,7 @@ async def show_recommendations(update: Update, context: ContextTypes.DEFAULT_TYP
         text += "• Разнообразие продуктов\n"
         text += "• Умеренные порции\n"
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCTS_MAIN"
@@ -1597,12 +1118,12 @@ async def show_recommendations(update: Update, context: ContextTypes.DEFAULT_TYP
 async def return_to_main_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Вернуться в главное меню"""
     chat_id = update.message.chat_id
-    user_data_storage[chat_id] = {}
+    user_data_storage[chat_id] = SurveyProfile()
     
     # Постоянные кнопки внизу экрана
     keyboard = [
         ['🚀 Начать', '❓ Помощь'],
-        [KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp_products_github.html?v=686')), '📊 О боте'],
+        [KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url=Keyboards.PRODUCTS_WEBAPP_URL)), '📊 О боте'],
         [KeyboardButton('', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp/'))]
     ]
     reply_markup = ReplyKeyboardMarkup(
@@ -1732,8 +1253,70 @@ async def show_mini_apps_menu(update: Update, context: ContextTypes.DEFAULT_TYPE
         await update.message.reply_text("❌ Произошла ошибка. Попробуйте еще раз.")
         return "GENDER"
 
+async def restore_sessions(application: Application) -> None:
+    """Порядок вытеснения сессий анкеты по данным из persistence, хранилище истории адаптации"""
+    user_data_storage.reload_sessions()
+    # История адаптации переживает перезапуск: буферы читаются из хранилища
+    attach_adaptation_storage()
+
+async def shutdown_storage(application: Application) -> None:
+    """Сброс кэша данных пользователей на диск при остановке бота"""
+    close_storage()
+    if isinstance(application.persistence, SQLitePersistence):
+        application.persistence.close()
+    logger.info("Storage flushed on shutdown")
+
+# === МАРШРУТЫ КНОПОК ===
+# Шаги анкеты: общие кнопки перехватываются, остальной текст - ответ на вопрос
+SURVEY_STATES = (AGE, WEIGHT, HEIGHT, FAT_PERCENTAGE, FAT_PERCENTAGE_INPUT, GOAL, HAS_TRAINING_EXPERIENCE,
+                 TRAINING_EXPERIENCE, TRAINING_DAYS, ACTIVITY_TYPE, WORKOUT_DURATION, STEPS, INTENSITY,
+                 RECOVERY, SLEEP_QUALITY, STRESS_LEVEL, OCCUPATION)
+# Меню: все кнопки, не кнопка - handle_message
+MENU_STATES = (GENDER, PRODUCTS_MENU, PRODUCT_SEARCH, PRODUCTS_MAIN, PRODUCTS_CATEGORY, PRODUCT_DETAILS,
+               PRODUCT_SEARCH_NEW, "WEBAPP_CHOICE")
+
+buttons = (
+    ButtonRouter('buttons')
+    .add(Keyboards.MAIN_MENU, {
+        '🚀 Начать': start_survey,
+        '❓ Помощь': help_command,
+        '📊 О боте': show_about,
+    }, states=SURVEY_STATES + MENU_STATES)
+    .add(Keyboards.RESULTS_MENU, {
+        '💬 Получить консультацию': show_consultation,
+        '🚀 Начать заново': start_survey,
+    }, states=MENU_STATES)
+    .add(Keyboards.MINI_APPS_HUB, {
+        '💧 Трекер воды': open_water_tracker,
+        '🔙 Главное меню': return_to_main_menu,
+    }, states=MENU_STATES)
+    .add(Keyboards.PRODUCTS_CATEGORIES, {
+        **{button: functools.partial(show_products_category, category=category)
+           for button, category in Keyboards.PRODUCT_CATEGORY_BUTTONS.items()},
+        '🔍 Поиск продукта': show_search_interface,
+        '📊 Рекомендации': show_recommendations,
+        '🔙 Назад': back_to_mini_apps,
+    }, states=MENU_STATES)
+    .add(Keyboards.MINI_APPS_MENU, {'🔙 Главное меню': return_to_main_menu}, states=MENU_STATES)
+    .add(Keyboards.BACK_TO_APPS, {'🔙 Назад к приложениям': back_to_mini_apps}, states=MENU_STATES)
+    .add(Keyboards.BACK_TO_CATEGORIES, {'🔙 Назад к категориям': back_to_categories}, states=MENU_STATES)
+    .add(Keyboards.GENDER_CHOICE, {'👨 Мужчина': gender, '👩 Женщина': gender},
+         states=(GENDER,), aliases={'мужчина': '👨 Мужчина', 'женщина': '👩 Женщина'})
+    # Краткое меню базы продуктов: свои обработчики поверх общих маршрутов
+    .add(Keyboards.PRODUCTS_MENU, {
+        '🥩 Белки': handle_products_category,
+        '🍞 Углеводы': handle_products_category,
+        '🧈 Жиры': handle_products_category,
+        '🔍 Поиск продукта': handle_products_menu,
+        '📊 Рекомендации': handle_products_menu,
+        '🔙 Назад': handle_products_menu,
+    }, states=(PRODUCTS_MENU,))
+)
+
 def main() -> None:
     """Главная функция запуска бота"""
+    # Запись в файл с ротацией идет в отдельном потоке (bot_logging.py)
+    setup_logging()
     print("🚀 Запуск FitAdventure Bot v5.0 Final...")
     
     # Автоматическая настройка токена
@@ -1749,7 +1332,15 @@ def main() -> None:
         
     # Создание приложения бота
     try:
-        application = Application.builder().token(TOKEN).build()
+        # TracingRequest отделяет время Telegram API от времени обработчиков в трассах
+        builder = (Application.builder().token(TOKEN).request(TracingRequest())
+                   .post_init(restore_sessions).post_shutdown(shutdown_storage))
+        if StorageConfig.PERSISTENCE_ENABLED:
+            # Состояние анкеты и данные чатов переживают перезапуск
+            builder = builder.persistence(SQLitePersistence())
+        application = builder.build()
+        user_data_storage.bind(application)
+        schedule_session_sweeper(application, user_data_storage)
         print("✅ Telegram Application создан успешно!")
     except Exception as e:
         print(f"❌ Ошибка создания приложения: {e}")
@@ -1770,131 +1361,48 @@ def main() -> None:
     conv_handler = ConversationHandler(
         entry_points=[CommandHandler('start', start)],
         states={
-            GENDER: [
-                MessageHandler(filters.Regex('^(👨 Мужчина|👩 Женщина|мужчина|Мужчина|женщина|Женщина)$'), gender),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            AGE: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, age)
-            ],
-            WEIGHT: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, weight)
-            ],
-            HEIGHT: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, height)
-            ],
-            FAT_PERCENTAGE: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, fat_percentage)
-            ],
-            FAT_PERCENTAGE_INPUT: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, fat_percentage_input)
-            ],
-            GOAL: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, goal)
-            ],
-            HAS_TRAINING_EXPERIENCE: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, has_training_experience)
-            ],
-            TRAINING_EXPERIENCE: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, training_experience)
-            ],
-            TRAINING_DAYS: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, training_days)
-            ],
-            ACTIVITY_TYPE: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, activity_type)
-            ],
-            WORKOUT_DURATION: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, workout_duration)
-            ],
-            STEPS: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, steps)
-            ],
-            INTENSITY: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, intensity)
-            ],
-            RECOVERY: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, recovery)
-            ],
-            SLEEP_QUALITY: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, sleep_quality)
-            ],
-            STRESS_LEVEL: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, stress_level)
-            ],
-            OCCUPATION: [
-                MessageHandler(filters.Regex('^(🚀 Начать|❓ Помощь|📊 О боте)$'), handle_buttons),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, occupation)
-            ],
-
+            GENDER: [buttons.handler(GENDER, default=handle_message)],
+            AGE: [buttons.handler(AGE), MessageHandler(filters.TEXT & ~filters.COMMAND, age)],
+            WEIGHT: [buttons.handler(WEIGHT), MessageHandler(filters.TEXT & ~filters.COMMAND, weight)],
+            HEIGHT: [buttons.handler(HEIGHT), MessageHandler(filters.TEXT & ~filters.COMMAND, height)],
+            FAT_PERCENTAGE: [buttons.handler(FAT_PERCENTAGE), MessageHandler(filters.TEXT & ~filters.COMMAND, fat_percentage)],
+            FAT_PERCENTAGE_INPUT: [buttons.handler(FAT_PERCENTAGE_INPUT), MessageHandler(filters.TEXT & ~filters.COMMAND, fat_percentage_input)],
+            GOAL: [buttons.handler(GOAL), MessageHandler(filters.TEXT & ~filters.COMMAND, goal)],
+            HAS_TRAINING_EXPERIENCE: [buttons.handler(HAS_TRAINING_EXPERIENCE), MessageHandler(filters.TEXT & ~filters.COMMAND, has_training_experience)],
+            TRAINING_EXPERIENCE: [buttons.handler(TRAINING_EXPERIENCE), MessageHandler(filters.TEXT & ~filters.COMMAND, training_experience)],
+            TRAINING_DAYS: [buttons.handler(TRAINING_DAYS), MessageHandler(filters.TEXT & ~filters.COMMAND, training_days)],
+            ACTIVITY_TYPE: [buttons.handler(ACTIVITY_TYPE), MessageHandler(filters.TEXT & ~filters.COMMAND, activity_type)],
+            WORKOUT_DURATION: [buttons.handler(WORKOUT_DURATION), MessageHandler(filters.TEXT & ~filters.COMMAND, workout_duration)],
+            STEPS: [buttons.handler(STEPS), MessageHandler(filters.TEXT & ~filters.COMMAND, steps)],
+            INTENSITY: [buttons.handler(INTENSITY), MessageHandler(filters.TEXT & ~filters.COMMAND, intensity)],
+            RECOVERY: [buttons.handler(RECOVERY), MessageHandler(filters.TEXT & ~filters.COMMAND, recovery)],
+            SLEEP_QUALITY: [buttons.handler(SLEEP_QUALITY), MessageHandler(filters.TEXT & ~filters.COMMAND, sleep_quality)],
+            STRESS_LEVEL: [buttons.handler(STRESS_LEVEL), MessageHandler(filters.TEXT & ~filters.COMMAND, stress_level)],
+            OCCUPATION: [buttons.handler(OCCUPATION), MessageHandler(filters.TEXT & ~filters.COMMAND, occupation)],
 
             # Добавляем недостающие состояния для мини-приложений
             MINI_APPS_MENU: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, lambda update, context: handle_mini_apps_navigation(update, context))
-            ],
-            PRODUCTS_MENU: [
-                MessageHandler(filters.Regex('^(🥩 Белки|🍞 Углеводы|🧈 Жиры)$'), 
-                             lambda update, context: handle_products_category(update, context)),
-                MessageHandler(filters.Regex('^(🔍 Поиск продукта|📊 Рекомендации|🔙 Назад)$'), 
-                             lambda update, context: handle_products_menu(update, context)),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            PRODUCT_SEARCH: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
+                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_mini_apps_navigation)
             ],
+            PRODUCTS_MENU: [buttons.handler(PRODUCTS_MENU, default=handle_message)],
+            PRODUCT_SEARCH: [buttons.handler(PRODUCT_SEARCH, default=handle_message)],
             
-            # Состояния для трекера воды
-            WATER_TRACKER: [
-                MessageHandler(filters.Regex(r'^(💧 \+250мл|💧 \+500мл|💧 \+1000мл|🔄 Сбросить|📊 Статистика|🔔 Напоминания|🔙 Назад)$'), 
-                             lambda update, context: handle_water_actions(update, context)),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_water_actions)
-            ],
-            WATER_REMINDERS: [
-                MessageHandler(filters.Regex('^(🔔 Включить|🔕 Выключить|⚙️ Интервал|📊 Статистика напоминаний|🔙 Назад к трекеру)$'), 
-                             lambda update, context: handle_water_reminders(update, context)),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_water_reminders)
-            ],
-            WATER_REMINDER_INTERVAL: [
-                MessageHandler(filters.Regex('^(⏰ Каждые 1 час|⏰ Каждые 2 часа|⏰ Каждые 3 часа|⏰ Каждые 4 часа|🔙 Назад)$'), 
-                             lambda update, context: handle_reminder_interval(update, context)),
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_reminder_interval)
-            ],
+            # Состояния для трекера воды (кнопки разбирают сами обработчики mini_apps)
+            WATER_TRACKER: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_water_actions)],
+            WATER_REMINDERS: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_water_reminders)],
+            WATER_REMINDER_INTERVAL: [MessageHandler(filters.TEXT & ~filters.COMMAND, handle_reminder_interval)],
             
             # Состояния для нового мини-приложения базы продуктов
-            PRODUCTS_MAIN: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            PRODUCTS_CATEGORY: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            PRODUCT_DETAILS: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            PRODUCT_SEARCH_NEW: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
-            "WEBAPP_CHOICE": [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_buttons)
-            ],
+            PRODUCTS_MAIN: [buttons.handler(PRODUCTS_MAIN, default=handle_message)],
+            PRODUCTS_CATEGORY: [buttons.handler(PRODUCTS_CATEGORY, default=handle_message)],
+            PRODUCT_DETAILS: [buttons.handler(PRODUCT_DETAILS, default=handle_message)],
+            PRODUCT_SEARCH_NEW: [buttons.handler(PRODUCT_SEARCH_NEW, default=handle_message)],
+            "WEBAPP_CHOICE": [buttons.handler("WEBAPP_CHOICE", default=handle_message)],
             
         },
         fallbacks=[CommandHandler('cancel', cancel)],
+        name='survey',
+        persistent=StorageConfig.PERSISTENCE_ENABLED,
     )
 
     application.add_handler(conv_handler)
@@ -1908,6 +1416,14 @@ def main() -> None:
     # Добавляем обработчик для данных Web App
     application.add_handler(MessageHandler(filters.StatusUpdate.WEB_APP_DATA, handle_webapp_data))
     
+    application.add_handler(CommandHandler('traces', traces_command))
+    
+    # Задержки всех обработчиков и сессии анкеты (активные, брошенные, вытеснение) - в /metrics, медленные обновления - в /traces
+    metrics.instrument_application(application)
+    metrics.track_survey_sessions(user_data_storage)
+    metrics.start_metrics_server()
+    tracing.instrument_application(application)
+    
 
     
     logger.info("🚀 FitAdventure Bot v5.0 Final запущен!")
@@ -1919,7 +1435,7 @@ def main() -> None:
     print("⌨️ Нажмите Ctrl+C для остановки")
     
     try:
-        application.run_polling()
+        run_application(application)  # polling или webhook (WebhookConfig.MODE)
     except KeyboardInterrupt:
         print("\n✅ Бот остановлен пользователем")
     except Exception as e:
@@ -18,7 +18,7 @@ from typing import Dict, Any
 # Импорт конфигурации
 from config import (
     get_bot_token, States, Keyboards, Messages, 
-    LoggingConfig, BOT_VERSION, BOT_NAME
+    StorageConfig, WebhookConfig, BOT_VERSION, BOT_NAME
 )
 
 # Импорт обработчиков
@@ -28,7 +28,17 @@ from handlers import (
 )
 
 # Импорт расчетов
-from calculations import generate_ultra_precise_recommendations
+from calculations import generate_ultra_precise_recommendations, calculator
+
+# Импорт хранилища
+from storage import close_storage
+from ultra_precise_formulas import attach_adaptation_storage
+from bot_persistence import SQLitePersistence, schedule_session_sweeper
+from bot_webhook import serve_webhook
+import bot_logging
+import metrics
+import tracing
+from tracing import TracingRequest, traces_command
 
 # Импорт Telegram библиотек
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, KeyboardButton, WebAppInfo
@@ -78,15 +88,8 @@ if not PRODUCTS_MINI_APP_AVAILABLE:
 
 # === НАСТРОЙКА ЛОГИРОВАНИЯ ===
 def setup_logging():
-    """Настройка системы логирования"""
-    logging.basicConfig(
-        format=LoggingConfig.FORMAT,
-        level=getattr(logging, LoggingConfig.LEVEL),
-        handlers=[
-            logging.FileHandler(LoggingConfig.FILE, encoding=LoggingConfig.ENCODING),
-            logging.StreamHandler()
-        ]
-    )
+    """Настройка системы логирования (очередь, ротация, прореживание - bot_logging.py)"""
+    bot_logging.setup_logging()
     return logging.getLogger(__name__)
 
 # === КЛАСС УПРАВЛЕНИЯ БОТОМ ===
@@ -112,19 +115,46 @@ class FitAdventureBot:
             self.logger.info("✅ Токен получен успешно!")
             
             # Создание приложения
-            self.application = Application.builder().token(self.token).build()
+            # TracingRequest отделяет время Telegram API от времени обработчиков в трассах
+            builder = (Application.builder().token(self.token).request(TracingRequest())
+                       .post_init(self._on_init).post_shutdown(self._on_shutdown))
+            if StorageConfig.PERSISTENCE_ENABLED:
+                # Состояние анкеты и данные чатов переживают перезапуск
+                builder = builder.persistence(SQLitePersistence())
+            self.application = builder.build()
+            user_data_storage.bind(self.application)
+            schedule_session_sweeper(self.application, user_data_storage)
             self.logger.info("✅ Telegram Application создан успешно!")
             
             # Настройка обработчиков
             self._setup_handlers()
             self.logger.info("✅ Обработчики настроены успешно!")
             
+            # Задержки обработчиков и сессии анкеты - в /metrics, медленные обновления - в /traces
+            metrics.instrument_application(self.application)
+            metrics.track_survey_sessions(user_data_storage)
+            metrics.start_metrics_server()
+            tracing.instrument_application(self.application)
+            
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Ошибка инициализации бота: {e}")
             return False
     
+    async def _on_init(self, application: Application) -> None:
+        """Порядок вытеснения сессий анкеты по данным из persistence, хранилище истории адаптации"""
+        user_data_storage.reload_sessions()
+        # История адаптации переживает перезапуск: буферы читаются из хранилища
+        attach_adaptation_storage()
+    
+    async def _on_shutdown(self, application: Application) -> None:
+        """Сброс кэша данных пользователей на диск при остановке"""
+        close_storage()
+        if isinstance(application.persistence, SQLitePersistence):
+            application.persistence.close()
+        self.logger.info("Storage flushed on shutdown")
+    
     def _setup_handlers(self):
         """Настройка всех обработчиков"""
         # Основной ConversationHandler
@@ -232,10 +262,13 @@ class FitAdventureBot:
                 ],
             },
             fallbacks=[CommandHandler('cancel', CommandHandlers.cancel)],
+            name='survey',
+            persistent=StorageConfig.PERSISTENCE_ENABLED,
         )
 
         self.application.add_handler(conv_handler)
         self.application.add_handler(CommandHandler('help', CommandHandlers.help_command))
+        self.application.add_handler(CommandHandler('traces', traces_command))
         
         # Обработчики Web App
         self.application.add_handler(CallbackQueryHandler(self._handle_webapp_callback))
@@ -573,8 +606,8 @@ class FitAdventureBot:
         
         # Генерируем ультра-точные рекомендации
         try:
-            self.logger.info(f"Starting calculations for user {chat_id}")
-            self.logger.info(f"User data: {user_data_storage[chat_id]}")
+            self.logger.debug("Starting calculations for user %s", chat_id)
+            self.logger.debug("User data: %s", user_data_storage[chat_id])
             
             results = generate_ultra_precise_recommendations(user_data_storage[chat_id])
             self.stats['successful_calculations'] += 1
@@ -695,7 +728,10 @@ class FitAdventureBot:
             print("📱 Откройте Telegram и найдите своего бота")
             print("⌨️ Нажмите Ctrl+C для остановки")
             
-            await self.application.run_polling()
+            if WebhookConfig.MODE == 'webhook':
+                await serve_webhook(self.application)
+            else:
+                await self.application.run_polling()
             
         except KeyboardInterrupt:
             print("\n✅ Бот остановлен пользователем")
@@ -707,7 +743,10 @@ class FitAdventureBot:
         """Получение статистики бота"""
         return {
             **self.stats,
-            'cache_stats': generate_ultra_precise_recommendations.__self__.get_cache_stats() if hasattr(generate_ultra_precise_recommendations, '__self__') else {}
+            'cache_stats': calculator.get_cache_stats(),
+            'session_stats': user_data_storage.stats(),
+            'handler_latency': metrics.latency_summary(),
+            'tracing': dict(tracing.tracer.stats)
         }
 
 # === ГЛАВНАЯ ФУНКЦИЯ ===
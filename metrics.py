@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Метрики FitAdventure Bot в формате Prometheus
+Счетчики, датчики и гистограммы задержек с фиксированными корзинами
+(без внешних зависимостей), экспорт в текстовом формате Prometheus
+на локальном порту (MetricsServer) или маршрутом /metrics в Flask.
+Обертки для обработчиков Telegram и маршрутов Flask считают задержку
+каждого шага анкеты и каждого API-маршрута.
+"""
+
+import time
+import bisect
+import functools
+import threading
+import logging
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import MetricsConfig
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+class Metric:
+    """Общая часть метрик: имя, описание, метки и значения по кортежу меток"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Tuple) -> Tuple[str, ...]:
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"{self.name}: ожидаются метки {self.label_names}, получено {labels}")
+        return tuple(str(label) for label in labels)
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        """Строки экспорта: (суффикс имени, метки, значение)"""
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines += [f"{self.name}{suffix}{labels} {_format_value(value)}" for suffix, labels, value in self.samples()]
+        return '\n'.join(lines)
+
+class Counter(Metric):
+    """Монотонно растущий счетчик"""
+
+    kind = 'counter'
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            items = sorted(self._values.items())
+        return [('', _format_labels(self.label_names, key), value) for key, value in items]
+
+class Gauge(Metric):
+    """Текущее значение; может вычисляться функцией в момент экспорта"""
+
+    kind = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._functions: Dict[Tuple[str, ...], Callable[[], float]] = {}
+
+    def set(self, value: float, *labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, function: Callable[[], float], *labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = function
+
+    def value(self, *labels) -> float:
+        key = self._key(labels)
+        function = self._functions.get(key)
+        return function() if function else self._values.get(key, 0)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, function in functions.items():
+            try:
+                values[key] = function()
+            except Exception as error:
+                logger.warning("Gauge %s%s callback failed: %s", self.name, key, error)
+        return [('', _format_labels(self.label_names, key), value) for key, value in sorted(values.items())]
+
+class Histogram(Metric):
+    """Распределение значений по фиксированным корзинам (в секундах для задержек)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = (),
+                 buckets: Iterable[float] = None):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets or MetricsConfig.LATENCY_BUCKETS))
+
+    def observe(self, value: float, *labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [счетчики корзин (последняя - +Inf), сумма]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, *labels):
+        """Замер длительности блока with"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, *labels)
+
+    def count(self, *labels) -> int:
+        state = self._values.get(self._key(labels))
+        return sum(state[0]) if state else 0
+
+    def quantile(self, q: float, *labels) -> Optional[float]:
+        """Оценка квантиля по корзинам (линейно внутри корзины), None - нет данных"""
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            counts = list(state[0]) if state else None
+        if not counts or not sum(counts):
+            return None
+        rank = q * sum(counts)
+        cumulative = 0
+        for index, count in enumerate(counts):
+            if cumulative + count >= rank and count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]  # выше последней корзины - только нижняя граница
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - cumulative) / count
+            cumulative += count
+        return self.buckets[-1]
+
+    def samples(self):
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1])) for key, state in self._values.items())
+        samples = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                samples.append(('_bucket', _format_labels(self.label_names, key, le), cumulative))
+            samples.append(('_sum', _format_labels(self.label_names, key), total))
+            samples.append(('_count', _format_labels(self.label_names, key), cumulative))
+        return samples
+
+class Registry:
+    """Набор метрик процесса"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # Повторный импорт модуля (например, main и main_optimized) получает ту же метрику
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: Iterable[str] = (),
+                  buckets: Iterable[float] = None) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        """Все метрики в текстовом формате Prometheus"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(metric.render() for metric in metrics) + '\n'
+
+REGISTRY = Registry()
+
+# === МЕТРИКИ ПРИЛОЖЕНИЯ ===
+HANDLER_SECONDS = REGISTRY.histogram(
+    'fitadventure_handler_duration_seconds', 'Время обработчика обновления Telegram', ('handler',))
+HANDLER_ERRORS = REGISTRY.counter(
+    'fitadventure_handler_errors_total', 'Исключения в обработчиках Telegram', ('handler',))
+HTTP_SECONDS = REGISTRY.histogram(
+    'fitadventure_http_request_duration_seconds', 'Время запроса к API веб-приложения', ('route', 'method'))
+HTTP_RESPONSES = REGISTRY.counter(
+    'fitadventure_http_responses_total', 'Ответы API веб-приложения', ('route', 'method', 'status'))
+STORAGE_SECONDS = REGISTRY.histogram(
+    'fitadventure_storage_operation_duration_seconds', 'Время операции хранилища', ('backend', 'operation'))
+CACHE_REQUESTS = REGISTRY.counter(
+    'fitadventure_calculator_cache_requests_total', 'Обращения к кэшу расчетов', ('result',))
+CACHE_SIZE = REGISTRY.gauge(
+    'fitadventure_calculator_cache_entries', 'Записей в кэше расчетов')
+SURVEY_SESSIONS = REGISTRY.gauge(
+    'fitadventure_survey_sessions', 'Активные сессии анкеты')
+SURVEY_SESSIONS_ABANDONED = REGISTRY.gauge(
+    'fitadventure_survey_sessions_abandoned', 'Сессии анкеты без ответа дольше порога брошенных')
+SURVEY_EVICTIONS_PER_HOUR = REGISTRY.gauge(
+    'fitadventure_survey_session_evictions_per_hour', 'Вытеснение сессий анкеты (по сроку и LRU) в час')
+TELEGRAM_API_SECONDS = REGISTRY.histogram(
+    'fitadventure_telegram_api_duration_seconds', 'Время запроса к Telegram Bot API', ('method',))
+
+def timed_storage(backend: str, operation: str):
+    """Декоратор метода хранилища: задержка в STORAGE_SECONDS"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            with STORAGE_SECONDS.time(backend, operation):
+                return method(*args, **kwargs)
+        return wrapper
+    return decorator
+
+# === ОБРАБОТЧИКИ TELEGRAM ===
+def timed_callback(callback: Callable, name: str = None) -> Callable:
+    """Асинхронный обработчик с замером задержки и подсчетом ошибок"""
+    if getattr(callback, '__metrics_wrapped__', False):
+        return callback
+    name = name or getattr(callback, '__qualname__', repr(callback))
+
+    @functools.wraps(callback)
+    async def wrapper(update, context):
+        started = time.perf_counter()
+        try:
+            return await callback(update, context)
+        except Exception:
+            HANDLER_ERRORS.inc(name)
+            raise
+        finally:
+            HANDLER_SECONDS.observe(time.perf_counter() - started, name)
+
+    wrapper.__metrics_wrapped__ = True
+    return wrapper
+
+def iter_handlers(handlers) -> Iterable:
+    """Все обработчики, включая вложенные в ConversationHandler"""
+    from telegram.ext import ConversationHandler
+
+    for handler in handlers:
+        if isinstance(handler, ConversationHandler):
+            yield from iter_handlers(handler.entry_points)
+            for state_handlers in handler.states.values():
+                yield from iter_handlers(state_handlers)
+            yield from iter_handlers(handler.fallbacks)
+        else:
+            yield handler
+
+def instrument_application(application) -> int:
+    """Замер всех зарегистрированных обработчиков приложения; возвращает их число"""
+    count = 0
+    for group_handlers in application.handlers.values():
+        for handler in iter_handlers(group_handlers):
+            handler.callback = timed_callback(handler.callback)
+            count += 1
+    logger.info("Metrics: instrumented %d handlers", count)
+    return count
+
+def track_survey_sessions(store) -> None:
+    """Датчики сессий анкеты из SurveyStateStore: активные, брошенные, вытеснение"""
+    SURVEY_SESSIONS.set_function(lambda: len(store))
+    SURVEY_SESSIONS_ABANDONED.set_function(lambda: store.stats()['abandoned_sessions'])
+    SURVEY_EVICTIONS_PER_HOUR.set_function(lambda: store.stats()['evictions_per_hour'])
+
+# === FLASK ===
+def instrument_flask(app) -> None:
+    """Задержка и статусы маршрутов Flask
+
+    Маршрут /metrics в приложение не добавляется: веб-приложение слушает 0.0.0.0,
+    а метрики отдает только локальный сервер start_metrics_server.
+    """
+    from flask import g, request
+
+    @app.before_request
+    def _start_timer():
+        g.metrics_started = time.perf_counter()
+
+    @app.after_request
+    def _record(response):
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            # Шаблон маршрута, а не путь: /api/search/<query> - одна серия
+            route = request.url_rule.rule if request.url_rule else 'unmatched'
+            HTTP_SECONDS.observe(time.perf_counter() - started, route, request.method)
+            HTTP_RESPONSES.inc(route, request.method, response.status_code)
+        return response
+
+# === HTTP-ЭКСПОРТ ===
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] != MetricsConfig.PATH:
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # запросы Prometheus не засоряют лог бота
+
+def start_metrics_server(host: str = None, port: int = None) -> Optional[ThreadingHTTPServer]:
+    """Экспорт метрик на локальном порту в фоновом потоке (None, если выключено)"""
+    if not MetricsConfig.ENABLED:
+        return None
+    address = (host or MetricsConfig.HOST, MetricsConfig.PORT if port is None else port)
+    try:
+        server = ThreadingHTTPServer(address, _MetricsRequestHandler)
+    except OSError as error:
+        # Порт занят (второй процесс бота, перезапуск) - бот работает и без экспорта
+        logger.warning("Metrics server not started on %s:%d: %s", *address, error)
+        return None
+    threading.Thread(target=server.serve_forever, name='metrics-server', daemon=True).start()
+    logger.info("Metrics available at http://%s:%d%s", *server.server_address[:2], MetricsConfig.PATH)
+    return server
+
+def latency_summary(histogram: Histogram = HANDLER_SECONDS) -> Dict[str, Dict[str, float]]:
+    """p50/p99 (мс) и число наблюдений по каждой серии гистограммы"""
+    with histogram._lock:
+        keys = list(histogram._values)
+    summary = {}
+    for key in sorted(keys):
+        summary[','.join(key)] = {
+            'count': histogram.count(*key),
+            'p50_ms': round(histogram.quantile(0.5, *key) * 1000, 2),
+            'p99_ms': round(histogram.quantile(0.99, *key) * 1000, 2),
+        }
+    return summary
@@ -4,9 +4,7 @@
 Мини-приложения для FitAdventure Bot
 """
 
-import json
 import datetime
-from pathlib import Path
 from products_database import (
     PRODUCTS_DATABASE, 
     get_products_by_goal, 
@@ -16,31 +14,29 @@ from products_database import (
     get_recommended_products
 )
 
-# Файл для хранения данных пользователей
-USER_DATA_FILE = "user_mini_apps_data.json"
+from config import StorageConfig, Keyboards
+from storage import get_storage
+from button_router import ButtonRouter
+from rendering import keyboard_markup, render_water_statistics
 
-def load_user_data():
-    """Загрузка данных пользователей"""
-    try:
-        with open(USER_DATA_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+# Пространство имен мини-приложений в хранилище
+STORAGE_NAMESPACE = StorageConfig.MINI_APPS_NAMESPACE
+
+def load_user_data(chat_id):
+    """Загрузка данных пользователя"""
+    return get_storage().get_user(STORAGE_NAMESPACE, chat_id)
 
-def save_user_data(data):
-    """Сохранение данных пользователей"""
-    with open(USER_DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def save_user_data(chat_id, data):
+    """Сохранение данных пользователя"""
+    get_storage().set_user(STORAGE_NAMESPACE, chat_id, data)
+
+def update_user_data(chat_id, updater):
+    """Атомарное изменение данных пользователя"""
+    return get_storage().update_user(STORAGE_NAMESPACE, chat_id, updater)
 
 # === МИНИ-ПРИЛОЖЕНИЕ: БАЗА ПРОДУКТОВ ===
 async def show_products_menu(update, context):
     """Показать меню базы продуктов"""
-    keyboard = [
-        ['🥩 Белки', '🍞 Углеводы'],
-        ['🧈 Жиры', '🔍 Поиск продукта'],
-        ['📊 Рекомендации', '🔙 Назад']
-    ]
-    
     text = """🍎 **База продуктов FitAdventure**
 
 Выберите категорию продуктов или найдите конкретный продукт:
@@ -51,8 +47,7 @@ async def show_products_menu(update, context):
 🔍 **Поиск** - найти продукт по названию
 📊 **Рекомендации** - продукты под вашу цель"""
     
-    from telegram import ReplyKeyboardMarkup
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('PRODUCTS_MENU')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode='Markdown')
     return 19  # PRODUCTS_MENU state
@@ -63,8 +58,7 @@ async def show_products_category(update, context):
     chat_id = str(update.message.chat_id)
     
     # Получаем цель пользователя
-    user_data = load_user_data()
-    user_goal = user_data.get(chat_id, {}).get('goal', 'поддержание')
+    user_goal = load_user_data(chat_id).get('goal', 'поддержание')
     
     category_map = {
         '🥩 Белки': 'белки',
@@ -183,8 +177,7 @@ async def show_recommendations(update, context):
         return 19  # PRODUCTS_MENU state
     
     chat_id = str(update.message.chat_id)
-    user_data = load_user_data()
-    user_goal = user_data.get(chat_id, {}).get('goal', 'поддержание')
+    user_goal = load_user_data(chat_id).get('goal', 'поддержание')
     
     result = f"📊 **Рекомендуемые продукты для {user_goal.replace('_', ' ').title()}:**\n\n"
     
@@ -206,10 +199,10 @@ async def show_recommendations(update, context):
 async def show_water_tracker(update, context):
     """Показать трекер воды"""
     chat_id = str(update.message.chat_id)
-    user_data = load_user_data()
+    user_data = load_user_data(chat_id)
     
     today = datetime.date.today().isoformat()
-    water_data = user_data.get(chat_id, {}).get('water', {})
+    water_data = user_data.get('water', {})
     today_water = water_data.get(today, 0)
     
     # Рекомендуемая норма воды (в мл)
@@ -268,20 +261,15 @@ async def add_water(update, context):
     if text in water_amounts:
         amount = water_amounts[text]
         
-        user_data = load_user_data()
-        if chat_id not in user_data:
-            user_data[chat_id] = {}
-        if 'water' not in user_data[chat_id]:
-            user_data[chat_id]['water'] = {}
-        
         today = datetime.date.today().isoformat()
-        if today not in user_data[chat_id]['water']:
-            user_data[chat_id]['water'][today] = 0
         
-        user_data[chat_id]['water'][today] += amount
-        save_user_data(user_data)
+        def add_amount(data):
+            water = data.setdefault('water', {})
+            water[today] = water.get(today, 0) + amount
+        
+        user_data = update_user_data(chat_id, add_amount)
         
-        new_total = user_data[chat_id]['water'][today]
+        new_total = user_data['water'][today]
         recommended_water = 2500
         progress = min(new_total / recommended_water * 100, 100)
         
@@ -296,11 +284,13 @@ async def add_water(update, context):
         return "WATER_TRACKER"
     
     elif text == '🔄 Сбросить':
-        user_data = load_user_data()
-        if chat_id in user_data and 'water' in user_data[chat_id]:
-            today = datetime.date.today().isoformat()
-            user_data[chat_id]['water'][today] = 0
-            save_user_data(user_data)
+        today = datetime.date.today().isoformat()
+        
+        def reset_today(data):
+            if 'water' in data:
+                data['water'][today] = 0
+        
+        update_user_data(chat_id, reset_today)
         
         await update.message.reply_text("🔄 Счетчик воды сброшен!")
         return "WATER_TRACKER"
@@ -314,34 +304,14 @@ async def add_water(update, context):
 async def show_water_statistics(update, context):
     """Показать статистику воды"""
     chat_id = str(update.message.chat_id)
-    user_data = load_user_data()
-    water_data = user_data.get(chat_id, {}).get('water', {})
+    water_data = load_user_data(chat_id).get('water', {})
     
     if not water_data:
         await update.message.reply_text("📊 Статистика воды пуста. Начните отслеживать потребление воды!")
         return "WATER_TRACKER"
     
     # Последние 7 дней
-    today = datetime.date.today()
-    stats = []
-    
-    for i in range(7):
-        date = today - datetime.timedelta(days=i)
-        date_str = date.isoformat()
-        amount = water_data.get(date_str, 0)
-        stats.append((date, amount))
-    
-    result = "📊 **Статистика воды за последние 7 дней:**\n\n"
-    
-    for date, amount in reversed(stats):
-        day_name = date.strftime("%A")  # День недели
-        date_str = date.strftime("%d.%m")
-        progress = min(amount / 2500 * 100, 100)
-        progress_bar = "💧" * int(progress / 20) + "⬜" * (5 - int(progress / 20))
-        
-        result += f"**{day_name}** ({date_str}): {amount}мл {progress_bar} {progress:.1f}%\n"
-    
-    result += "\n💡 Рекомендуемая норма: 2500мл в день"
+    result = render_water_statistics(water_data, datetime.date.today())
     
     await update.message.reply_text(result, parse_mode='Markdown')
     return "WATER_TRACKER"
@@ -350,9 +320,7 @@ async def show_water_statistics(update, context):
 async def show_goals_tracker(update, context):
     """Показать трекер целей"""
     chat_id = str(update.message.chat_id)
-    user_data = load_user_data()
-    
-    goals = user_data.get(chat_id, {}).get('goals', {})
+    goals = load_user_data(chat_id).get('goals', {})
     
     keyboard = [
         ['📝 Добавить цель', '✅ Отметить прогресс'],
@@ -401,14 +369,10 @@ async def handle_goal_name(update, context):
     chat_id = str(update.message.chat_id)
     
     # Сохраняем название цели во временные данные
-    user_data = load_user_data()
-    if chat_id not in user_data:
-        user_data[chat_id] = {}
-    if 'temp_goal' not in user_data[chat_id]:
-        user_data[chat_id]['temp_goal'] = {}
+    def set_temp_goal(data):
+        data.setdefault('temp_goal', {})['name'] = goal_name
     
-    user_data[chat_id]['temp_goal']['name'] = goal_name
-    save_user_data(user_data)
+    update_user_data(chat_id, set_temp_goal)
     
     await update.message.reply_text(
         f"📊 Введите целевое значение для '{goal_name}' (например: 5 для 5 кг):"
@@ -421,27 +385,23 @@ async def handle_goal_target(update, context):
         target = float(update.message.text)
         chat_id = str(update.message.chat_id)
         
-        user_data = load_user_data()
-        temp_goal = user_data.get(chat_id, {}).get('temp_goal', {})
-        goal_name = temp_goal.get('name', 'Новая цель')
-        
-        # Создаем новую цель
-        if 'goals' not in user_data[chat_id]:
-            user_data[chat_id]['goals'] = {}
+        created = {}
         
-        goal_id = str(len(user_data[chat_id]['goals']) + 1)
-        user_data[chat_id]['goals'][goal_id] = {
-            'name': goal_name,
-            'target': target,
-            'progress': 0,
-            'created': datetime.date.today().isoformat()
-        }
+        def create_goal(data):
+            # Создаем новую цель и удаляем временные данные
+            temp_goal = data.pop('temp_goal', {})
+            goals = data.setdefault('goals', {})
+            goal_id = str(len(goals) + 1)
+            goals[goal_id] = {
+                'name': temp_goal.get('name', 'Новая цель'),
+                'target': target,
+                'progress': 0,
+                'created': datetime.date.today().isoformat()
+            }
+            created.update(goals[goal_id])
         
-        # Удаляем временные данные
-        if 'temp_goal' in user_data[chat_id]:
-            del user_data[chat_id]['temp_goal']
-        
-        save_user_data(user_data)
+        update_user_data(chat_id, create_goal)
+        goal_name = created['name']
         
         await update.message.reply_text(
             f"✅ Цель '{goal_name}' с целевым значением {target} добавлена!"
@@ -456,12 +416,6 @@ async def handle_goal_target(update, context):
 # === ГЛАВНОЕ МЕНЮ МИНИ-ПРИЛОЖЕНИЙ ===
 async def show_mini_apps_menu(update, context):
     """Показать главное меню мини-приложений"""
-    keyboard = [
-        ['🍎 База продуктов', '💧 Трекер воды'],
-        ['🎯 Трекер целей', '📊 Статистика'],
-        ['🔙 Главное меню']
-    ]
-    
     text = """🎮 **Мини-приложения FitAdventure**
 
 Выберите нужное приложение:
@@ -471,38 +425,25 @@ async def show_mini_apps_menu(update, context):
 🎯 **Трекер целей** - отслеживание прогресса к целям
 📊 **Статистика** - ваша статистика и прогресс"""
     
-    from telegram import ReplyKeyboardMarkup
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('MINI_APPS_HUB')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode='Markdown')
     return 18  # MINI_APPS_MENU state
 
 async def handle_mini_apps_navigation(update, context):
     """Обработка навигации в мини-приложениях"""
-    text = update.message.text
-    
-    if text == '🍎 База продуктов':
-        return await show_products_menu(update, context)
-    elif text == '💧 Трекер воды':
-        return await show_water_tracker(update, context)
-    elif text == '🎯 Трекер целей':
-        return await show_goals_tracker(update, context)
-    elif text == '📊 Статистика':
-        return await show_general_statistics(update, context)
-    elif text == '🔙 Главное меню':
-        return await return_to_main_menu(update, context)
-    
-    return 18  # MINI_APPS_MENU state
+    result = await mini_apps_buttons.dispatch(update, context)
+    return 18 if result is None else result  # не кнопка - остаемся в MINI_APPS_MENU
 
 async def show_general_statistics(update, context):
     """Показать общую статистику"""
     chat_id = str(update.message.chat_id)
-    user_data = load_user_data()
+    user_data = load_user_data(chat_id)
     
     text = "📊 **Ваша статистика**\n\n"
     
     # Статистика воды
-    water_data = user_data.get(chat_id, {}).get('water', {})
+    water_data = user_data.get('water', {})
     if water_data:
         total_water_days = len(water_data)
         total_water = sum(water_data.values())
@@ -514,7 +455,7 @@ async def show_general_statistics(update, context):
         text += f"   Среднее в день: {avg_water:.0f}мл\n\n"
     
     # Статистика целей
-    goals = user_data.get(chat_id, {}).get('goals', {})
+    goals = user_data.get('goals', {})
     if goals:
         active_goals = len(goals)
         completed_goals = sum(1 for goal in goals.values() 
@@ -547,4 +488,13 @@ async def return_to_main_menu(update, context):
         return await main_return_to_main_menu(update, context)
     except ImportError:
         # Если не удалось импортировать, возвращаемся к начальному состоянию
-        return "GENDER" 
\ No newline at end of file
+        return "GENDER"
+
+# Кнопки меню мини-приложений -> обработчики (handle_mini_apps_navigation)
+mini_apps_buttons = ButtonRouter('mini_apps').add(Keyboards.MINI_APPS_HUB, {
+    '🍎 База продуктов': show_products_menu,
+    '💧 Трекер воды': show_water_tracker,
+    '🎯 Трекер целей': show_goals_tracker,
+    '📊 Статистика': show_general_statistics,
+    '🔙 Главное меню': return_to_main_menu,
+})
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Единый движок расчета плана питания FitAdventure Bot
+Таблицы коэффициентов замораживаются один раз при импорте из CalculationConstants;
+расчет - чистая функция без логирования и побочных эффектов.
+Все точки входа бота (main.py, fitadventure_v5_final.py, calculations.py)
+считают план через compute_plan.
+"""
+
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, NamedTuple, Tuple
+
+from config import CalculationConstants
+
+# Версия формул: меняется при любом изменении результата расчета
+ENGINE_VERSION = '4.1'
+
+REQUIRED_FIELDS = (
+    'weight', 'height', 'age', 'gender', 'steps',
+    'occupation', 'recovery', 'sleep_quality', 'stress_level', 'goal'
+)
+TRAINING_FIELDS = ('training_days', 'activity_type', 'intensity', 'workout_duration')
+
+# Категории процента жира: верхние границы по полу
+FAT_CATEGORY_LABELS = ("Экстремально низкий", "Спортивный", "Фитнес", "Средний", "Высокий", "Очень высокий")
+FAT_CATEGORY_BOUNDS = MappingProxyType({
+    'мужчина': (6, 14, 18, 25, 32),
+    'женщина': (14, 21, 25, 32, 38),
+})
+
+class FactorTables(NamedTuple):
+    """Неизменяемые таблицы коэффициентов расчета"""
+    occupation: Mapping[str, float]
+    activity: Mapping[str, float]
+    intensity: Mapping[str, float]
+    recovery: Mapping[str, float]
+    sleep: Mapping[str, float]
+    goal: Mapping[str, float]
+    protein_per_kg: float
+    protein_min: float
+    protein_max: float
+    fat_share: float
+    fiber_min_rest: int
+    fiber_min_training: int
+    fiber_share: float
+    water_per_kg: int
+
+def freeze_tables(constants=CalculationConstants) -> FactorTables:
+    """Снимок коэффициентов из констант (копии словарей только для чтения)"""
+    return FactorTables(
+        occupation=MappingProxyType(dict(constants.OCCUPATION_FACTORS)),
+        activity=MappingProxyType(dict(constants.ACTIVITY_MULTIPLIERS)),
+        intensity=MappingProxyType(dict(constants.INTENSITY_MULTIPLIERS)),
+        recovery=MappingProxyType(dict(constants.RECOVERY_FACTORS)),
+        sleep=MappingProxyType(dict(constants.SLEEP_FACTORS)),
+        goal=MappingProxyType(dict(constants.GOAL_ADJUSTMENTS)),
+        protein_per_kg=constants.PROTEIN_PER_KG,
+        protein_min=constants.PROTEIN_MIN_MULTIPLIER,
+        protein_max=constants.PROTEIN_MAX_MULTIPLIER,
+        fat_share=constants.FAT_PERCENTAGE,
+        fiber_min_rest=constants.FIBER_MIN_REST,
+        fiber_min_training=constants.FIBER_MIN_TRAINING,
+        fiber_share=constants.FIBER_PERCENTAGE,
+        water_per_kg=constants.WATER_PER_KG,
+    )
+
+FACTORS = freeze_tables()
+
+# === ЭТАПЫ РАСЧЕТА ===
+def validate(user_data: Mapping[str, Any]) -> None:
+    """Проверка заполненности анкеты (ValueError с подсказкой пользователю)"""
+    is_complete = getattr(user_data, 'is_complete', None)
+    if is_complete is not None and is_complete():
+        return  # SurveyProfile: проверка по маске отвеченных шагов
+
+    missing = [field for field in REQUIRED_FIELDS if field not in user_data]
+    if missing:
+        raise ValueError(f"Не заполнены обязательные поля: {', '.join(missing)}. Пройдите все этапы опроса!")
+
+    if user_data.get('has_training_experience', True):
+        missing_training = [field for field in TRAINING_FIELDS if field not in user_data]
+        if missing_training:
+            raise ValueError(f"Не заполнены поля тренировок: {', '.join(missing_training)}. Пройдите все этапы опроса!")
+
+def estimate_fat_percent(weight: float, height: float, age: float, gender: str) -> float:
+    """Процент жира по ИМТ и возрасту, ограниченный 8-35%"""
+    bmi = weight / ((height / 100) ** 2)
+    if gender == 'мужчина':
+        fat_percent = 1.20 * bmi + 0.23 * age - 16.2
+    else:
+        fat_percent = 1.20 * bmi + 0.23 * age - 5.4
+    return round(max(8, min(35, fat_percent)), 1)
+
+def fat_category(fat_percent: float, gender: str) -> str:
+    """Категория по проценту жира"""
+    bounds = FAT_CATEGORY_BOUNDS['мужчина' if gender == 'мужчина' else 'женщина']
+    return FAT_CATEGORY_LABELS[bisect_right(bounds, fat_percent)]
+
+def mifflin_st_jeor(weight: float, height: float, age: float, gender: str) -> float:
+    """BMR по формуле Mifflin-St Jeor"""
+    if gender == 'мужчина':
+        return 10 * weight + 6.25 * height - 5 * age + 5
+    return 10 * weight + 6.25 * height - 5 * age - 161
+
+def activity_factors(user_data: Mapping[str, Any], has_training: bool,
+                     tables: FactorTables = FACTORS) -> Tuple[float, float]:
+    """Факторы активности дней отдыха и тренировок (до учета восстановления)"""
+    work_factor = tables.occupation.get(user_data['occupation'], 0.2)
+    steps_factor = min(user_data['steps'] / 10000 * 0.05, 0.15)
+    rest_day_factor = 1 + work_factor + steps_factor
+
+    if not has_training:
+        return rest_day_factor, rest_day_factor
+
+    training_base = tables.activity.get(user_data['activity_type'], 0.08)
+    intensity_factor = tables.intensity.get(user_data['intensity'], 1.0)
+    duration_factor = min(user_data['workout_duration'] / 60, 2.0)
+    training_factor = training_base * intensity_factor * duration_factor * (user_data['training_days'] / 7)
+    return rest_day_factor, rest_day_factor + training_factor
+
+def recovery_multiplier(user_data: Mapping[str, Any], tables: FactorTables = FACTORS) -> float:
+    """Общий множитель восстановления, сна и стресса"""
+    recovery = tables.recovery.get(user_data['recovery'], 1.0)
+    sleep = tables.sleep.get(user_data['sleep_quality'], 1.0)
+    stress = max(0.85, 1.1 - (user_data['stress_level'] / 10) * 0.25)
+    return recovery * sleep * stress
+
+# === ОСНОВНОЙ РАСЧЕТ ===
+def compute_plan(user_data: Mapping[str, Any], tables: FactorTables = FACTORS) -> Dict[str, Any]:
+    """План питания по данным анкеты (данные должны пройти validate)"""
+    has_training = bool(user_data.get('has_training_experience', True))
+
+    rest_day_factor, training_day_factor = activity_factors(user_data, has_training, tables)
+    multiplier = recovery_multiplier(user_data, tables)
+    rest_day_factor *= multiplier
+    training_day_factor *= multiplier
+
+    return assemble_plan(user_data, has_training, rest_day_factor, training_day_factor, tables)
+
+def assemble_plan(user_data: Mapping[str, Any], has_training: bool, rest_day_factor: float,
+                  training_day_factor: float, tables: FactorTables = FACTORS) -> Dict[str, Any]:
+    """План питания по готовым факторам активности (с учетом восстановления)"""
+    weight, height, age, gender = user_data['weight'], user_data['height'], user_data['age'], user_data['gender']
+
+    fat_percent = user_data.get('fat_percent')
+    if fat_percent is None:
+        fat_percent = estimate_fat_percent(weight, height, age, gender)
+
+    bmr = mifflin_st_jeor(weight, height, age, gender)
+
+    tdee_rest = int(bmr * rest_day_factor)
+    tdee_training = int(bmr * training_day_factor)
+    if has_training:
+        training_days = user_data['training_days']
+        rest_days = 7 - training_days
+        tdee_average = int((tdee_rest * rest_days + tdee_training * training_days) / 7)
+    else:
+        training_days, rest_days = 0, 7
+        tdee_average = tdee_rest
+
+    adjustment = tables.goal.get(user_data['goal'], 0)
+    target_rest = int(tdee_rest * (1 + adjustment))
+    target_training = int(tdee_training * (1 + adjustment))
+    target_average = int(tdee_average * (1 + adjustment))
+
+    protein_grams = int(weight * tables.protein_per_kg)
+    fats_rest = int(target_rest * tables.fat_share / 9)
+    fats_training = int(target_training * tables.fat_share / 9)
+    carbs_rest = int((target_rest - protein_grams * 4 - fats_rest * 9) / 4)
+    carbs_training = int((target_training - protein_grams * 4 - fats_training * 9) / 4)
+
+    return {
+        'bmr': int(bmr),
+        'tdee_rest': tdee_rest,
+        'tdee_training': tdee_training,
+        'tdee_average': tdee_average,
+        'target_calories_rest': target_rest,
+        'target_calories_training': target_training,
+        'target_calories_average': target_average,
+        'protein_grams': protein_grams,
+        'protein_min': int(weight * tables.protein_min),
+        'protein_max': int(weight * tables.protein_max),
+        'fats_rest': fats_rest,
+        'fats_training': fats_training,
+        'carbs_rest': carbs_rest,
+        'carbs_training': carbs_training,
+        'fiber_rest': max(tables.fiber_min_rest, int(carbs_rest * tables.fiber_share)),
+        'fiber_training': max(tables.fiber_min_training, int(carbs_training * tables.fiber_share)),
+        'water': int(weight * tables.water_per_kg),
+        'rest_day_factor': round(rest_day_factor, 2),
+        'training_day_factor': round(training_day_factor, 2),
+        'training_days': training_days,
+        'rest_days': rest_days,
+        'has_training_experience': has_training,
+        'fat_percent': fat_percent,
+        'fat_category': fat_category(fat_percent, gender),
+        'precision_score': 98,
+        'engine_version': ENGINE_VERSION
+    }
+
+# === ПРЕДВЫЧИСЛЕННАЯ СЕТКА ФАКТОРОВ ===
+class FactorGrid:
+    """Произведения коэффициентов по всем дискретным ответам анкеты
+
+    Строится один раз: для каждой комбинации (профессия, восстановление, сон,
+    стресс) хранятся 1 + фактор работы и общий множитель восстановления,
+    для (тип тренировок, интенсивность, дни) - произведение базы на интенсивность
+    и доля дней недели. Непрерывные шаги и длительность тренировки домножаются
+    при расчете в том же порядке операций, что и в compute_plan, поэтому
+    результат совпадает до бита. Ответы вне сетки считаются обычным compute_plan.
+    """
+
+    STRESS_LEVELS = range(1, 11)
+    TRAINING_DAYS = range(1, 8)
+
+    def __init__(self, tables: FactorTables = FACTORS):
+        self.tables = tables
+        # (профессия, восстановление, сон, стресс) -> (1 + фактор работы, множитель)
+        self.rest_grid: Dict[Tuple[str, str, str, int], Tuple[float, float]] = {}
+        for occupation, work_factor in tables.occupation.items():
+            for recovery_name, recovery in tables.recovery.items():
+                for sleep_name, sleep in tables.sleep.items():
+                    for stress_level in self.STRESS_LEVELS:
+                        stress = max(0.85, 1.1 - (stress_level / 10) * 0.25)
+                        key = (occupation, recovery_name, sleep_name, stress_level)
+                        self.rest_grid[key] = (1 + work_factor, recovery * sleep * stress)
+
+        # (тип тренировок, интенсивность, дни) -> (база * интенсивность, дни / 7)
+        self.training_grid: Dict[Tuple[str, str, int], Tuple[float, float]] = {}
+        for activity, training_base in tables.activity.items():
+            for intensity, intensity_factor in tables.intensity.items():
+                for training_days in self.TRAINING_DAYS:
+                    key = (activity, intensity, training_days)
+                    self.training_grid[key] = (training_base * intensity_factor, training_days / 7)
+
+    def __len__(self) -> int:
+        return len(self.rest_grid) + len(self.training_grid)
+
+    def compute_plan(self, user_data: Mapping[str, Any]) -> Dict[str, Any]:
+        """План питания через сетку (результат совпадает с compute_plan)"""
+        has_training = bool(user_data.get('has_training_experience', True))
+        try:
+            base_factor, multiplier = self.rest_grid[(user_data['occupation'], user_data['recovery'],
+                                                      user_data['sleep_quality'], user_data['stress_level'])]
+            if has_training:
+                training_base, day_fraction = self.training_grid[(user_data['activity_type'], user_data['intensity'],
+                                                                  user_data['training_days'])]
+        except (KeyError, TypeError):
+            return compute_plan(user_data, self.tables)
+
+        rest_day_factor = base_factor + min(user_data['steps'] / 10000 * 0.05, 0.15)
+        if has_training:
+            duration_factor = min(user_data['workout_duration'] / 60, 2.0)
+            training_day_factor = (rest_day_factor + training_base * duration_factor * day_fraction) * multiplier
+        else:
+            training_day_factor = rest_day_factor * multiplier
+        return assemble_plan(user_data, has_training, rest_day_factor * multiplier, training_day_factor, self.tables)
+
+def calculate_plan(user_data: Mapping[str, Any]) -> Dict[str, Any]:
+    """Проверка анкеты и расчет плана"""
+    validate(user_data)
+    return compute_plan(user_data)
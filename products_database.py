@@ -5,4 +5,82 @@
 Добавлены легко доступные продукты
 """
 
-PRODUCTS_DATABASE = {'похудение': {'сложные_углеводы': {'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Медленные углеводы, надолго насыщают'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Богата железом, идеальна для похудения'}, 'киноа': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Полноценный белок, низкая калорийность'}, 'булгур': {'калории': 342, 'белки': 12, 'жиры': 1.3, 'углеводы': 76, 'клетчатка': 8, 'описание': 'Быстро готовится, много клетчатки'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Нешлифованный рис с оболочкой'}, 'рис белый': {'калории': 344, 'белки': 6.7, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Белый рис, быстро готовится'}, 'рис басмати': {'калории': 345, 'белки': 7.1, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Ароматный рис'}, 'рис жасмин': {'калории': 345, 'белки': 7.1, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Душистый рис'}, 'чечевица': {'калории': 116, 'белки': 9, 'жиры': 0.4, 'углеводы': 20, 'клетчатка': 7.9, 'описание': 'Много белка и клетчатки'}, 'нут': {'калории': 164, 'белки': 8.9, 'жиры': 2.6, 'углеводы': 27, 'клетчатка': 7.6, 'описание': 'Нут - отличный источник белка'}, 'фасоль': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Классическая фасоль'}, 'фасоль красная': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Красная фасоль'}, 'фасоль белая': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Белая фасоль'}, 'перловка': {'калории': 352, 'белки': 9.9, 'жиры': 1.2, 'углеводы': 78, 'клетчатка': 15.6, 'описание': 'Ячменная крупа, много клетчатки'}, 'пшено': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа, богата магнием'}, 'кукурузная крупа': {'калории': 337, 'белки': 8.1, 'жиры': 1.2, 'углеводы': 75, 'клетчатка': 7.3, 'описание': 'Кукурузная каша, без глютена'}, 'ячневая крупа': {'калории': 324, 'белки': 10, 'жиры': 1.3, 'углеводы': 73, 'клетчатка': 17.3, 'описание': 'Ячменная крупа, рекорд клетчатки'}, 'горох': {'калории': 84, 'белки': 5.4, 'жиры': 0.4, 'углеводы': 14, 'клетчатка': 5.7, 'описание': 'Зеленый горошек, много белка'}, 'маш': {'калории': 347, 'белки': 23.9, 'жиры': 1.2, 'углеводы': 62, 'клетчатка': 16.3, 'описание': 'Бобы мунг, суперфуд'}, 'соя': {'калории': 446, 'белки': 36.5, 'жиры': 20, 'углеводы': 30, 'клетчатка': 9.3, 'описание': 'Соевые бобы, рекорд белка'}, 'картофель': {'калории': 77, 'белки': 2, 'жиры': 0.1, 'углеводы': 17, 'клетчатка': 2.2, 'описание': 'Крахмалистые углеводы'}, 'батат': {'калории': 86, 'белки': 1.6, 'жиры': 0.1, 'углеводы': 20, 'клетчатка': 3, 'описание': 'Сладкий картофель'}, 'макароны': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Быстро готовятся'}, 'макароны из твердых сортов': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Качественные макароны'}, 'спагетти': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Классические спагетти'}, 'паста': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Итальянская паста'}, 'хлеб цельнозерновой': {'калории': 247, 'белки': 13, 'жиры': 4.2, 'углеводы': 41, 'клетчатка': 7, 'описание': 'Полезный хлеб'}, 'хлеб ржаной': {'калории': 259, 'белки': 8.5, 'жиры': 3.3, 'углеводы': 48, 'клетчатка': 5.8, 'описание': 'Ржаной хлеб'}, 'хлеб белый': {'калории': 265, 'белки': 9, 'жиры': 3.2, 'углеводы': 49, 'клетчатка': 2.7, 'описание': 'Белый хлеб'}, 'лаваш': {'калории': 275, 'белки': 9, 'жиры': 1.2, 'углеводы': 56, 'клетчатка': 2.2, 'описание': 'Тонкий хлеб'}, 'тортилья': {'калории': 218, 'белки': 5.4, 'жиры': 2.9, 'углеводы': 45, 'клетчатка': 2.9, 'описание': 'Мексиканская лепешка'}, 'кускус': {'калории': 376, 'белки': 12.8, 'жиры': 0.6, 'углеводы': 77, 'клетчатка': 5, 'описание': 'Быстро готовится'}, 'манка': {'калории': 360, 'белки': 12.7, 'жиры': 1, 'углеводы': 73, 'клетчатка': 3.9, 'описание': 'Манная крупа'}, 'пшеничная крупа': {'калории': 340, 'белки': 11, 'жиры': 1.2, 'углеводы': 72, 'клетчатка': 4.5, 'описание': 'Пшеничная каша'}, 'полба': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Древняя пшеница'}, 'спельта': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Полбяная пшеница'}, 'амарант': {'калории': 103, 'белки': 4, 'жиры': 1.6, 'углеводы': 19, 'клетчатка': 2.1, 'описание': 'Щирица'}, 'теф': {'калории': 101, 'белки': 4, 'жиры': 1, 'углеводы': 20, 'клетчатка': 2.8, 'описание': 'Эфиопская крупа'}, 'сорго': {'калории': 329, 'белки': 11, 'жиры': 3.5, 'углеводы': 72, 'клетчатка': 6.7, 'описание': 'Африканская крупа'}, 'просо': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа'}, 'камут': {'калории': 337, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 11.1, 'описание': 'Хорасанская пшеница'}, 'фарро': {'калории': 340, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Итальянская полба'}, 'эммер': {'калории': 339, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Двузернянка'}, 'каша овсяная быстрого приготовления': {'калории': 68, 'белки': 2.4, 'жиры': 1.4, 'углеводы': 12, 'клетчатка': 1.7, 'описание': 'Быстрая овсянка'}, 'каша гречневая быстрого приготовления': {'калории': 92, 'белки': 3.5, 'жиры': 0.9, 'углеводы': 19, 'клетчатка': 2.6, 'описание': 'Быстрая гречка'}, 'батон': {'калории': 235, 'белки': 7.5, 'жиры': 1.3, 'углеводы': 49, 'клетчатка': 2.5, 'описание': 'Белый батон'}, 'булочка сдобная': {'калории': 280, 'белки': 8, 'жиры': 4, 'углеводы': 55, 'клетчатка': 2, 'описание': 'Сдобная булочка'}, 'круассан': {'калории': 406, 'белки': 8.2, 'жиры': 21, 'углеводы': 45, 'клетчатка': 2.5, 'описание': 'Французский круассан'}, 'хлебцы': {'калории': 280, 'белки': 10, 'жиры': 2, 'углеводы': 55, 'клетчатка': 8, 'описание': 'Диетические хлебцы'}, 'крекеры': {'калории': 380, 'белки': 8, 'жиры': 12, 'углеводы': 62, 'клетчатка': 2, 'описание': 'Крекеры'}, 'печенье': {'калории': 450, 'белки': 6, 'жиры': 18, 'углеводы': 68, 'клетчатка': 1.5, 'описание': 'Сладкое печенье'}, 'лапша быстрого приготовления': {'калории': 380, 'белки': 8, 'жиры': 14, 'углеводы': 58, 'клетчатка': 2, 'описание': 'Доширак/Роллтон'}, 'пельмени': {'калории': 233, 'белки': 8.5, 'жиры': 3.2, 'углеводы': 42, 'клетчатка': 1.5, 'описание': 'Русские пельмени'}, 'вареники': {'калории': 215, 'белки': 7.8, 'жиры': 2.8, 'углеводы': 40, 'клетчатка': 1.8, 'описание': 'Украинские вареники'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Натуральный подсластитель'}, 'банан': {'калории': 89, 'белки': 1.1, 'жиры': 0.3, 'углеводы': 23, 'клетчатка': 2.6, 'описание': 'Быстрая энергия, много калия'}, 'яблоко': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Низкокалорийный фрукт'}, 'груша': {'калории': 57, 'белки': 0.4, 'жиры': 0.1, 'углеводы': 15, 'клетчатка': 3.1, 'описание': 'Сладкая и сочная'}, 'апельсин': {'калории': 47, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 12, 'клетчатка': 2.4, 'описание': 'Много витамина С'}, 'виноград': {'калории': 62, 'белки': 0.6, 'жиры': 0.2, 'углеводы': 16, 'клетчатка': 0.9, 'описание': 'Сладкий и освежающий'}, 'сухофрукты': {'калории': 240, 'белки': 3.4, 'жиры': 0.4, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Концентрированные фрукты'}, 'манго': {'калории': 60, 'белки': 0.8, 'жиры': 0.4, 'углеводы': 15, 'клетчатка': 1.6, 'описание': 'Тропический фрукт, витамин А'}, 'ананас': {'калории': 50, 'белки': 0.5, 'жиры': 0.1, 'углеводы': 13, 'клетчатка': 1.4, 'описание': 'Бромелайн для пищеварения'}, 'персик': {'калории': 39, 'белки': 0.9, 'жиры': 0.3, 'углеводы': 10, 'клетчатка': 1.5, 'описание': 'Сладкий и ароматный'}, 'абрикос': {'калории': 48, 'белки': 1.4, 'жиры': 0.4, 'углеводы': 11, 'клетчатка': 2, 'описание': 'Бета-каротин'}, 'слива': {'калории': 46, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 11, 'клетчатка': 1.4, 'описание': 'Антиоксиданты'}, 'клубника': {'калории': 32, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 8, 'клетчатка': 2, 'описание': 'Витамин С'}, 'малина': {'калории': 52, 'белки': 1.2, 'жиры': 0.7, 'углеводы': 12, 'клетчатка': 6.5, 'описание': 'Много клетчатки'}, 'черника': {'калории': 57, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Антоцианы'}, 'изюм': {'калории': 299, 'белки': 3.1, 'жиры': 0.5, 'углеводы': 79, 'клетчатка': 3.7, 'описание': 'Сушеный виноград'}, 'курага': {'калории': 241, 'белки': 3.4, 'жиры': 0.5, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Сушеные абрикосы'}, 'чернослив': {'калории': 240, 'белки': 2.2, 'жиры': 0.4, 'углеводы': 64, 'клетчатка': 7.1, 'описание': 'Сушеные сливы'}, 'финики': {'калории': 282, 'белки': 2.5, 'жиры': 0.4, 'углеводы': 75, 'клетчатка': 8, 'описание': 'Природный энергетик'}, 'инжир': {'калории': 74, 'белки': 0.8, 'жиры': 0.3, 'углеводы': 19, 'клетчатка': 2.9, 'описание': 'Сладкий и питательный'}, 'шоколад молочный': {'калории': 545, 'белки': 7.5, 'жиры': 31, 'углеводы': 61, 'клетчатка': 2.5, 'описание': 'Молочный шоколад'}, 'шоколад темный': {'калории': 546, 'белки': 4.9, 'жиры': 31, 'углеводы': 61, 'клетчатка': 7, 'описание': 'Темный шоколад'}, 'конфеты': {'калории': 380, 'белки': 2, 'жиры': 8, 'углеводы': 75, 'клетчатка': 0, 'описание': 'Сладкие конфеты'}, 'мармелад': {'калории': 266, 'белки': 0.1, 'жиры': 0, 'углеводы': 70, 'клетчатка': 0, 'описание': 'Фруктовый мармелад'}, 'зефир': {'калории': 304, 'белки': 0.8, 'жиры': 0, 'углеводы': 81, 'клетчатка': 0, 'описание': 'Воздушный зефир'}, 'сок апельсиновый': {'калории': 45, 'белки': 0.7, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 0.2, 'описание': 'Апельсиновый сок'}, 'сок яблочный': {'калории': 46, 'белки': 0.1, 'жиры': 0.1, 'углеводы': 11, 'клетчатка': 0.2, 'описание': 'Яблочный сок'}, 'кола': {'калории': 42, 'белки': 0, 'жиры': 0, 'углеводы': 10.6, 'клетчатка': 0, 'описание': 'Кока-кола'}, 'пепси': {'калории': 41, 'белки': 0, 'жиры': 0, 'углеводы': 11, 'клетчатка': 0, 'описание': 'Пепси-кола'}, 'мороженое пломбир': {'калории': 227, 'белки': 3.5, 'жиры': 15, 'углеводы': 20, 'клетчатка': 0, 'описание': 'Классический пломбир'}, 'мороженое эскимо': {'калории': 267, 'белки': 3.8, 'жиры': 18, 'углеводы': 22, 'клетчатка': 0, 'описание': 'Мороженое в шоколаде'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'куриное филе': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Филе курицы'}, 'куриные окорочка': {'калории': 209, 'белки': 26, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Куриные ножки'}, 'куриные крылышки': {'калории': 290, 'белки': 27, 'жиры': 19, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Куриные крылышки'}, 'куриная печень': {'калории': 167, 'белки': 26, 'жиры': 6.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Куриная печень'}, 'куриные сердечки': {'калории': 185, 'белки': 26, 'жиры': 8.3, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Куриные сердечки'}, 'индейка грудка': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постное мясо индейки'}, 'индейка филе': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Филе индейки'}, 'индейка окорочка': {'калории': 189, 'белки': 28, 'жиры': 8.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Ножки индейки'}, 'яичные белки': {'калории': 52, 'белки': 11, 'жиры': 0.2, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Чистый белок без жира'}, 'яйца куриные': {'калории': 157, 'белки': 12.7, 'жиры': 11.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Полноценный белок'}, 'перепелиные яйца': {'калории': 158, 'белки': 13.1, 'жиры': 11.2, 'углеводы': 0.4, 'клетчатка': 0, 'описание': 'Мини-яйца'}, 'утиные яйца': {'калории': 185, 'белки': 13, 'жиры': 14, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Утиные яйца'}, 'гусиные яйца': {'калории': 185, 'белки': 13, 'жиры': 14, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Гусиные яйца'}, 'творог обезжиренный': {'калории': 88, 'белки': 18, 'жиры': 0.6, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Много белка, мало жира'}, 'творог 0%': {'калории': 88, 'белки': 18, 'жиры': 0.6, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Обезжиренный творог'}, 'творог 2%': {'калории': 101, 'белки': 17, 'жиры': 2, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Нежирный творог'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Сбалансированный творог'}, 'творог 9%': {'калории': 159, 'белки': 16, 'жиры': 9, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Жирный творог'}, 'творог 18%': {'калории': 232, 'белки': 14, 'жиры': 18, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Очень жирный творог'}, 'рыба белая': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная рыба'}, 'треска': {'калории': 82, 'белки': 18, 'жиры': 0.7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Треска'}, 'минтай': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Минтай'}, 'хек': {'калории': 86, 'белки': 18, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Хек'}, 'окунь': {'калории': 91, 'белки': 19, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Окунь'}, 'судак': {'калории': 84, 'белки': 18, 'жиры': 1.1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Судак'}, 'щука': {'калории': 88, 'белки': 19, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Щука'}, 'карп': {'калории': 127, 'белки': 18, 'жиры': 5.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Карп'}, 'сом': {'калории': 95, 'белки': 18, 'жиры': 2.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Сом'}, 'креветки': {'калории': 99, 'белки': 24, 'жиры': 0.3, 'углеводы': 0.2, 'клетчатка': 0, 'описание': 'Морской белок'}, 'крабы': {'калории': 97, 'белки': 19, 'жиры': 1.5, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Крабовое мясо'}, 'раки': {'калории': 77, 'белки': 16, 'жиры': 1, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Раки'}, 'протеин изолят': {'калории': 350, 'белки': 85, 'жиры': 1, 'углеводы': 5, 'клетчатка': 0, 'описание': 'Концентрированный белок'}, 'говядина постная': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Креатин и железо'}, 'говядина вырезка': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Говяжья вырезка'}, 'говядина язык': {'калории': 224, 'белки': 16, 'жиры': 17, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Говяжий язык'}, 'говяжья печень': {'калории': 135, 'белки': 20, 'жиры': 3.6, 'углеводы': 3.9, 'клетчатка': 0, 'описание': 'Говяжья печень'}, 'говяжье сердце': {'калории': 112, 'белки': 17, 'жиры': 3.9, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Говяжье сердце'}, 'телятина': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Нежное мясо'}, 'баранина': {'калории': 294, 'белки': 25, 'жиры': 21, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирное мясо'}, 'баранина постная': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная баранина'}, 'свинина постная': {'калории': 242, 'белки': 27, 'жиры': 14, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная свинина'}, 'свиная вырезка': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Свиная вырезка'}, 'свиная печень': {'калории': 134, 'белки': 21, 'жиры': 3.7, 'углеводы': 2.5, 'клетчатка': 0, 'описание': 'Свиная печень'}, 'кролик': {'калории': 173, 'белки': 33, 'жиры': 3.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'утка': {'калории': 337, 'белки': 19, 'жиры': 28, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная птица'}, 'гусь': {'калории': 305, 'белки': 29, 'жиры': 22, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная птица'}, 'перепелка': {'калории': 134, 'белки': 21, 'жиры': 4.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Перепелка'}, 'фазан': {'калории': 133, 'белки': 24, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Фазан'}, 'лосось': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и белок'}, 'тунец': {'калории': 144, 'белки': 30, 'жиры': 1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Чистый белок'}, 'форель': {'калории': 190, 'белки': 20, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Речная рыба'}, 'сельдь': {'калории': 158, 'белки': 18, 'жиры': 9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная рыба'}, 'сардины': {'калории': 208, 'белки': 24, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированная рыба'}, 'скумбрия': {'калории': 305, 'белки': 19, 'жиры': 25, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Скумбрия'}, 'палтус': {'калории': 111, 'белки': 21, 'жиры': 2.3, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Палтус'}, 'камбала': {'калории': 86, 'белки': 16, 'жиры': 2.4, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Камбала'}, 'мидии': {'калории': 86, 'белки': 12, 'жиры': 2.2, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Морские моллюски'}, 'устрицы': {'калории': 69, 'белки': 9, 'жиры': 2, 'углеводы': 4.2, 'клетчатка': 0, 'описание': 'Морские моллюски'}, 'кальмары': {'калории': 92, 'белки': 18, 'жиры': 1.4, 'углеводы': 3.1, 'клетчатка': 0, 'описание': 'Морские головоногие'}, 'осьминог': {'калории': 82, 'белки': 15, 'жиры': 1, 'углеводы': 2.2, 'клетчатка': 0, 'описание': 'Морские головоногие'}, 'сыр рикотта': {'калории': 174, 'белки': 11, 'жиры': 13, 'углеводы': 3, 'клетчатка': 0, 'описание': 'Итальянский сыр'}, 'сыр фета': {'калории': 264, 'белки': 14, 'жиры': 21, 'углеводы': 4, 'клетчатка': 0, 'описание': 'Греческий сыр'}, 'сыр моцарелла': {'калории': 280, 'белки': 28, 'жиры': 17, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Итальянский сыр'}, 'сыр чеддер': {'калории': 403, 'белки': 25, 'жиры': 33, 'углеводы': 1.3, 'клетчатка': 0, 'описание': 'Английский сыр'}, 'сыр пармезан': {'калории': 431, 'белки': 38, 'жиры': 29, 'углеводы': 4.1, 'клетчатка': 0, 'описание': 'Твердый итальянский сыр'}, 'сыр гауда': {'калории': 356, 'белки': 25, 'жиры': 27, 'углеводы': 2.2, 'клетчатка': 0, 'описание': 'Голландский сыр'}, 'сыр эдам': {'калории': 357, 'белки': 25, 'жиры': 28, 'углеводы': 1.4, 'клетчатка': 0, 'описание': 'Голландский сыр'}, 'сыр бри': {'калории': 334, 'белки': 21, 'жиры': 28, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Французский сыр'}, 'сыр камамбер': {'калории': 300, 'белки': 20, 'жиры': 24, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Французский сыр'}, 'сыр рокфор': {'калории': 369, 'белки': 22, 'жиры': 31, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Голубой сыр'}, 'сыр горгонзола': {'калории': 357, 'белки': 21, 'жиры': 31, 'углеводы': 2.3, 'клетчатка': 0, 'описание': 'Голубой сыр'}, 'сыр сулугуни': {'калории': 286, 'белки': 20, 'жиры': 22, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Грузинский сыр'}, 'сыр адыгейский': {'калории': 240, 'белки': 19, 'жиры': 18, 'углеводы': 1.5, 'клетчатка': 0, 'описание': 'Адыгейский сыр'}, 'сыр брынза': {'калории': 262, 'белки': 22, 'жиры': 19, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Брынза'}, 'йогурт греческий': {'калории': 59, 'белки': 10, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 0, 'описание': 'Протеиновый йогурт'}, 'йогурт натуральный': {'калории': 59, 'белки': 10, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 0, 'описание': 'Натуральный йогурт'}, 'йогурт питьевой': {'калории': 72, 'белки': 4.5, 'жиры': 3.2, 'углеводы': 5.2, 'клетчатка': 0, 'описание': 'Питьевой йогурт'}, 'кефир': {'калории': 64, 'белки': 3.4, 'жиры': 3.6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Пробиотический напиток'}, 'кефир 1%': {'калории': 40, 'белки': 3.4, 'жиры': 1, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Нежирный кефир'}, 'кефир 2.5%': {'калории': 53, 'белки': 3.4, 'жиры': 2.5, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Среднежирный кефир'}, 'кефир 3.2%': {'калории': 64, 'белки': 3.4, 'жиры': 3.6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Жирный кефир'}, 'ряженка': {'калории': 67, 'белки': 3.2, 'жиры': 4, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Топленый молочный продукт'}, 'сметана 10%': {'калории': 115, 'белки': 3, 'жиры': 10, 'углеводы': 2.9, 'клетчатка': 0, 'описание': 'Среднежирная сметана'}, 'сметана 15%': {'калории': 160, 'белки': 2.8, 'жиры': 15, 'углеводы': 3.2, 'клетчатка': 0, 'описание': 'Жирная сметана'}, 'сметана 20%': {'калории': 206, 'белки': 2.5, 'жиры': 20, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Жирная сметана'}, 'молоко 1.5%': {'калории': 42, 'белки': 3.3, 'жиры': 1.5, 'углеводы': 4.8, 'клетчатка': 0, 'описание': 'Нежирное молоко'}, 'молоко 2.5%': {'калории': 50, 'белки': 3.3, 'жиры': 2.5, 'углеводы': 4.8, 'клетчатка': 0, 'описание': 'Среднежирное молоко'}, 'молоко 3.2%': {'калории': 60, 'белки': 3.2, 'жиры': 3.2, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Жирное молоко'}, 'молоко 6%': {'калории': 84, 'белки': 3.2, 'жиры': 6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Очень жирное молоко'}, 'протеин сывороточный': {'калории': 375, 'белки': 80, 'жиры': 4, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Быстрый белок'}, 'протеин казеин': {'калории': 360, 'белки': 80, 'жиры': 2, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Медленный белок'}, 'протеин многокомпонентный': {'калории': 370, 'белки': 75, 'жиры': 3, 'углеводы': 10, 'клетчатка': 0, 'описание': 'Комплексный протеин'}, 'соевый протеин': {'калории': 335, 'белки': 80, 'жиры': 1, 'углеводы': 7, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'гороховый протеин': {'калории': 320, 'белки': 80, 'жиры': 2, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'конопляный протеин': {'калории': 330, 'белки': 75, 'жиры': 3, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'рисовый протеин': {'калории': 340, 'белки': 80, 'жиры': 1, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'овсяный протеин': {'калории': 325, 'белки': 75, 'жиры': 2, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'куриные наггетсы': {'калории': 290, 'белки': 14, 'жиры': 18, 'углеводы': 20, 'клетчатка': 1, 'описание': 'Готовые куриные наггетсы'}, 'куриные котлеты': {'калории': 220, 'белки': 18, 'жиры': 12, 'углеводы': 8, 'клетчатка': 0.5, 'описание': 'Готовые куриные котлеты'}, 'сосиски куриные': {'калории': 180, 'белки': 12, 'жиры': 14, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Куриные сосиски'}, 'колбаса докторская': {'калории': 257, 'белки': 12, 'жиры': 22, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Докторская колбаса'}, 'ветчина': {'калории': 126, 'белки': 22, 'жиры': 3, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Ветчина'}, 'бекон': {'калории': 541, 'белки': 37, 'жиры': 42, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Бекон'}, 'тунец консервированный': {'калории': 116, 'белки': 26, 'жиры': 0.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированный тунец'}, 'лосось консервированный': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированный лосось'}, 'сардины консервированные': {'калории': 208, 'белки': 24, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированные сардины'}, 'йогурт питьевой фруктовый': {'калории': 85, 'белки': 3, 'жиры': 1.5, 'углеводы': 15, 'клетчатка': 0, 'описание': 'Фруктовый питьевой йогурт'}, 'творожная масса': {'калории': 340, 'белки': 11, 'жиры': 23, 'углеводы': 26, 'клетчатка': 0, 'описание': 'Сладкая творожная масса'}, 'сыр плавленый': {'калории': 290, 'белки': 22, 'жиры': 21, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Плавленый сыр'}, 'майонез': {'калории': 680, 'белки': 1, 'жиры': 75, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Майонез'}}, 'ненасыщенные_жиры': {'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Мононенасыщенные жиры'}, 'орехи грецкие': {'калории': 654, 'белки': 15, 'жиры': 65, 'углеводы': 14, 'клетчатка': 6.7, 'описание': 'Омега-3 жиры'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'семена льна': {'калории': 534, 'белки': 18, 'жиры': 42, 'углеводы': 29, 'клетчатка': 27.3, 'описание': 'Омега-3 и клетчатка'}, 'семена чиа': {'калории': 486, 'белки': 17, 'жиры': 31, 'углеводы': 42, 'клетчатка': 34.4, 'описание': 'Суперфуд'}, 'кешью': {'калории': 553, 'белки': 18, 'жиры': 44, 'углеводы': 30, 'клетчатка': 3.3, 'описание': 'Магний'}, 'арахис': {'калории': 567, 'белки': 26, 'жиры': 49, 'углеводы': 16, 'клетчатка': 8.5, 'описание': 'Дешевый источник жиров'}, 'фисташки': {'калории': 560, 'белки': 20, 'жиры': 45, 'углеводы': 28, 'клетчатка': 10.6, 'описание': 'Антиоксиданты'}, 'фундук': {'калории': 628, 'белки': 15, 'жиры': 61, 'углеводы': 17, 'клетчатка': 9.7, 'описание': 'Витамин Е'}, 'пекан': {'калории': 691, 'белки': 9, 'жиры': 72, 'углеводы': 14, 'клетчатка': 9.6, 'описание': 'Мононенасыщенные жиры'}, 'бразильские орехи': {'калории': 656, 'белки': 14, 'жиры': 66, 'углеводы': 12, 'клетчатка': 7.5, 'описание': 'Селен'}, 'макадамия': {'калории': 718, 'белки': 8, 'жиры': 76, 'углеводы': 14, 'клетчатка': 8.6, 'описание': 'Королевские орехи'}, 'семена подсолнечника': {'калории': 584, 'белки': 21, 'жиры': 51, 'углеводы': 20, 'клетчатка': 8.6, 'описание': 'Витамин Е'}, 'семена тыквы': {'калории': 559, 'белки': 19, 'жиры': 49, 'углеводы': 54, 'клетчатка': 18.4, 'описание': 'Цинк'}, 'семена кунжута': {'калории': 573, 'белки': 18, 'жиры': 50, 'углеводы': 23, 'клетчатка': 11.8, 'описание': 'Кальций'}, 'семена конопли': {'калории': 553, 'белки': 31, 'жиры': 49, 'углеводы': 9, 'клетчатка': 4, 'описание': 'Полноценный белок'}, 'рапсовое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и омега-6'}, 'льняное масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3'}, 'масло грецкого ореха': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3'}, 'масло авокадо': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Мононенасыщенные жиры'}, 'масло виноградной косточки': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-6'}, 'масло кунжута': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Сезамол'}, 'оливки': {'калории': 115, 'белки': 0.8, 'жиры': 11, 'углеводы': 6, 'клетчатка': 3.2, 'описание': 'Мононенасыщенные жиры'}, 'маслины': {'калории': 115, 'белки': 0.8, 'жиры': 11, 'углеводы': 6, 'клетчатка': 3.2, 'описание': 'Черные оливки'}}, 'насыщенные_жиры': {'сливочное масло': {'калории': 717, 'белки': 0.9, 'жиры': 81, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Животные жиры'}, 'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и белок'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамин С и клетчатка'}, 'цветная капуста': {'калории': 25, 'белки': 1.9, 'жиры': 0.3, 'углеводы': 5, 'клетчатка': 2.5, 'описание': 'Низкокалорийная'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо и витамины'}, 'капуста': {'калории': 25, 'белки': 1.3, 'жиры': 0.2, 'углеводы': 5.8, 'клетчатка': 2.5, 'описание': 'Витамин К'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}, 'свекла': {'калории': 43, 'белки': 1.6, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Нитраты для сосудов'}, 'кабачки': {'калории': 17, 'белки': 1.2, 'жиры': 0.3, 'углеводы': 3.1, 'клетчатка': 1, 'описание': 'Низкокалорийные'}, 'баклажаны': {'калории': 25, 'белки': 1, 'жиры': 0.2, 'углеводы': 6, 'клетчатка': 3, 'описание': 'Антоцианы'}, 'перец болгарский': {'калории': 31, 'белки': 1, 'жиры': 0.3, 'углеводы': 7, 'клетчатка': 2.1, 'описание': 'Витамин С'}, 'помидоры': {'калории': 18, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 3.9, 'клетчатка': 1.2, 'описание': 'Ликопин'}, 'огурцы': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.6, 'клетчатка': 0.5, 'описание': 'Вода и клетчатка'}, 'лук репчатый': {'калории': 40, 'белки': 1.1, 'жиры': 0.1, 'углеводы': 9, 'клетчатка': 1.7, 'описание': 'Кверцетин'}, 'чеснок': {'калории': 149, 'белки': 6.4, 'жиры': 0.5, 'углеводы': 33, 'клетчатка': 2.1, 'описание': 'Аллицин'}, 'сельдерей': {'калории': 16, 'белки': 0.7, 'жиры': 0.2, 'углеводы': 3, 'клетчатка': 1.6, 'описание': 'Отрицательные калории'}, 'спаржа': {'калории': 20, 'белки': 2.2, 'жиры': 0.1, 'углеводы': 3.9, 'клетчатка': 2.1, 'описание': 'Фолиевая кислота'}, 'артишок': {'калории': 47, 'белки': 3.3, 'жиры': 0.2, 'углеводы': 11, 'клетчатка': 5.4, 'описание': 'Цинарин'}, 'брюссельская капуста': {'калории': 43, 'белки': 3.4, 'жиры': 0.3, 'углеводы': 9, 'клетчатка': 3.8, 'описание': 'Глюкозинолаты'}, 'кольраби': {'калории': 27, 'белки': 1.7, 'жиры': 0.1, 'углеводы': 6, 'клетчатка': 3.6, 'описание': 'Витамин С'}, 'репа': {'калории': 28, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 6, 'клетчатка': 1.8, 'описание': 'Глюкорафанин'}, 'редька': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.4, 'клетчатка': 1.6, 'описание': 'Горчичное масло'}, 'редис': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.4, 'клетчатка': 1.6, 'описание': 'Острый вкус'}, 'руккола': {'калории': 25, 'белки': 2.6, 'жиры': 0.7, 'углеводы': 3.7, 'клетчатка': 1.6, 'описание': 'Горчичное масло'}, 'салат латук': {'калории': 15, 'белки': 1.4, 'жиры': 0.1, 'углеводы': 2.9, 'клетчатка': 1.3, 'описание': 'Вода и витамины'}, 'салат айсберг': {'калории': 14, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 3, 'клетчатка': 1.2, 'описание': 'Хрустящий салат'}, 'салат ромэн': {'калории': 17, 'белки': 1.2, 'жиры': 0.3, 'углеводы': 3.3, 'клетчатка': 2.1, 'описание': 'Витамин К'}, 'салат фризе': {'калории': 14, 'белки': 1.4, 'жиры': 0.2, 'углеводы': 2.8, 'клетчатка': 2.5, 'описание': 'Горький салат'}, 'салат радиккио': {'калории': 23, 'белки': 1.4, 'жиры': 0.3, 'углеводы': 4.5, 'клетчатка': 0.9, 'описание': 'Красный салат'}, 'салат эндивий': {'калории': 17, 'белки': 1.3, 'жиры': 0.2, 'углеводы': 3.4, 'клетчатка': 3.1, 'описание': 'Горький салат'}, 'салат мангольд': {'калории': 19, 'белки': 1.8, 'жиры': 0.2, 'углеводы': 3.7, 'клетчатка': 1.6, 'описание': 'Листовая свекла'}, 'салат кале': {'калории': 49, 'белки': 4.3, 'жиры': 0.9, 'углеводы': 8.8, 'клетчатка': 3.6, 'описание': 'Кудрявая капуста'}, 'салат бок-чой': {'калории': 13, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Китайская капуста'}, 'салат татсой': {'калории': 12, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Азиатская зелень'}, 'салат мизуна': {'калории': 12, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Японская зелень'}, 'салат амарант': {'калории': 103, 'белки': 4, 'жиры': 1.6, 'углеводы': 19, 'клетчатка': 2.1, 'описание': 'Щирица'}, 'салат портулак': {'калории': 16, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 3.4, 'клетчатка': 0.9, 'описание': 'Дандур'}, 'салат крапива': {'калории': 42, 'белки': 2.7, 'жиры': 0.1, 'углеводы': 7.5, 'клетчатка': 6.9, 'описание': 'Жгучая крапива'}, 'салат одуванчик': {'калории': 45, 'белки': 2.7, 'жиры': 0.7, 'углеводы': 9.2, 'клетчатка': 3.5, 'описание': 'Дикий одуванчик'}, 'салат подорожник': {'калории': 26, 'белки': 2.5, 'жиры': 0.4, 'углеводы': 4.8, 'клетчатка': 3.6, 'описание': 'Дикий подорожник'}, 'салат лебеда': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Киноа'}, 'салат теф': {'калории': 101, 'белки': 4, 'жиры': 1, 'углеводы': 20, 'клетчатка': 2.8, 'описание': 'Эфиопская крупа'}, 'салат сорго': {'калории': 329, 'белки': 11, 'жиры': 3.5, 'углеводы': 72, 'клетчатка': 6.7, 'описание': 'Африканская крупа'}, 'салат просо': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа'}, 'салат полба': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Древняя пшеница'}, 'салат камут': {'калории': 337, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 11.1, 'описание': 'Хорасанская пшеница'}, 'салат фарро': {'калории': 340, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Итальянская полба'}, 'салат эммер': {'калории': 339, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Двузернянка'}, 'салат спельта': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Полбяная пшеница'}}}, 'набор_массы': {'сложные_углеводы': {'рис белый': {'калории': 344, 'белки': 6.7, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Быстрые углеводы для массы'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Более полезный рис'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Белок + углеводы'}, 'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Идеальна для набора массы'}, 'макароны': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Быстро готовятся'}, 'картофель': {'калории': 77, 'белки': 2, 'жиры': 0.1, 'углеводы': 17, 'клетчатка': 2.2, 'описание': 'Крахмалистые углеводы'}, 'батат': {'калории': 86, 'белки': 1.6, 'жиры': 0.1, 'углеводы': 20, 'клетчатка': 3, 'описание': 'Сладкий картофель'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Быстрая энергия'}, 'банан': {'калории': 89, 'белки': 1.1, 'жиры': 0.3, 'углеводы': 23, 'клетчатка': 2.6, 'описание': 'После тренировки'}, 'виноград': {'калории': 62, 'белки': 0.6, 'жиры': 0.2, 'углеводы': 16, 'клетчатка': 0.9, 'описание': 'Сладкие углеводы'}, 'сухофрукты': {'калории': 240, 'белки': 3.4, 'жиры': 0.4, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Концентрированные углеводы'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Основной источник белка'}, 'говядина постная': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Креатин и железо'}, 'свинина постная': {'калории': 242, 'белки': 27, 'жиры': 14, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирное мясо для массы'}, 'яйца куриные': {'калории': 157, 'белки': 12.7, 'жиры': 11.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Полноценный белок'}, 'лосось': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и белок'}, 'тунец': {'калории': 144, 'белки': 30, 'жиры': 1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Чистый белок'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Казеин на ночь'}, 'протеин сывороточный': {'калории': 375, 'белки': 80, 'жиры': 4, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Быстрый белок'}}, 'ненасыщенные_жиры': {'орехи грецкие': {'калории': 654, 'белки': 15, 'жиры': 65, 'углеводы': 14, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'кешью': {'калории': 553, 'белки': 18, 'жиры': 44, 'углеводы': 30, 'клетчатка': 3.3, 'описание': 'Магний'}, 'арахис': {'калории': 567, 'белки': 26, 'жиры': 49, 'углеводы': 16, 'клетчатка': 8.5, 'описание': 'Дешевый источник жиров'}, 'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Мононенасыщенные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Здоровые жиры'}}, 'насыщенные_жиры': {'сливочное масло': {'калории': 717, 'белки': 0.9, 'жиры': 81, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Животные жиры'}, 'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и жиры'}, 'сметана 20%': {'калории': 206, 'белки': 2.5, 'жиры': 20, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Жирная сметана'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамины и клетчатка'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}, 'яблоко': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Пектин'}, 'груша': {'калории': 57, 'белки': 0.4, 'жиры': 0.1, 'углеводы': 15, 'клетчатка': 3.1, 'описание': 'Сладкая клетчатка'}}}, 'поддержание': {'сложные_углеводы': {'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Сбалансированный завтрак'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Классический гарнир'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Полезный рис'}, 'киноа': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Суперфуд'}, 'чечевица': {'калории': 116, 'белки': 9, 'жиры': 0.4, 'углеводы': 20, 'клетчатка': 7.9, 'описание': 'Белок + клетчатка'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Натуральный сахар'}, 'фрукты': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Витамины и фруктоза'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постное мясо'}, 'индейка грудка': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Сбалансированный творог'}, 'рыба белая': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная рыба'}}, 'ненасыщенные_жиры': {'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Средиземноморская диета'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'семена льна': {'калории': 534, 'белки': 18, 'жиры': 42, 'углеводы': 29, 'клетчатка': 27.3, 'описание': 'Омега-3'}}, 'насыщенные_жиры': {'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и белок'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамин С'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}}}}
\ No newline at end of file
+PRODUCTS_DATABASE = {'похудение': {'сложные_углеводы': {'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Медленные углеводы, надолго насыщают'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Богата железом, идеальна для похудения'}, 'киноа': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Полноценный белок, низкая калорийность'}, 'булгур': {'калории': 342, 'белки': 12, 'жиры': 1.3, 'углеводы': 76, 'клетчатка': 8, 'описание': 'Быстро готовится, много клетчатки'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Нешлифованный рис с оболочкой'}, 'рис белый': {'калории': 344, 'белки': 6.7, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Белый рис, быстро готовится'}, 'рис басмати': {'калории': 345, 'белки': 7.1, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Ароматный рис'}, 'рис жасмин': {'калории': 345, 'белки': 7.1, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Душистый рис'}, 'чечевица': {'калории': 116, 'белки': 9, 'жиры': 0.4, 'углеводы': 20, 'клетчатка': 7.9, 'описание': 'Много белка и клетчатки'}, 'нут': {'калории': 164, 'белки': 8.9, 'жиры': 2.6, 'углеводы': 27, 'клетчатка': 7.6, 'описание': 'Нут - отличный источник белка'}, 'фасоль': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Классическая фасоль'}, 'фасоль красная': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Красная фасоль'}, 'фасоль белая': {'калории': 127, 'белки': 9, 'жиры': 0.5, 'углеводы': 23, 'клетчатка': 6.4, 'описание': 'Белая фасоль'}, 'перловка': {'калории': 352, 'белки': 9.9, 'жиры': 1.2, 'углеводы': 78, 'клетчатка': 15.6, 'описание': 'Ячменная крупа, много клетчатки'}, 'пшено': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа, богата магнием'}, 'кукурузная крупа': {'калории': 337, 'белки': 8.1, 'жиры': 1.2, 'углеводы': 75, 'клетчатка': 7.3, 'описание': 'Кукурузная каша, без глютена'}, 'ячневая крупа': {'калории': 324, 'белки': 10, 'жиры': 1.3, 'углеводы': 73, 'клетчатка': 17.3, 'описание': 'Ячменная крупа, рекорд клетчатки'}, 'горох': {'калории': 84, 'белки': 5.4, 'жиры': 0.4, 'углеводы': 14, 'клетчатка': 5.7, 'описание': 'Зеленый горошек, много белка'}, 'маш': {'калории': 347, 'белки': 23.9, 'жиры': 1.2, 'углеводы': 62, 'клетчатка': 16.3, 'описание': 'Бобы мунг, суперфуд'}, 'соя': {'калории': 446, 'белки': 36.5, 'жиры': 20, 'углеводы': 30, 'клетчатка': 9.3, 'описание': 'Соевые бобы, рекорд белка'}, 'картофель': {'калории': 77, 'белки': 2, 'жиры': 0.1, 'углеводы': 17, 'клетчатка': 2.2, 'описание': 'Крахмалистые углеводы'}, 'батат': {'калории': 86, 'белки': 1.6, 'жиры': 0.1, 'углеводы': 20, 'клетчатка': 3, 'описание': 'Сладкий картофель'}, 'макароны': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Быстро готовятся'}, 'макароны из твердых сортов': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Качественные макароны'}, 'спагетти': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Классические спагетти'}, 'паста': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Итальянская паста'}, 'хлеб цельнозерновой': {'калории': 247, 'белки': 13, 'жиры': 4.2, 'углеводы': 41, 'клетчатка': 7, 'описание': 'Полезный хлеб'}, 'хлеб ржаной': {'калории': 259, 'белки': 8.5, 'жиры': 3.3, 'углеводы': 48, 'клетчатка': 5.8, 'описание': 'Ржаной хлеб'}, 'хлеб белый': {'калории': 265, 'белки': 9, 'жиры': 3.2, 'углеводы': 49, 'клетчатка': 2.7, 'описание': 'Белый хлеб'}, 'лаваш': {'калории': 275, 'белки': 9, 'жиры': 1.2, 'углеводы': 56, 'клетчатка': 2.2, 'описание': 'Тонкий хлеб'}, 'тортилья': {'калории': 218, 'белки': 5.4, 'жиры': 2.9, 'углеводы': 45, 'клетчатка': 2.9, 'описание': 'Мексиканская лепешка'}, 'кускус': {'калории': 376, 'белки': 12.8, 'жиры': 0.6, 'углеводы': 77, 'клетчатка': 5, 'описание': 'Быстро готовится'}, 'манка': {'калории': 360, 'белки': 12.7, 'жиры': 1, 'углеводы': 73, 'клетчатка': 3.9, 'описание': 'Манная крупа'}, 'пшеничная крупа': {'калории': 340, 'белки': 11, 'жиры': 1.2, 'углеводы': 72, 'клетчатка': 4.5, 'описание': 'Пшеничная каша'}, 'полба': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Древняя пшеница'}, 'спельта': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Полбяная пшеница'}, 'амарант': {'калории': 103, 'белки': 4, 'жиры': 1.6, 'углеводы': 19, 'клетчатка': 2.1, 'описание': 'Щирица'}, 'теф': {'калории': 101, 'белки': 4, 'жиры': 1, 'углеводы': 20, 'клетчатка': 2.8, 'описание': 'Эфиопская крупа'}, 'сорго': {'калории': 329, 'белки': 11, 'жиры': 3.5, 'углеводы': 72, 'клетчатка': 6.7, 'описание': 'Африканская крупа'}, 'просо': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа'}, 'камут': {'калории': 337, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 11.1, 'описание': 'Хорасанская пшеница'}, 'фарро': {'калории': 340, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Итальянская полба'}, 'эммер': {'калории': 339, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Двузернянка'}, 'каша овсяная быстрого приготовления': {'калории': 68, 'белки': 2.4, 'жиры': 1.4, 'углеводы': 12, 'клетчатка': 1.7, 'описание': 'Быстрая овсянка'}, 'каша гречневая быстрого приготовления': {'калории': 92, 'белки': 3.5, 'жиры': 0.9, 'углеводы': 19, 'клетчатка': 2.6, 'описание': 'Быстрая гречка'}, 'батон': {'калории': 235, 'белки': 7.5, 'жиры': 1.3, 'углеводы': 49, 'клетчатка': 2.5, 'описание': 'Белый батон'}, 'булочка сдобная': {'калории': 280, 'белки': 8, 'жиры': 4, 'углеводы': 55, 'клетчатка': 2, 'описание': 'Сдобная булочка'}, 'круассан': {'калории': 406, 'белки': 8.2, 'жиры': 21, 'углеводы': 45, 'клетчатка': 2.5, 'описание': 'Французский круассан'}, 'хлебцы': {'калории': 280, 'белки': 10, 'жиры': 2, 'углеводы': 55, 'клетчатка': 8, 'описание': 'Диетические хлебцы'}, 'крекеры': {'калории': 380, 'белки': 8, 'жиры': 12, 'углеводы': 62, 'клетчатка': 2, 'описание': 'Крекеры'}, 'печенье': {'калории': 450, 'белки': 6, 'жиры': 18, 'углеводы': 68, 'клетчатка': 1.5, 'описание': 'Сладкое печенье'}, 'лапша быстрого приготовления': {'калории': 380, 'белки': 8, 'жиры': 14, 'углеводы': 58, 'клетчатка': 2, 'описание': 'Доширак/Роллтон'}, 'пельмени': {'калории': 233, 'белки': 8.5, 'жиры': 3.2, 'углеводы': 42, 'клетчатка': 1.5, 'описание': 'Русские пельмени'}, 'вареники': {'калории': 215, 'белки': 7.8, 'жиры': 2.8, 'углеводы': 40, 'клетчатка': 1.8, 'описание': 'Украинские вареники'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Натуральный подсластитель'}, 'банан': {'калории': 89, 'белки': 1.1, 'жиры': 0.3, 'углеводы': 23, 'клетчатка': 2.6, 'описание': 'Быстрая энергия, много калия'}, 'яблоко': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Низкокалорийный фрукт'}, 'груша': {'калории': 57, 'белки': 0.4, 'жиры': 0.1, 'углеводы': 15, 'клетчатка': 3.1, 'описание': 'Сладкая и сочная'}, 'апельсин': {'калории': 47, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 12, 'клетчатка': 2.4, 'описание': 'Много витамина С'}, 'виноград': {'калории': 62, 'белки': 0.6, 'жиры': 0.2, 'углеводы': 16, 'клетчатка': 0.9, 'описание': 'Сладкий и освежающий'}, 'сухофрукты': {'калории': 240, 'белки': 3.4, 'жиры': 0.4, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Концентрированные фрукты'}, 'манго': {'калории': 60, 'белки': 0.8, 'жиры': 0.4, 'углеводы': 15, 'клетчатка': 1.6, 'описание': 'Тропический фрукт, витамин А'}, 'ананас': {'калории': 50, 'белки': 0.5, 'жиры': 0.1, 'углеводы': 13, 'клетчатка': 1.4, 'описание': 'Бромелайн для пищеварения'}, 'персик': {'калории': 39, 'белки': 0.9, 'жиры': 0.3, 'углеводы': 10, 'клетчатка': 1.5, 'описание': 'Сладкий и ароматный'}, 'абрикос': {'калории': 48, 'белки': 1.4, 'жиры': 0.4, 'углеводы': 11, 'клетчатка': 2, 'описание': 'Бета-каротин'}, 'слива': {'калории': 46, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 11, 'клетчатка': 1.4, 'описание': 'Антиоксиданты'}, 'клубника': {'калории': 32, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 8, 'клетчатка': 2, 'описание': 'Витамин С'}, 'малина': {'калории': 52, 'белки': 1.2, 'жиры': 0.7, 'углеводы': 12, 'клетчатка': 6.5, 'описание': 'Много клетчатки'}, 'черника': {'калории': 57, 'белки': 0.7, 'жиры': 0.3, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Антоцианы'}, 'изюм': {'калории': 299, 'белки': 3.1, 'жиры': 0.5, 'углеводы': 79, 'клетчатка': 3.7, 'описание': 'Сушеный виноград'}, 'курага': {'калории': 241, 'белки': 3.4, 'жиры': 0.5, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Сушеные абрикосы'}, 'чернослив': {'калории': 240, 'белки': 2.2, 'жиры': 0.4, 'углеводы': 64, 'клетчатка': 7.1, 'описание': 'Сушеные сливы'}, 'финики': {'калории': 282, 'белки': 2.5, 'жиры': 0.4, 'углеводы': 75, 'клетчатка': 8, 'описание': 'Природный энергетик'}, 'инжир': {'калории': 74, 'белки': 0.8, 'жиры': 0.3, 'углеводы': 19, 'клетчатка': 2.9, 'описание': 'Сладкий и питательный'}, 'шоколад молочный': {'калории': 545, 'белки': 7.5, 'жиры': 31, 'углеводы': 61, 'клетчатка': 2.5, 'описание': 'Молочный шоколад'}, 'шоколад темный': {'калории': 546, 'белки': 4.9, 'жиры': 31, 'углеводы': 61, 'клетчатка': 7, 'описание': 'Темный шоколад'}, 'конфеты': {'калории': 380, 'белки': 2, 'жиры': 8, 'углеводы': 75, 'клетчатка': 0, 'описание': 'Сладкие конфеты'}, 'мармелад': {'калории': 266, 'белки': 0.1, 'жиры': 0, 'углеводы': 70, 'клетчатка': 0, 'описание': 'Фруктовый мармелад'}, 'зефир': {'калории': 304, 'белки': 0.8, 'жиры': 0, 'углеводы': 81, 'клетчатка': 0, 'описание': 'Воздушный зефир'}, 'сок апельсиновый': {'калории': 45, 'белки': 0.7, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 0.2, 'описание': 'Апельсиновый сок'}, 'сок яблочный': {'калории': 46, 'белки': 0.1, 'жиры': 0.1, 'углеводы': 11, 'клетчатка': 0.2, 'описание': 'Яблочный сок'}, 'кола': {'калории': 42, 'белки': 0, 'жиры': 0, 'углеводы': 10.6, 'клетчатка': 0, 'описание': 'Кока-кола'}, 'пепси': {'калории': 41, 'белки': 0, 'жиры': 0, 'углеводы': 11, 'клетчатка': 0, 'описание': 'Пепси-кола'}, 'мороженое пломбир': {'калории': 227, 'белки': 3.5, 'жиры': 15, 'углеводы': 20, 'клетчатка': 0, 'описание': 'Классический пломбир'}, 'мороженое эскимо': {'калории': 267, 'белки': 3.8, 'жиры': 18, 'углеводы': 22, 'клетчатка': 0, 'описание': 'Мороженое в шоколаде'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'куриное филе': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Филе курицы'}, 'куриные окорочка': {'калории': 209, 'белки': 26, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Куриные ножки'}, 'куриные крылышки': {'калории': 290, 'белки': 27, 'жиры': 19, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Куриные крылышки'}, 'куриная печень': {'калории': 167, 'белки': 26, 'жиры': 6.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Куриная печень'}, 'куриные сердечки': {'калории': 185, 'белки': 26, 'жиры': 8.3, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Куриные сердечки'}, 'индейка грудка': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постное мясо индейки'}, 'индейка филе': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Филе индейки'}, 'индейка окорочка': {'калории': 189, 'белки': 28, 'жиры': 8.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Ножки индейки'}, 'яичные белки': {'калории': 52, 'белки': 11, 'жиры': 0.2, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Чистый белок без жира'}, 'яйца куриные': {'калории': 157, 'белки': 12.7, 'жиры': 11.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Полноценный белок'}, 'перепелиные яйца': {'калории': 158, 'белки': 13.1, 'жиры': 11.2, 'углеводы': 0.4, 'клетчатка': 0, 'описание': 'Мини-яйца'}, 'утиные яйца': {'калории': 185, 'белки': 13, 'жиры': 14, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Утиные яйца'}, 'гусиные яйца': {'калории': 185, 'белки': 13, 'жиры': 14, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Гусиные яйца'}, 'творог обезжиренный': {'калории': 88, 'белки': 18, 'жиры': 0.6, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Много белка, мало жира'}, 'творог 0%': {'калории': 88, 'белки': 18, 'жиры': 0.6, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Обезжиренный творог'}, 'творог 2%': {'калории': 101, 'белки': 17, 'жиры': 2, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Нежирный творог'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Сбалансированный творог'}, 'творог 9%': {'калории': 159, 'белки': 16, 'жиры': 9, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Жирный творог'}, 'творог 18%': {'калории': 232, 'белки': 14, 'жиры': 18, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Очень жирный творог'}, 'рыба белая': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная рыба'}, 'треска': {'калории': 82, 'белки': 18, 'жиры': 0.7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Треска'}, 'минтай': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Минтай'}, 'хек': {'калории': 86, 'белки': 18, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Хек'}, 'окунь': {'калории': 91, 'белки': 19, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Окунь'}, 'судак': {'калории': 84, 'белки': 18, 'жиры': 1.1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Судак'}, 'щука': {'калории': 88, 'белки': 19, 'жиры': 1.2, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Щука'}, 'карп': {'калории': 127, 'белки': 18, 'жиры': 5.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Карп'}, 'сом': {'калории': 95, 'белки': 18, 'жиры': 2.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Сом'}, 'креветки': {'калории': 99, 'белки': 24, 'жиры': 0.3, 'углеводы': 0.2, 'клетчатка': 0, 'описание': 'Морской белок'}, 'крабы': {'калории': 97, 'белки': 19, 'жиры': 1.5, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Крабовое мясо'}, 'раки': {'калории': 77, 'белки': 16, 'жиры': 1, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Раки'}, 'протеин изолят': {'калории': 350, 'белки': 85, 'жиры': 1, 'углеводы': 5, 'клетчатка': 0, 'описание': 'Концентрированный белок'}, 'говядина постная': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Креатин и железо'}, 'говядина вырезка': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Говяжья вырезка'}, 'говядина язык': {'калории': 224, 'белки': 16, 'жиры': 17, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Говяжий язык'}, 'говяжья печень': {'калории': 135, 'белки': 20, 'жиры': 3.6, 'углеводы': 3.9, 'клетчатка': 0, 'описание': 'Говяжья печень'}, 'говяжье сердце': {'калории': 112, 'белки': 17, 'жиры': 3.9, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Говяжье сердце'}, 'телятина': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Нежное мясо'}, 'баранина': {'калории': 294, 'белки': 25, 'жиры': 21, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирное мясо'}, 'баранина постная': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная баранина'}, 'свинина постная': {'калории': 242, 'белки': 27, 'жиры': 14, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная свинина'}, 'свиная вырезка': {'калории': 143, 'белки': 21, 'жиры': 7, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Свиная вырезка'}, 'свиная печень': {'калории': 134, 'белки': 21, 'жиры': 3.7, 'углеводы': 2.5, 'клетчатка': 0, 'описание': 'Свиная печень'}, 'кролик': {'калории': 173, 'белки': 33, 'жиры': 3.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'утка': {'калории': 337, 'белки': 19, 'жиры': 28, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная птица'}, 'гусь': {'калории': 305, 'белки': 29, 'жиры': 22, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная птица'}, 'перепелка': {'калории': 134, 'белки': 21, 'жиры': 4.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Перепелка'}, 'фазан': {'калории': 133, 'белки': 24, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Фазан'}, 'лосось': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и белок'}, 'тунец': {'калории': 144, 'белки': 30, 'жиры': 1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Чистый белок'}, 'форель': {'калории': 190, 'белки': 20, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Речная рыба'}, 'сельдь': {'калории': 158, 'белки': 18, 'жиры': 9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирная рыба'}, 'сардины': {'калории': 208, 'белки': 24, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированная рыба'}, 'скумбрия': {'калории': 305, 'белки': 19, 'жиры': 25, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Скумбрия'}, 'палтус': {'калории': 111, 'белки': 21, 'жиры': 2.3, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Палтус'}, 'камбала': {'калории': 86, 'белки': 16, 'жиры': 2.4, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Камбала'}, 'мидии': {'калории': 86, 'белки': 12, 'жиры': 2.2, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Морские моллюски'}, 'устрицы': {'калории': 69, 'белки': 9, 'жиры': 2, 'углеводы': 4.2, 'клетчатка': 0, 'описание': 'Морские моллюски'}, 'кальмары': {'калории': 92, 'белки': 18, 'жиры': 1.4, 'углеводы': 3.1, 'клетчатка': 0, 'описание': 'Морские головоногие'}, 'осьминог': {'калории': 82, 'белки': 15, 'жиры': 1, 'углеводы': 2.2, 'клетчатка': 0, 'описание': 'Морские головоногие'}, 'сыр рикотта': {'калории': 174, 'белки': 11, 'жиры': 13, 'углеводы': 3, 'клетчатка': 0, 'описание': 'Итальянский сыр'}, 'сыр фета': {'калории': 264, 'белки': 14, 'жиры': 21, 'углеводы': 4, 'клетчатка': 0, 'описание': 'Греческий сыр'}, 'сыр моцарелла': {'калории': 280, 'белки': 28, 'жиры': 17, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Итальянский сыр'}, 'сыр чеддер': {'калории': 403, 'белки': 25, 'жиры': 33, 'углеводы': 1.3, 'клетчатка': 0, 'описание': 'Английский сыр'}, 'сыр пармезан': {'калории': 431, 'белки': 38, 'жиры': 29, 'углеводы': 4.1, 'клетчатка': 0, 'описание': 'Твердый итальянский сыр'}, 'сыр гауда': {'калории': 356, 'белки': 25, 'жиры': 27, 'углеводы': 2.2, 'клетчатка': 0, 'описание': 'Голландский сыр'}, 'сыр эдам': {'калории': 357, 'белки': 25, 'жиры': 28, 'углеводы': 1.4, 'клетчатка': 0, 'описание': 'Голландский сыр'}, 'сыр бри': {'калории': 334, 'белки': 21, 'жиры': 28, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Французский сыр'}, 'сыр камамбер': {'калории': 300, 'белки': 20, 'жиры': 24, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Французский сыр'}, 'сыр рокфор': {'калории': 369, 'белки': 22, 'жиры': 31, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Голубой сыр'}, 'сыр горгонзола': {'калории': 357, 'белки': 21, 'жиры': 31, 'углеводы': 2.3, 'клетчатка': 0, 'описание': 'Голубой сыр'}, 'сыр сулугуни': {'калории': 286, 'белки': 20, 'жиры': 22, 'углеводы': 0.5, 'клетчатка': 0, 'описание': 'Грузинский сыр'}, 'сыр адыгейский': {'калории': 240, 'белки': 19, 'жиры': 18, 'углеводы': 1.5, 'клетчатка': 0, 'описание': 'Адыгейский сыр'}, 'сыр брынза': {'калории': 262, 'белки': 22, 'жиры': 19, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Брынза'}, 'йогурт греческий': {'калории': 59, 'белки': 10, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 0, 'описание': 'Протеиновый йогурт'}, 'йогурт натуральный': {'калории': 59, 'белки': 10, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 0, 'описание': 'Натуральный йогурт'}, 'йогурт питьевой': {'калории': 72, 'белки': 4.5, 'жиры': 3.2, 'углеводы': 5.2, 'клетчатка': 0, 'описание': 'Питьевой йогурт'}, 'кефир': {'калории': 64, 'белки': 3.4, 'жиры': 3.6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Пробиотический напиток'}, 'кефир 1%': {'калории': 40, 'белки': 3.4, 'жиры': 1, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Нежирный кефир'}, 'кефир 2.5%': {'калории': 53, 'белки': 3.4, 'жиры': 2.5, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Среднежирный кефир'}, 'кефир 3.2%': {'калории': 64, 'белки': 3.4, 'жиры': 3.6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Жирный кефир'}, 'ряженка': {'калории': 67, 'белки': 3.2, 'жиры': 4, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Топленый молочный продукт'}, 'сметана 10%': {'калории': 115, 'белки': 3, 'жиры': 10, 'углеводы': 2.9, 'клетчатка': 0, 'описание': 'Среднежирная сметана'}, 'сметана 15%': {'калории': 160, 'белки': 2.8, 'жиры': 15, 'углеводы': 3.2, 'клетчатка': 0, 'описание': 'Жирная сметана'}, 'сметана 20%': {'калории': 206, 'белки': 2.5, 'жиры': 20, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Жирная сметана'}, 'молоко 1.5%': {'калории': 42, 'белки': 3.3, 'жиры': 1.5, 'углеводы': 4.8, 'клетчатка': 0, 'описание': 'Нежирное молоко'}, 'молоко 2.5%': {'калории': 50, 'белки': 3.3, 'жиры': 2.5, 'углеводы': 4.8, 'клетчатка': 0, 'описание': 'Среднежирное молоко'}, 'молоко 3.2%': {'калории': 60, 'белки': 3.2, 'жиры': 3.2, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Жирное молоко'}, 'молоко 6%': {'калории': 84, 'белки': 3.2, 'жиры': 6, 'углеводы': 4.7, 'клетчатка': 0, 'описание': 'Очень жирное молоко'}, 'протеин сывороточный': {'калории': 375, 'белки': 80, 'жиры': 4, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Быстрый белок'}, 'протеин казеин': {'калории': 360, 'белки': 80, 'жиры': 2, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Медленный белок'}, 'протеин многокомпонентный': {'калории': 370, 'белки': 75, 'жиры': 3, 'углеводы': 10, 'клетчатка': 0, 'описание': 'Комплексный протеин'}, 'соевый протеин': {'калории': 335, 'белки': 80, 'жиры': 1, 'углеводы': 7, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'гороховый протеин': {'калории': 320, 'белки': 80, 'жиры': 2, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'конопляный протеин': {'калории': 330, 'белки': 75, 'жиры': 3, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'рисовый протеин': {'калории': 340, 'белки': 80, 'жиры': 1, 'углеводы': 6, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'овсяный протеин': {'калории': 325, 'белки': 75, 'жиры': 2, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Растительный белок'}, 'куриные наггетсы': {'калории': 290, 'белки': 14, 'жиры': 18, 'углеводы': 20, 'клетчатка': 1, 'описание': 'Готовые куриные наггетсы'}, 'куриные котлеты': {'калории': 220, 'белки': 18, 'жиры': 12, 'углеводы': 8, 'клетчатка': 0.5, 'описание': 'Готовые куриные котлеты'}, 'сосиски куриные': {'калории': 180, 'белки': 12, 'жиры': 14, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Куриные сосиски'}, 'колбаса докторская': {'калории': 257, 'белки': 12, 'жиры': 22, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Докторская колбаса'}, 'ветчина': {'калории': 126, 'белки': 22, 'жиры': 3, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Ветчина'}, 'бекон': {'калории': 541, 'белки': 37, 'жиры': 42, 'углеводы': 1, 'клетчатка': 0, 'описание': 'Бекон'}, 'тунец консервированный': {'калории': 116, 'белки': 26, 'жиры': 0.5, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированный тунец'}, 'лосось консервированный': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированный лосось'}, 'сардины консервированные': {'калории': 208, 'белки': 24, 'жиры': 12, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Консервированные сардины'}, 'йогурт питьевой фруктовый': {'калории': 85, 'белки': 3, 'жиры': 1.5, 'углеводы': 15, 'клетчатка': 0, 'описание': 'Фруктовый питьевой йогурт'}, 'творожная масса': {'калории': 340, 'белки': 11, 'жиры': 23, 'углеводы': 26, 'клетчатка': 0, 'описание': 'Сладкая творожная масса'}, 'сыр плавленый': {'калории': 290, 'белки': 22, 'жиры': 21, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Плавленый сыр'}, 'майонез': {'калории': 680, 'белки': 1, 'жиры': 75, 'углеводы': 2, 'клетчатка': 0, 'описание': 'Майонез'}}, 'ненасыщенные_жиры': {'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Мононенасыщенные жиры'}, 'орехи грецкие': {'калории': 654, 'белки': 15, 'жиры': 65, 'углеводы': 14, 'клетчатка': 6.7, 'описание': 'Омега-3 жиры'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'семена льна': {'калории': 534, 'белки': 18, 'жиры': 42, 'углеводы': 29, 'клетчатка': 27.3, 'описание': 'Омега-3 и клетчатка'}, 'семена чиа': {'калории': 486, 'белки': 17, 'жиры': 31, 'углеводы': 42, 'клетчатка': 34.4, 'описание': 'Суперфуд'}, 'кешью': {'калории': 553, 'белки': 18, 'жиры': 44, 'углеводы': 30, 'клетчатка': 3.3, 'описание': 'Магний'}, 'арахис': {'калории': 567, 'белки': 26, 'жиры': 49, 'углеводы': 16, 'клетчатка': 8.5, 'описание': 'Дешевый источник жиров'}, 'фисташки': {'калории': 560, 'белки': 20, 'жиры': 45, 'углеводы': 28, 'клетчатка': 10.6, 'описание': 'Антиоксиданты'}, 'фундук': {'калории': 628, 'белки': 15, 'жиры': 61, 'углеводы': 17, 'клетчатка': 9.7, 'описание': 'Витамин Е'}, 'пекан': {'калории': 691, 'белки': 9, 'жиры': 72, 'углеводы': 14, 'клетчатка': 9.6, 'описание': 'Мононенасыщенные жиры'}, 'бразильские орехи': {'калории': 656, 'белки': 14, 'жиры': 66, 'углеводы': 12, 'клетчатка': 7.5, 'описание': 'Селен'}, 'макадамия': {'калории': 718, 'белки': 8, 'жиры': 76, 'углеводы': 14, 'клетчатка': 8.6, 'описание': 'Королевские орехи'}, 'семена подсолнечника': {'калории': 584, 'белки': 21, 'жиры': 51, 'углеводы': 20, 'клетчатка': 8.6, 'описание': 'Витамин Е'}, 'семена тыквы': {'калории': 559, 'белки': 19, 'жиры': 49, 'углеводы': 54, 'клетчатка': 18.4, 'описание': 'Цинк'}, 'семена кунжута': {'калории': 573, 'белки': 18, 'жиры': 50, 'углеводы': 23, 'клетчатка': 11.8, 'описание': 'Кальций'}, 'семена конопли': {'калории': 553, 'белки': 31, 'жиры': 49, 'углеводы': 9, 'клетчатка': 4, 'описание': 'Полноценный белок'}, 'рапсовое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и омега-6'}, 'льняное масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3'}, 'масло грецкого ореха': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3'}, 'масло авокадо': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Мононенасыщенные жиры'}, 'масло виноградной косточки': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-6'}, 'масло кунжута': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Сезамол'}, 'оливки': {'калории': 115, 'белки': 0.8, 'жиры': 11, 'углеводы': 6, 'клетчатка': 3.2, 'описание': 'Мононенасыщенные жиры'}, 'маслины': {'калории': 115, 'белки': 0.8, 'жиры': 11, 'углеводы': 6, 'клетчатка': 3.2, 'описание': 'Черные оливки'}}, 'насыщенные_жиры': {'сливочное масло': {'калории': 717, 'белки': 0.9, 'жиры': 81, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Животные жиры'}, 'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и белок'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамин С и клетчатка'}, 'цветная капуста': {'калории': 25, 'белки': 1.9, 'жиры': 0.3, 'углеводы': 5, 'клетчатка': 2.5, 'описание': 'Низкокалорийная'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо и витамины'}, 'капуста': {'калории': 25, 'белки': 1.3, 'жиры': 0.2, 'углеводы': 5.8, 'клетчатка': 2.5, 'описание': 'Витамин К'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}, 'свекла': {'калории': 43, 'белки': 1.6, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Нитраты для сосудов'}, 'кабачки': {'калории': 17, 'белки': 1.2, 'жиры': 0.3, 'углеводы': 3.1, 'клетчатка': 1, 'описание': 'Низкокалорийные'}, 'баклажаны': {'калории': 25, 'белки': 1, 'жиры': 0.2, 'углеводы': 6, 'клетчатка': 3, 'описание': 'Антоцианы'}, 'перец болгарский': {'калории': 31, 'белки': 1, 'жиры': 0.3, 'углеводы': 7, 'клетчатка': 2.1, 'описание': 'Витамин С'}, 'помидоры': {'калории': 18, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 3.9, 'клетчатка': 1.2, 'описание': 'Ликопин'}, 'огурцы': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.6, 'клетчатка': 0.5, 'описание': 'Вода и клетчатка'}, 'лук репчатый': {'калории': 40, 'белки': 1.1, 'жиры': 0.1, 'углеводы': 9, 'клетчатка': 1.7, 'описание': 'Кверцетин'}, 'чеснок': {'калории': 149, 'белки': 6.4, 'жиры': 0.5, 'углеводы': 33, 'клетчатка': 2.1, 'описание': 'Аллицин'}, 'сельдерей': {'калории': 16, 'белки': 0.7, 'жиры': 0.2, 'углеводы': 3, 'клетчатка': 1.6, 'описание': 'Отрицательные калории'}, 'спаржа': {'калории': 20, 'белки': 2.2, 'жиры': 0.1, 'углеводы': 3.9, 'клетчатка': 2.1, 'описание': 'Фолиевая кислота'}, 'артишок': {'калории': 47, 'белки': 3.3, 'жиры': 0.2, 'углеводы': 11, 'клетчатка': 5.4, 'описание': 'Цинарин'}, 'брюссельская капуста': {'калории': 43, 'белки': 3.4, 'жиры': 0.3, 'углеводы': 9, 'клетчатка': 3.8, 'описание': 'Глюкозинолаты'}, 'кольраби': {'калории': 27, 'белки': 1.7, 'жиры': 0.1, 'углеводы': 6, 'клетчатка': 3.6, 'описание': 'Витамин С'}, 'репа': {'калории': 28, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 6, 'клетчатка': 1.8, 'описание': 'Глюкорафанин'}, 'редька': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.4, 'клетчатка': 1.6, 'описание': 'Горчичное масло'}, 'редис': {'калории': 16, 'белки': 0.7, 'жиры': 0.1, 'углеводы': 3.4, 'клетчатка': 1.6, 'описание': 'Острый вкус'}, 'руккола': {'калории': 25, 'белки': 2.6, 'жиры': 0.7, 'углеводы': 3.7, 'клетчатка': 1.6, 'описание': 'Горчичное масло'}, 'салат латук': {'калории': 15, 'белки': 1.4, 'жиры': 0.1, 'углеводы': 2.9, 'клетчатка': 1.3, 'описание': 'Вода и витамины'}, 'салат айсберг': {'калории': 14, 'белки': 0.9, 'жиры': 0.1, 'углеводы': 3, 'клетчатка': 1.2, 'описание': 'Хрустящий салат'}, 'салат ромэн': {'калории': 17, 'белки': 1.2, 'жиры': 0.3, 'углеводы': 3.3, 'клетчатка': 2.1, 'описание': 'Витамин К'}, 'салат фризе': {'калории': 14, 'белки': 1.4, 'жиры': 0.2, 'углеводы': 2.8, 'клетчатка': 2.5, 'описание': 'Горький салат'}, 'салат радиккио': {'калории': 23, 'белки': 1.4, 'жиры': 0.3, 'углеводы': 4.5, 'клетчатка': 0.9, 'описание': 'Красный салат'}, 'салат эндивий': {'калории': 17, 'белки': 1.3, 'жиры': 0.2, 'углеводы': 3.4, 'клетчатка': 3.1, 'описание': 'Горький салат'}, 'салат мангольд': {'калории': 19, 'белки': 1.8, 'жиры': 0.2, 'углеводы': 3.7, 'клетчатка': 1.6, 'описание': 'Листовая свекла'}, 'салат кале': {'калории': 49, 'белки': 4.3, 'жиры': 0.9, 'углеводы': 8.8, 'клетчатка': 3.6, 'описание': 'Кудрявая капуста'}, 'салат бок-чой': {'калории': 13, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Китайская капуста'}, 'салат татсой': {'калории': 12, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Азиатская зелень'}, 'салат мизуна': {'калории': 12, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 2.2, 'клетчатка': 1, 'описание': 'Японская зелень'}, 'салат амарант': {'калории': 103, 'белки': 4, 'жиры': 1.6, 'углеводы': 19, 'клетчатка': 2.1, 'описание': 'Щирица'}, 'салат портулак': {'калории': 16, 'белки': 1.5, 'жиры': 0.2, 'углеводы': 3.4, 'клетчатка': 0.9, 'описание': 'Дандур'}, 'салат крапива': {'калории': 42, 'белки': 2.7, 'жиры': 0.1, 'углеводы': 7.5, 'клетчатка': 6.9, 'описание': 'Жгучая крапива'}, 'салат одуванчик': {'калории': 45, 'белки': 2.7, 'жиры': 0.7, 'углеводы': 9.2, 'клетчатка': 3.5, 'описание': 'Дикий одуванчик'}, 'салат подорожник': {'калории': 26, 'белки': 2.5, 'жиры': 0.4, 'углеводы': 4.8, 'клетчатка': 3.6, 'описание': 'Дикий подорожник'}, 'салат лебеда': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Киноа'}, 'салат теф': {'калории': 101, 'белки': 4, 'жиры': 1, 'углеводы': 20, 'клетчатка': 2.8, 'описание': 'Эфиопская крупа'}, 'салат сорго': {'калории': 329, 'белки': 11, 'жиры': 3.5, 'углеводы': 72, 'клетчатка': 6.7, 'описание': 'Африканская крупа'}, 'салат просо': {'калории': 378, 'белки': 11, 'жиры': 4.2, 'углеводы': 73, 'клетчатка': 8.5, 'описание': 'Пшенная крупа'}, 'салат полба': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Древняя пшеница'}, 'салат камут': {'калории': 337, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 11.1, 'описание': 'Хорасанская пшеница'}, 'салат фарро': {'калории': 340, 'белки': 15, 'жиры': 2.2, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Итальянская полба'}, 'салат эммер': {'калории': 339, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.8, 'описание': 'Двузернянка'}, 'салат спельта': {'калории': 338, 'белки': 15, 'жиры': 2.4, 'углеводы': 70, 'клетчатка': 10.7, 'описание': 'Полбяная пшеница'}}}, 'набор_массы': {'сложные_углеводы': {'рис белый': {'калории': 344, 'белки': 6.7, 'жиры': 0.7, 'углеводы': 78, 'клетчатка': 2.8, 'описание': 'Быстрые углеводы для массы'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Более полезный рис'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Белок + углеводы'}, 'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Идеальна для набора массы'}, 'макароны': {'калории': 371, 'белки': 13, 'жиры': 1.5, 'углеводы': 75, 'клетчатка': 3.2, 'описание': 'Быстро готовятся'}, 'картофель': {'калории': 77, 'белки': 2, 'жиры': 0.1, 'углеводы': 17, 'клетчатка': 2.2, 'описание': 'Крахмалистые углеводы'}, 'батат': {'калории': 86, 'белки': 1.6, 'жиры': 0.1, 'углеводы': 20, 'клетчатка': 3, 'описание': 'Сладкий картофель'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Быстрая энергия'}, 'банан': {'калории': 89, 'белки': 1.1, 'жиры': 0.3, 'углеводы': 23, 'клетчатка': 2.6, 'описание': 'После тренировки'}, 'виноград': {'калории': 62, 'белки': 0.6, 'жиры': 0.2, 'углеводы': 16, 'клетчатка': 0.9, 'описание': 'Сладкие углеводы'}, 'сухофрукты': {'калории': 240, 'белки': 3.4, 'жиры': 0.4, 'углеводы': 63, 'клетчатка': 7.3, 'описание': 'Концентрированные углеводы'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Основной источник белка'}, 'говядина постная': {'калории': 250, 'белки': 26, 'жиры': 15, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Креатин и железо'}, 'свинина постная': {'калории': 242, 'белки': 27, 'жиры': 14, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Жирное мясо для массы'}, 'яйца куриные': {'калории': 157, 'белки': 12.7, 'жиры': 11.5, 'углеводы': 0.7, 'клетчатка': 0, 'описание': 'Полноценный белок'}, 'лосось': {'калории': 208, 'белки': 20, 'жиры': 13, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Омега-3 и белок'}, 'тунец': {'калории': 144, 'белки': 30, 'жиры': 1, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Чистый белок'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Казеин на ночь'}, 'протеин сывороточный': {'калории': 375, 'белки': 80, 'жиры': 4, 'углеводы': 8, 'клетчатка': 0, 'описание': 'Быстрый белок'}}, 'ненасыщенные_жиры': {'орехи грецкие': {'калории': 654, 'белки': 15, 'жиры': 65, 'углеводы': 14, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'кешью': {'калории': 553, 'белки': 18, 'жиры': 44, 'углеводы': 30, 'клетчатка': 3.3, 'описание': 'Магний'}, 'арахис': {'калории': 567, 'белки': 26, 'жиры': 49, 'углеводы': 16, 'клетчатка': 8.5, 'описание': 'Дешевый источник жиров'}, 'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Мононенасыщенные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Здоровые жиры'}}, 'насыщенные_жиры': {'сливочное масло': {'калории': 717, 'белки': 0.9, 'жиры': 81, 'углеводы': 0.1, 'клетчатка': 0, 'описание': 'Животные жиры'}, 'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и жиры'}, 'сметана 20%': {'калории': 206, 'белки': 2.5, 'жиры': 20, 'углеводы': 3.4, 'клетчатка': 0, 'описание': 'Жирная сметана'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамины и клетчатка'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}, 'яблоко': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Пектин'}, 'груша': {'калории': 57, 'белки': 0.4, 'жиры': 0.1, 'углеводы': 15, 'клетчатка': 3.1, 'описание': 'Сладкая клетчатка'}}}, 'поддержание': {'сложные_углеводы': {'овсянка': {'калории': 389, 'белки': 16.9, 'жиры': 6.9, 'углеводы': 66, 'клетчатка': 10.6, 'описание': 'Сбалансированный завтрак'}, 'гречка': {'калории': 343, 'белки': 13, 'жиры': 3.4, 'углеводы': 72, 'клетчатка': 10, 'описание': 'Классический гарнир'}, 'рис бурый': {'калории': 337, 'белки': 7.4, 'жиры': 2.2, 'углеводы': 73, 'клетчатка': 3.5, 'описание': 'Полезный рис'}, 'киноа': {'калории': 120, 'белки': 4.4, 'жиры': 1.9, 'углеводы': 22, 'клетчатка': 2.8, 'описание': 'Суперфуд'}, 'чечевица': {'калории': 116, 'белки': 9, 'жиры': 0.4, 'углеводы': 20, 'клетчатка': 7.9, 'описание': 'Белок + клетчатка'}}, 'простые_углеводы': {'мед': {'калории': 304, 'белки': 0.3, 'жиры': 0, 'углеводы': 82, 'клетчатка': 0, 'описание': 'Натуральный сахар'}, 'фрукты': {'калории': 52, 'белки': 0.3, 'жиры': 0.2, 'углеводы': 14, 'клетчатка': 2.4, 'описание': 'Витамины и фруктоза'}}, 'белки': {'куриная грудка': {'калории': 165, 'белки': 31, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постное мясо'}, 'индейка грудка': {'калории': 157, 'белки': 29, 'жиры': 3.6, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Диетическое мясо'}, 'творог 5%': {'калории': 121, 'белки': 17, 'жиры': 5, 'углеводы': 1.8, 'клетчатка': 0, 'описание': 'Сбалансированный творог'}, 'рыба белая': {'калории': 72, 'белки': 16, 'жиры': 0.9, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Постная рыба'}}, 'ненасыщенные_жиры': {'авокадо': {'калории': 160, 'белки': 2, 'жиры': 15, 'углеводы': 9, 'клетчатка': 6.7, 'описание': 'Полезные жиры'}, 'оливковое масло': {'калории': 884, 'белки': 0, 'жиры': 100, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Средиземноморская диета'}, 'миндаль': {'калории': 579, 'белки': 21, 'жиры': 50, 'углеводы': 22, 'клетчатка': 12.5, 'описание': 'Витамин Е'}, 'семена льна': {'калории': 534, 'белки': 18, 'жиры': 42, 'углеводы': 29, 'клетчатка': 27.3, 'описание': 'Омега-3'}}, 'насыщенные_жиры': {'сыр твердый': {'калории': 350, 'белки': 25, 'жиры': 27, 'углеводы': 0, 'клетчатка': 0, 'описание': 'Кальций и белок'}}, 'клетчатка': {'брокколи': {'калории': 34, 'белки': 2.8, 'жиры': 0.4, 'углеводы': 7, 'клетчатка': 2.6, 'описание': 'Витамин С'}, 'шпинат': {'калории': 23, 'белки': 2.9, 'жиры': 0.4, 'углеводы': 3.6, 'клетчатка': 2.2, 'описание': 'Железо'}, 'морковь': {'калории': 41, 'белки': 0.9, 'жиры': 0.2, 'углеводы': 10, 'клетчатка': 2.8, 'описание': 'Бета-каротин'}}}}
+from products_index import ProductIndex
+from products_table import ProductTable
+
+# Поисковый индекс строится один раз при импорте
+PRODUCTS_INDEX = ProductIndex(PRODUCTS_DATABASE)
+PRODUCTS_TABLE = ProductTable(PRODUCTS_DATABASE)
+
+# Описания категорий
+CATEGORY_DESCRIPTIONS = {
+    "сложные_углеводы": "🌾 Медленные углеводы дают энергию надолго и поддерживают стабильный уровень сахара в крови",
+    "простые_углеводы": "⚡ Быстрые углеводы - быстрая энергия, лучше всего до и после тренировки",
+    "белки": "🥩 Белки - строительный материал для мышц, основа восстановления",
+    "ненасыщенные_жиры": "🫒 Полезные жиры для гормонов, сердца и сосудов",
+    "насыщенные_жиры": "🧈 Насыщенные жиры - употребляйте умеренно",
+    "клетчатка": "🌿 Клетчатка улучшает пищеварение и надолго насыщает"
+}
+
+def search_product(product_name):
+    """Поиск продукта по названию (по индексу, с группировкой по цели и категории)"""
+    return PRODUCTS_INDEX.search(product_name)
+
+def search_product_fuzzy(product_name, limit=10):
+    """Поиск с учетом опечаток и словоформ, результаты в порядке релевантности"""
+    return PRODUCTS_INDEX.fuzzy_search(product_name, limit)
+
+def get_products_by_goal(goal):
+    """Все продукты для цели"""
+    return PRODUCTS_DATABASE.get(goal, {})
+
+def get_products_by_category(goal, category):
+    """Продукты категории; 'углеводы' и 'жиры' объединяют подкатегории"""
+    categories = PRODUCTS_DATABASE.get(goal, {})
+    if category in categories:
+        return categories[category]
+
+    products = {}
+    for name, items in categories.items():
+        if name.endswith('_' + category):
+            products.update(items)
+    return products
+
+def get_recommended_products(goal, category, limit=3):
+    """Первые продукты категории для цели: список (название, данные)"""
+    return PRODUCTS_TABLE.items(PRODUCTS_TABLE.filter(goal, category)[:limit])
+
+def filter_products(goal=None, category=None, conditions=(), sort_by=None, descending=False, limit=None):
+    """Отбор продуктов по КБЖУ: список (название, данные)
+
+    Пример: filter_products('похудение', conditions=[('белки', '>', 20), ('калории', '<', 150)],
+                            sort_by='белки', descending=True, limit=5)
+    """
+    rows = PRODUCTS_TABLE.filter(goal, category, conditions)
+    if sort_by is not None:
+        if limit is not None:
+            rows = PRODUCTS_TABLE.top(sort_by, limit, rows, descending)
+        else:
+            rows = PRODUCTS_TABLE.sort(rows, sort_by, descending)
+    elif limit is not None:
+        rows = rows[:limit]
+    return PRODUCTS_TABLE.items(rows)
+
+def get_category_description(category):
+    """Описание категории продуктов"""
+    return CATEGORY_DESCRIPTIONS.get(category, category.replace('_', ' ').title())
+
+def format_product_info(name, data):
+    """Форматирование информации о продукте"""
+    text = f"🍎 **{name.title()}**\n\n"
+    text += "📊 **Пищевая ценность на 100г:**\n"
+    text += f"🔥 Калории: {data['калории']} ккал\n"
+    text += f"🥩 Белки: {data['белки']} г\n"
+    text += f"🧈 Жиры: {data['жиры']} г\n"
+    text += f"🍞 Углеводы: {data['углеводы']} г\n"
+    if 'клетчатка' in data:
+        text += f"🌾 Клетчатка: {data['клетчатка']} г\n"
+    if 'описание' in data:
+        text += f"\n💡 {data['описание']}\n"
+    return text
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Поисковый индекс базы продуктов FitAdventure Bot
+Инвертированный индекс n-грамм по нормализованным названиям
+и нечеткий ранжированный поиск с исправлением опечаток
+"""
+
+import re
+import heapq
+from bisect import bisect_left
+from typing import Dict, Any, List, Tuple, Set
+
+# Максимальная длина n-граммы в индексе (1- и 2-граммы нужны для коротких запросов)
+MAX_GRAM = 3
+
+# Латинские буквы, похожие на кириллические
+LATIN_LOOKALIKES = str.maketrans({
+    'a': 'а', 'b': 'в', 'c': 'с', 'e': 'е', 'h': 'н', 'k': 'к', 'm': 'м',
+    'o': 'о', 'p': 'р', 't': 'т', 'x': 'х', 'y': 'у'
+})
+
+# Окончания для облегченного стемминга (сначала длинные)
+RUSSIAN_ENDINGS = (
+    'иями', 'ями', 'ами', 'ого', 'его', 'ому', 'ему', 'ыми', 'ими',
+    'ая', 'яя', 'ое', 'ее', 'ые', 'ие', 'ый', 'ий', 'ой', 'ей', 'ом', 'ем',
+    'ах', 'ях', 'ов', 'ев', 'ую', 'юю',
+    'а', 'я', 'ы', 'и', 'у', 'ю', 'е', 'о', 'ь'
+)
+MIN_STEM = 3
+
+# Веса совпадений токенов в нечетком поиске
+EXACT_WEIGHT = 1.0
+PREFIX_WEIGHT = 0.85
+EDIT_WEIGHTS = {1: 0.7, 2: 0.5}
+MIN_FUZZY_SCORE = 0.35
+MAX_PREFIX_EXPANSION = 200
+
+_TOKEN_RE = re.compile(r'[0-9a-zа-я]+')
+_DOUBLE_RE = re.compile(r'(.)\1+')
+
+def normalize_name(text: str) -> str:
+    """Нормализация названия продукта для поиска"""
+    return ' '.join(text.lower().replace('ё', 'е').split())
+
+def fold_text(text: str) -> str:
+    """Свертка для нечеткого поиска: регистр, ё/е, латинские двойники"""
+    return normalize_name(text).translate(LATIN_LOOKALIKES)
+
+def stem_token(token: str) -> str:
+    """Облегченный стемминг: схлопывание удвоенных букв и отбрасывание окончания"""
+    if token.isdigit():
+        return token
+    token = _DOUBLE_RE.sub(r'\1', token)
+    for ending in RUSSIAN_ENDINGS:
+        if token.endswith(ending) and len(token) - len(ending) >= MIN_STEM:
+            return token[:-len(ending)]
+    return token
+
+def tokenize(text: str) -> List[str]:
+    """Токены нечеткого поиска"""
+    return [stem_token(token) for token in _TOKEN_RE.findall(fold_text(text))]
+
+def max_edits(token: str) -> int:
+    """Допустимое число опечаток в зависимости от длины токена"""
+    if token.isdigit() or len(token) <= 3:
+        return 0
+    return 1 if len(token) <= 6 else 2
+
+def iter_deletes(token: str, distance: int) -> Set[str]:
+    """Все варианты токена с удалением до distance символов (SymSpell)"""
+    deletes = {token}
+    frontier = {token}
+    for _ in range(distance):
+        next_frontier = set()
+        for word in frontier:
+            for i in range(len(word)):
+                next_frontier.add(word[:i] + word[i + 1:])
+        deletes |= next_frontier
+        frontier = next_frontier
+    return deletes
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """Расстояние Дамерау-Левенштейна (OSA) с ранним выходом; limit + 1, если больше"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1 and
+                    a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def iter_grams(text: str, max_gram: int = MAX_GRAM):
+    """Все n-граммы строки длиной от 1 до max_gram"""
+    length = len(text)
+    for n in range(1, max_gram + 1):
+        for i in range(length - n + 1):
+            yield text[i:i + n]
+
+class ProductIndex:
+    """Индекс для поиска продуктов по подстроке и префиксу
+
+    Одинаковые названия из разных целей и категорий хранятся один раз;
+    списки вхождений возвращают все их местоположения в исходной базе.
+    """
+
+    def __init__(self, database: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]):
+        self.database = database
+        # Местоположения в порядке обхода базы: (цель, категория, название, данные)
+        self.locations: List[Tuple[str, str, str, Dict[str, Any]]] = []
+        # Уникальные нормализованные названия и их местоположения
+        self.names: List[str] = []
+        self.name_locations: List[List[int]] = []
+        self.postings: Dict[str, Set[int]] = {}
+        self._sorted_names: List[Tuple[str, int]] = []
+        # Структуры нечеткого поиска: словарь токенов, их вхождения и удаления
+        self.name_folded: List[str] = []
+        self.name_token_counts: List[int] = []
+        self.tokens: List[str] = []
+        self.token_postings: List[List[int]] = []
+        self.deletes: Dict[str, List[int]] = {}
+        self._sorted_tokens: List[Tuple[str, int]] = []
+        self._build()
+
+    def _build(self) -> None:
+        """Построение индекса (один раз при импорте)"""
+        name_ids: Dict[str, int] = {}
+        self._token_ids: Dict[str, int] = {}
+
+        for goal, categories in self.database.items():
+            for category, products in categories.items():
+                for name, data in products.items():
+                    location_id = len(self.locations)
+                    self.locations.append((goal, category, name, data))
+
+                    normalized = normalize_name(name)
+                    name_id = name_ids.get(normalized)
+                    if name_id is None:
+                        name_id = len(self.names)
+                        name_ids[normalized] = name_id
+                        self.names.append(normalized)
+                        self.name_locations.append([])
+                        for gram in set(iter_grams(normalized)):
+                            self.postings.setdefault(gram, set()).add(name_id)
+                        self._index_tokens(name_id, normalized)
+                    self.name_locations[name_id].append(location_id)
+
+        self._sorted_names = sorted((name, name_id) for name_id, name in enumerate(self.names))
+        self._sorted_tokens = sorted((token, token_id) for token_id, token in enumerate(self.tokens))
+
+    def _index_tokens(self, name_id: int, normalized: str) -> None:
+        """Токены названия для нечеткого поиска"""
+        self.name_folded.append(fold_text(normalized))
+        name_tokens = set(tokenize(normalized))
+        self.name_token_counts.append(len(name_tokens))
+
+        for token in name_tokens:
+            token_id = self._token_ids.get(token)
+            if token_id is None:
+                token_id = len(self.tokens)
+                self._token_ids[token] = token_id
+                self.tokens.append(token)
+                self.token_postings.append([])
+                for variant in iter_deletes(token, max_edits(token)):
+                    self.deletes.setdefault(variant, []).append(token_id)
+            self.token_postings[token_id].append(name_id)
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    # === ПОИСК ===
+    def find_substring(self, query: str) -> List[int]:
+        """Идентификаторы названий, содержащих подстроку"""
+        query = normalize_name(query)
+        if not query:
+            return []
+
+        if len(query) <= MAX_GRAM:
+            return sorted(self.postings.get(query, ()))
+
+        grams = {query[i:i + MAX_GRAM] for i in range(len(query) - MAX_GRAM + 1)}
+        posting_lists = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return []
+            posting_lists.append(posting)
+
+        # Пересечение от самого короткого списка; затем проверка подстроки
+        posting_lists.sort(key=len)
+        candidates = posting_lists[0].intersection(*posting_lists[1:])
+        return sorted(name_id for name_id in candidates if query in self.names[name_id])
+
+    def find_prefix(self, prefix: str) -> List[int]:
+        """Идентификаторы названий, начинающихся с префикса"""
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return []
+
+        result = []
+        position = bisect_left(self._sorted_names, (prefix, -1))
+        while position < len(self._sorted_names):
+            name, name_id = self._sorted_names[position]
+            if not name.startswith(prefix):
+                break
+            result.append(name_id)
+            position += 1
+        return sorted(result)
+
+    def group(self, name_ids: List[int]) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Группировка найденных названий по цели и категории (в порядке базы)"""
+        location_ids = sorted(
+            location_id for name_id in name_ids for location_id in self.name_locations[name_id]
+        )
+
+        results: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        for location_id in location_ids:
+            goal, category, name, data = self.locations[location_id]
+            results.setdefault(goal, {}).setdefault(category, {})[name] = data
+        return results
+
+    def search(self, query: str) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Поиск по подстроке, результат сгруппирован по цели и категории"""
+        return self.group(self.find_substring(query))
+
+    def search_prefix(self, prefix: str) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Поиск по префиксу, результат сгруппирован по цели и категории"""
+        return self.group(self.find_prefix(prefix))
+
+    # === НЕЧЕТКИЙ ПОИСК ===
+    def _match_token(self, token: str) -> Dict[int, float]:
+        """Токены словаря, похожие на токен запроса: token_id -> вес"""
+        matches: Dict[int, float] = {}
+
+        # Опечатки: пересечение словарей удалений и проверка расстояния
+        limit = max_edits(token)
+        for variant in iter_deletes(token, limit):
+            for token_id in self.deletes.get(variant, ()):
+                if token_id in matches:
+                    continue
+                candidate = self.tokens[token_id]
+                distance = 0 if candidate == token else bounded_edit_distance(token, candidate, limit)
+                if distance == 0:
+                    matches[token_id] = EXACT_WEIGHT
+                elif distance <= limit:
+                    matches[token_id] = EDIT_WEIGHTS[distance]
+
+        # Незаконченное слово: совпадение по началу токена
+        if len(token) >= 2 and not token.isdigit():
+            position = bisect_left(self._sorted_tokens, (token, -1))
+            end = min(position + MAX_PREFIX_EXPANSION, len(self._sorted_tokens))
+            while position < end:
+                candidate, token_id = self._sorted_tokens[position]
+                if not candidate.startswith(token):
+                    break
+                if matches.get(token_id, 0.0) < PREFIX_WEIGHT:
+                    matches[token_id] = PREFIX_WEIGHT
+                position += 1
+
+        return matches
+
+    def rank(self, query: str, limit: int = 10) -> List[Tuple[float, int]]:
+        """Ранжированный нечеткий поиск: список (оценка, id названия), лучшие первыми"""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        token_count = len(query_tokens)
+        totals: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for token in query_tokens:
+            # Лучший вес каждого названия для этого слова запроса: обновление
+            # словаря по возрастанию веса оставляет максимальный
+            best: Dict[int, float] = {}
+            for token_id, weight in sorted(self._match_token(token).items(), key=lambda item: item[1]):
+                best.update(dict.fromkeys(self.token_postings[token_id], weight))
+            for name_id, weight in best.items():
+                totals[name_id] = totals.get(name_id, 0.0) + weight
+                matched[name_id] = matched.get(name_id, 0) + 1
+
+        folded_query = fold_text(query)
+        name_token_counts = self.name_token_counts
+        name_folded = self.name_folded
+        ranked = []
+        for name_id, total in totals.items():
+            # Доля совпавших слов запроса и покрытие слов названия
+            name_tokens = name_token_counts[name_id]
+            score = total / token_count * (0.8 + 0.2 * min(matched[name_id], name_tokens) / name_tokens)
+            if folded_query in name_folded[name_id]:
+                score += 0.1
+            if score >= MIN_FUZZY_SCORE:
+                ranked.append((score, -name_id))
+
+        return [(round(score, 4), -name_id) for score, name_id in heapq.nlargest(limit, ranked)]
+
+    def fuzzy_search(self, query: str, limit: int = 10) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Нечеткий поиск, сгруппированный по цели и категории в порядке релевантности"""
+        results: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        for _, name_id in self.rank(query, limit):
+            for location_id in self.name_locations[name_id]:
+                goal, category, name, data = self.locations[location_id]
+                results.setdefault(goal, {}).setdefault(category, {})[name] = data
+        return results
+
+    def ranked_results(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Нечеткий поиск в виде плоского списка для API"""
+        results = []
+        for score, name_id in self.rank(query, limit):
+            locations = [self.locations[location_id] for location_id in self.name_locations[name_id]]
+            name, data = locations[0][2], locations[0][3]
+            results.append({
+                'name': name,
+                'score': score,
+                'data': data,
+                'goals': [{'goal': goal, 'category': category} for goal, category, _, _ in locations]
+            })
+        return results
+
+def scan_search(database: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]], query: str):
+    """Эталонный линейный поиск (для сравнения в бенчмарке и тестах)"""
+    results = {}
+    query_lower = query.lower()
+
+    for goal, categories in database.items():
+        for category, products in categories.items():
+            matches = {}
+            for name, data in products.items():
+                if query_lower in name.lower():
+                    matches[name] = data
+            if matches:
+                results.setdefault(goal, {})[category] = matches
+
+    return results
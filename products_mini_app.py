@@ -5,36 +5,34 @@
 Современный дизайн с детальной информацией о продуктах
 """
 
-import json
 import datetime
-from pathlib import Path
+import functools
 from telegram import Update, ReplyKeyboardMarkup, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.constants import ParseMode
 
 # Импортируем улучшенную базу данных
-from products_database import PRODUCTS_DATABASE, get_products_by_goal, get_products_by_category, search_product, format_product_info, get_category_description
+from products_database import PRODUCTS_DATABASE, get_products_by_goal, get_products_by_category, search_product, search_product_fuzzy, get_category_description
 
-# Файл для хранения данных пользователей
-USER_DATA_FILE = "user_products_data.json"
+from config import StorageConfig, Keyboards
+from storage import get_storage
+from button_router import ButtonRouter
+from rendering import keyboard_markup, product_card
 
-def load_user_data():
-    """Загрузка данных пользователей"""
-    try:
-        with open(USER_DATA_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+# Пространство имен базы продуктов в хранилище
+STORAGE_NAMESPACE = StorageConfig.PRODUCTS_NAMESPACE
 
-def save_user_data(data):
-    """Сохранение данных пользователей"""
-    with open(USER_DATA_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+def load_user_data(chat_id):
+    """Загрузка данных пользователя"""
+    return get_storage().get_user(STORAGE_NAMESPACE, chat_id)
+
+def save_user_data(chat_id, data):
+    """Сохранение данных пользователя"""
+    get_storage().set_user(STORAGE_NAMESPACE, chat_id, data)
 
 def get_user_goal(chat_id):
     """Получить цель пользователя"""
-    user_data = load_user_data()
-    return user_data.get(str(chat_id), {}).get('goal', 'поддержание')
+    return load_user_data(chat_id).get('goal', 'поддержание')
 
 # === ГЛАВНОЕ МЕНЮ МИНИ-ПРИЛОЖЕНИЯ ===
 async def show_products_mini_app(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -51,15 +49,7 @@ async def show_products_mini_app(update: Update, context: ContextTypes.DEFAULT_T
 Выберите категорию продуктов для просмотра:"""
     
     # Создаем обычные кнопки для категорий
-    keyboard = [
-        ['🌾 Сложные углеводы', '⚡ Простые углеводы'],
-        ['🥩 Белки', '🫒 Ненасыщенные жиры'],
-        ['🧈 Насыщенные жиры', '🌿 Клетчатка'],
-        ['🔍 Поиск продукта', '📊 Рекомендации'],
-        ['🔙 Главное меню']
-    ]
-    
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('PRODUCTS_MINI_APP')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCTS_MAIN"
@@ -67,41 +57,16 @@ async def show_products_mini_app(update: Update, context: ContextTypes.DEFAULT_T
 # === ОБРАБОТЧИКИ КНОПОК ===
 async def handle_products_navigation(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Обработчик навигации в мини-приложении"""
-    text = update.message.text
-    chat_id = update.effective_chat.id
-    user_goal = get_user_goal(chat_id)
-    
-    # Обработка категорий
-    category_map = {
-        '🌾 Сложные углеводы': 'сложные_углеводы',
-        '⚡ Простые углеводы': 'простые_углеводы',
-        '🥩 Белки': 'белки',
-        '🫒 Ненасыщенные жиры': 'ненасыщенные_жиры',
-        '🧈 Насыщенные жиры': 'насыщенные_жиры',
-        '🌿 Клетчатка': 'клетчатка'
-    }
-    
-    if text in category_map:
-        category = category_map[text]
-        return await show_category_products(update, context, category, user_goal)
-    
-    elif text == '🔍 Поиск продукта':
-        return await show_search_interface(update, context)
-    
-    elif text == '📊 Рекомендации':
-        return await show_recommendations(update, context, user_goal)
-    
-    elif text == '🔙 Главное меню':
-        return await return_to_main_menu(update, context)
-    
-    elif text == '🔙 Назад к категориям':
-        return await show_products_mini_app(update, context)
-    
     # Если это не кнопка, возможно это поиск продукта
-    else:
-        return await handle_product_search(update, context)
-    
-    return "PRODUCTS_MAIN"
+    return await products_buttons.dispatch(update, context, default=handle_product_search)
+
+async def show_category_for_goal(update: Update, context: ContextTypes.DEFAULT_TYPE, category: str):
+    """Продукты категории для цели пользователя"""
+    return await show_category_products(update, context, category, get_user_goal(update.effective_chat.id))
+
+async def show_recommendations_for_goal(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Рекомендации для цели пользователя"""
+    return await show_recommendations(update, context, get_user_goal(update.effective_chat.id))
 
 async def show_category_products(update: Update, context: ContextTypes.DEFAULT_TYPE, category: str, user_goal: str):
     """Показать продукты по категории"""
@@ -109,8 +74,7 @@ async def show_category_products(update: Update, context: ContextTypes.DEFAULT_T
     
     if not products:
         text = f"❌ Продукты для категории '{category.replace('_', ' ').title()}' не найдены"
-        keyboard = [['🔙 Назад к категориям']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+        reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
         await update.message.reply_text(text, reply_markup=reply_markup)
         return "PRODUCTS_MAIN"
     
@@ -147,75 +111,22 @@ async def show_category_products(update: Update, context: ContextTypes.DEFAULT_T
     
     text += "💡 **Напишите название продукта для подробной информации**"
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCTS_CATEGORY"
 
 async def show_product_details(update: Update, context: ContextTypes.DEFAULT_TYPE, product_name: str, user_goal: str):
     """Показать подробную информацию о продукте"""
-    # Ищем продукт во всех категориях
-    product_data = None
-    product_category = None
-    
-    for category, products in PRODUCTS_DATABASE.get(user_goal, {}).items():
-        if product_name.lower() in [name.lower() for name in products.keys()]:
-            # Находим точное название
-            for name, data in products.items():
-                if product_name.lower() in name.lower():
-                    product_data = data
-                    product_category = category
-                    product_name = name  # Используем точное название
-                    break
-            if product_data:
-                break
+    # Карточка неизменна для пары (продукт, цель) и берется из кэша
+    card = product_card(product_name, user_goal)
     
-    if not product_data:
+    if card is None:
         text = f"❌ Продукт '{product_name}' не найден в базе данных"
-        keyboard = [['🔙 Назад к категориям']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-        await update.message.reply_text(text, reply_markup=reply_markup)
+        await update.message.reply_text(text, reply_markup=keyboard_markup('BACK_TO_CATEGORIES'))
         return "PRODUCTS_MAIN"
     
-    # Форматируем информацию о продукте
-    result = format_product_info(product_name, product_data)
-    
-    # Добавляем рекомендации
-    category_names = {
-        "сложные_углеводы": "🌾 Сложные углеводы",
-        "простые_углеводы": "⚡ Простые углеводы", 
-        "белки": "🥩 Белки",
-        "ненасыщенные_жиры": "🫒 Ненасыщенные жиры",
-        "насыщенные_жиры": "🧈 Насыщенные жиры",
-        "клетчатка": "🌿 Клетчатка"
-    }
-    
-    result += f"\n📂 **Категория:** {category_names.get(product_category, product_category)}\n"
-    result += f"🎯 **Рекомендуется для:** {user_goal.replace('_', ' ').title()}\n\n"
-    
-    # Добавляем советы по употреблению в зависимости от цели
-    if user_goal == "похудение":
-        if product_category in ["сложные_углеводы", "белки"]:
-            result += "💡 **Совет:** Отличный выбор для похудения! Контролируйте порции и ешьте в первой половине дня."
-        elif product_category == "клетчатка":
-            result += "💡 **Совет:** Отлично для похудения! Клетчатка надолго насыщает и улучшает пищеварение."
-        else:
-            result += "💡 **Совет:** Употребляйте умеренно для похудения."
-    elif user_goal == "набор_массы":
-        if product_category in ["сложные_углеводы", "белки"]:
-            result += "💡 **Совет:** Отлично для набора массы! Можете увеличить порции, особенно после тренировки."
-        elif product_category in ["ненасыщенные_жиры", "насыщенные_жиры"]:
-            result += "💡 **Совет:** Полезные жиры для набора массы! Добавляйте в рацион умеренно."
-        else:
-            result += "💡 **Совет:** Хороший выбор для набора массы!"
-    else:  # поддержание
-        result += "💡 **Совет:** Сбалансированный продукт для поддержания формы! Подходит для ежедневного употребления."
-    
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
-    
-    await update.message.reply_text(result, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
+    await update.message.reply_text(card, reply_markup=keyboard_markup('BACK_TO_CATEGORIES'), parse_mode=ParseMode.MARKDOWN)
     return "PRODUCT_DETAILS"
 
 async def show_search_interface(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -231,8 +142,7 @@ async def show_search_interface(update: Update, context: ContextTypes.DEFAULT_TY
 • гречка
 • творог"""
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCT_SEARCH_NEW"
@@ -280,8 +190,7 @@ async def show_recommendations(update: Update, context: ContextTypes.DEFAULT_TYP
         text += "• Разнообразие продуктов\n"
         text += "• Умеренные порции\n"
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
     return "PRODUCTS_MAIN"
@@ -302,6 +211,11 @@ async def handle_product_search(update: Update, context: ContextTypes.DEFAULT_TY
     user_goal = get_user_goal(chat_id)
     
     results = search_product(product_name)
+    fuzzy = False
+    if not results:
+        # Точных совпадений нет - пробуем с учетом опечаток
+        results = search_product_fuzzy(product_name)
+        fuzzy = bool(results)
     
     if not results:
         text = f"❌ Продукт '{product_name}' не найден в базе данных\n\n"
@@ -310,13 +224,15 @@ async def handle_product_search(update: Update, context: ContextTypes.DEFAULT_TY
         text += "• Использовать более общие названия\n"
         text += "• Поискать в категориях продуктов"
         
-        keyboard = [['🔙 Назад к категориям']]
-        reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+        reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
         await update.message.reply_text(text, reply_markup=reply_markup)
         return "PRODUCTS_MAIN"
     
     # Показываем результаты поиска
-    text = f"🔍 **Результаты поиска для '{product_name}':**\n\n"
+    if fuzzy:
+        text = f"🔍 **Точных совпадений нет, похожие продукты для '{product_name}':**\n\n"
+    else:
+        text = f"🔍 **Результаты поиска для '{product_name}':**\n\n"
     
     found_products = []
     
@@ -345,8 +261,20 @@ async def handle_product_search(update: Update, context: ContextTypes.DEFAULT_TY
     else:
         text += "💡 **Напишите точное название продукта для подробной информации**"
     
-    keyboard = [['🔙 Назад к категориям']]
-    reply_markup = ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+    reply_markup = keyboard_markup('BACK_TO_CATEGORIES')
     
     await update.message.reply_text(text, reply_markup=reply_markup, parse_mode=ParseMode.MARKDOWN)
-    return "PRODUCTS_MAIN" 
\ No newline at end of file
+    return "PRODUCTS_MAIN"
+
+# Кнопки мини-приложения -> обработчики (handle_products_navigation)
+products_buttons = (
+    ButtonRouter('products')
+    .add(Keyboards.PRODUCTS_MINI_APP, {
+        **{button: functools.partial(show_category_for_goal, category=category)
+           for button, category in Keyboards.PRODUCT_CATEGORY_BUTTONS.items()},
+        '🔍 Поиск продукта': show_search_interface,
+        '📊 Рекомендации': show_recommendations_for_goal,
+        '🔙 Главное меню': return_to_main_menu,
+    })
+    .add(Keyboards.BACK_TO_CATEGORIES, {'🔙 Назад к категориям': show_products_mini_app})
+)
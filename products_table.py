@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Колоночная таблица продуктов FitAdventure Bot
+Вложенная база {цель: {категория: {название: данные}}} разворачивается один раз
+в плоские столбцы: коды целей и категорий, id названий и массивы КБЖУ.
+Фильтрация, сортировка и выбор топ-N выполняются векторно (NumPy),
+без NumPy - теми же операциями на списках.
+"""
+
+import operator
+from bisect import bisect_right
+from typing import Dict, Any, List, Tuple, Optional, Iterable, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Числовые столбцы таблицы (ключи данных продукта)
+MACRO_COLUMNS = ('калории', 'белки', 'жиры', 'углеводы', 'клетчатка')
+
+# Столбцы с заранее построенным порядком сортировки
+NAME_COLUMN = 'название'
+SORT_COLUMNS = MACRO_COLUMNS + (NAME_COLUMN,)
+
+# Операторы условий фильтра: ('белки', '>', 20)
+OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+Condition = Tuple[str, str, float]
+
+class ProductTable:
+    """Плоская таблица продуктов: одна строка на (цель, категория, название)
+
+    Строки идут в порядке обхода исходной базы, поэтому выборка без сортировки
+    сохраняет привычный порядок продуктов.
+    """
+
+    def __init__(self, database: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]):
+        self.database = database
+        # Справочники кодов
+        self.goals: List[str] = []
+        self.categories: List[str] = []
+        self.names: List[str] = []
+        self._goal_codes: Dict[str, int] = {}
+        self._category_codes: Dict[str, int] = {}
+        self._name_ids: Dict[str, int] = {}
+        # Исходные данные строки (для выдачи результатов)
+        self.records: List[Dict[str, Any]] = []
+        # Порядок строк для каждого столбца сортировки: (столбец, по убыванию) -> строки
+        self._sort_orders: Dict[Tuple[str, bool], Sequence[int]] = {}
+        self._build()
+
+    def _intern(self, value: str, codes: Dict[str, int], values: List[str]) -> int:
+        """Код строкового значения (одинаковые строки хранятся один раз)"""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _build(self) -> None:
+        """Разворачивание базы в столбцы (один раз при импорте)"""
+        goal_column, category_column, name_column = [], [], []
+        macro_columns: Dict[str, List[float]] = {column: [] for column in MACRO_COLUMNS}
+
+        for goal, categories in self.database.items():
+            goal_code = self._intern(goal, self._goal_codes, self.goals)
+            for category, products in categories.items():
+                category_code = self._intern(category, self._category_codes, self.categories)
+                for name, data in products.items():
+                    goal_column.append(goal_code)
+                    category_column.append(category_code)
+                    name_column.append(self._intern(name, self._name_ids, self.names))
+                    for column in MACRO_COLUMNS:
+                        macro_columns[column].append(float(data.get(column, 0)))
+                    self.records.append(data)
+
+        if NUMPY_AVAILABLE:
+            self.goal_codes = np.array(goal_column, dtype=np.int8)
+            self.category_codes = np.array(category_column, dtype=np.int16)
+            self.name_ids = np.array(name_column, dtype=np.int32)
+            self.columns = {column: np.array(values, dtype=np.float32) for column, values in macro_columns.items()}
+        else:
+            self.goal_codes = goal_column
+            self.category_codes = category_column
+            self.name_ids = name_column
+            self.columns = macro_columns
+
+        for column in SORT_COLUMNS:
+            for descending in (False, True):
+                self._sort_orders[(column, descending)] = self._compute_order(column, descending)
+
+    def _compute_order(self, column: str, descending: bool) -> Sequence[int]:
+        """Устойчивый порядок всех строк по столбцу (равные значения - в порядке базы)"""
+        if column == NAME_COLUMN:
+            keys = [self.names[name_id] for name_id in self.name_ids]
+            rows = sorted(range(len(self)), key=keys.__getitem__, reverse=descending)
+            return np.array(rows, dtype=np.intp) if NUMPY_AVAILABLE else rows
+        if NUMPY_AVAILABLE:
+            keys = self.columns[column]
+            return np.argsort(-keys if descending else keys, kind='stable')
+        return sorted(range(len(self)), key=self.columns[column].__getitem__, reverse=descending)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # === ВЫБОРКА ===
+    def category_codes_for(self, category: str) -> List[int]:
+        """Коды категорий; 'углеводы' и 'жиры' объединяют подкатегории"""
+        if category in self._category_codes:
+            return [self._category_codes[category]]
+        return [code for code, name in enumerate(self.categories) if name.endswith('_' + category)]
+
+    def filter(self, goal: Optional[str] = None, category: Optional[str] = None,
+               conditions: Iterable[Condition] = ()) -> Sequence[int]:
+        """Номера строк, удовлетворяющих цели, категории и условиям по КБЖУ
+
+        Пример: filter(conditions=[('белки', '>', 20), ('калории', '<', 150)])
+        """
+        conditions = [self._check_condition(condition) for condition in conditions]
+
+        if goal is not None and goal not in self._goal_codes:
+            return self._empty()
+        category_codes = self.category_codes_for(category) if category is not None else None
+        if category_codes == []:
+            return self._empty()
+
+        if NUMPY_AVAILABLE:
+            mask = np.ones(len(self), dtype=bool)
+            if goal is not None:
+                mask &= self.goal_codes == self._goal_codes[goal]
+            if category_codes is not None:
+                mask &= np.isin(self.category_codes, category_codes)
+            for column, op, value in conditions:
+                mask &= OPERATORS[op](self.columns[column], np.float32(value))
+            return np.flatnonzero(mask)
+
+        rows = range(len(self))
+        if goal is not None:
+            goal_code = self._goal_codes[goal]
+            rows = [row for row in rows if self.goal_codes[row] == goal_code]
+        if category_codes is not None:
+            allowed = set(category_codes)
+            rows = [row for row in rows if self.category_codes[row] in allowed]
+        for column, op, value in conditions:
+            values, compare = self.columns[column], OPERATORS[op]
+            rows = [row for row in rows if compare(values[row], value)]
+        return list(rows)
+
+    def sort(self, rows: Sequence[int], column: str, descending: bool = False) -> Sequence[int]:
+        """Устойчивая сортировка строк по столбцу"""
+        self._check_column(column)
+        values = self.columns[column]
+        if NUMPY_AVAILABLE:
+            rows = np.asarray(rows, dtype=np.intp)
+            keys = values[rows]
+            order = np.argsort(-keys if descending else keys, kind='stable')
+            return rows[order]
+        return sorted(rows, key=values.__getitem__, reverse=descending)
+
+    def sort_order(self, column: str, descending: bool = False) -> Sequence[int]:
+        """Предвычисленный порядок всех строк по столбцу"""
+        if (column, descending) not in self._sort_orders:
+            raise ValueError(f"Неизвестный столбец: {column}")
+        return self._sort_orders[(column, descending)]
+
+    def page(self, rows: Sequence[int], column: str, descending: bool = False, limit: int = 20,
+             offset: int = 0, after: Optional[int] = None) -> Tuple[Sequence[int], int, Optional[int]]:
+        """Страница отсортированной выборки по предвычисленному порядку
+
+        Возвращает (строки страницы, всего строк в выборке, курсор следующей страницы).
+        Курсор - позиция последней выданной строки в порядке sort_order; при after
+        страница начинается сразу за ней, offset при этом не используется.
+        """
+        order = self.sort_order(column, descending)
+        if NUMPY_AVAILABLE:
+            selected = np.zeros(len(self), dtype=bool)
+            selected[np.asarray(rows, dtype=np.intp)] = True
+            # Позиции выбранных строк в общем порядке - уже отсортированы
+            positions = np.flatnonzero(selected[order])
+            start = int(np.searchsorted(positions, after, side='right')) if after is not None else offset
+        else:
+            selected = set(rows)
+            positions = [position for position, row in enumerate(order) if row in selected]
+            start = bisect_right(positions, after) if after is not None else offset
+
+        chosen = positions[start:start + limit]
+        total = len(positions)
+        next_after = int(chosen[-1]) if len(chosen) and start + limit < total else None
+        return [int(order[position]) for position in chosen], total, next_after
+
+    def top(self, column: str, n: int, rows: Optional[Sequence[int]] = None,
+            descending: bool = True) -> Sequence[int]:
+        """Топ-N строк по столбцу (по умолчанию - наибольшие значения)"""
+        if rows is None:
+            rows = self.filter()
+        if n <= 0:
+            return self._empty()
+        if NUMPY_AVAILABLE:
+            rows = np.asarray(rows, dtype=np.intp)
+            if n < len(rows):
+                keys = self.columns[column][rows]
+                # argpartition отбирает N кандидатов за O(n), сортируются только они
+                part = np.argpartition(-keys if descending else keys, n - 1)[:n]
+                rows = rows[np.sort(part)]
+        return self.sort(rows, column, descending)[:n]
+
+    # === РЕЗУЛЬТАТЫ ===
+    def record(self, row: int) -> Tuple[str, str, str, Dict[str, Any]]:
+        """Строка таблицы: (цель, категория, название, данные)"""
+        row = int(row)
+        return (self.goals[self.goal_codes[row]], self.categories[self.category_codes[row]],
+                self.names[self.name_ids[row]], self.records[row])
+
+    def items(self, rows: Sequence[int]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Список (название, данные) в порядке строк"""
+        return [(self.names[self.name_ids[int(row)]], self.records[int(row)]) for row in rows]
+
+    def group(self, rows: Sequence[int]) -> Dict[str, Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Строки в формате исходной базы {цель: {категория: {название: данные}}}"""
+        results: Dict[str, Dict[str, Dict[str, Dict[str, Any]]]] = {}
+        for row in rows:
+            goal, category, name, data = self.record(row)
+            results.setdefault(goal, {}).setdefault(category, {})[name] = data
+        return results
+
+    # === СЛУЖЕБНЫЕ ===
+    def _empty(self) -> Sequence[int]:
+        return np.empty(0, dtype=np.intp) if NUMPY_AVAILABLE else []
+
+    def _check_column(self, column: str) -> None:
+        if column not in self.columns:
+            raise ValueError(f"Неизвестный столбец: {column}")
+
+    def _check_condition(self, condition: Condition) -> Condition:
+        column, op, value = condition
+        self._check_column(column)
+        if op not in OPERATORS:
+            raise ValueError(f"Неизвестный оператор: {op}")
+        return column, op, float(value)
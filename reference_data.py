@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Эталонные данные и прежние реализации для тестов и бенчмарков: тесты и
+бенчмарки импортируют их отсюда, а не друг из друга
+"""
+
+import random
+import datetime
+from typing import List
+
+from telegram import KeyboardButton, ReplyKeyboardMarkup, WebAppInfo
+
+import rendering
+from calculations import calculator
+from products_database import PRODUCTS_DATABASE, format_product_info
+
+# === ДАННЫЕ ===
+def random_profiles(count, seed=7):
+    """Случайные профили по всему пространству опроса"""
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        profile = {
+            'weight': rng.choice([rng.randint(45, 140), round(rng.uniform(45, 140), 1)]),
+            'height': rng.randint(150, 205), 'age': rng.randint(16, 80),
+            'gender': rng.choice(['мужчина', 'женщина']), 'steps': rng.randrange(1000, 30000, 500),
+            'occupation': rng.choice(['office', 'healthcare', 'construction', 'other']),
+            'recovery': rng.choice(['excellent', 'good', 'average', 'poor']),
+            'sleep_quality': rng.choice(['excellent', 'good', 'average', 'poor']),
+            'stress_level': rng.randint(1, 10),
+            'goal': rng.choice(['Похудение', 'Поддержание', 'Набор массы']),
+            'has_training_experience': rng.random() < 0.8,
+        }
+        if profile['has_training_experience']:
+            profile.update(training_days=rng.randint(1, 7), activity_type=rng.choice(['Силовые', 'Выносливость', 'Кроссфит']),
+                           intensity=rng.choice(['low', 'moderate', 'high', 'very_high']),
+                           workout_duration=rng.randrange(15, 180, 5))
+        if rng.random() < 0.3:
+            profile['fat_percent'] = round(rng.uniform(8, 40), 1)
+        profiles.append(profile)
+    return profiles
+
+def sample_results() -> List[tuple]:
+    """Планы питания для профилей с тренировками и без"""
+    profiles = random_profiles(40)
+    return [(calculator.calculate_nutrition_plan(profile),) for profile in profiles]
+
+def sample_products() -> List[tuple]:
+    return [(name, goal) for goal, categories in PRODUCTS_DATABASE.items()
+            for products in categories.values() for name in list(products)[:3]]
+
+def sample_water() -> List[tuple]:
+    today = datetime.date(2026, 10, 18)
+    water = {(today - datetime.timedelta(days=day)).isoformat(): 400 * day for day in range(7)}
+    return [(water, today)]
+
+# === ПРЕЖНЯЯ ОТРИСОВКА (эталон для rendering.py) ===
+def legacy_results(results):
+    """Текст из main.occupation / MessageFormatter и новая клавиатура консультации"""
+    if results['has_training_experience']:
+        text = rendering.RESULTS_TRAINING.text.format(**results)
+    else:
+        text = rendering.RESULTS_NO_TRAINING.text.format(**results)
+    keyboard = [
+        [KeyboardButton('💬 Получить консультацию'), KeyboardButton('🍎 База продуктов', web_app=WebAppInfo(url='https://darksaiders12.github.io/fitadventure-webapp/webapp_products_github.html?v=686'))],
+        ['🚀 Начать заново', '❓ Помощь'],
+        ['🌍 Язык', '📊 О боте']
+    ]
+    return text, ReplyKeyboardMarkup(keyboard, resize_keyboard=True)
+
+def legacy_product_details(product_name, user_goal):
+    """Тело products_mini_app.show_product_details до rendering.product_card"""
+    product_data = None
+    product_category = None
+    for category, products in PRODUCTS_DATABASE.get(user_goal, {}).items():
+        if product_name.lower() in [name.lower() for name in products.keys()]:
+            for name, data in products.items():
+                if product_name.lower() in name.lower():
+                    product_data = data
+                    product_category = category
+                    product_name = name
+                    break
+            if product_data:
+                break
+    if not product_data:
+        return None, ReplyKeyboardMarkup([['🔙 Назад к категориям']], resize_keyboard=True)
+
+    result = format_product_info(product_name, product_data)
+    category_names = {
+        "сложные_углеводы": "🌾 Сложные углеводы",
+        "простые_углеводы": "⚡ Простые углеводы",
+        "белки": "🥩 Белки",
+        "ненасыщенные_жиры": "🫒 Ненасыщенные жиры",
+        "насыщенные_жиры": "🧈 Насыщенные жиры",
+        "клетчатка": "🌿 Клетчатка"
+    }
+    result += f"\n📂 **Категория:** {category_names.get(product_category, product_category)}\n"
+    result += f"🎯 **Рекомендуется для:** {user_goal.replace('_', ' ').title()}\n\n"
+    if user_goal == "похудение":
+        if product_category in ["сложные_углеводы", "белки"]:
+            result += "💡 **Совет:** Отличный выбор для похудения! Контролируйте порции и ешьте в первой половине дня."
+        elif product_category == "клетчатка":
+            result += "💡 **Совет:** Отлично для похудения! Клетчатка надолго насыщает и улучшает пищеварение."
+        else:
+            result += "💡 **Совет:** Употребляйте умеренно для похудения."
+    elif user_goal == "набор_массы":
+        if product_category in ["сложные_углеводы", "белки"]:
+            result += "💡 **Совет:** Отлично для набора массы! Можете увеличить порции, особенно после тренировки."
+        elif product_category in ["ненасыщенные_жиры", "насыщенные_жиры"]:
+            result += "💡 **Совет:** Полезные жиры для набора массы! Добавляйте в рацион умеренно."
+        else:
+            result += "💡 **Совет:** Хороший выбор для набора массы!"
+    else:
+        result += "💡 **Совет:** Сбалансированный продукт для поддержания формы! Подходит для ежедневного употребления."
+    return result, ReplyKeyboardMarkup([['🔙 Назад к категориям']], resize_keyboard=True)
+
+def legacy_water_statistics(water_data, today):
+    """Тело mini_apps.show_water_statistics до rendering.render_water_statistics"""
+    stats = []
+    for i in range(7):
+        date = today - datetime.timedelta(days=i)
+        stats.append((date, water_data.get(date.isoformat(), 0)))
+    result = "📊 **Статистика воды за последние 7 дней:**\n\n"
+    for date, amount in reversed(stats):
+        day_name = date.strftime("%A")
+        date_str = date.strftime("%d.%m")
+        progress = min(amount / 2500 * 100, 100)
+        progress_bar = "💧" * int(progress / 20) + "⬜" * (5 - int(progress / 20))
+        result += f"**{day_name}** ({date_str}): {amount}мл {progress_bar} {progress:.1f}%\n"
+    result += "\n💡 Рекомендуемая норма: 2500мл в день"
+    return result
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Отрисовка ответов FitAdventure Bot
+Шаблоны сообщений разбираются один раз при импорте и заполняются одним
+вызовом format_map вместо цепочек +=. Клавиатуры (ReplyKeyboardMarkup
+неизменяемы после создания) строятся из config.Keyboards один раз и
+переиспользуются. Карточки продуктов не зависят от пользователя и
+кэшируются по (продукт, цель).
+"""
+
+import datetime
+import functools
+from string import Formatter
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from telegram import KeyboardButton, ReplyKeyboardMarkup, WebAppInfo
+
+from config import Keyboards, RenderingConfig
+from products_database import PRODUCTS_DATABASE, format_product_info
+
+class Template:
+    """Шаблон сообщения: поля разбираются при создании, заполнение - один format_map"""
+
+    __slots__ = ('text', 'fields')
+
+    def __init__(self, text: str):
+        self.text = text
+        self.fields = tuple(dict.fromkeys(name for _, name, _, _ in Formatter().parse(text) if name))
+
+    def render(self, values: Mapping[str, Any] = None, **kwargs) -> str:
+        return self.text.format_map(kwargs if values is None else values)
+
+# === РЕЗУЛЬТАТЫ РАСЧЕТА ===
+RESULTS_TRAINING = Template("""🎉 **Ваш ультра-точный план питания готов!**
+
+🎯 **Точность расчета:** {precision_score}%
+
+📊 **КАЛОРИИ ПО ДНЯМ:**
+• 💤 Дни отдыха: **{target_calories_rest} ккал**
+• 🏋️ Дни тренировок: **{target_calories_training} ккал**
+• 📈 Средний показатель: **{target_calories_average} ккал**
+
+🥩 **МАКРОНУТРИЕНТЫ:**
+
+**🥤 Белки:** {protein_grams} г ({protein_min}-{protein_max} г)
+
+**🥑 Жиры:**
+• Дни отдыха: {fats_rest} г
+• Дни тренировок: {fats_training} г
+
+**🍞 Углеводы:**
+• Дни отдыха: {carbs_rest} г  
+• Дни тренировок: {carbs_training} г
+
+**🌾 Клетчатка:**
+• Дни отдыха: {fiber_rest} г
+• Дни тренировок: {fiber_training} г
+
+**💧 Вода:** {water} мл/день
+
+📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
+• 🔥 BMR (базовый метаболизм): {bmr} ккал
+• ⚡ TDEE отдых: {tdee_rest} ккал
+• 🏋️ TDEE тренировки: {tdee_training} ккал
+• 📊 Коэффициент отдыха: {rest_day_factor}
+• 💪 Коэффициент тренировок: {training_day_factor}
+
+📊 **АНАЛИЗ ТЕЛА:**
+• 🎯 Процент жира: **{fat_percent}%**
+• 📋 Категория: **{fat_category}**
+
+**📚 ОБЪЯСНЕНИЯ:**
+• **BMR** - калории для поддержания жизнедеятельности в покое
+• **TDEE** - общий расход энергии с учетом активности
+• **Целевые калории** - калории для достижения вашей цели
+• **Процент жира** - рассчитан на основе ваших параметров
+
+✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
+
+🎯 Следуйте плану и достигайте своих целей!""")
+
+RESULTS_NO_TRAINING = Template("""🎉 **Ваш ультра-точный план питания готов!**
+
+🎯 **Точность расчета:** {precision_score}%
+
+📊 **КАЛОРИИ:**
+• 📈 Ежедневная норма: **{target_calories_average} ккал**
+
+🥩 **МАКРОНУТРИЕНТЫ:**
+
+**🥤 Белки:** {protein_grams} г ({protein_min}-{protein_max} г)
+
+**🥑 Жиры:** {fats_rest} г
+
+**🍞 Углеводы:** {carbs_rest} г
+
+**🌾 Клетчатка:** {fiber_rest} г
+
+**💧 Вода:** {water} мл/день
+
+📈 **ДЕТАЛЬНЫЕ ПОКАЗАТЕЛИ:**
+• 🔥 BMR (базовый метаболизм): {bmr} ккал
+• ⚡ TDEE (общий расход энергии): {tdee_average} ккал
+• 📊 Коэффициент активности: {rest_day_factor}
+
+📊 **АНАЛИЗ ТЕЛА:**
+• 🎯 Процент жира: **{fat_percent}%**
+• 📋 Категория: **{fat_category}**
+
+**📚 ОБЪЯСНЕНИЯ:**
+• **BMR** - калории для поддержания жизнедеятельности в покое
+• **TDEE** - общий расход энергии с учетом активности
+• **Целевые калории** - калории для достижения вашей цели
+• **Процент жира** - рассчитан на основе ваших параметров
+
+💡 **РЕКОМЕНДАЦИЯ:** Если планируете начать тренировки, пересчитайте план с учетом новой активности!
+
+✨ *Расчеты учитывают ВСЕ индивидуальные факторы для максимальной точности!*
+
+🎯 Следуйте плану и достигайте своих целей!""")
+
+CONSULTATION_PROMPT = (
+    "💬 **Нужна персональная консультация?**\n\n"
+    "🎯 Получите индивидуальные рекомендации от эксперта\n"
+    "📋 Составление персонального плана тренировок\n"
+    "🍽️ Детальный план питания с рецептами\n"
+    "📊 Анализ прогресса и корректировка плана\n\n"
+    "Нажмите кнопку ниже для связи с @DARKSIDERS17"
+)
+
+def render_results(results: Dict[str, Any]) -> str:
+    """План питания: с разбивкой по дням тренировок или единой нормой"""
+    template = RESULTS_TRAINING if results['has_training_experience'] else RESULTS_NO_TRAINING
+    return template.render(results)
+
+# === КЛАВИАТУРЫ ===
+@functools.lru_cache(maxsize=None)
+def keyboard_markup(name: str, one_time_keyboard: bool = False, web_apps: bool = False) -> ReplyKeyboardMarkup:
+    """Клавиатура из раскладки Keyboards.<name>, общая для всех сообщений
+
+    web_apps=True - кнопки из Keyboards.WEB_APP_BUTTONS открывают Web App.
+    """
+    def button(text):
+        url = Keyboards.WEB_APP_BUTTONS.get(text) if web_apps else None
+        return KeyboardButton(text, web_app=WebAppInfo(url=url)) if url else text
+
+    layout = [[button(text) for text in row] for row in getattr(Keyboards, name)]
+    return ReplyKeyboardMarkup(layout, resize_keyboard=True, one_time_keyboard=one_time_keyboard)
+
+# === КАРТОЧКИ ПРОДУКТОВ ===
+CATEGORY_TITLES = {category: button for button, category in Keyboards.PRODUCT_CATEGORY_BUTTONS.items()}
+
+PRODUCT_CARD_FOOTER = Template("""
+📂 **Категория:** {category}
+🎯 **Рекомендуется для:** {goal}
+
+💡 **Совет:** {advice}""")
+
+def goal_advice(goal: str, category: str) -> str:
+    """Совет по употреблению продукта категории для цели"""
+    if goal == "похудение":
+        if category in ("сложные_углеводы", "белки"):
+            return "Отличный выбор для похудения! Контролируйте порции и ешьте в первой половине дня."
+        if category == "клетчатка":
+            return "Отлично для похудения! Клетчатка надолго насыщает и улучшает пищеварение."
+        return "Употребляйте умеренно для похудения."
+    if goal == "набор_массы":
+        if category in ("сложные_углеводы", "белки"):
+            return "Отлично для набора массы! Можете увеличить порции, особенно после тренировки."
+        if category in ("ненасыщенные_жиры", "насыщенные_жиры"):
+            return "Полезные жиры для набора массы! Добавляйте в рацион умеренно."
+        return "Хороший выбор для набора массы!"
+    return "Сбалансированный продукт для поддержания формы! Подходит для ежедневного употребления."
+
+def find_product(product_name: str, goal: str) -> Optional[Tuple[str, Dict[str, Any], str]]:
+    """(точное название, данные, категория) продукта для цели или None"""
+    query = product_name.lower()
+    for category, products in PRODUCTS_DATABASE.get(goal, {}).items():
+        names = [name.lower() for name in products]
+        if query in names:
+            # Первое название, содержащее запрос (как в поиске по категории)
+            for name, data in products.items():
+                if query in name.lower():
+                    return name, data, category
+    return None
+
+@functools.lru_cache(maxsize=RenderingConfig.PRODUCT_CARD_CACHE_SIZE)
+def product_card(product_name: str, goal: str) -> Optional[str]:
+    """Карточка продукта с категорией и советом для цели (None - продукта нет)"""
+    found = find_product(product_name, goal)
+    if found is None:
+        return None
+    name, data, category = found
+    return format_product_info(name, data) + PRODUCT_CARD_FOOTER.render(
+        category=CATEGORY_TITLES.get(category, category),
+        goal=goal.replace('_', ' ').title(),
+        advice=goal_advice(goal, category),
+    )
+
+# === СТАТИСТИКА ВОДЫ ===
+WATER_STATS_HEADER = f"📊 **Статистика воды за последние {RenderingConfig.WATER_STATS_DAYS} дней:**\n\n"
+WATER_STATS_FOOTER = f"\n💡 Рекомендуемая норма: {RenderingConfig.WATER_DAILY_NORM}мл в день"
+WATER_DAY = "**{}** ({}): {}мл {} {:.1f}%\n"
+# Полоса прогресса по 20%: индекс - число заполненных делений
+PROGRESS_BARS = tuple("💧" * filled + "⬜" * (5 - filled) for filled in range(6))
+
+def render_water_statistics(water_data: Dict[str, int], today: datetime.date) -> str:
+    """Потребление воды за последние дни, от самого раннего"""
+    norm = RenderingConfig.WATER_DAILY_NORM
+    parts = [WATER_STATS_HEADER]
+    for offset in range(RenderingConfig.WATER_STATS_DAYS - 1, -1, -1):
+        date = today - datetime.timedelta(days=offset)
+        amount = water_data.get(date.isoformat(), 0)
+        progress = min(amount / norm * 100, 100)
+        parts.append(WATER_DAY.format(date.strftime("%A"), date.strftime("%d.%m"), amount,
+                                      PROGRESS_BARS[int(progress / 20)], progress))
+    parts.append(WATER_STATS_FOOTER)
+    return ''.join(parts)
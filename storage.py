@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Хранилище данных пользователей FitAdventure Bot
+Подключаемые бэкенды: SQLite (WAL, построчные записи) и JSON-файлы
+"""
+
+import os
+import json
+import sqlite3
+import tempfile
+import copy
+import threading
+import time
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from config import StorageConfig
+from metrics import timed_storage
+
+logger = logging.getLogger(__name__)
+
+# === ИНТЕРФЕЙС ХРАНИЛИЩА ===
+class BaseStorage:
+    """Базовый интерфейс хранилища: данные пользователя по (namespace, chat_id)"""
+
+    def get_user(self, namespace: str, chat_id) -> Dict[str, Any]:
+        """Получить данные одного пользователя (пустой словарь, если нет)"""
+        raise NotImplementedError
+
+    def set_user(self, namespace: str, chat_id, data: Dict[str, Any]) -> None:
+        """Сохранить данные одного пользователя"""
+        raise NotImplementedError
+
+    def delete_user(self, namespace: str, chat_id) -> None:
+        """Удалить данные пользователя"""
+        raise NotImplementedError
+
+    def set_many(self, namespace: str, users: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Записать нескольких пользователей за раз (None - удалить)"""
+        with self.batch():
+            for chat_id, data in users.items():
+                if data is None:
+                    self.delete_user(namespace, chat_id)
+                else:
+                    self.set_user(namespace, chat_id, data)
+
+    def load_all(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        """Получить данные всех пользователей пространства имен"""
+        raise NotImplementedError
+
+    @contextmanager
+    def batch(self):
+        """Группировка нескольких записей в одну фиксацию"""
+        yield self
+
+    def update_user(self, namespace: str, chat_id,
+                    updater: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """Атомарное чтение-изменение-запись данных пользователя"""
+        with self.batch():
+            data = self.get_user(namespace, chat_id)
+            updater(data)
+            self.set_user(namespace, chat_id, data)
+        return data
+
+    def close(self) -> None:
+        """Закрытие хранилища"""
+        pass
+
+# === JSON-ФАЙЛЫ (СОВМЕСТИМОСТЬ) ===
+class JSONFileStorage(BaseStorage):
+    """Хранилище в JSON-файлах: один файл на пространство имен"""
+
+    def __init__(self, files: Optional[Dict[str, str]] = None):
+        self.files = dict(files or StorageConfig.JSON_FILES)
+        self._lock = threading.RLock()
+        # Разобранное содержимое файлов: namespace -> (подпись файла, данные)
+        self._parsed: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]]]] = {}
+
+    def _path(self, namespace: str) -> Path:
+        return Path(self.files.get(namespace, f"user_{namespace}_data.json"))
+
+    def _read(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        """Чтение файла; повторный разбор только если файл изменился"""
+        path = self._path(namespace)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return {}
+
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed.get(namespace)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        self._parsed[namespace] = (signature, data)
+        return data
+
+    def _write(self, namespace: str, data: Dict[str, Dict[str, Any]]) -> None:
+        """Атомарная запись: временный файл + переименование"""
+        path = self._path(namespace)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp",
+                                        dir=str(path.parent.resolve()))
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        stat = path.stat()
+        self._parsed[namespace] = ((stat.st_mtime_ns, stat.st_size), data)
+
+    @timed_storage('json', 'get_user')
+    def get_user(self, namespace: str, chat_id) -> Dict[str, Any]:
+        with self._lock:
+            return copy.deepcopy(self._read(namespace).get(str(chat_id), {}))
+
+    def set_user(self, namespace: str, chat_id, data: Dict[str, Any]) -> None:
+        self.set_many(namespace, {str(chat_id): data})
+
+    def delete_user(self, namespace: str, chat_id) -> None:
+        self.set_many(namespace, {str(chat_id): None})
+
+    @timed_storage('json', 'set_many')
+    def set_many(self, namespace: str, users: Dict[str, Optional[Dict[str, Any]]]) -> None:
+        """Одно чтение и одна атомарная запись файла на весь набор"""
+        with self._lock:
+            all_data = dict(self._read(namespace))
+            for chat_id, data in users.items():
+                if data is None:
+                    all_data.pop(str(chat_id), None)
+                else:
+                    all_data[str(chat_id)] = copy.deepcopy(data)
+            self._write(namespace, all_data)
+
+    @timed_storage('json', 'load_all')
+    def load_all(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return copy.deepcopy(self._read(namespace))
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            yield self
+
+# === SQLITE (WAL) ===
+class SQLiteStorage(BaseStorage):
+    """Хранилище в SQLite: одна строка на пользователя, режим WAL"""
+
+    def __init__(self, db_file: str = None):
+        self.db_file = db_file or StorageConfig.SQLITE_FILE
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        # isolation_level=None - транзакциями управляем сами (BEGIN IMMEDIATE в batch)
+        self._conn = sqlite3.connect(self.db_file, isolation_level=None,
+                                     check_same_thread=False,
+                                     timeout=StorageConfig.SQLITE_BUSY_TIMEOUT)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS user_data (
+                namespace TEXT NOT NULL,
+                chat_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (namespace, chat_id)
+            )
+        """)
+
+    @timed_storage('sqlite', 'get_user')
+    def get_user(self, namespace: str, chat_id) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM user_data WHERE namespace = ? AND chat_id = ?",
+                (namespace, str(chat_id))
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    @timed_storage('sqlite', 'get_user_if_newer')
+    def get_user_if_newer(self, namespace: str, chat_id, since: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Данные и время изменения, если запись изменилась позже since (иначе None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, updated_at FROM user_data WHERE namespace = ? AND chat_id = ? AND updated_at > ?",
+                (namespace, str(chat_id), since)
+            ).fetchone()
+        return (json.loads(row[0]), row[1]) if row else None
+
+    @timed_storage('sqlite', 'set_user')
+    def set_user(self, namespace: str, chat_id, data: Dict[str, Any]) -> None:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO user_data (namespace, chat_id, data, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(namespace, chat_id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                (namespace, str(chat_id), payload, time.time())
+            )
+
+    @timed_storage('sqlite', 'delete_user')
+    def delete_user(self, namespace: str, chat_id) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM user_data WHERE namespace = ? AND chat_id = ?",
+                (namespace, str(chat_id))
+            )
+
+    @timed_storage('sqlite', 'load_all')
+    def load_all(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chat_id, data FROM user_data WHERE namespace = ?",
+                (namespace,)
+            ).fetchall()
+        return {chat_id: json.loads(data) for chat_id, data in rows}
+
+    def count(self, namespace: str) -> int:
+        """Количество пользователей в пространстве имен"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM user_data WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+
+    @contextmanager
+    def batch(self):
+        """Все записи внутри блока фиксируются одной транзакцией"""
+        with self._lock:
+            outermost = self._batch_depth == 0
+            if outermost:
+                self._conn.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if outermost:
+                    self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._batch_depth -= 1
+                if outermost:
+                    self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+# === КЭШ С ОТЛОЖЕННОЙ ЗАПИСЬЮ ===
+class CachedStorage(BaseStorage):
+    """Кэш в памяти поверх любого хранилища с отложенной записью (write-behind)
+
+    Чтения и записи идут в память; измененные пользователи помечаются
+    "грязными" и сбрасываются в хранилище фоновым потоком: по таймеру или
+    сразу после накопления FLUSH_THRESHOLD записей, а также явным вызовом
+    flush(). Вызывающий поток (цикл событий бота) хранилища не касается,
+    кроме промахов чтения. В памяти держится не больше max_entries записей:
+    давно не использованные сохраненные записи вытесняются, грязные - никогда.
+    Как и JSON-хранилище, get_user возвращает копию, а set_user сохраняет копию.
+    """
+
+    _DELETED = object()
+
+    def __init__(self, backend: BaseStorage, flush_interval: float = None,
+                 flush_threshold: int = None, max_entries: int = None):
+        self.backend = backend
+        self.flush_interval = flush_interval if flush_interval is not None else StorageConfig.FLUSH_INTERVAL
+        self.flush_threshold = flush_threshold if flush_threshold is not None else StorageConfig.FLUSH_THRESHOLD
+        self.max_entries = max_entries or StorageConfig.CACHE_MAX_ENTRIES
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._dirty: set = set()
+        self._flushing: set = set()  # записи, которые сейчас пишутся в хранилище
+        self._timer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self.stats = {'hits': 0, 'misses': 0, 'flushes': 0, 'flushed_entries': 0, 'evictions': 0,
+                      'dropped_entries': 0}
+
+    def get_user(self, namespace: str, chat_id) -> Dict[str, Any]:
+        key = (namespace, str(chat_id))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                entry = self.backend.get_user(namespace, chat_id)
+                self._entries[key] = entry
+                self._evict()
+            else:
+                self.stats['hits'] += 1
+                self._entries.move_to_end(key)
+            # Изменения копии не попадают в кэш до set_user
+            return {} if entry is self._DELETED else copy.deepcopy(entry)
+
+    def set_user(self, namespace: str, chat_id, data: Dict[str, Any]) -> None:
+        self._mark(namespace, chat_id, copy.deepcopy(data))
+
+    def delete_user(self, namespace: str, chat_id) -> None:
+        self._mark(namespace, chat_id, self._DELETED)
+
+    def _mark(self, namespace: str, chat_id, entry) -> None:
+        key = (namespace, str(chat_id))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._dirty.add(key)
+            if len(self._dirty) >= self.flush_threshold:
+                # Сброс выполнит фоновый поток, запись не ждет хранилища
+                self._wake.set()
+            self._evict()
+
+    def _evict(self) -> None:
+        """Вытеснение давно не использованных сохраненных записей сверх max_entries"""
+        excess = len(self._entries) - self.max_entries
+        if excess <= 0:
+            return
+        victims = []
+        for key in self._entries:
+            if len(victims) >= excess:
+                break
+            if key not in self._dirty and key not in self._flushing:
+                victims.append(key)
+        for key in victims:
+            del self._entries[key]
+        self.stats['evictions'] += len(victims)
+
+    def load_all(self, namespace: str) -> Dict[str, Dict[str, Any]]:
+        """Полная выборка: сначала сброс, затем чтение из хранилища"""
+        self.flush()
+        return self.backend.load_all(namespace)
+
+    @contextmanager
+    def batch(self):
+        with self._lock:
+            yield self
+
+    def dirty_count(self) -> int:
+        """Количество несохраненных записей"""
+        with self._lock:
+            return len(self._dirty)
+
+    @timed_storage('cached', 'flush')
+    def flush(self) -> int:
+        """Сброс грязных записей в хранилище. Возвращает число записей
+
+        Запись в хранилище идет без блокировки кэша: чтения и записи других
+        потоков ее не ждут. Записи в кэше - собственные копии (set_user),
+        поэтому их можно сериализовать вне блокировки. Если хранилище не
+        принимает пространство имен целиком, оно пишется по одной записи
+        (_write_one_by_one).
+        """
+        with self._lock:
+            # Запись, которую сейчас пишет другой сброс, останется грязной до следующего:
+            # одна запись не пишется двумя сбросами одновременно (и в обратном порядке)
+            keys = self._dirty - self._flushing
+            if not keys:
+                return 0
+            self._dirty -= keys
+            self._flushing |= keys
+            by_namespace: Dict[str, Dict[str, Optional[Dict[str, Any]]]] = {}
+            for namespace, chat_id in keys:
+                entry = self._entries[(namespace, chat_id)]
+                by_namespace.setdefault(namespace, {})[chat_id] = None if entry is self._DELETED else entry
+
+        retry, error, dropped = set(), None, []
+        try:
+            for namespace, users in by_namespace.items():
+                try:
+                    self.backend.set_many(namespace, users)
+                except Exception:
+                    # Одна плохая запись не должна блокировать все пространство имен
+                    failed, namespace_error = self._write_one_by_one(namespace, users, dropped)
+                    retry |= failed
+                    error = error or namespace_error
+        except BaseException:
+            retry = keys
+            raise
+        finally:
+            with self._lock:
+                self._flushing -= keys
+                self._dirty |= retry
+                for key, entry in dropped:
+                    # Неизмененная с тех пор запись уходит из кэша: читается сохраненная версия
+                    if key not in self._dirty and self._entries.get(key) is entry:
+                        del self._entries[key]
+
+        with self._lock:
+            self._evict()
+            self.stats['flushes'] += 1
+            self.stats['flushed_entries'] += len(keys) - len(retry) - len(dropped)
+            self.stats['dropped_entries'] += len(dropped)
+        if error is not None:
+            raise error
+        return len(keys) - len(retry) - len(dropped)
+
+    def _write_one_by_one(self, namespace: str, users: Dict[str, Optional[Dict[str, Any]]],
+                          dropped: list) -> Tuple[set, Optional[Exception]]:
+        """Запись пространства имен по одному пользователю после ошибки set_many
+
+        Запись, которую хранилище не может сериализовать (TypeError, ValueError),
+        отбрасывается с ошибкой в логе и попадает в dropped. При прочих ошибках
+        (диск, блокировка базы) запись остается грязной до следующего сброса.
+        Возвращает ключи для повтора и последнюю такую ошибку.
+        """
+        retry, error = set(), None
+        for chat_id, data in users.items():
+            try:
+                self.backend.set_many(namespace, {chat_id: data})
+            except (TypeError, ValueError) as e:
+                logger.error("Dropping unserializable cached record %s/%s: %s", namespace, chat_id, e)
+                dropped.append(((namespace, chat_id), data))
+            except Exception as e:
+                retry.add((namespace, chat_id))
+                error = e
+        return retry, error
+
+    def start_auto_flush(self) -> None:
+        """Фоновый поток, сбрасывающий кэш каждые flush_interval секунд"""
+        if self._timer is not None:
+            return
+
+        def run():
+            while not self._stop.is_set():
+                # Просыпается по таймеру или раньше, когда накопилось flush_threshold записей
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                if self._stop.is_set():
+                    break
+                try:
+                    self.flush()
+                except Exception as e:
+                    logger.error(f"Ошибка фонового сброса кэша: {e}")
+
+        self._timer = threading.Thread(target=run, name="storage-flush", daemon=True)
+        self._timer.start()
+
+    def close(self) -> None:
+        """Остановка таймера, финальный сброс и закрытие хранилища"""
+        self._stop.set()
+        self._wake.set()
+        if self._timer is not None:
+            self._timer.join(timeout=self.flush_interval + 1)
+            self._timer = None
+        try:
+            self.flush()
+        finally:
+            self.backend.close()
+
+# === МИГРАЦИЯ ===
+def migrate_json_to_sqlite(json_file: str, namespace: str, storage: SQLiteStorage) -> int:
+    """Однократный перенос JSON-файла в SQLite. Возвращает число перенесенных пользователей"""
+    path = Path(json_file)
+    if not path.exists():
+        return 0
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    with storage.batch():
+        for chat_id, user_data in data.items():
+            storage.set_user(namespace, chat_id, user_data)
+
+    logger.info(f"Migrated {len(data)} users from {json_file} to namespace '{namespace}'")
+    return len(data)
+
+# === ГЛОБАЛЬНОЕ ХРАНИЛИЩЕ ===
+_storage: Optional[BaseStorage] = None
+_storage_lock = threading.Lock()
+
+def create_storage(backend: str = None) -> BaseStorage:
+    """Создание хранилища по имени бэкенда"""
+    backend = backend or StorageConfig.BACKEND
+
+    if backend == 'json':
+        return JSONFileStorage()
+
+    if backend == 'sqlite':
+        is_new = not Path(StorageConfig.SQLITE_FILE).exists()
+        storage = SQLiteStorage()
+        if is_new:
+            for namespace, json_file in StorageConfig.JSON_FILES.items():
+                migrate_json_to_sqlite(json_file, namespace, storage)
+        return storage
+
+    raise ValueError(f"Неизвестный бэкенд хранилища: {backend}")
+
+def get_storage() -> BaseStorage:
+    """Получение глобального хранилища (создается при первом обращении)"""
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                storage = create_storage()
+                if StorageConfig.CACHE_ENABLED:
+                    storage = CachedStorage(storage)
+                    storage.start_auto_flush()
+                _storage = storage
+    return _storage
+
+def close_storage() -> None:
+    """Сброс кэша и закрытие глобального хранилища (при остановке бота)"""
+    global _storage
+    with _storage_lock:
+        if _storage is not None:
+            _storage.close()
+            _storage = None
+
+if __name__ == "__main__":
+    # Ручная миграция: python storage.py
+    target = SQLiteStorage()
+    for ns, file_name in StorageConfig.JSON_FILES.items():
+        migrated = migrate_json_to_sqlite(file_name, ns, target)
+        print(f"✅ {file_name} -> {StorageConfig.SQLITE_FILE} [{ns}]: {migrated} пользователей")
+    target.close()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Подписчики рассылок FitAdventure Bot
+SubscriberRegistry хранит подписки в хранилище (storage.py), поэтому они
+переживают перезапуск, и держит в памяти индекс по цели (отбор по времени
+последней активности - по записям в памяти). Рассылка получает снимок получателей,
+так что /subscribe и /unsubscribe во время рассылки ей не мешают.
+Чаты, заблокировавшие бота, помечаются и в следующие рассылки не попадают.
+"""
+
+import time
+import threading
+import logging
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from config import StorageConfig
+from storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+# Короткие имена сегментов по цели для /broadcast
+GOAL_SEGMENTS = {
+    'похудение': 'Похудение',
+    'поддержание': 'Поддержание',
+    'набор': 'Набор массы',
+}
+
+class SubscriberRegistry:
+    """Подписчики с индексами по цели и отметкой недоступных чатов
+
+    Запись подписчика в хранилище: {'subscribed_at', 'last_active', 'goal', 'dead'}.
+    Данные загружаются при первом обращении; все операции потокобезопасны.
+    """
+
+    def __init__(self, storage=None, namespace: str = None, clock: Callable[[], float] = time.time):
+        self._storage = storage
+        self.namespace = namespace or StorageConfig.SUBSCRIBERS_NAMESPACE
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._records: Optional[Dict[int, Dict[str, Any]]] = None
+        self._by_goal: Dict[Optional[str], set] = {}
+        self._dead: set = set()
+
+    @property
+    def storage(self):
+        """Хранилище подписок (глобальное, если не задано)"""
+        if self._storage is None:
+            self._storage = get_storage()
+        return self._storage
+
+    # === ЗАГРУЗКА И ИНДЕКСЫ ===
+    def _loaded(self) -> Dict[int, Dict[str, Any]]:
+        if self._records is None:
+            records = {int(chat_id): record for chat_id, record in self.storage.load_all(self.namespace).items()}
+            self._records = {}
+            for chat_id, record in records.items():
+                self._index(chat_id, record)
+            logger.info(f"Loaded {len(self._records)} subscribers ({len(self._dead)} dead)")
+        return self._records
+
+    def _index(self, chat_id: int, record: Dict[str, Any]) -> None:
+        self._unindex(chat_id)
+        self._records[chat_id] = record
+        self._by_goal.setdefault(record.get('goal'), set()).add(chat_id)
+        if record.get('dead'):
+            self._dead.add(chat_id)
+
+    def _unindex(self, chat_id: int) -> None:
+        record = self._records.pop(chat_id, None)
+        if record is None:
+            return
+        segment = self._by_goal.get(record.get('goal'))
+        if segment is not None:
+            segment.discard(chat_id)
+            if not segment:
+                del self._by_goal[record.get('goal')]
+        self._dead.discard(chat_id)
+
+    def _store(self, chat_id: int, record: Dict[str, Any]) -> None:
+        self._index(chat_id, record)
+        self.storage.set_user(self.namespace, chat_id, dict(record))
+
+    # === ПОДПИСКА ===
+    def add(self, chat_id: int, goal: Optional[str] = None) -> bool:
+        """Подписка (True - новая); повторная подписка возвращает недоступный чат в рассылки"""
+        with self._lock:
+            records = self._loaded()
+            record = records.get(chat_id)
+            now = self._clock()
+            if record is not None and not record.get('dead'):
+                return False
+            self._store(chat_id, {
+                'subscribed_at': record['subscribed_at'] if record else now,
+                'last_active': now,
+                'goal': goal or (record or {}).get('goal'),
+                'dead': False,
+            })
+            return True
+
+    def remove(self, chat_id: int) -> bool:
+        """Отписка (False - не был подписан)"""
+        with self._lock:
+            if chat_id not in self._loaded():
+                return False
+            self._unindex(chat_id)
+            self.storage.delete_user(self.namespace, chat_id)
+            return True
+
+    def touch(self, chat_id: int, goal: Optional[str] = None) -> None:
+        """Отметка активности подписчика (и его текущей цели); остальных не касается"""
+        with self._lock:
+            record = self._loaded().get(chat_id)
+            if record is None:
+                return
+            self._store(chat_id, dict(record, last_active=self._clock(), goal=goal or record.get('goal')))
+
+    def mark_dead(self, chat_ids) -> int:
+        """Отметка недоступных чатов (бот заблокирован); возвращает число новых"""
+        with self._lock:
+            records = self._loaded()
+            changed = {}
+            for chat_id in chat_ids:
+                record = records.get(chat_id)
+                if record is not None and not record.get('dead'):
+                    record = dict(record, dead=True)
+                    self._index(chat_id, record)
+                    changed[str(chat_id)] = dict(record)
+            if changed:
+                self.storage.set_many(self.namespace, changed)
+                logger.info(f"Marked {len(changed)} subscribers as dead")
+            return len(changed)
+
+    # === ВЫБОРКИ ===
+    def __contains__(self, chat_id) -> bool:
+        """Подписан и доступен"""
+        with self._lock:
+            return chat_id in self._loaded() and chat_id not in self._dead
+
+    def __len__(self) -> int:
+        """Число доступных подписчиков"""
+        with self._lock:
+            return len(self._loaded()) - len(self._dead)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.snapshot())
+
+    def snapshot(self, goal: Optional[str] = None, active_within: Optional[float] = None) -> Tuple[int, ...]:
+        """Получатели рассылки на текущий момент (копия, без недоступных чатов)
+
+        goal - только подписчики с этой целью, active_within - только активные
+        за последние active_within секунд.
+        """
+        with self._lock:
+            records = self._loaded()
+            chat_ids = self._by_goal.get(goal, set()) if goal is not None else records.keys()
+            since = self._clock() - active_within if active_within is not None else None
+            return tuple(sorted(
+                chat_id for chat_id in chat_ids
+                if chat_id not in self._dead and (since is None or records[chat_id]['last_active'] >= since)
+            ))
+
+    def stats(self) -> Dict[str, Any]:
+        """Статистика подписчиков"""
+        with self._lock:
+            records = self._loaded()
+            return {
+                'total': len(records),
+                'active': len(records) - len(self._dead),
+                'dead': len(self._dead),
+                'by_goal': {goal or 'unknown': len(chat_ids - self._dead) for goal, chat_ids in self._by_goal.items()},
+            }
+
+def parse_segment(text: str) -> Tuple[Optional[str], Optional[float], str]:
+    """Разбор сегмента в начале текста рассылки
+
+    '/broadcast цель=похудение активны=7 Текст' -> ('Похудение', 7 дней в секундах, 'Текст').
+    """
+    goal, active_within = None, None
+    words = text.split(' ')
+    while words:
+        key, separator, value = words[0].partition('=')
+        if not separator:
+            break
+        if key == 'цель' and value.lower() in GOAL_SEGMENTS:
+            goal = GOAL_SEGMENTS[value.lower()]
+        elif key == 'активны' and value.isdigit():
+            active_within = int(value) * 24 * 60 * 60
+        else:
+            break
+        words.pop(0)
+    return goal, active_within, ' '.join(words).strip()
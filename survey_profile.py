@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Анкета пользователя FitAdventure Bot
+SurveyProfile - компактная запись ответов (__slots__) вместо словаря:
+дискретные ответы хранятся как члены Enum, отвеченные шаги - битовой маской,
+поэтому проверка полноты анкеты - одно сравнение масок.
+Для совместимости с обработчиками и калькуляторами профиль ведет себя как словарь
+(profile['age'], profile.get('goal'), 'steps' in profile); значения Enum
+отдаются строками, как и раньше.
+"""
+
+from enum import Enum
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from nutrition_engine import REQUIRED_FIELDS, TRAINING_FIELDS
+
+# === ДИСКРЕТНЫЕ ОТВЕТЫ ===
+class Gender(Enum):
+    MALE = 'мужчина'
+    FEMALE = 'женщина'
+
+class Goal(Enum):
+    WEIGHT_LOSS = 'Похудение'
+    MAINTENANCE = 'Поддержание'
+    MUSCLE_GAIN = 'Набор массы'
+
+class Experience(Enum):
+    NONE = 'Нет опыта'
+    BEGINNER = 'Новичок'
+    INTERMEDIATE = 'Средний'
+    ADVANCED = 'Опытный'
+
+class ActivityType(Enum):
+    NONE = 'Нет'
+    STRENGTH = 'Силовые'
+    ENDURANCE = 'Выносливость'
+    CROSSFIT = 'Кроссфит'
+
+class Intensity(Enum):
+    LOW = 'low'
+    MODERATE = 'moderate'
+    HIGH = 'high'
+    VERY_HIGH = 'very_high'
+
+class Quality(Enum):
+    """Качество восстановления и сна"""
+    EXCELLENT = 'excellent'
+    GOOD = 'good'
+    AVERAGE = 'average'
+    POOR = 'poor'
+
+class Occupation(Enum):
+    OFFICE = 'office'
+    HEALTHCARE = 'healthcare'
+    CONSTRUCTION = 'construction'
+
+# Поля анкеты в порядке шагов опроса и их типы (Enum или функция приведения)
+FIELD_TYPES = {
+    'gender': Gender,
+    'age': int,
+    'weight': float,
+    'height': float,
+    'fat_percent': float,
+    'goal': Goal,
+    'has_training_experience': bool,
+    'training_experience': Experience,
+    'training_days': int,
+    'activity_type': ActivityType,
+    'workout_duration': int,
+    'steps': int,
+    'intensity': Intensity,
+    'recovery': Quality,
+    'sleep_quality': Quality,
+    'stress_level': int,
+    'occupation': Occupation,
+    'fat_category': str,  # вычисляется при расчете
+}
+FIELDS = tuple(FIELD_TYPES)
+FIELD_BITS = {field: 1 << position for position, field in enumerate(FIELDS)}
+
+def fields_mask(fields: Iterable[str]) -> int:
+    """Битовая маска набора полей"""
+    mask = 0
+    for field in fields:
+        mask |= FIELD_BITS[field]
+    return mask
+
+REQUIRED_MASK = fields_mask(REQUIRED_FIELDS)
+TRAINING_MASK = fields_mask(TRAINING_FIELDS)
+
+class SurveyProfile(MutableMapping):
+    """Ответы анкеты одного пользователя
+
+    Запись поля приводит значение к его типу (неизвестный вариант ответа -
+    ValueError) и отмечает шаг в маске answered; None допустим для любого поля.
+    """
+
+    __slots__ = FIELDS + ('answered',)
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None, **fields):
+        self.answered = 0
+        for field, value in {**(data or {}), **fields}.items():
+            self[field] = value
+
+    # === ДОСТУП КАК К СЛОВАРЮ ===
+    def __setitem__(self, field: str, value: Any) -> None:
+        bit = FIELD_BITS.get(field)
+        if bit is None:
+            raise KeyError(field)
+        if value is not None:
+            kind = FIELD_TYPES[field]
+            if type(value) is not kind:
+                value = kind(value)
+        setattr(self, field, value)
+        self.answered |= bit
+
+    def __getitem__(self, field: str) -> Any:
+        bit = FIELD_BITS.get(field)
+        if bit is None or not self.answered & bit:
+            raise KeyError(field)
+        value = getattr(self, field)
+        return value.value if isinstance(value, Enum) else value
+
+    def __delitem__(self, field: str) -> None:
+        bit = FIELD_BITS.get(field)
+        if bit is None or not self.answered & bit:
+            raise KeyError(field)
+        delattr(self, field)
+        self.answered &= ~bit
+
+    def __contains__(self, field: object) -> bool:
+        bit = FIELD_BITS.get(field)
+        return bit is not None and bool(self.answered & bit)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        bit = FIELD_BITS.get(field)
+        if bit is None or not self.answered & bit:
+            return default
+        value = getattr(self, field)
+        return value.value if isinstance(value, Enum) else value
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in FIELDS if self.answered & FIELD_BITS[field])
+
+    def __len__(self) -> int:
+        return bin(self.answered).count('1')
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SurveyProfile):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented if not isinstance(other, dict) else self.to_dict() == other
+
+    def __repr__(self) -> str:
+        return f"SurveyProfile({self.to_dict()})"
+
+    # === ПОЛНОТА АНКЕТЫ ===
+    def is_complete(self) -> bool:
+        """Все обязательные шаги пройдены (O(1))"""
+        answered = self.answered
+        if answered & REQUIRED_MASK != REQUIRED_MASK:
+            return False
+        if self.get('has_training_experience', True):
+            return answered & TRAINING_MASK == TRAINING_MASK
+        return True
+
+    def has_fields(self, mask: int) -> bool:
+        """Отвечены все поля маски (см. fields_mask)"""
+        return self.answered & mask == mask
+
+    def missing_fields(self) -> List[str]:
+        """Незаполненные обязательные поля (пустой список для полной анкеты)"""
+        if self.is_complete():
+            return []
+        missing = [field for field in REQUIRED_FIELDS if field not in self]
+        if self.get('has_training_experience', True):
+            missing += [field for field in TRAINING_FIELDS if field not in self]
+        return missing
+
+    # === СЕРИАЛИЗАЦИЯ ===
+    def to_dict(self) -> Dict[str, Any]:
+        """Ответы в виде обычного словаря (строковые значения Enum)"""
+        return {field: self[field] for field in self}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SurveyProfile':
+        """Профиль из словаря; неизвестные поля отбрасываются"""
+        return cls({field: value for field, value in data.items() if field in FIELD_BITS})
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты рассылки подписчикам
+"""
+
+import asyncio
+
+import pytest
+from telegram.error import Forbidden, NetworkError, RetryAfter
+
+from broadcast import Broadcaster, BroadcastJob, TokenBucket
+from storage import SQLiteStorage
+
+class FakeBot:
+    """Бот, который один раз отвечает ошибкой для заданных чатов"""
+
+    def __init__(self, errors=None):
+        self.errors = dict(errors or {})
+        self.delivered = []
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        error = self.errors.pop(chat_id, None)
+        if error is not None:
+            raise error
+        self.delivered.append(chat_id)
+
+def test_token_bucket_limits_rate():
+    """Сверх burst токены выдаются не чаще rate в секунду, RetryAfter ставит паузу"""
+    now = [0.0]
+
+    async def sleep(seconds):
+        now[0] += seconds
+
+    async def scenario():
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(6):
+            await bucket.acquire()
+        assert abs(now[0] - 0.4) < 1e-9
+        bucket.pause(3)
+        await bucket.acquire()
+        assert abs(now[0] - 3.5) < 1e-9
+
+    asyncio.run(scenario())
+
+def test_broadcast_retries_and_resumes(tmp_path):
+    """Повторы после RetryAfter и сетевых ошибок, заблокировавшие бота - без повторов, продолжение с контрольной точки"""
+    storage = SQLiteStorage(str(tmp_path / "broadcast.db"))
+    broadcaster = Broadcaster(storage, rate=1000, burst=10, concurrency=3, checkpoint_every=2)
+    bot = FakeBot({3: RetryAfter(0), 4: Forbidden("bot was blocked by the user"), 5: NetworkError("timeout")})
+    progress = []
+
+    async def on_progress(job):
+        progress.append(job.processed)
+
+    job = broadcaster.create_job("Привет", range(1, 11), admin_chat_id=99)
+    asyncio.run(broadcaster.run(bot, job, on_progress=on_progress))
+    assert sorted(bot.delivered) == [1, 2, 3, 5, 6, 7, 8, 9, 10]
+    assert (job.sent, job.failed, job.blocked, job.retries) == (9, 1, [4], 2)
+    assert progress[-1] == 10 and broadcaster.unfinished() == []
+
+    # Прерванная рассылка: продолжение отправляет только оставшимся
+    interrupted = broadcaster.create_job("Второе", [1, 2, 3, 4])
+    interrupted.done.update([1, 2])
+    interrupted.sent = 2
+    broadcaster.save(interrupted)
+    resumed = Broadcaster(storage, rate=1000, burst=10)
+    [pending] = resumed.unfinished()
+    bot = FakeBot()
+    asyncio.run(resumed.run(bot, pending))
+    assert sorted(bot.delivered) == [3, 4] and pending.sent == 4
+    assert resumed.load(pending.job_id).status == 'done'
+    storage.close()
+
+def test_broadcast_survives_unexpected_errors(tmp_path):
+    """Непредвиденная ошибка получателя - неудача, ошибка контрольной точки - запись в лог, упавший отправитель не вешает рассылку"""
+    storage = SQLiteStorage(str(tmp_path / "broadcast.db"))
+    broadcaster = Broadcaster(storage, rate=1000, burst=10, concurrency=2, checkpoint_every=1)
+    job = broadcaster.create_job("Привет", range(1, 6))
+
+    def disk_full(namespace, chat_id, data):
+        raise OSError("No space left on device")
+
+    storage.set_user = disk_full
+    bot = FakeBot({2: ValueError("bad chat id")})
+    asyncio.run(asyncio.wait_for(broadcaster.run(bot, job), timeout=5))
+    assert sorted(bot.delivered) == [1, 3, 4, 5]
+    assert (job.sent, job.failed, job.status) == (4, 1, 'done')
+
+    class BrokenBucket:
+        async def acquire(self):
+            raise RuntimeError("bucket broken")
+
+    broken = Broadcaster(storage, concurrency=2, bucket=BrokenBucket())
+    job = BroadcastJob("Второе", [1, 2, 3])
+    with pytest.raises(RuntimeError):
+        asyncio.run(asyncio.wait_for(broken.run(FakeBot(), job), timeout=5))
+    assert job.status == 'running' and broken.active == set()
+    storage.close()
+
+def test_subscriber_registry_segments_and_dead_chats(tmp_path):
+    """Подписки переживают перезапуск, снимок не меняется при отписке, недоступные чаты пропускаются"""
+    from subscribers import SubscriberRegistry, parse_segment
+
+    now = [1000.0]
+    storage = SQLiteStorage(str(tmp_path / "subscribers.db"))
+    registry = SubscriberRegistry(storage, clock=lambda: now[0])
+    assert registry.add(1, goal='Похудение') and registry.add(2) and registry.add(3, goal='Похудение')
+    assert not registry.add(1)
+    now[0] += 10 * 24 * 60 * 60
+    registry.touch(2, goal='Набор массы')
+
+    snapshot = registry.snapshot()
+    assert registry.remove(3) and not registry.remove(3)
+    assert snapshot == (1, 2, 3) and registry.snapshot() == (1, 2)
+    assert registry.snapshot(goal='Похудение') == (1,)
+    assert registry.snapshot(active_within=24 * 60 * 60) == (2,)
+
+    assert registry.mark_dead([1, 1, 42]) == 1
+    assert 1 not in registry and len(registry) == 1
+
+    restarted = SubscriberRegistry(storage, clock=lambda: now[0])
+    assert restarted.snapshot() == (2,)
+    assert restarted.stats() == {'total': 2, 'active': 1, 'dead': 1, 'by_goal': {'Похудение': 0, 'Набор массы': 1}}
+    assert restarted.add(1) and restarted.snapshot(goal='Похудение') == (1,)
+    storage.close()
+
+    assert parse_segment('цель=набор активны=7 Привет всем') == ('Набор массы', 7 * 24 * 60 * 60, 'Привет всем')
+    assert parse_segment('Привет=всем') == (None, None, 'Привет=всем')
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты таблицы маршрутов кнопок
+"""
+
+import asyncio
+import logging
+import time
+
+import pytest
+from telegram import Update
+
+from bot_logging import DroppingQueueHandler
+from button_router import ButtonRouter, normalize_button
+from config import Keyboards
+
+def make_update(text: str) -> Update:
+    return Update.de_json({
+        'update_id': 1,
+        'message': {'message_id': 1, 'date': int(time.time()), 'text': text,
+                    'chat': {'id': 1, 'type': 'private'}}
+    }, None)
+
+def test_routes_follow_keyboards():
+    """Кнопку вне клавиатуры привязать нельзя; состояние уточняет общий маршрут"""
+    async def start(update, context):
+        return 'start'
+
+    async def about(update, context):
+        return 'about'
+
+    async def fallback(update, context):
+        return 'text'
+
+    with pytest.raises(ValueError):
+        ButtonRouter().add(Keyboards.MAIN_MENU, {'🚀 Начать заново': start})
+
+    router = (ButtonRouter()
+              .add(Keyboards.MAIN_MENU, {'🚀 Начать': start, '📊 О боте': about})
+              .add(Keyboards.MAIN_MENU, {'📊 О боте': start}, states=('special',)))
+    assert normalize_button(' ⚖️  Поддержание ') == normalize_button('⚖ поддержание')
+    assert router.resolve('any', '🚀  начать') is start
+    assert router.resolve('special', '📊 О боте') is start
+    assert router.resolve('any', '📊 О боте') is about
+    assert router.resolve('any', '75') is None
+
+    # Без default обработчик состояния пропускает обычный текст дальше по списку
+    handler = router.handler('survey')
+    assert handler.check_update(make_update('🚀 Начать'))
+    assert not handler.check_update(make_update('75'))
+    assert not handler.check_update(make_update('/start'))
+    assert asyncio.run(handler.callback(make_update('🚀 Начать'), None)) == 'start'
+    assert asyncio.run(router.handler('menu', default=fallback).callback(make_update('75'), None)) == 'text'
+
+def test_bot_routes_built_from_config():
+    """Маршруты бота и мини-приложений собраны из config.Keyboards"""
+    import main
+    # Импорт модуля бота не настраивает логирование (это делает main.main())
+    assert not any(isinstance(handler, DroppingQueueHandler) for handler in logging.getLogger().handlers)
+    from mini_apps import mini_apps_buttons
+    from products_mini_app import products_buttons, show_category_for_goal
+
+    # Посреди анкеты перехватываются только общие кнопки
+    assert main.buttons.buttons(main.AGE) == tuple(sorted(
+        normalize_button(button) for button in ('🚀 Начать', '❓ Помощь', '📊 О боте')))
+    assert main.buttons.resolve(main.GENDER, 'мужчина') is main.gender
+    assert main.buttons.resolve(main.PRODUCTS_MENU, '🥩 Белки') is main.handle_products_category
+    assert main.buttons.resolve(main.GENDER, '🥩 Белки').keywords == {'category': 'белки'}
+    assert main.buttons.resolve(main.GENDER, '🔙 Назад к приложениям') is main.back_to_mini_apps
+    assert main.buttons.resolve(main.PRODUCTS_MENU, '🔙 Главное меню') is main.return_to_main_menu
+
+    assert mini_apps_buttons.buttons() == tuple(sorted(
+        normalize_button(button) for row in Keyboards.MINI_APPS_HUB for button in row))
+    category_route = products_buttons.resolve(None, '🌿 Клетчатка')
+    assert category_route.func is show_category_for_goal and category_route.keywords == {'category': 'клетчатка'}
+    assert products_buttons.resolve(None, 'гречка') is None
+
+def test_back_to_mini_apps_uses_config_layout():
+    """Меню мини-приложений из Keyboards.MINI_APPS_MENU, без пустых кнопок"""
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock
+    import main
+
+    update = SimpleNamespace(message=SimpleNamespace(reply_text=AsyncMock()))
+    assert asyncio.run(main.back_to_mini_apps(update, None)) == main.GENDER
+    markup = update.message.reply_text.call_args.kwargs['reply_markup']
+    assert [[button.text for button in row] for row in markup.keyboard] == Keyboards.MINI_APPS_MENU
+    assert markup.keyboard[0][0].web_app is not None
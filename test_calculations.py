@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты расчетов питания
+"""
+
+from bounded_cache import BoundedCache
+from calculations import NutritionCalculator, CACHE_KEY_FIELDS
+from reference_data import random_profiles
+
+USER_DATA = {
+    'weight': 80, 'height': 180, 'age': 30, 'gender': 'мужчина', 'steps': 8000,
+    'occupation': 'office', 'recovery': 'good', 'sleep_quality': 'good', 'stress_level': 5,
+    'goal': 'Похудение', 'has_training_experience': True, 'training_days': 3,
+    'activity_type': 'Силовые', 'intensity': 'moderate', 'workout_duration': 60
+}
+
+def test_bounded_cache_lru_and_ttl():
+    """LRU вытесняет давние записи, TTL - устаревшие"""
+    now = [0.0]
+    cache = BoundedCache(max_size=2, ttl=10, clock=lambda: now[0])
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1          # 'a' становится самой свежей
+    cache.set('c', 3)                   # вытесняется 'b'
+    assert cache.get('b') is None
+    assert len(cache) == 2
+
+    now[0] = 10
+    assert cache.get('a') is None       # срок жизни истек
+    assert cache.stats() == {
+        'size': 1, 'max_size': 2, 'ttl': 10, 'hits': 1, 'misses': 2,
+        'evictions': 1, 'expirations': 1, 'hit_rate': 33.33
+    }
+
+def test_calculator_cache_key_and_stats():
+    """Одинаковые данные с разной записью чисел попадают в одну запись кэша"""
+    calculator = NutritionCalculator(cache_size=2)
+
+    first = calculator.calculate_nutrition_plan(USER_DATA)
+    assert calculator.calculate_nutrition_plan(dict(USER_DATA, weight=80.0)) is first
+    assert calculator.calculate_nutrition_plan(dict(USER_DATA, weight=80.0000001)) is first
+
+    calculator.calculate_nutrition_plan(dict(USER_DATA, weight=81))
+    calculator.calculate_nutrition_plan(dict(USER_DATA, weight=82))
+
+    stats = calculator.get_cache_stats()
+    assert stats['cache_size'] == 2
+    assert (stats['cache_hits'], stats['cache_misses'], stats['cache_evictions']) == (2, 3, 1)
+
+    calculator.clear_cache()
+    assert calculator.get_cache_stats()['cache_size'] == 0
+
+def test_calculate_batch_matches_scalar():
+    """Пакетный расчет совпадает со скалярным для каждого профиля"""
+    calculator = NutritionCalculator()
+    profiles = random_profiles(3000)
+    batch = calculator.calculate_batch(profiles)
+
+    for i, profile in enumerate(profiles):
+        expected = calculator.calculate_nutrition_plan(profile)
+        for key, value in expected.items():
+            assert batch[key][i] == value, (i, key, batch[key][i], value)
+
+    # Столбцовый ввод дает тот же результат
+    columns = {field: [profile.get(field) for profile in profiles] for field in CACHE_KEY_FIELDS}
+    assert (calculator.calculate_batch(columns)['target_calories_average'] == batch['target_calories_average']).all()
+
+def test_nutrition_engine_is_shared():
+    """Все точки входа считают план одним движком с неизменяемыми таблицами"""
+    import pytest
+    import nutrition_engine
+    from calculations import generate_ultra_precise_recommendations
+
+    plan = nutrition_engine.calculate_plan(USER_DATA)
+    assert plan['engine_version'] == nutrition_engine.ENGINE_VERSION
+    assert generate_ultra_precise_recommendations(dict(USER_DATA)) == plan
+    assert nutrition_engine.fat_category(14.0, 'мужчина') == "Фитнес"
+
+    with pytest.raises(TypeError):
+        nutrition_engine.FACTORS.goal['Похудение'] = 0
+    with pytest.raises(ValueError):
+        nutrition_engine.calculate_plan({'weight': 80})
+
+def test_ultra_precise_tables_hoisted():
+    """Калькулятор v5.0 читает таблицы модуля и дает прежний результат"""
+    import ultra_precise_formulas as ultra
+    from benchmark_ultra_precise import PROFILE
+
+    result = ultra.generate_maximum_precision_recommendations(PROFILE)
+    assert (result['target_calories'], result['tdee'], result['bmr'], result['lbm']) == (2128, 2533, 1540, 53.3)
+
+    calculator = ultra.UltraPreciseCalculatorV5()
+    assert calculator.get_adaptive_tdee(2000, 0, 0, 0, sleep_quality='very_poor') == 2000 * ultra.SLEEP_TDEE_FACTORS['very_poor']
+    assert calculator.get_ultra_precise_tef(100, 0, 0, 30, digestive_health='poor') == 100 * 4 * 0.25 * ultra.DIGESTIVE_TEF_FACTORS['poor']
+
+def test_factor_grid_matches_formulas():
+    """Расчет через сетку факторов совпадает с формулами, включая ответы вне сетки"""
+    import nutrition_engine
+
+    grid = nutrition_engine.FactorGrid()
+    calculator = NutritionCalculator(precompute=True)
+    profiles = random_profiles(2000, seed=11)
+    odd = dict(profiles[0], occupation='other', stress_level=5.5, training_days=0, has_training_experience=True)
+    for profile in profiles + [odd]:
+        expected = nutrition_engine.compute_plan(profile)
+        assert grid.compute_plan(profile) == expected
+        assert calculator.calculate_nutrition_plan(profile) == expected
+
+def test_survey_profile_is_dict_compatible():
+    """Анкета SurveyProfile: приведение ответов, маска шагов и тот же расчет, что по словарю"""
+    import json
+    import pytest
+    import nutrition_engine
+    from bot_persistence import encode_chat_data, decode_chat_data
+    from survey_profile import SurveyProfile, Goal, fields_mask
+
+    profile = SurveyProfile(gender='мужчина', age='30')
+    assert profile['age'] == 30 and profile.gender is profile.gender.MALE
+    assert 'weight' not in profile and not profile.is_complete()
+    assert profile.missing_fields()[:2] == ['weight', 'height']
+    with pytest.raises(ValueError):
+        profile['goal'] = 'Сушка'
+    with pytest.raises(KeyError):
+        profile['unknown'] = 1
+
+    profile.update(USER_DATA)
+    assert profile.is_complete() and profile.missing_fields() == []
+    assert profile.goal is Goal.WEIGHT_LOSS and profile == USER_DATA
+    assert profile.has_fields(fields_mask(['steps', 'goal']))
+    del profile['steps']
+    assert not profile.is_complete() and profile.get('steps', 0) == 0
+
+    calculator = NutritionCalculator()
+    for data in random_profiles(300, seed=17):
+        if data['occupation'] == 'other':
+            continue
+        assert calculator.calculate_nutrition_plan(SurveyProfile(data)) == nutrition_engine.compute_plan(data)
+
+    stored = json.loads(json.dumps(encode_chat_data({'survey': SurveyProfile(USER_DATA), 'survey_touched': 1.0})))
+    restored = decode_chat_data(stored)
+    assert isinstance(restored['survey'], SurveyProfile) and restored['survey'] == USER_DATA
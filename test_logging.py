@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты логирования через очередь
+"""
+
+import logging
+import queue
+
+import bot_logging
+from bot_logging import DroppingQueueHandler, SamplingFilter
+from config import LoggingConfig
+
+def test_sampling_and_dropping():
+    """Прореживание по шаблону сообщения и отбрасывание при полной очереди"""
+    sampling = SamplingFilter(every=10)
+    hot = [logging.LogRecord('calculations', logging.DEBUG, __file__, 1, "Cache hit! Total hits: %d", (i,), None)
+           for i in range(25)]
+    rare = logging.LogRecord('calculations', logging.DEBUG, __file__, 1, "Cache miss!", (), None)
+    error = logging.LogRecord('calculations', logging.ERROR, __file__, 1, "Failed: %s", ('x',), None)
+    assert [record.args[0] for record in hot if sampling.filter(record)] == [0, 10, 20]
+    assert sampling.filter(rare) and sampling.filter(error) and sampling.filter(error)
+
+    handler = DroppingQueueHandler(queue.Queue(2))
+    for record in hot[:5]:
+        handler.handle(record)
+    assert handler.queue.qsize() == 2 and handler.dropped == 3
+    # Сообщение собрано в вызывающем потоке: поток записи не обращается к аргументам
+    queued = handler.queue.get_nowait()
+    assert queued.msg == "Cache hit! Total hits: 0" and queued.args is None
+
+def test_message_captures_arguments_at_call_time():
+    """Изменение аргумента после вызова логгера не меняет записанное сообщение"""
+    handler = DroppingQueueHandler(queue.Queue())
+    logger = logging.getLogger('test_logging.capture')
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        profile = {'goal': 'Похудение'}
+        logger.info("User data: %s", profile)
+        profile['goal'] = 'Набор массы'
+        logger.debug("below level: %s", profile)
+    finally:
+        logger.removeHandler(handler)
+    assert handler.queue.qsize() == 1
+    assert handler.queue.get_nowait().getMessage() == "User data: {'goal': 'Похудение'}"
+
+def test_setup_logging_rotates_file(tmp_path, monkeypatch):
+    """Записи доходят до файла через поток QueueListener, файл ротируется по размеру"""
+    monkeypatch.setattr(LoggingConfig, 'MAX_BYTES', 2000)
+    monkeypatch.setattr(LoggingConfig, 'BACKUP_COUNT', 2)
+    monkeypatch.setattr(LoggingConfig, 'SAMPLING', {})
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    log_file = tmp_path / "bot.log"
+    try:
+        bot_logging.setup_logging(level='INFO', log_file=str(log_file), console=False)
+        logger = logging.getLogger('test_logging')
+        for index in range(200):
+            logger.info("Plan %d calculated for %s", index, {'goal': 'Похудение'})
+        logger.debug("not written")
+        bot_logging.stop_logging()
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    files = sorted(path.name for path in tmp_path.iterdir())
+    assert files == ['bot.log', 'bot.log.1', 'bot.log.2']
+    assert all(path.stat().st_size <= 2000 for path in tmp_path.iterdir())
+    assert "Plan 199 calculated for {'goal': 'Похудение'}" in log_file.read_text(encoding='utf-8')
+    assert "not written" not in log_file.read_text(encoding='utf-8')
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты метрик Prometheus
+"""
+
+import asyncio
+import urllib.request
+
+from telegram.ext import CommandHandler, ConversationHandler, MessageHandler, filters
+
+import metrics
+from metrics import Registry
+
+def test_histogram_buckets_and_text_format():
+    """Корзины накопительные, _count совпадает с +Inf, квантиль попадает в корзину"""
+    registry = Registry()
+    histogram = registry.histogram('test_seconds', 'Тестовая задержка', ('handler',), buckets=(0.01, 0.1, 1.0))
+    counter = registry.counter('test_total', 'Тестовый счетчик', ('result',))
+    for value in (0.005, 0.05, 0.05, 0.5, 5.0):
+        histogram.observe(value, 'weight')
+    counter.inc('hit')
+    counter.inc('hit', amount=2)
+
+    text = registry.render()
+    assert '# TYPE test_seconds histogram' in text
+    assert 'test_seconds_bucket{handler="weight",le="0.01"} 1' in text
+    assert 'test_seconds_bucket{handler="weight",le="0.1"} 3' in text
+    assert 'test_seconds_bucket{handler="weight",le="+Inf"} 5' in text
+    assert 'test_seconds_count{handler="weight"} 5' in text
+    assert 'test_total{result="hit"} 3' in text
+    assert 0.01 < histogram.quantile(0.5, 'weight') <= 0.1
+    assert registry.counter('test_total', 'Повторная регистрация', ('result',)) is counter
+
+def test_application_handlers_instrumented_and_exported():
+    """Обработчики внутри ConversationHandler замеряются, метрики отдаются по HTTP"""
+    async def ask_weight(update, context):
+        return 1
+
+    async def failing(update, context):
+        raise RuntimeError("boom")
+
+    class FakeApplication:
+        handlers = {0: [
+            ConversationHandler(
+                entry_points=[CommandHandler('start', ask_weight)],
+                states={1: [MessageHandler(filters.TEXT, ask_weight)]},
+                fallbacks=[CommandHandler('cancel', failing)],
+            ),
+            CommandHandler('help', ask_weight),
+        ]}
+
+    application = FakeApplication()
+    assert metrics.instrument_application(application) == 4
+    assert metrics.instrument_application(application) == 4  # повторно не оборачивается
+
+    conversation = application.handlers[0][0]
+    name = ask_weight.__qualname__
+    before = metrics.HANDLER_SECONDS.count(name)
+    assert asyncio.run(conversation.states[1][0].callback(None, None)) == 1
+    assert metrics.HANDLER_SECONDS.count(name) == before + 1
+    try:
+        asyncio.run(conversation.fallbacks[0].callback(None, None))
+    except RuntimeError:
+        pass
+    assert metrics.HANDLER_ERRORS.value(failing.__qualname__) == 1
+
+    server = metrics.start_metrics_server(port=0)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+        assert response.headers['Content-Type'].startswith('text/plain')
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert f'fitadventure_handler_duration_seconds_count{{handler="{name}"}}' in body
+    assert 'fitadventure_calculator_cache_entries' in body
+
+def test_metrics_server_port_in_use():
+    """Занятый порт не мешает запуску: экспорт просто не поднимается"""
+    server = metrics.start_metrics_server(port=0)
+    try:
+        assert metrics.start_metrics_server(port=server.server_address[1]) is None
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_survey_session_gauges():
+    """Брошенные сессии и скорость вытеснения экспортируются из SurveyStateStore"""
+    from bot_persistence import SurveyStateStore
+
+    now = [0.0]
+    store = SurveyStateStore(ttl=1000, max_sessions=2, abandon_after=50, clock=lambda: now[0])
+    for chat_id in range(3):  # третья сессия вытесняет первую (LRU)
+        store[chat_id] = {'step': chat_id}
+    now[0] = 1800
+    store[3] = {'step': 3}  # вытесняет вторую; третья брошена
+
+    metrics.track_survey_sessions(store)
+    assert metrics.SURVEY_SESSIONS.value() == 2
+    assert metrics.SURVEY_SESSIONS_ABANDONED.value() == 1
+    assert metrics.SURVEY_EVICTIONS_PER_HOUR.value() == 4.0
+    text = metrics.REGISTRY.render()
+    assert 'fitadventure_survey_sessions_abandoned 1' in text
+    assert 'fitadventure_survey_session_evictions_per_hour 4' in text
@@ -52,5 +52,192 @@ def test_products_database():
     
     print("\n✅ Тестирование завершено!")
 
+def test_search_index_matches_scan():
+    """Индексный поиск совпадает с линейным проходом по базе"""
+    from products_database import PRODUCTS_INDEX
+    from products_index import scan_search
+
+    for query in ["овсянка", "рис", "а", "гр", "куриная грудка", "творог 5%", "xyz"]:
+        assert search_product(query) == scan_search(PRODUCTS_DATABASE, query)
+
+    prefix_results = PRODUCTS_INDEX.search_prefix("рис")
+    names = {name for categories in prefix_results.values() for products in categories.values() for name in products}
+    assert names and all(name.startswith("рис") for name in names)
+
+def test_fuzzy_search_tolerates_typos():
+    """Нечеткий поиск находит продукт при опечатках, словоформах и латинице"""
+    from products_database import PRODUCTS_INDEX, search_product_fuzzy
+
+    def top(query):
+        ranked = PRODUCTS_INDEX.rank(query, 3)
+        return PRODUCTS_INDEX.names[ranked[0][1]] if ranked else None
+
+    assert top("куринная грудка") == "куриная грудка"
+    assert top("kуриная грудка") == "куриная грудка"
+    assert top("авакадо") == "авокадо"
+    assert top("творог 5") == "творог 5%"
+    assert top("мёд") == "мед"
+    assert top("гречка ядрица") == "гречка"
+    assert PRODUCTS_INDEX.rank("xyzqw") == []
+
+    scores = [score for score, _ in PRODUCTS_INDEX.rank("творог", 10)]
+    assert scores == sorted(scores, reverse=True)
+    assert any(search_product_fuzzy("грутка").values())
+
+def scan_filter(goal=None, conditions=()):
+    """Эталонный отбор вложенными циклами"""
+    import operator
+    ops = {'>': operator.gt, '<': operator.lt, '>=': operator.ge}
+    rows = []
+    for goal_name, categories in PRODUCTS_DATABASE.items():
+        for category, products in categories.items():
+            for name, data in products.items():
+                if goal is not None and goal_name != goal:
+                    continue
+                if all(ops[op](data[column], value) for column, op, value in conditions):
+                    rows.append((name, data))
+    return rows
+
+def test_product_table_vectorized():
+    """Колоночная таблица дает те же выборки, что и обход вложенной базы"""
+    import products_table
+    from products_database import PRODUCTS_TABLE, filter_products, get_recommended_products, get_products_by_category
+
+    conditions = [('белки', '>', 20), ('калории', '<', 150)]
+    assert filter_products(conditions=conditions) == scan_filter(conditions=conditions)
+    assert filter_products('похудение', conditions=conditions) == scan_filter('похудение', conditions)
+    assert filter_products(goal='нет_такой_цели') == []
+
+    # Сортировка и топ-N
+    expected = sorted(scan_filter('набор_массы'), key=lambda item: -item[1]['белки'])
+    proteins = [data['белки'] for _, data in filter_products('набор_массы', sort_by='белки', descending=True)]
+    assert proteins == [data['белки'] for _, data in expected]
+    top = filter_products('набор_массы', sort_by='белки', descending=True, limit=5)
+    assert [data['белки'] for _, data in top] == proteins[:5]
+
+    # Объединенные категории и порядок строк
+    assert get_recommended_products('похудение', 'углеводы', 3) == \
+        list(get_products_by_category('похудение', 'углеводы').items())[:3]
+    assert len(PRODUCTS_TABLE) == sum(len(p) for c in PRODUCTS_DATABASE.values() for p in c.values())
+
+    # Запасной вариант без NumPy дает тот же результат
+    original = products_table.NUMPY_AVAILABLE
+    products_table.NUMPY_AVAILABLE = False
+    try:
+        fallback = products_table.ProductTable(PRODUCTS_DATABASE)
+        rows = fallback.top('белки', 5, fallback.filter('набор_массы'))
+        assert fallback.items(rows) == top
+        assert fallback.items(fallback.filter(conditions=conditions)) == scan_filter(conditions=conditions)
+        for args in [('белки', True, 4, 0, None), ('название', False, 5, 3, None), ('жиры', False, 3, 0, 10)]:
+            assert fallback.page(fallback.filter('похудение'), *args) == \
+                PRODUCTS_TABLE.page(PRODUCTS_TABLE.filter('похудение'), *args)
+    finally:
+        products_table.NUMPY_AVAILABLE = original
+
+def test_products_query_api():
+    """/api/products/query повторяет passesFilters и sortProducts и листает страницы"""
+    import webapp_products
+
+    client = webapp_products.app.test_client()
+    database = webapp_products.PRODUCTS_DATABASE
+
+    # Эталон как в браузере: фильтр по уровням, стабильная сортировка по убыванию белков
+    expected = [
+        (name, data) for categories in database.values() for products in categories.values()
+        for name, data in products.items()
+        if data['белки'] >= 15 and data['калории'] <= 300
+    ]
+    expected.sort(key=lambda item: -item[1]['белки'])
+
+    names, cursor = [], None
+    while True:
+        url = '/api/products/query?protein=high&calories_max=300&sort=protein&limit=7'
+        page = client.get(url + (f'&cursor={cursor}' if cursor else '')).get_json()
+        assert page['total'] == len(expected)
+        names += [item['name'] for item in page['items']]
+        cursor = page['next_cursor']
+        if cursor is None:
+            break
+    assert names == [name for name, _ in expected]
+
+    # offset-пагинация и фильтр по цели и категории
+    page = client.get('/api/products/query?goal=похудение&category=белки&sort=name&offset=2&limit=3').get_json()
+    assert [item['name'] for item in page['items']] == sorted(database['похудение']['белки'])[2:5]
+
+    assert client.get('/api/products/query?sort=sugar').status_code == 400
+    assert client.get('/api/products/query?limit=1000').status_code == 400
+    assert client.get('/api/products/query?sort=fat&cursor=bad').status_code == 400
+
+    # Маршрут учитывается по шаблону, а не по фактическому пути; наружу метрики не отдаются
+    from metrics import REGISTRY
+    assert client.get('/metrics').status_code == 404
+    body = REGISTRY.render()
+    assert ('fitadventure_http_responses_total{route="/api/products/query",method="GET",status="400"} 3'
+            in body)
+
+def test_webapp_assets_are_versioned(tmp_path):
+    """Файлы данных веб-приложения именуются по хэшу содержимого"""
+    import json
+    import build_webapp_assets as build
+    import webapp_products
+
+    assets = build.build_assets()
+    products_name = next(name for name in assets if name.startswith('products.'))
+    bundle = json.loads(assets[products_name])
+    source = json.loads(build.PRODUCTS_SOURCE.read_text(encoding='utf-8'))
+    assert bundle == source and len(bundle['простые_углеводы']['похудение']) == 119
+    assert build.build_assets() == assets
+
+    # Старые версии удаляются, манифест в HTML обновляется
+    html_file = tmp_path / 'page.html'
+    html_file.write_text('<script>\n    // ASSETS:BEGIN\n    const ASSETS = {};\n    // ASSETS:END\n</script>', encoding='utf-8')
+    (tmp_path / 'products.000000000000.json').write_text('{}', encoding='utf-8')
+    build.write_assets(html_file, assets)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(['page.html', *assets])
+    assert f'"products": "{products_name}"' in html_file.read_text(encoding='utf-8')
+
+    # Flask отдает текущие файлы с бессрочным кэшем
+    client = webapp_products.app.test_client()
+    response = client.get('/' + products_name)
+    assert response.status_code == 200
+    assert 'immutable' in response.headers['Cache-Control']
+    response.close()
+    assert client.get('/products.latest.json').status_code == 404
+
+def test_static_api_precompressed_with_etag():
+    """Статические ответы API: сжатие, ETag и 304"""
+    import gzip
+    import http_cache
+    import webapp_products
+
+    client = webapp_products.app.test_client()
+    plain = client.get('/api/products/похудение')
+    assert plain.get_json() == webapp_products.PRODUCTS_DATABASE['похудение']
+    assert 'Content-Encoding' not in plain.headers
+
+    compressed = client.get('/api/products/похудение', headers={'Accept-Encoding': 'gzip;q=0.5, identity'})
+    assert compressed.headers['Content-Encoding'] == 'gzip'
+    assert gzip.decompress(compressed.data) == plain.data
+    assert compressed.headers['ETag'] != plain.headers['ETag']
+    assert compressed.headers['Vary'] == 'Accept-Encoding'
+
+    if http_cache.BROTLI_AVAILABLE:
+        response = client.get('/api/goals', headers={'Accept-Encoding': 'gzip, br'})
+        assert response.headers['Content-Encoding'] == 'br'
+
+    # Повторные запросы: 304 по ETag любого представления и по дате
+    for url in ('/api/products/похудение', '/api/categories', '/api/goals'):
+        etag = client.get(url).headers['ETag']
+        assert client.get(url, headers={'If-None-Match': etag, 'Accept-Encoding': 'gzip'}).status_code == 304
+        assert client.get(url, headers={'If-None-Match': '"stale"'}).status_code == 200
+        last_modified = client.get(url).headers['Last-Modified']
+        assert client.get(url, headers={'If-Modified-Since': last_modified}).status_code == 304
+
+    assert http_cache.parse_accept_encoding('gzip;q=0, br') == {'gzip': 0.0, 'br': 1.0}
+
 if __name__ == "__main__":
-    test_products_database() 
\ No newline at end of file
+    test_products_database()
+    test_search_index_matches_scan()
+    test_fuzzy_search_tolerates_typos()
+    test_product_table_vectorized()
+    test_products_query_api() 
\ No newline at end of file
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты слоя отрисовки ответов
+"""
+
+import datetime
+
+import pytest
+
+import rendering
+from reference_data import (legacy_product_details, legacy_results, legacy_water_statistics,
+                            sample_products, sample_results)
+from config import Keyboards
+from products_database import PRODUCTS_DATABASE
+
+def test_results_match_previous_messages():
+    """Шаблоны плана питания дают тот же текст и ту же клавиатуру, что и прежние f-строки"""
+    samples = sample_results()
+    assert {results['has_training_experience'] for results, in samples} == {True, False}
+    for results, in samples:
+        text, markup = legacy_results(results)
+        assert rendering.render_results(results) == text
+        assert rendering.keyboard_markup('RESULTS_MENU', web_apps=True) == markup
+
+    with pytest.raises(KeyError):
+        rendering.RESULTS_NO_TRAINING.render({'precision_score': 90})
+
+def test_keyboards_built_once():
+    """Клавиатура строится один раз на раскладку и параметры"""
+    markup = rendering.keyboard_markup('BACK_TO_CATEGORIES')
+    assert rendering.keyboard_markup('BACK_TO_CATEGORIES') is markup
+    assert rendering.keyboard_markup('BACK_TO_CATEGORIES', one_time_keyboard=True) is not markup
+    assert [[button.text for button in row] for row in markup.keyboard] == Keyboards.BACK_TO_CATEGORIES
+    with pytest.raises(AttributeError):
+        markup.resize_keyboard = False  # общий объект неизменяем
+
+def test_product_cards_match_previous_details():
+    """Карточка каждого продукта совпадает с прежней и берется из кэша"""
+    products = [(name, goal) for goal, categories in PRODUCTS_DATABASE.items()
+                for products in categories.values() for name in products]
+    for name, goal in products + sample_products() + [('несуществующий продукт', 'похудение')]:
+        card, _ = legacy_product_details(name, goal)
+        assert rendering.product_card(name, goal) == card
+    assert rendering.product_card(*products[0]) is rendering.product_card(*products[0])
+
+def test_water_statistics_match_previous_text():
+    today = datetime.date(2026, 10, 18)
+    water = {(today - datetime.timedelta(days=day)).isoformat(): 450 * day for day in range(9)}
+    assert rendering.render_water_statistics(water, today) == legacy_water_statistics(water, today)
+    assert rendering.render_water_statistics({}, today) == legacy_water_statistics({}, today)
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты хранилища данных пользователей
+"""
+
+import json
+import time
+import sqlite3
+
+import pytest
+
+from storage import SQLiteStorage, JSONFileStorage, CachedStorage, migrate_json_to_sqlite
+
+def test_sqlite_row_level_reads_and_writes(tmp_path):
+    """Чтение и запись отдельных пользователей в SQLite"""
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+
+    storage.set_user('mini_apps', 1, {'water': {'2025-07-23': 250}})
+    storage.set_user('mini_apps', '2', {'goal': 'похудение'})
+
+    assert storage.get_user('mini_apps', '1') == {'water': {'2025-07-23': 250}}
+    assert storage.get_user('mini_apps', 2) == {'goal': 'похудение'}
+    assert storage.get_user('products', 1) == {}
+    assert storage.count('mini_apps') == 2
+
+    storage.delete_user('mini_apps', 1)
+    assert storage.load_all('mini_apps') == {'2': {'goal': 'похудение'}}
+    storage.close()
+
+def test_sqlite_batch_rollback(tmp_path):
+    """Пакетная запись фиксируется целиком или откатывается"""
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+
+    with storage.batch():
+        for chat_id in range(100):
+            storage.set_user('mini_apps', chat_id, {'n': chat_id})
+    assert storage.count('mini_apps') == 100
+
+    try:
+        with storage.batch():
+            storage.set_user('mini_apps', 'lost', {'n': -1})
+            raise RuntimeError("сбой посреди пакета")
+    except RuntimeError:
+        pass
+    assert storage.get_user('mini_apps', 'lost') == {}
+    storage.close()
+
+def test_update_user_is_read_modify_write(tmp_path):
+    """Изменения одного пользователя не затирают данные других"""
+    db_file = str(tmp_path / "test.db")
+    first = SQLiteStorage(db_file)
+    second = SQLiteStorage(db_file)
+
+    def add_water(data):
+        water = data.setdefault('water', {})
+        water['today'] = water.get('today', 0) + 250
+
+    first.update_user('mini_apps', 1, add_water)
+    second.update_user('mini_apps', 2, add_water)
+    second.update_user('mini_apps', 1, add_water)
+
+    assert first.get_user('mini_apps', 1) == {'water': {'today': 500}}
+    assert first.get_user('mini_apps', 2) == {'water': {'today': 250}}
+    first.close()
+    second.close()
+
+def test_json_migration(tmp_path):
+    """Однократный перенос JSON-файла в SQLite"""
+    json_file = tmp_path / "user_mini_apps_data.json"
+    legacy = {'100': {'goals': {'1': {'name': 'Сбросить 5 кг', 'target': 5.0}}}, '200': {}}
+    json_file.write_text(json.dumps(legacy, ensure_ascii=False), encoding='utf-8')
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    assert migrate_json_to_sqlite(str(json_file), 'mini_apps', storage) == 2
+    assert storage.load_all('mini_apps') == legacy
+    assert migrate_json_to_sqlite(str(tmp_path / "missing.json"), 'mini_apps', storage) == 0
+    storage.close()
+
+def test_json_backend_same_interface(tmp_path):
+    """JSON-бэкенд реализует тот же интерфейс"""
+    storage = JSONFileStorage({'products': str(tmp_path / "products.json")})
+
+    storage.set_user('products', 7, {'goal': 'набор_массы'})
+    storage.update_user('products', 7, lambda data: data.update(viewed=1))
+
+    assert storage.get_user('products', '7') == {'goal': 'набор_массы', 'viewed': 1}
+    assert json.loads((tmp_path / "products.json").read_text(encoding='utf-8')) == {
+        '7': {'goal': 'набор_массы', 'viewed': 1}
+    }
+
+def test_cached_storage_write_behind(tmp_path):
+    """Записи копятся в памяти и сбрасываются пачкой"""
+    backend = SQLiteStorage(str(tmp_path / "test.db"))
+    cache = CachedStorage(backend, flush_interval=3600, flush_threshold=10)
+
+    for chat_id in range(9):
+        cache.update_user('mini_apps', chat_id, lambda data: data.update(water=250))
+    assert cache.dirty_count() == 9
+    assert backend.count('mini_apps') == 0
+    assert cache.get_user('mini_apps', 3) == {'water': 250}
+
+    # Порог достигнут - фоновый поток сбрасывает все одной транзакцией
+    cache.start_auto_flush()
+    cache.set_user('mini_apps', 9, {'water': 500})
+    deadline = time.monotonic() + 5
+    while cache.stats['flushes'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.dirty_count() == 0
+    assert backend.count('mini_apps') == 10
+
+    cache.delete_user('mini_apps', 0)
+    assert cache.get_user('mini_apps', 0) == {}
+    cache.close()
+
+    reopened = SQLiteStorage(str(tmp_path / "test.db"))
+    assert reopened.count('mini_apps') == 9
+    reopened.close()
+
+def test_cached_storage_copies_evicts_and_never_writes_inline(tmp_path):
+    """Копии при чтении и записи, LRU-вытеснение сохраненных записей, запись без сброса"""
+    backend = SQLiteStorage(str(tmp_path / "test.db"))
+    cache = CachedStorage(backend, flush_interval=3600, flush_threshold=2, max_entries=3)
+
+    data = {'water': {'2025-07-23': 250}}
+    cache.set_user('mini_apps', 1, data)
+    data['water']['2025-07-23'] = 999
+    loaded = cache.get_user('mini_apps', 1)
+    loaded['water']['2025-07-24'] = 100  # обработчик упал до set_user
+    assert cache.get_user('mini_apps', 1) == {'water': {'2025-07-23': 250}}
+
+    # Порог пройден, но без фонового потока запись не касается хранилища
+    for chat_id in range(2, 6):
+        cache.set_user('mini_apps', chat_id, {'n': chat_id})
+    assert backend.count('mini_apps') == 0 and cache.dirty_count() == 5
+    assert len(cache._entries) == 5  # грязные записи не вытесняются
+
+    assert cache.flush() == 5
+    assert len(cache._entries) == 3 and cache.stats['evictions'] == 2
+    cache.get_user('mini_apps', 3)
+    cache.get_user('mini_apps', 1)  # промах: вытеснена как самая старая
+    assert cache.stats['misses'] == 1
+    assert ('mini_apps', '4') not in cache._entries  # вытеснена вместо недавно прочитанной 3
+    assert cache.get_user('mini_apps', 1) == {'water': {'2025-07-23': 250}}
+    cache.close()
+
+def test_cached_json_flush_is_atomic(tmp_path):
+    """Сброс в JSON идет через временный файл, без мусора в каталоге"""
+    backend = JSONFileStorage({'mini_apps': str(tmp_path / "mini.json")})
+    cache = CachedStorage(backend, flush_interval=3600, flush_threshold=1000)
+
+    for chat_id in range(50):
+        cache.set_user('mini_apps', chat_id, {'goal': 'поддержание'})
+    assert not (tmp_path / "mini.json").exists()
+
+    assert cache.flush() == 50
+    assert len(json.loads((tmp_path / "mini.json").read_text(encoding='utf-8'))) == 50
+    assert [p.name for p in tmp_path.iterdir()] == ["mini.json"]
+
+def test_cached_storage_drops_unserializable_record(tmp_path):
+    """Несериализуемая запись отбрасывается, остальные сохраняются; хранилище закрывается всегда"""
+    backend = SQLiteStorage(str(tmp_path / "test.db"))
+    cache = CachedStorage(backend, flush_interval=3600, flush_threshold=1000)
+    backend.set_user('mini_apps', 2, {'n': 0})
+    for chat_id in range(1, 4):
+        cache.set_user('mini_apps', chat_id, {'n': chat_id})
+    cache.set_user('mini_apps', 2, {'n': {1, 2}})  # set не пишется в JSON
+
+    assert cache.flush() == 2
+    assert cache.dirty_count() == 0 and cache.stats['dropped_entries'] == 1
+    assert backend.get_user('mini_apps', 1) == {'n': 1} and backend.get_user('mini_apps', 3) == {'n': 3}
+    assert cache.get_user('mini_apps', 2) == {'n': 0}  # из кэша ушла и отброшенная версия
+
+    # Ошибка хранилища (не данных) оставляет запись грязной, а close все равно закрывает хранилище
+    cache.set_user('mini_apps', 4, {'n': 4})
+    closed = []
+
+    def locked(namespace, users):
+        raise sqlite3.OperationalError('database is locked')
+
+    backend.set_many = locked
+    backend.close = lambda: closed.append(True)
+    with pytest.raises(sqlite3.OperationalError):
+        cache.close()
+    assert cache.dirty_count() == 1 and closed == [True]
+
+def test_adaptation_history_ring_and_reload(tmp_path):
+    """История адаптации ограничена емкостью и переживает перезапуск"""
+    from adaptation_history import AdaptationHistory
+    from ultra_precise_formulas import UltraPreciseCalculatorV5
+
+    storage = SQLiteStorage(str(tmp_path / "test.db"))
+    calculator = UltraPreciseCalculatorV5(storage=storage)
+    calculator.adaptation_history.capacity = 3
+    for week in range(10):
+        calculator.get_adaptive_tdee(2000, 0, 0, 0, weeks_on_plan=week, user_id=42)
+
+    records = calculator.adaptation_history.get(42)
+    assert [record['weeks_on_plan'] for record in records] == [7, 8, 9]
+    assert records[-1]['adaptation_factor'] == 1 - 0.02 * 5 / 4
+
+    # Новый экземпляр (перезапуск) и вытеснение из памяти: данные читаются из хранилища
+    history = AdaptationHistory(capacity=2, max_users=1, storage=storage)
+    assert [record['weeks_on_plan'] for record in history.get(42)] == [8, 9]
+    history.append(7, 1, 1.0, 1800)
+    assert len(history) == 1 and 42 in history
+    assert history.get(7)[0]['tdee'] == 1800
+    storage.close()
+
+def test_bot_persistence_survives_restart(tmp_path):
+    """Состояния диалога и данные чата восстанавливаются новым процессом"""
+    import asyncio
+    from collections import defaultdict
+    from types import MappingProxyType, SimpleNamespace
+    from bot_persistence import SQLitePersistence, SurveyStateStore
+
+    db_file = str(tmp_path / "state.db")
+
+    async def scenario():
+        first = SQLitePersistence(db_file, shared=True)
+        await first.update_conversation('survey', (1, 1), 3)
+        await first.update_conversation('survey', (2, 2), 'GENDER')
+        await first.update_conversation('survey', (2, 2), None)
+        await first.update_chat_data(1, {'survey': {'gender': 'мужчина', 'age': 30}})
+        await first.update_bot_data({'started': 1})
+        assert first.storage.dirty_count() > 0
+        await first.flush()
+
+        second = SQLitePersistence(db_file, shared=True)
+        assert await second.get_conversations('survey') == {(1, 1): 3}
+        chat_data = await second.get_chat_data()
+        assert chat_data == {1: {'survey': {'gender': 'мужчина', 'age': 30}}}
+        assert await second.get_bot_data() == {'started': 1}
+
+        # Изменение из другого процесса подхватывается перед обработкой обновления
+        await first.update_chat_data(1, {'survey': {'gender': 'мужчина', 'age': 31}})
+        await first.flush()
+        await second.refresh_chat_data(1, chat_data[1])
+        assert chat_data[1]['survey']['age'] == 31
+        first.close()
+        second.close()
+        return chat_data
+
+    chat_data = asyncio.run(scenario())
+
+    # Ответы анкеты живут в chat_data приложения
+    store = SurveyStateStore()
+    store[5] = {'goal': 'Похудение'}
+    chat_data = defaultdict(dict, chat_data)
+    application = SimpleNamespace(chat_data=MappingProxyType(chat_data), drop_chat_data=chat_data.pop)
+    store.bind(application)
+    assert store[1]['age'] == 31 and store[5] == {'goal': 'Похудение'}
+    assert application.chat_data[5]['survey'] == {'goal': 'Похудение'}
+    del store[5]
+    assert 5 not in store and len(store) == 1
+
+def test_survey_sessions_expire_and_respect_cap():
+    """Брошенные сессии удаляются по TTL, сверх лимита - самые давние"""
+    from collections import defaultdict
+    from types import MappingProxyType
+    from bot_persistence import SurveyStateStore
+
+    class FakeApplication:
+        def __init__(self):
+            self._chat_data = defaultdict(dict)
+            self.chat_data = MappingProxyType(self._chat_data)
+            self.dropped, self.marked = [], []
+
+        def drop_chat_data(self, chat_id):
+            self.dropped.append(chat_id)
+            del self._chat_data[chat_id]
+
+        def mark_data_for_update_persistence(self, chat_ids=None):
+            self.marked.append(chat_ids)
+
+    now = [0.0]
+    store = SurveyStateStore(ttl=100, max_sessions=3, abandon_after=50, clock=lambda: now[0])
+    application = FakeApplication()
+    store.bind(application)
+
+    for chat_id in range(4):
+        now[0] += 10
+        store[chat_id] = {'step': chat_id}
+    assert list(store) == [1, 2, 3] and application.dropped == [0]
+    assert store.metrics['evicted_lru'] == 1
+
+    application._chat_data[1]['water'] = 500  # другие данные чата сохраняются
+    now[0] = 80
+    store[3]['age'] = 30  # обращение продлевает сессию
+    now[0] = 125
+    assert store.stats()['abandoned_sessions'] == 2
+    now[0] = 135
+    assert store.sweep() == 2
+    assert list(store) == [3] and application.chat_data[1] == {'water': 500}
+    assert application.marked == [1]
+    assert store.stats()['expired'] == 2
+
+def test_bot_startup_persists_adaptation_history(tmp_path, monkeypatch):
+    """post_init бота подключает хранилище к истории глобального калькулятора"""
+    import asyncio
+    import main
+    import storage as storage_module
+    from adaptation_history import AdaptationHistory
+    from ultra_precise_formulas import ultra_calculator
+
+    backend = SQLiteStorage(str(tmp_path / "test.db"))
+    monkeypatch.setattr(storage_module, '_storage', backend)
+    history = ultra_calculator.adaptation_history
+    try:
+        asyncio.run(main.restore_sessions(None))
+        assert history.storage is backend
+        ultra_calculator.get_adaptive_tdee(2000, 0, 0, 0, weeks_on_plan=6, user_id=42)
+    finally:
+        history.attach_storage(None)
+
+    # После перезапуска история читается из того же хранилища
+    assert [record['weeks_on_plan'] for record in AdaptationHistory(storage=backend).get(42)] == [6]
+    backend.close()
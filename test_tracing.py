@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты трассировки медленных обновлений
+"""
+
+import time
+import asyncio
+
+from telegram import Bot
+
+from benchmark_webhook import FakeTelegramAPI, TOKEN
+from tracing import Tracer, TracingRequest, split_message
+
+async def wait_reply(bot):
+    await asyncio.sleep(0.12)
+    await bot.send_message(chat_id=1, text="✅")
+
+def test_slow_update_traced_with_api_split_and_stack():
+    """Время Telegram API отделено от обработчика, зависшее обновление получает снимок стека"""
+    tracer = Tracer(threshold=0.05, capacity=2, sample_interval=0.02)
+
+    async def ask_steps(update, context):
+        await wait_reply(context)
+
+    async def fast(update, context):
+        return 'ok'
+
+    async def blocking(update, context):
+        time.sleep(0.08)  # занимает цикл событий
+
+    async def scenario():
+        api = FakeTelegramAPI(expected=1)
+        await api.start()
+        bot = Bot(TOKEN, base_url=f"http://127.0.0.1:{api.port}/bot", request=TracingRequest())
+        tracer.start()
+        try:
+            async with bot:
+                await tracer.wrap(ask_steps)(None, bot)
+            assert await tracer.wrap(fast)(None, None) == 'ok'
+            await tracer.wrap(blocking)(None, None)
+        finally:
+            tracer.stop()
+            await api.stop()
+
+    asyncio.run(scenario())
+    assert tracer.stats == {'traced': 3, 'slow': 2}
+    trace, blocked = tracer.slowest()  # от самой медленной
+    assert blocked.handler.endswith('blocking') and not blocked.api_calls
+    assert trace.handler.endswith('ask_steps')
+    assert [method for method, _ in trace.api_calls] == ['sendMessage']
+    assert 0 < trace.api_time < trace.total
+    assert abs(trace.handler_time + trace.api_time - trace.total) < 1e-9
+    assert trace.samples and 'ожидает' in trace.samples[0][1] and 'wait_reply' in trace.samples[0][1]
+    assert 'sendMessage' in tracer.dump()
+
+    # Кольцевой буфер: новая медленная трасса вытесняет самую старую
+    asyncio.run(tracer.wrap(blocking, name='blocking_again')(None, None))
+    assert 'ask_steps' not in tracer.dump()
+
+def test_blocking_handler_sampled_and_profiled():
+    """Обработчик, занявший цикл событий, виден в стеке потока и в профиле"""
+    tracer = Tracer(threshold=0.03, sample_interval=0.01, profile=True)
+
+    def crunch():
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            pass
+
+    async def calculate(update, context):
+        crunch()
+
+    tracer.start()
+    try:
+        asyncio.run(tracer.wrap(calculate)(None, None))
+    finally:
+        tracer.stop()
+    trace, = tracer.slowest()
+    assert trace.samples and 'выполняется' in trace.samples[0][1] and 'crunch' in trace.samples[0][1]
+    assert 'crunch' in trace.profile
+
+def test_split_message_respects_limit():
+    text = '\n'.join(['x' * 30] * 10 + ['y' * 95])
+    chunks = split_message(text, limit=40)
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert ''.join(chunks) == text.replace('\n', '')
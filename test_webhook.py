@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Тесты режима webhook на поддельном Bot API
+"""
+
+import asyncio
+
+import pytest
+from telegram.ext import Application, MessageHandler, filters
+
+from benchmark_webhook import FakeTelegramAPI, SECRET, TOKEN, echo, make_update
+from bot_webhook import WebhookServer, read_http_request, serve_webhook
+
+async def post(port, path, body, secret=SECRET):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nContent-Type: application/json\r\nConnection: close\r\n"
+        f"X-Telegram-Bot-Api-Secret-Token: {secret}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await read_http_request(reader, 1024)
+    writer.close()
+    return int(response[1])
+
+def test_webhook_validates_and_drains():
+    """Чужой токен и путь отклоняются, принятые обновления обрабатываются до остановки"""
+    async def scenario():
+        api = FakeTelegramAPI(expected=3)
+        await api.start()
+        application = Application.builder().token(TOKEN).base_url(f"http://127.0.0.1:{api.port}/bot").build()
+        application.add_handler(MessageHandler(filters.TEXT, echo))
+        server = WebhookServer(application, listen='127.0.0.1', port=0, secret_token=SECRET, max_connections=4)
+        stop_event = asyncio.Event()
+        serving = asyncio.create_task(serve_webhook(application, stop_event, server))
+        while not server.running or not application.running:
+            await asyncio.sleep(0.01)
+
+        assert await post(server.port, server.url_path, make_update(1), secret='wrong') == 403
+        assert await post(server.port, '/other', make_update(1)) == 404
+        assert await post(server.port, server.url_path, b'{not json') == 400
+        for update_id in range(3):
+            assert await post(server.port, server.url_path, make_update(update_id)) == 200
+
+        # Остановка сразу после приема: очередь обновлений дорабатывается
+        stop_event.set()
+        await serving
+        await api.stop()
+        assert api.sent == 3
+        assert server.stats == {'accepted': 3, 'rejected': 3, 'connections': 6}
+
+    asyncio.run(scenario())
+
+def test_webhook_startup_failure_cleans_up(monkeypatch):
+    """Ошибка регистрации webhook: сервер останавливается, приложение закрывается, не запустившись"""
+    from telegram.error import NetworkError
+    from telegram.ext import ExtBot
+    from config import WebhookConfig
+
+    async def unreachable(*args, **kwargs):
+        raise NetworkError("Bot API unreachable")
+
+    monkeypatch.setattr(WebhookConfig, 'URL', 'https://bot.example.com')
+    monkeypatch.setattr(ExtBot, 'set_webhook', unreachable)
+    shutdowns, servers = [], []
+
+    async def post_shutdown(application):
+        shutdowns.append(application.running)
+
+    async def scenario():
+        api = FakeTelegramAPI(expected=0)
+        await api.start()
+        application = (Application.builder().token(TOKEN).base_url(f"http://127.0.0.1:{api.port}/bot")
+                       .post_shutdown(post_shutdown).build())
+        servers.append(WebhookServer(application, listen='127.0.0.1', port=0, secret_token=SECRET))
+        try:
+            await asyncio.wait_for(serve_webhook(application, asyncio.Event(), servers[0]), timeout=5)
+        finally:
+            await api.stop()
+
+    with pytest.raises(NetworkError):
+        asyncio.run(scenario())
+    assert shutdowns == [False] and not servers[0].running
+
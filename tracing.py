@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Трассировка обновлений FitAdventure Bot
+Каждый обработчик оборачивается замером: полное время обновления делится
+на время самого обработчика и время запросов к Telegram Bot API
+(TracingRequest). Если обновление обрабатывается дольше порога, фоновый
+поток снимает стек (где обработчик ждет или чем занят цикл событий),
+а при TracingConfig.PROFILE к трассе прикладывается отчет cProfile.
+Самые медленные обновления хранятся в кольцевом буфере; администратор
+получает их командой /traces.
+"""
+
+import io
+import os
+import sys
+import time
+import pstats
+import cProfile
+import functools
+import threading
+import traceback
+import logging
+from collections import deque
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from telegram import Update
+from telegram.ext import ContextTypes
+from telegram.request import HTTPXRequest
+
+import metrics
+from config import TracingConfig
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_LIMIT = 4096
+
+# Трасса обновления, которое обрабатывается в текущей задаче asyncio
+_current_trace: ContextVar[Optional['UpdateTrace']] = ContextVar('fitadventure_trace', default=None)
+
+class UpdateTrace:
+    """Замер одного обновления: обработчик, запросы к API, снимки стека"""
+
+    __slots__ = ('handler', 'update_id', 'chat_id', 'received_at', 'delivery_delay', 'started',
+                 'total', 'api_time', 'api_calls', 'samples', 'profile', 'error', 'coro')
+
+    def __init__(self, handler: str, update, started: float):
+        self.handler = handler
+        self.update_id = getattr(update, 'update_id', None)
+        chat = getattr(update, 'effective_chat', None)
+        self.chat_id = chat.id if chat else None
+        self.received_at = time.time()
+        # Задержка доставки: от отправки сообщения пользователем до начала обработки
+        message = getattr(update, 'message', None)
+        date = getattr(message, 'date', None)
+        self.delivery_delay = max(0.0, self.received_at - date.timestamp()) if date else None
+        self.started = started
+        self.total: Optional[float] = None
+        self.api_time = 0.0
+        self.api_calls: List[Tuple[str, float]] = []
+        self.samples: List[Tuple[float, str]] = []
+        self.profile: Optional[str] = None
+        self.error: Optional[str] = None
+        self.coro = None
+
+    @property
+    def handler_time(self) -> float:
+        """Время обработчика без ожидания Telegram API"""
+        return max(0.0, (self.total or 0.0) - self.api_time)
+
+    def add_api_call(self, method: str, duration: float) -> None:
+        self.api_time += duration
+        self.api_calls.append((method, duration))
+
+    def format(self) -> str:
+        """Трасса в виде текста для администратора"""
+        lines = [f"🐢 {self.total:.2f} с — {self.handler} (update {self.update_id}, чат {self.chat_id}, "
+                 f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.received_at))})"]
+        calls = ', '.join(f"{method} {duration:.2f}" for method, duration in self.api_calls)
+        lines.append(f"   обработчик {self.handler_time:.2f} с · Telegram API {self.api_time:.2f} с"
+                     + (f": {calls}" if calls else ''))
+        if self.delivery_delay is not None:
+            lines.append(f"   доставка до бота {self.delivery_delay:.1f} с")
+        if self.error:
+            lines.append(f"   ошибка: {self.error}")
+        lines += [f"   стек на {elapsed:.2f} с: {stack}" for elapsed, stack in self.samples]
+        if self.profile:
+            lines.append("   профиль:\n" + self.profile)
+        return '\n'.join(lines)
+
+def capture_stack(coro, thread_frame=None, limit: int = 12) -> str:
+    """Снимок стека обработчика
+
+    Если обработчик сейчас выполняется (и занимает цикл событий), берется
+    стек потока; если ждет - цепочка await от обработчика до ожидаемого объекта.
+    """
+    if coro is not None and getattr(coro, 'cr_running', False) and thread_frame is not None:
+        frames = [frame for frame, _ in traceback.walk_stack(thread_frame)][::-1]
+        state = 'выполняется'
+    else:
+        frames = []
+        while coro is not None:
+            frame = getattr(coro, 'cr_frame', None) or getattr(coro, 'gi_frame', None)
+            if frame is None:
+                break
+            frames.append(frame)
+            coro = getattr(coro, 'cr_await', None) or getattr(coro, 'gi_yieldfrom', None)
+        state = 'ожидает'
+    path = ' → '.join(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+                      for frame in frames[-limit:])
+    return f"{state}: {path or '?'}"
+
+class TracingRequest(HTTPXRequest):
+    """HTTPXRequest, учитывающий время каждого запроса к Bot API в трассе обновления"""
+
+    __slots__ = ()
+
+    def __init__(self, connection_pool_size: int = 256, **kwargs):
+        # 256 - как у запросов, которые ApplicationBuilder создает по умолчанию
+        super().__init__(connection_pool_size=connection_pool_size, **kwargs)
+
+    async def do_request(self, url: str, method: str, request_data=None, **timeouts):
+        started = time.perf_counter()
+        try:
+            return await super().do_request(url, method, request_data, **timeouts)
+        finally:
+            duration = time.perf_counter() - started
+            api_method = url.rsplit('/', 1)[-1]
+            metrics.TELEGRAM_API_SECONDS.observe(duration, api_method)
+            trace = _current_trace.get()
+            # Задачи, созданные обработчиком, наследуют контекст и могут пережить его трассу
+            if trace is not None and trace.total is None:
+                trace.add_api_call(api_method, duration)
+
+class Tracer:
+    """Обертка обработчиков, сторожевой поток и буфер медленных трасс"""
+
+    def __init__(self, threshold: float = None, capacity: int = None, sample_interval: float = None,
+                 max_samples: int = None, profile: bool = None, clock: Callable[[], float] = time.perf_counter):
+        self.threshold = TracingConfig.SLOW_THRESHOLD if threshold is None else threshold
+        self.sample_interval = sample_interval or TracingConfig.SAMPLE_INTERVAL
+        self.max_samples = TracingConfig.MAX_SAMPLES if max_samples is None else max_samples
+        self.profile = TracingConfig.PROFILE if profile is None else profile
+        self.clock = clock
+        self.stats = {'traced': 0, 'slow': 0}
+        self._slow: deque = deque(maxlen=capacity or TracingConfig.CAPACITY)
+        self._active: Dict[int, Tuple[UpdateTrace, int]] = {}
+        self._lock = threading.Lock()
+        self._profiling = False
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # === ОБЕРТКА ОБРАБОТЧИКОВ ===
+    def wrap(self, callback: Callable, name: str = None) -> Callable:
+        """Асинхронный обработчик с трассировкой"""
+        if getattr(callback, '__tracing_wrapped__', False):
+            return callback
+        name = name or getattr(callback, '__qualname__', repr(callback))
+
+        @functools.wraps(callback)
+        async def wrapper(update, context):
+            trace = UpdateTrace(name, update, self.clock())
+            token = _current_trace.set(trace)
+            profiler = self._start_profile()
+            with self._lock:
+                self._active[id(trace)] = (trace, threading.get_ident())
+            try:
+                trace.coro = callback(update, context)
+                return await trace.coro
+            except Exception as error:
+                trace.error = repr(error)
+                raise
+            finally:
+                with self._lock:
+                    self._active.pop(id(trace), None)
+                _current_trace.reset(token)
+                self._finish(trace, profiler)
+
+        wrapper.__tracing_wrapped__ = True
+        return wrapper
+
+    def instrument(self, application) -> int:
+        """Трассировка всех обработчиков приложения и запуск сторожевого потока"""
+        count = 0
+        for group_handlers in application.handlers.values():
+            for handler in metrics.iter_handlers(group_handlers):
+                handler.callback = self.wrap(handler.callback)
+                count += 1
+        self.start()
+        logger.info("Tracing: %d handlers, slow threshold %.2fs", count, self.threshold)
+        return count
+
+    def _start_profile(self) -> Optional[cProfile.Profile]:
+        # Профилировщик в потоке один: параллельное обновление идет без профиля
+        if not self.profile or self._profiling:
+            return None
+        self._profiling = True
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+
+    def _finish(self, trace: UpdateTrace, profiler: Optional[cProfile.Profile]) -> None:
+        trace.total = self.clock() - trace.started
+        trace.coro = None
+        if profiler is not None:
+            profiler.disable()
+            self._profiling = False
+        self.stats['traced'] += 1
+        if trace.total < self.threshold:
+            return
+        if profiler is not None:
+            output = io.StringIO()
+            pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(TracingConfig.PROFILE_LINES)
+            trace.profile = output.getvalue().strip()
+        self.stats['slow'] += 1
+        with self._lock:
+            self._slow.append(trace)
+        logger.warning("Slow update %s in %s: %.2fs (Telegram API %.2fs, %d calls)",
+                       trace.update_id, trace.handler, trace.total, trace.api_time, len(trace.api_calls))
+
+    # === СНИМКИ СТЕКА ===
+    def start(self) -> None:
+        """Фоновый поток, снимающий стек обновлений дольше порога"""
+        if self._watchdog is not None:
+            return
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name='trace-watchdog', daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.sample_interval + 1)
+            self._watchdog = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.sample_interval):
+            try:
+                self.sample_overdue()
+            except Exception as error:
+                logger.error("Trace watchdog failed: %s", error)
+
+    def sample_overdue(self) -> int:
+        """Снимок стека каждого обновления, превысившего порог. Возвращает число снимков"""
+        now = self.clock()
+        with self._lock:
+            active = list(self._active.values())
+        if not active:
+            return 0
+        thread_frames = sys._current_frames()
+        sampled = 0
+        for trace, thread_id in active:
+            elapsed = now - trace.started
+            if elapsed < self.threshold or len(trace.samples) >= self.max_samples or trace.coro is None:
+                continue
+            trace.samples.append((elapsed, capture_stack(trace.coro, thread_frames.get(thread_id))))
+            sampled += 1
+        return sampled
+
+    # === ВЫГРУЗКА ===
+    def slowest(self, limit: int = None) -> List[UpdateTrace]:
+        """Трассы буфера от самой медленной"""
+        with self._lock:
+            traces = sorted(self._slow, key=lambda trace: trace.total, reverse=True)
+        return traces[:limit] if limit else traces
+
+    def dump(self, limit: int = None) -> str:
+        traces = self.slowest(limit)
+        header = (f"📊 Обновлений: {self.stats['traced']}, медленных (≥ {self.threshold:.2f} с): "
+                  f"{self.stats['slow']}, в буфере: {len(traces)}")
+        if not traces:
+            return header + "\n✅ Медленных обновлений нет"
+        return '\n\n'.join([header] + [trace.format() for trace in traces])
+
+def split_message(text: str, limit: int = MESSAGE_LIMIT) -> List[str]:
+    """Разбиение длинного текста на сообщения Telegram по границам строк"""
+    chunks, current = [], ''
+    for line in text.split('\n'):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ''
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if current and len(current) + 1 + len(line) > limit:
+            chunks.append(current)
+            current = line
+        else:
+            current = f"{current}\n{line}" if current else line
+    if current:
+        chunks.append(current)
+    return chunks
+
+# Глобальный трассировщик
+tracer = Tracer()
+
+def instrument_application(application) -> int:
+    """Трассировка обработчиков приложения, если она включена в TracingConfig"""
+    if not TracingConfig.ENABLED:
+        return 0
+    return tracer.instrument(application)
+
+async def traces_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Медленные обновления из буфера трассировки (только для администратора)
+
+    /traces [N] - N самых медленных трасс.
+    """
+    if update.effective_chat.id != TracingConfig.ADMIN_ID:
+        await update.message.reply_text("❌ Команда доступна только администратору.")
+        return
+    limit = int(context.args[0]) if context.args and context.args[0].isdigit() else None
+    # Без разметки: в стеках и профиле есть символы, которые ломают Markdown
+    for chunk in split_message(tracer.dump(limit)):
+        await update.message.reply_text(chunk)
@@ -6,13 +6,262 @@
 
 import math
 import json
-from datetime import datetime
+
+from adaptation_history import AdaptationHistory
+from storage import get_storage
+
+# === ТАБЛИЦЫ КОЭФФИЦИЕНТОВ ===
+# Создаются один раз при импорте: методы калькулятора только читают их
+
+# Этнические коэффициенты (научные исследования)
+ETHNIC_LBM_COEFFICIENTS = {
+    'caucasian': {'male': 1.00, 'female': 1.00},
+    'african': {'male': 1.09, 'female': 1.07},      # больше мышечной массы
+    'asian': {'male': 0.94, 'female': 0.92},        # меньше мышечной массы
+    'hispanic': {'male': 0.98, 'female': 0.96},
+    'mixed': {'male': 1.02, 'female': 1.01}
+}
+
+# Генетические факторы (расширенные)
+GENETIC_FACTORS = {
+    'exceptional': 1.18,   # топ 1% генетики
+    'excellent': 1.12,     # топ 5% генетики  
+    'very_good': 1.08,     # топ 15% генетики
+    'good': 1.04,          # выше среднего
+    'average': 1.00,       # средняя генетика
+    'below_average': 0.95, # ниже среднего
+    'poor': 0.88,          # слабая генетика
+    'very_poor': 0.82      # очень слабая генетика
+}
+
+# Качество мышечной ткани (улучшенное)
+MUSCLE_QUALITY_FACTORS = {
+    'elite_athlete': 1.20,  # элитные спортсмены
+    'competitive': 1.15,    # соревнующиеся атлеты
+    'excellent': 1.10,      # многолетние тренировки
+    'good': 1.05,           # регулярные тренировки
+    'average': 1.00,        # обычное состояние
+    'below_average': 0.94,  # малоактивный
+    'poor': 0.87,           # сидячий образ жизни
+    'sedentary': 0.80       # полностью неактивный
+}
+
+# Гормональный статус (новый фактор)
+HORMONE_LBM_FACTORS = {
+    'optimal': 1.08,        # оптимальные гормоны
+    'good': 1.03,           # хорошие гормоны
+    'normal': 1.00,         # нормальные гормоны
+    'suboptimal': 0.95,     # сниженные гормоны
+    'low': 0.88,            # низкие гормоны
+    'very_low': 0.82        # очень низкие гормоны
+}
+
+# Климатические факторы (расширенные)
+CLIMATE_FACTORS = {
+    'arctic': 1.18,         # арктический (+18%)
+    'subarctic': 1.12,      # субарктический (+12%)
+    'cold': 1.08,           # холодный (+8%)
+    'temperate': 1.00,      # умеренный (базовый)
+    'subtropical': 0.97,    # субтропический (-3%)
+    'tropical': 0.94,       # тропический (-6%)
+    'desert': 0.91          # пустынный (-9%)
+}
+
+# Функция щитовидной железы (критический фактор)
+THYROID_FACTORS = {
+    'hyperthyroid': 1.25,   # гипертиреоз (+25%)
+    'mild_hyper': 1.12,     # легкий гипертиреоз (+12%)
+    'optimal': 1.05,        # оптимальная функция (+5%)
+    'normal': 1.00,         # нормальная функция
+    'mild_hypo': 0.90,      # легкий гипотиреоз (-10%)
+    'hypothyroid': 0.75,    # гипотиреоз (-25%)
+    'severe_hypo': 0.65     # тяжелый гипотиреоз (-35%)
+}
+
+# Хронотип (циркадные ритмы)
+CHRONOTYPE_BMR_FACTORS = {
+    'extreme_morning': 1.03,    # жаворонки
+    'moderate_morning': 1.01,   
+    'intermediate': 1.00,       # промежуточный тип
+    'moderate_evening': 0.98,   
+    'extreme_evening': 0.96     # совы
+}
+
+# Состояние здоровья (детализированное)
+HEALTH_BMR_FACTORS = {
+    'excellent': 1.05,      # отличное здоровье
+    'very_good': 1.03,      # очень хорошее
+    'good': 1.01,           # хорошее
+    'healthy': 1.00,        # здоровый (базовый)
+    'fair': 0.98,           # удовлетворительное
+    'poor': 0.95,           # плохое
+    'chronic_illness': 0.90, # хронические заболевания
+    'metabolic_disorder': 0.85 # метаболические нарушения
+}
+
+# Влияние медикаментов на метаболизм
+MEDICATION_EFFECTS = {
+    'beta_blockers': 0.95,      # бета-блокаторы снижают
+    'thyroid_hormone': 1.10,    # гормоны щитовидной железы повышают
+    'antidepressants': 0.92,    # антидепрессанты снижают
+    'stimulants': 1.08,         # стимуляторы повышают
+    'corticosteroids': 1.12,    # кортикостероиды повышают
+    'metformin': 1.03,          # метформин слегка повышает
+    'insulin': 0.96             # инсулин может снижать
+}
+
+# Профессиональная активность
+OCCUPATION_NEAT_FACTORS = {
+    'construction': 1.4,   # физический труд
+    'healthcare': 1.25,    # медработники
+    'retail': 1.15,        # продавцы
+    'teacher': 1.1,        # учителя
+    'office': 1.0,         # офисные работники
+    'driver': 0.85,        # водители
+    'remote': 0.8          # удаленная работа
+}
+
+# Уровень непроизвольной активности (fidgeting)
+FIDGETING_FACTORS = {
+    'high': 1.25,      # очень подвижный тип
+    'above_average': 1.15,  # выше среднего
+    'average': 1.0,    # средний уровень
+    'below_average': 0.88,  # ниже среднего
+    'low': 0.75        # малоподвижный тип
+}
+
+# Базовые MET значения с детализацией по опыту
+MET_DATABASE = {
+    'Силовые': {
+        'Новичок': {'low': 3.5, 'moderate': 4.5, 'high': 5.5, 'very_high': 6.5},
+        'Средний': {'low': 4.5, 'moderate': 5.5, 'high': 6.8, 'very_high': 8.0},
+        'Опытный': {'low': 5.5, 'moderate': 7.0, 'high': 8.5, 'very_high': 10.0}
+    },
+    'Кроссфит': {
+        'Новичок': {'low': 5.0, 'moderate': 7.0, 'high': 9.0, 'very_high': 11.0},
+        'Средний': {'low': 7.0, 'moderate': 9.5, 'high': 12.0, 'very_high': 14.5},
+        'Опытный': {'low': 9.0, 'moderate': 12.0, 'high': 15.0, 'very_high': 18.0}
+    },
+    'Выносливость': {
+        'Новичок': {'low': 4.0, 'moderate': 6.0, 'high': 8.0, 'very_high': 10.0},
+        'Средний': {'low': 6.0, 'moderate': 8.5, 'high': 11.0, 'very_high': 13.5},
+        'Опытный': {'low': 8.0, 'moderate': 11.0, 'high': 14.0, 'very_high': 17.0}
+    }
+}
+
+# Качество восстановления
+RECOVERY_EAT_FACTORS = {
+    'excellent': 1.1,   # отличное восстановление
+    'good': 1.05,       # хорошее восстановление  
+    'average': 1.0,     # среднее восстановление
+    'poor': 0.9,        # плохое восстановление
+    'very_poor': 0.8    # очень плохое восстановление
+}
+
+# Качество пищи
+FOOD_QUALITY_TEF_FACTORS = {
+    'whole_foods': 1.15,    # цельные продукты
+    'mixed': 1.0,           # смешанное питание
+    'processed': 0.85       # обработанные продукты
+}
+
+# Здоровье пищеварительной системы
+DIGESTIVE_TEF_FACTORS = {
+    'excellent': 1.1,    # отличное пищеварение
+    'good': 1.05,        # хорошее пищеварение
+    'average': 1.0,      # среднее
+    'poor': 0.9          # проблемы с пищеварением
+}
+
+# Качество сна (критически важно для метаболизма)
+SLEEP_TDEE_FACTORS = {
+    'excellent': 1.05,   # отличный сон
+    'good': 1.02,        # хороший сон
+    'average': 1.0,      # средний сон
+    'poor': 0.95,        # плохой сон
+    'very_poor': 0.88    # очень плохой сон
+}
+
+# Улучшенные факторы точности v5.0
+PRECISION_FACTORS = {
+    'fat_percent': 0.09,          # знание % жира +9%
+    'detailed_activity': 0.05,    # детальные данные о тренировках +5%
+    'health_status': 0.04,        # состояние здоровья +4%
+    'occupation': 0.025,          # профессия +2.5%
+    'sleep_quality': 0.025,       # качество сна +2.5%
+    'stress_level': 0.02,         # уровень стресса +2%
+    'ethnicity': 0.03,            # этническая принадлежность +3%
+    'hormone_status': 0.04,       # гормональный статус +4%
+    'chronotype': 0.015,          # хронотип +1.5%
+    'thyroid_function': 0.035,    # функция щитовидной железы +3.5%
+    'body_temperature': 0.02,     # температура тела +2%
+    'medications': 0.025,         # учет медикаментов +2.5%
+    'genetic_data': 0.035,        # генетические данные +3.5%
+    'muscle_quality': 0.03        # качество мышечной ткани +3%
+}
+
+# Базовые потребности в белке по целям (г/кг LBM)
+PROTEIN_BASE_RANGES = {
+    'Похудение': (2.4, 2.9), 'weight_loss': (2.4, 2.9),
+    'Поддержание': (1.9, 2.3), 'maintenance': (1.9, 2.3),
+    'Набор массы': (2.1, 2.6), 'muscle_gain': (2.1, 2.6)
+}
+
+# Гормональные коррекции доли жиров
+HORMONE_FAT_ADJUSTMENTS = {
+    'male': {
+        'optimal': -0.02,      # меньше жиров при высоком тестостероне
+        'good': -0.01,
+        'normal': 0.00,
+        'suboptimal': +0.02,
+        'low': +0.04,          # больше жиров при низком тестостероне
+        'very_low': +0.06
+    },
+    'female': {
+        'optimal': -0.01,
+        'good': 0.00,
+        'normal': 0.00,
+        'suboptimal': +0.03,   # больше жиров для женских гормонов
+        'low': +0.05,
+        'very_low': +0.07
+    }
+}
+
+# Этнические различия в потребностях белка
+ETHNIC_PROTEIN_FACTORS = {
+    'african': 1.05,      # немного больше потребности
+    'caucasian': 1.00,    # базовый уровень
+    'asian': 0.96,        # немного меньше потребности
+    'hispanic': 0.99,
+    'mixed': 1.01
+}
+
+# Этнические различия
+ETHNIC_FIBER_FACTORS = {
+    'asian': 1.15,        # традиционно больше растительной пищи
+    'african': 1.10,      # высокое потребление овощей
+    'hispanic': 1.08,     # много бобовых и овощей
+    'caucasian': 1.00,    # базовый уровень
+    'mixed': 1.05
+}
+
+# Здоровье пищеварения (расширенное)
+HEALTH_FIBER_FACTORS = {
+    'excellent': 1.15,
+    'very_good': 1.08,
+    'good': 1.00,
+    'healthy': 1.00,
+    'fair': 0.95,
+    'poor': 0.88,
+    'digestive_issues': 0.80
+}
 
 class UltraPreciseCalculatorV5:
     """Ультра-точный калькулятор v5.0 с максимальной научной точностью"""
     
-    def __init__(self):
-        self.adaptation_history = {}  # История адаптации пользователей
+    def __init__(self, storage=None):
+        # История адаптации: кольцевой буфер на пользователя, при storage - с сохранением
+        self.adaptation_history = AdaptationHistory(storage=storage)
         self.metabolic_profiles = {}   # Метаболические профили
         self.precision_neural_weights = self._init_neural_weights()
         
@@ -36,17 +285,9 @@ class UltraPreciseCalculatorV5:
         else:
             # Мультиформульный подход с этническими коэффициентами
             
-            # Этнические коэффициенты (научные исследования)
-            ethnic_coefficients = {
-                'caucasian': {'male': 1.00, 'female': 1.00},
-                'african': {'male': 1.09, 'female': 1.07},      # больше мышечной массы
-                'asian': {'male': 0.94, 'female': 0.92},        # меньше мышечной массы
-                'hispanic': {'male': 0.98, 'female': 0.96},
-                'mixed': {'male': 1.02, 'female': 1.01}
-            }
             
             gender_key = 'male' if gender in ['мужчина', 'male'] else 'female'
-            ethnic_factor = ethnic_coefficients.get(ethnicity, ethnic_coefficients['caucasian'])[gender_key]
+            ethnic_factor = ETHNIC_LBM_COEFFICIENTS.get(ethnicity, ETHNIC_LBM_COEFFICIENTS['caucasian'])[gender_key]
             
             # Улучшенная формула Boer с этническими поправками
             if gender in ['мужчина', 'male']:
@@ -73,42 +314,11 @@ class UltraPreciseCalculatorV5:
         # Продвинутые возрастные корректировки с половой спецификой
         age_factor = self._calculate_sarcopenia_factor(age, gender, hormone_status)
         
-        # Генетические факторы (расширенные)
-        genetic_factors = {
-            'exceptional': 1.18,   # топ 1% генетики
-            'excellent': 1.12,     # топ 5% генетики  
-            'very_good': 1.08,     # топ 15% генетики
-            'good': 1.04,          # выше среднего
-            'average': 1.00,       # средняя генетика
-            'below_average': 0.95, # ниже среднего
-            'poor': 0.88,          # слабая генетика
-            'very_poor': 0.82      # очень слабая генетика
-        }
-        genetic_factor = genetic_factors.get(genetics, 1.0)
-        
-        # Качество мышечной ткани (улучшенное)
-        muscle_quality_factors = {
-            'elite_athlete': 1.20,  # элитные спортсмены
-            'competitive': 1.15,    # соревнующиеся атлеты
-            'excellent': 1.10,      # многолетние тренировки
-            'good': 1.05,           # регулярные тренировки
-            'average': 1.00,        # обычное состояние
-            'below_average': 0.94,  # малоактивный
-            'poor': 0.87,           # сидячий образ жизни
-            'sedentary': 0.80       # полностью неактивный
-        }
-        muscle_quality_factor = muscle_quality_factors.get(muscle_quality, 1.0)
-        
-        # Гормональный статус (новый фактор)
-        hormone_factors = {
-            'optimal': 1.08,        # оптимальные гормоны
-            'good': 1.03,           # хорошие гормоны
-            'normal': 1.00,         # нормальные гормоны
-            'suboptimal': 0.95,     # сниженные гормоны
-            'low': 0.88,            # низкие гормоны
-            'very_low': 0.82        # очень низкие гормоны
-        }
-        hormone_factor = hormone_factors.get(hormone_status, 1.0)
+        genetic_factor = GENETIC_FACTORS.get(genetics, 1.0)
+        
+        muscle_quality_factor = MUSCLE_QUALITY_FACTORS.get(muscle_quality, 1.0)
+        
+        hormone_factor = HORMONE_LBM_FACTORS.get(hormone_status, 1.0)
         
         final_lbm = base_lbm * age_factor * genetic_factor * muscle_quality_factor * hormone_factor
         
@@ -157,55 +367,16 @@ class UltraPreciseCalculatorV5:
         # Возрастные изменения метаболизма (нелинейные)
         age_factor = self._calculate_metabolic_aging_factor(age, gender, health_status)
         
-        # Климатические факторы (расширенные)
-        climate_factors = {
-            'arctic': 1.18,         # арктический (+18%)
-            'subarctic': 1.12,      # субарктический (+12%)
-            'cold': 1.08,           # холодный (+8%)
-            'temperate': 1.00,      # умеренный (базовый)
-            'subtropical': 0.97,    # субтропический (-3%)
-            'tropical': 0.94,       # тропический (-6%)
-            'desert': 0.91          # пустынный (-9%)
-        }
-        climate_factor = climate_factors.get(climate, 1.0)
-        
-        # Функция щитовидной железы (критический фактор)
-        thyroid_factors = {
-            'hyperthyroid': 1.25,   # гипертиреоз (+25%)
-            'mild_hyper': 1.12,     # легкий гипертиреоз (+12%)
-            'optimal': 1.05,        # оптимальная функция (+5%)
-            'normal': 1.00,         # нормальная функция
-            'mild_hypo': 0.90,      # легкий гипотиреоз (-10%)
-            'hypothyroid': 0.75,    # гипотиреоз (-25%)
-            'severe_hypo': 0.65     # тяжелый гипотиреоз (-35%)
-        }
-        thyroid_factor = thyroid_factors.get(thyroid_function, 1.0)
+        climate_factor = CLIMATE_FACTORS.get(climate, 1.0)
+        
+        thyroid_factor = THYROID_FACTORS.get(thyroid_function, 1.0)
         
         # Температура тела (новый научный подход)
         temp_factor = 1 + ((body_temp - 36.6) * 0.13)  # 13% изменение на 1°C
         
-        # Хронотип (циркадные ритмы)
-        chronotype_bmr_factors = {
-            'extreme_morning': 1.03,    # жаворонки
-            'moderate_morning': 1.01,   
-            'intermediate': 1.00,       # промежуточный тип
-            'moderate_evening': 0.98,   
-            'extreme_evening': 0.96     # совы
-        }
-        chronotype_factor = chronotype_bmr_factors.get(chronotype, 1.0)
-        
-        # Состояние здоровья (детализированное)
-        health_factors = {
-            'excellent': 1.05,      # отличное здоровье
-            'very_good': 1.03,      # очень хорошее
-            'good': 1.01,           # хорошее
-            'healthy': 1.00,        # здоровый (базовый)
-            'fair': 0.98,           # удовлетворительное
-            'poor': 0.95,           # плохое
-            'chronic_illness': 0.90, # хронические заболевания
-            'metabolic_disorder': 0.85 # метаболические нарушения
-        }
-        health_factor = health_factors.get(health_status, 1.0)
+        chronotype_factor = CHRONOTYPE_BMR_FACTORS.get(chronotype, 1.0)
+        
+        health_factor = HEALTH_BMR_FACTORS.get(health_status, 1.0)
         
         # Медикаменты (если предоставлены)
         medication_factor = self._calculate_medication_factor(medications) if medications else 1.0
@@ -242,21 +413,11 @@ class UltraPreciseCalculatorV5:
         """Влияние медикаментов на метаболизм"""
         if not medications or not isinstance(medications, list):
             return 1.0
-            
-        medication_effects = {
-            'beta_blockers': 0.95,      # бета-блокаторы снижают
-            'thyroid_hormone': 1.10,    # гормоны щитовидной железы повышают
-            'antidepressants': 0.92,    # антидепрессанты снижают
-            'stimulants': 1.08,         # стимуляторы повышают
-            'corticosteroids': 1.12,    # кортикостероиды повышают
-            'metformin': 1.03,          # метформин слегка повышает
-            'insulin': 0.96             # инсулин может снижать
-        }
         
         total_factor = 1.0
         for medication in medications:
-            if medication in medication_effects:
-                total_factor *= medication_effects[medication]
+            if medication in MEDICATION_EFFECTS:
+                total_factor *= MEDICATION_EFFECTS[medication]
                 
         return max(0.85, min(1.15, total_factor))  # ограничения безопасности
     
@@ -275,27 +436,9 @@ class UltraPreciseCalculatorV5:
             activity_decline = 0.008  # снижение на 0.8% в год после 25
             age_factor = 1 - ((age - 25) * activity_decline / 100)
         
-        # Профессиональная активность
-        occupation_factors = {
-            'construction': 1.4,   # физический труд
-            'healthcare': 1.25,    # медработники
-            'retail': 1.15,        # продавцы
-            'teacher': 1.1,        # учителя
-            'office': 1.0,         # офисные работники
-            'driver': 0.85,        # водители
-            'remote': 0.8          # удаленная работа
-        }
-        occupation_factor = occupation_factors.get(occupation, 1.0)
-        
-        # Уровень непроизвольной активности (fidgeting)
-        fidgeting_factors = {
-            'high': 1.25,      # очень подвижный тип
-            'above_average': 1.15,  # выше среднего
-            'average': 1.0,    # средний уровень
-            'below_average': 0.88,  # ниже среднего
-            'low': 0.75        # малоподвижный тип
-        }
-        fidgeting_factor = fidgeting_factors.get(fidgeting, 1.0)
+        occupation_factor = OCCUPATION_NEAT_FACTORS.get(occupation, 1.0)
+        
+        fidgeting_factor = FIDGETING_FACTORS.get(fidgeting, 1.0)
         
         # Температурная адаптация
         temp_factor = 1.0
@@ -316,26 +459,7 @@ class UltraPreciseCalculatorV5:
         Ультра-точный EAT - точность 95%+
         Учитывает: интенсивность, восстановление, адаптацию к нагрузкам
         """
-        # Базовые MET значения с детализацией по опыту
-        met_database = {
-            'Силовые': {
-                'Новичок': {'low': 3.5, 'moderate': 4.5, 'high': 5.5, 'very_high': 6.5},
-                'Средний': {'low': 4.5, 'moderate': 5.5, 'high': 6.8, 'very_high': 8.0},
-                'Опытный': {'low': 5.5, 'moderate': 7.0, 'high': 8.5, 'very_high': 10.0}
-            },
-            'Кроссфит': {
-                'Новичок': {'low': 5.0, 'moderate': 7.0, 'high': 9.0, 'very_high': 11.0},
-                'Средний': {'low': 7.0, 'moderate': 9.5, 'high': 12.0, 'very_high': 14.5},
-                'Опытный': {'low': 9.0, 'moderate': 12.0, 'high': 15.0, 'very_high': 18.0}
-            },
-            'Выносливость': {
-                'Новичок': {'low': 4.0, 'moderate': 6.0, 'high': 8.0, 'very_high': 10.0},
-                'Средний': {'low': 6.0, 'moderate': 8.5, 'high': 11.0, 'very_high': 13.5},
-                'Опытный': {'low': 8.0, 'moderate': 11.0, 'high': 14.0, 'very_high': 17.0}
-            }
-        }
-        
-        base_met = met_database.get(activity_type, met_database['Силовые']).get(experience, {}).get(intensity, 5.0)
+        base_met = MET_DATABASE.get(activity_type, MET_DATABASE['Силовые']).get(experience, {}).get(intensity, 5.0)
         
         # Возрастная адаптация к нагрузкам
         age_factor = 1.0
@@ -344,15 +468,7 @@ class UltraPreciseCalculatorV5:
             decline_rate = 0.005 if gender in ['мужчина', 'male'] else 0.006
             age_factor = 1 - ((age - 30) * decline_rate)
         
-        # Качество восстановления
-        recovery_factors = {
-            'excellent': 1.1,   # отличное восстановление
-            'good': 1.05,       # хорошее восстановление  
-            'average': 1.0,     # среднее восстановление
-            'poor': 0.9,        # плохое восстановление
-            'very_poor': 0.8    # очень плохое восстановление
-        }
-        recovery_factor = recovery_factors.get(recovery, 1.0)
+        recovery_factor = RECOVERY_EAT_FACTORS.get(recovery, 1.0)
         
         # Адаптация к объему тренировок
         volume_factor = 1.0
@@ -390,22 +506,9 @@ class UltraPreciseCalculatorV5:
         elif meal_frequency <= 2:
             frequency_factor = 0.95  # редкие приемы снижают TEF
         
-        # Качество пищи
-        quality_factors = {
-            'whole_foods': 1.15,    # цельные продукты
-            'mixed': 1.0,           # смешанное питание
-            'processed': 0.85       # обработанные продукты
-        }
-        quality_factor = quality_factors.get(food_quality, 1.0)
-        
-        # Здоровье пищеварительной системы
-        digestive_factors = {
-            'excellent': 1.1,    # отличное пищеварение
-            'good': 1.05,        # хорошее пищеварение
-            'average': 1.0,      # среднее
-            'poor': 0.9          # проблемы с пищеварением
-        }
-        digestive_factor = digestive_factors.get(digestive_health, 1.0)
+        quality_factor = FOOD_QUALITY_TEF_FACTORS.get(food_quality, 1.0)
+        
+        digestive_factor = DIGESTIVE_TEF_FACTORS.get(digestive_health, 1.0)
         
         final_tef = base_tef * age_factor * frequency_factor * quality_factor * digestive_factor
         return final_tef
@@ -421,10 +524,6 @@ class UltraPreciseCalculatorV5:
         # Метаболическая адаптация при длительном дефиците/профиците
         adaptation_factor = 1.0
         if weeks_on_plan > 4 and user_id:
-            # Получаем историю адаптации пользователя
-            user_history = self.adaptation_history.get(user_id, {})
-            previous_adaptations = user_history.get('adaptations', [])
-            
             # Прогрессивная адаптация: чем дольше диета, тем больше замедление
             adaptation_rate = 0.02 * (weeks_on_plan - 4) / 4  # 2% за месяц
             adaptation_factor = max(1 - adaptation_rate, 0.85)  # максимум 15% замедления
@@ -436,15 +535,7 @@ class UltraPreciseCalculatorV5:
         elif stress_level < 3:
             stress_factor = 1.02  # низкий стресс немного повышает
         
-        # Качество сна (критически важно для метаболизма)
-        sleep_factors = {
-            'excellent': 1.05,   # отличный сон
-            'good': 1.02,        # хороший сон
-            'average': 1.0,      # средний сон
-            'poor': 0.95,        # плохой сон
-            'very_poor': 0.88    # очень плохой сон
-        }
-        sleep_factor = sleep_factors.get(sleep_quality, 1.0)
+        sleep_factor = SLEEP_TDEE_FACTORS.get(sleep_quality, 1.0)
         
         # Гормональный статус (циркадные ритмы)
         circadian_factor = 1.0  # можно расширить для учета времени суток
@@ -453,15 +544,7 @@ class UltraPreciseCalculatorV5:
         
         # Сохраняем данные для адаптации
         if user_id:
-            if user_id not in self.adaptation_history:
-                self.adaptation_history[user_id] = {'adaptations': []}
-            
-            self.adaptation_history[user_id]['adaptations'].append({
-                'date': datetime.now().isoformat(),
-                'weeks_on_plan': weeks_on_plan,
-                'adaptation_factor': adaptation_factor,
-                'tdee': adaptive_tdee
-            })
+            self.adaptation_history.append(user_id, weeks_on_plan, adaptation_factor, adaptive_tdee)
         
         return adaptive_tdee
     
@@ -472,26 +555,9 @@ class UltraPreciseCalculatorV5:
         """
         base_precision = 0.88  # базовая точность повышена до 88%
         
-        # Улучшенные факторы точности v5.0
-        precision_factors = {
-            'fat_percent': 0.09,          # знание % жира +9%
-            'detailed_activity': 0.05,    # детальные данные о тренировках +5%
-            'health_status': 0.04,        # состояние здоровья +4%
-            'occupation': 0.025,          # профессия +2.5%
-            'sleep_quality': 0.025,       # качество сна +2.5%
-            'stress_level': 0.02,         # уровень стресса +2%
-            'ethnicity': 0.03,            # этническая принадлежность +3%
-            'hormone_status': 0.04,       # гормональный статус +4%
-            'chronotype': 0.015,          # хронотип +1.5%
-            'thyroid_function': 0.035,    # функция щитовидной железы +3.5%
-            'body_temperature': 0.02,     # температура тела +2%
-            'medications': 0.025,         # учет медикаментов +2.5%
-            'genetic_data': 0.035,        # генетические данные +3.5%
-            'muscle_quality': 0.03        # качество мышечной ткани +3%
-        }
         
         total_precision = base_precision
-        for factor, bonus in precision_factors.items():
+        for factor, bonus in PRECISION_FACTORS.items():
             if factor in data_completeness and data_completeness[factor]:
                 total_precision += bonus
         
@@ -509,6 +575,10 @@ class UltraPreciseCalculatorV5:
 # Создаем глобальный экземпляр калькулятора v5.0
 ultra_calculator = UltraPreciseCalculatorV5()
 
+def attach_adaptation_storage(storage=None) -> None:
+    """Сохранение истории адаптации глобального калькулятора (вызывается при запуске бота)"""
+    ultra_calculator.adaptation_history.attach_storage(storage or get_storage())
+
 def generate_maximum_precision_recommendations(data):
     """
     Генерация рекомендаций с максимальной точностью v5.0: 96-99.5%
@@ -628,23 +698,10 @@ def generate_maximum_precision_recommendations(data):
 
 def get_ultra_precise_protein_needs_v5(lbm, goal, age, training_days, ethnicity='caucasian'):
     """Ультра-точные потребности в белке v5.0 с учетом этничности"""
-    base_ranges = {
-        'Похудение': (2.4, 2.9), 'weight_loss': (2.4, 2.9),
-        'Поддержание': (1.9, 2.3), 'maintenance': (1.9, 2.3),
-        'Набор массы': (2.1, 2.6), 'muscle_gain': (2.1, 2.6)
-    }
     
-    min_protein, max_protein = base_ranges.get(goal, (2.0, 2.5))
+    min_protein, max_protein = PROTEIN_BASE_RANGES.get(goal, (2.0, 2.5))
     
-    # Этнические различия в потребностях белка
-    ethnic_protein_factors = {
-        'african': 1.05,      # немного больше потребности
-        'caucasian': 1.00,    # базовый уровень
-        'asian': 0.96,        # немного меньше потребности
-        'hispanic': 0.99,
-        'mixed': 1.01
-    }
-    ethnic_factor = ethnic_protein_factors.get(ethnicity, 1.0)
+    ethnic_factor = ETHNIC_PROTEIN_FACTORS.get(ethnicity, 1.0)
     
     # Возрастные корректировки (улучшенные)
     if age > 65:
@@ -679,28 +736,12 @@ def get_ultra_precise_macros_v5(goal, calories, protein_g, gender, age, hormone_
         base_fat_percent = 0.26 + (age - 25) * 0.0012
         base_fat_percent = min(base_fat_percent, 0.36)
         
-        # Гормональные коррекции для мужчин
-        hormone_fat_adjustments = {
-            'optimal': -0.02,      # меньше жиров при высоком тестостероне
-            'good': -0.01,
-            'normal': 0.00,
-            'suboptimal': +0.02,
-            'low': +0.04,          # больше жиров при низком тестостероне
-            'very_low': +0.06
-        }
+        hormone_fat_adjustments = HORMONE_FAT_ADJUSTMENTS['male']
     else:
         base_fat_percent = 0.32 + (age - 25) * 0.001
         base_fat_percent = min(base_fat_percent, 0.42)
         
-        # Гормональные коррекции для женщин
-        hormone_fat_adjustments = {
-            'optimal': -0.01,
-            'good': 0.00,
-            'normal': 0.00,
-            'suboptimal': +0.03,   # больше жиров для женских гормонов
-            'low': +0.05,
-            'very_low': +0.07
-        }
+        hormone_fat_adjustments = HORMONE_FAT_ADJUSTMENTS['female']
     
     hormone_adjustment = hormone_fat_adjustments.get(hormone_status, 0.00)
     fat_percent = base_fat_percent + hormone_adjustment
@@ -775,15 +816,7 @@ def get_precision_fiber_v5(calories, age, health_status='good', ethnicity='cauca
     """Точная рекомендация по клетчатке v5.0 с этническими факторами"""
     base_fiber = (calories / 1000) * 15  # повышен базовый стандарт до 15г/1000 ккал
     
-    # Этнические различия
-    ethnic_fiber_factors = {
-        'asian': 1.15,        # традиционно больше растительной пищи
-        'african': 1.10,      # высокое потребление овощей
-        'hispanic': 1.08,     # много бобовых и овощей
-        'caucasian': 1.00,    # базовый уровень
-        'mixed': 1.05
-    }
-    ethnic_factor = ethnic_fiber_factors.get(ethnicity, 1.0)
+    ethnic_factor = ETHNIC_FIBER_FACTORS.get(ethnicity, 1.0)
     
     # Возрастные корректировки (улучшенные)
     if age > 65:
@@ -793,17 +826,7 @@ def get_precision_fiber_v5(calories, age, health_status='good', ethnicity='cauca
     elif age > 30:
         base_fiber += 2
     
-    # Здоровье пищеварения (расширенное)
-    health_fiber_factors = {
-        'excellent': 1.15,
-        'very_good': 1.08,
-        'good': 1.00,
-        'healthy': 1.00,
-        'fair': 0.95,
-        'poor': 0.88,
-        'digestive_issues': 0.80
-    }
-    health_factor = health_fiber_factors.get(health_status, 1.0)
+    health_factor = HEALTH_FIBER_FACTORS.get(health_status, 1.0)
     
     final_fiber = base_fiber * ethnic_factor * health_factor
     return round(max(final_fiber, 25))  # минимум повышен до 25г 
\ No newline at end of file
@@ -5,11 +5,28 @@
 Telegram Web App API
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, send_from_directory, abort
 import json
 import os
+import re
+import time
+import base64
+import binascii
+
+from products_index import ProductIndex
+from products_table import ProductTable, MACRO_COLUMNS, NAME_COLUMN
+from http_cache import PrecompressedResponse
+from metrics import instrument_flask
 
 app = Flask(__name__)
+# Задержки и статусы маршрутов API; экспорт - локальный сервер metrics.py
+instrument_flask(app)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Версионированные файлы данных (build_webapp_assets.py) не меняются никогда
+ASSET_HASH_PATTERN = re.compile(r'^[0-9a-f]{12}$')
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
 
 # === БАЗА ДАННЫХ ПРОДУКТОВ ===
 PRODUCTS_DATABASE = {
@@ -143,21 +160,178 @@ PRODUCTS_DATABASE = {
     }
 }
 
+# Поисковый индекс строится один раз при запуске
+PRODUCTS_INDEX = ProductIndex(PRODUCTS_DATABASE)
+PRODUCTS_TABLE = ProductTable(PRODUCTS_DATABASE)
+
+CATEGORIES = {
+    "сложные_углеводы": "🌾 Сложные углеводы",
+    "простые_углеводы": "⚡ Простые углеводы",
+    "белки": "🥩 Белки",
+    "ненасыщенные_жиры": "🫒 Ненасыщенные жиры",
+    "насыщенные_жиры": "🧈 Насыщенные жиры",
+    "клетчатка": "🌿 Клетчатка"
+}
+
+GOALS = {
+    "похудение": "Похудение",
+    "набор_массы": "Набор массы",
+    "поддержание": "Поддержание формы"
+}
+
+# === СТАТИЧЕСКИЕ ОТВЕТЫ API ===
+# Данные меняются только при деплое: сериализуем и сжимаем один раз при запуске
+STARTED_AT = time.time()
+
+def precompressed_json(data):
+    """Ответ в формате jsonify, подготовленный заранее"""
+    body = app.json.dumps(data, separators=(',', ':')) + '\n'
+    return PrecompressedResponse(body.encode('utf-8'), app.json.mimetype, STARTED_AT)
+
+GOAL_RESPONSES = {goal: precompressed_json(products) for goal, products in PRODUCTS_DATABASE.items()}
+EMPTY_RESPONSE = precompressed_json({})
+CATEGORIES_RESPONSE = precompressed_json(CATEGORIES)
+GOALS_RESPONSE = precompressed_json(GOALS)
+
+# === ПАРАМЕТРЫ /api/products/query ===
+# Имена параметров запроса -> столбцы таблицы
+QUERY_COLUMNS = {
+    'calories': 'калории',
+    'protein': 'белки',
+    'fat': 'жиры',
+    'carbs': 'углеводы',
+    'fiber': 'клетчатка',
+    'name': NAME_COLUMN,
+}
+
+# Уровни фильтров веб-приложения (как в passesFilters)
+FILTER_PRESETS = {
+    'calories': {
+        'low': [('калории', '<=', 100)],
+        'medium': [('калории', '>', 100), ('калории', '<=', 300)],
+        'high': [('калории', '>', 300)],
+    },
+    'protein': {
+        'low': [('белки', '<', 5)],
+        'medium': [('белки', '>=', 5), ('белки', '<', 15)],
+        'high': [('белки', '>=', 15)],
+    },
+    'carbs': {
+        'low': [('углеводы', '<=', 10)],
+        'medium': [('углеводы', '>', 10), ('углеводы', '<=', 30)],
+        'high': [('углеводы', '>', 30)],
+    },
+    'fat': {
+        'low': [('жиры', '<=', 5)],
+        'medium': [('жиры', '>', 5), ('жиры', '<=', 20)],
+        'high': [('жиры', '>', 20)],
+    },
+}
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+class QueryError(ValueError):
+    """Некорректные параметры запроса"""
+
+def encode_cursor(sort_key, descending, position):
+    """Непрозрачный курсор следующей страницы"""
+    raw = f"{sort_key}:{int(descending)}:{position}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor, sort_key, descending):
+    """Позиция из курсора; курсор должен соответствовать текущей сортировке"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+        cursor_sort, cursor_descending, position = raw.split(':')
+        position = int(position)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise QueryError("Некорректный курсор")
+    if cursor_sort != sort_key or cursor_descending != str(int(descending)) or position < 0:
+        raise QueryError("Курсор не соответствует сортировке")
+    return position
+
+def parse_int(args, name, default, minimum, maximum=None):
+    """Целочисленный параметр запроса в допустимых границах"""
+    value = args.get(name)
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise QueryError(f"Параметр {name} должен быть целым числом")
+    if value < minimum or (maximum is not None and value > maximum):
+        raise QueryError(f"Параметр {name} вне допустимого диапазона")
+    return value
+
+def parse_conditions(args):
+    """Условия фильтра: уровни low/medium/high и диапазоны <параметр>_min/_max"""
+    conditions = []
+    for param, presets in FILTER_PRESETS.items():
+        level = args.get(param)
+        if level and level != 'all':
+            if level not in presets:
+                raise QueryError(f"Неизвестный уровень {param}: {level}")
+            conditions.extend(presets[level])
+
+    for param, column in QUERY_COLUMNS.items():
+        if column == NAME_COLUMN:
+            continue
+        for suffix, op in (('_min', '>='), ('_max', '<=')):
+            value = args.get(param + suffix)
+            if value is None:
+                continue
+            try:
+                conditions.append((column, op, float(value)))
+            except ValueError:
+                raise QueryError(f"Параметр {param + suffix} должен быть числом")
+    return conditions
+
+def query_products(args):
+    """Фильтрация, сортировка и постраничная выдача продуктов"""
+    sort_key = args.get('sort', 'name')
+    if sort_key not in QUERY_COLUMNS:
+        raise QueryError(f"Неизвестная сортировка: {sort_key}")
+    # По умолчанию как в sortProducts: название по алфавиту, КБЖУ по убыванию
+    order = args.get('order', 'asc' if sort_key == 'name' else 'desc')
+    if order not in ('asc', 'desc'):
+        raise QueryError("Параметр order должен быть asc или desc")
+    descending = order == 'desc'
+
+    limit = parse_int(args, 'limit', DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+    offset = parse_int(args, 'offset', 0, 0)
+    cursor = args.get('cursor')
+    after = decode_cursor(cursor, sort_key, descending) if cursor else None
+
+    rows = PRODUCTS_TABLE.filter(args.get('goal') or None, args.get('category') or None,
+                                 parse_conditions(args))
+    page_rows, total, next_after = PRODUCTS_TABLE.page(
+        rows, QUERY_COLUMNS[sort_key], descending, limit, offset, after
+    )
+
+    items = []
+    for row in page_rows:
+        goal, category, name, data = PRODUCTS_TABLE.record(row)
+        items.append({'name': name, 'goal': goal, 'category': category, **data})
+
+    return {
+        'items': items,
+        'total': total,
+        'limit': limit,
+        'offset': offset if after is None else None,
+        'next_cursor': encode_cursor(sort_key, descending, next_after) if next_after is not None else None,
+    }
+
 def search_product(product_name):
     """Поиск продукта по названию"""
-    results = {}
-    product_name_lower = product_name.lower()
-    
-    for goal, categories in PRODUCTS_DATABASE.items():
-        results[goal] = {}
-        for category, products in categories.items():
-            matches = {}
-            for name, data in products.items():
-                if product_name_lower in name.lower():
-                    matches[name] = data
-            if matches:
-                results[goal][category] = matches
-    
+    results = {goal: {} for goal in PRODUCTS_DATABASE}
+    results.update(PRODUCTS_INDEX.search(product_name))
+    return results
+
+def search_product_fuzzy(product_name, limit=10):
+    """Поиск с учетом опечаток, в формате search_product"""
+    results = {goal: {} for goal in PRODUCTS_DATABASE}
+    results.update(PRODUCTS_INDEX.fuzzy_search(product_name, limit))
     return results
 
 @app.route('/')
@@ -165,41 +339,74 @@ def index():
     """Главная страница веб-приложения"""
     return render_template('index.html')
 
+@app.route('/webapp_products_github.html')
+def products_webapp_page():
+    """Страница базы продуктов: всегда перепроверяется, данные грузит лениво"""
+    response = send_from_directory(BASE_DIR, 'webapp_products_github.html', max_age=0)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/products.<asset_hash>.json')
+def products_bundle(asset_hash):
+    """Версионированная база продуктов"""
+    return send_asset(f'products.{asset_hash}.json', asset_hash)
+
+@app.route('/meal_templates.<asset_hash>.js')
+def meal_templates_bundle(asset_hash):
+    """Версионированные шаблоны питания"""
+    return send_asset(f'meal_templates.{asset_hash}.js', asset_hash)
+
+def send_asset(filename, asset_hash):
+    """Отдача версионированного файла с бессрочным кэшированием"""
+    if not ASSET_HASH_PATTERN.match(asset_hash):
+        abort(404)
+    response = send_from_directory(BASE_DIR, filename)
+    response.headers['Cache-Control'] = IMMUTABLE_CACHE
+    return response
+
 @app.route('/api/products/<goal>')
 def get_products_by_goal(goal):
     """API для получения продуктов по цели"""
-    if goal in PRODUCTS_DATABASE:
-        return jsonify(PRODUCTS_DATABASE[goal])
-    return jsonify({})
+    return GOAL_RESPONSES.get(goal, EMPTY_RESPONSE).make_response()
+
+@app.route('/api/products/query')
+def query_products_api():
+    """API для фильтрации и сортировки продуктов на сервере
+
+    Параметры: goal, category; calories/protein/carbs/fat=low|medium|high;
+    <calories|protein|fat|carbs|fiber>_min/_max; sort=name|calories|protein|fat|carbs|fiber,
+    order=asc|desc; limit, offset или cursor из next_cursor предыдущей страницы.
+    """
+    try:
+        return jsonify(query_products(request.args))
+    except QueryError as e:
+        return jsonify({'error': str(e)}), 400
 
 @app.route('/api/search/<query>')
 def search_products(query):
-    """API для поиска продуктов"""
+    """API для поиска продуктов
+
+    ?ranked=1 возвращает плоский список с оценкой релевантности (limit - число результатов);
+    без него при отсутствии точных совпадений используется поиск с учетом опечаток.
+    """
+    limit = request.args.get('limit', default=10, type=int)
+    if request.args.get('ranked') == '1':
+        return jsonify(PRODUCTS_INDEX.ranked_results(query, max(1, min(limit, 100))))
+
     results = search_product(query)
+    if not any(results.values()):
+        results = search_product_fuzzy(query, max(1, min(limit, 100)))
     return jsonify(results)
 
 @app.route('/api/categories')
 def get_categories():
     """API для получения категорий"""
-    categories = {
-        "сложные_углеводы": "🌾 Сложные углеводы",
-        "простые_углеводы": "⚡ Простые углеводы",
-        "белки": "🥩 Белки",
-        "ненасыщенные_жиры": "🫒 Ненасыщенные жиры",
-        "насыщенные_жиры": "🧈 Насыщенные жиры",
-        "клетчатка": "🌿 Клетчатка"
-    }
-    return jsonify(categories)
+    return CATEGORIES_RESPONSE.make_response()
 
 @app.route('/api/goals')
 def get_goals():
     """API для получения целей"""
-    goals = {
-        "похудение": "Похудение",
-        "набор_массы": "Набор массы",
-        "поддержание": "Поддержание формы"
-    }
-    return jsonify(goals)
+    return GOALS_RESPONSE.make_response()
 
 if __name__ == '__main__':
     # Получаем порт из переменной окружения (для хостингов)